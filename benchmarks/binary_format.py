@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare the size and the encoding and decoding time of a stream of
+Observables in JSON Lines and in the cybox.utils.binary format.
+
+Only the encoding step is timed; to_dict() and from_dict() are the same for
+every format.
+
+Example usage:
+    python benchmarks/binary_format.py [copies]
+"""
+
+import sys
+
+from mixbox.vendor import six
+
+from cybox.utils import binary, jsonio
+
+from fixtures import best_of, make_observables, report
+
+
+def json_lines(backend):
+    def dump(values):
+        return "".join(backend.dumps(value) + "\n" for value in values)
+
+    def load(doc):
+        return [backend.loads(line) for line in doc.splitlines()]
+
+    return dump, load
+
+
+def binary_stream(encoder, decoder, compact=False):
+    def dump(values):
+        out = six.BytesIO()
+        writer = binary.BinaryWriter(out)
+        writer._encoder = encoder(compact)
+        for value in values:
+            writer.write(value)
+        return out.getvalue()
+
+    def load(data):
+        reader = binary.BinaryReader(six.BytesIO(data))
+        reader._decoder = decoder()
+        return list(reader)
+
+    return dump, load
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    values = [observable.to_dict() for observable in make_observables(copies)]
+
+    formats = [
+        ("JSON Lines (%s)" % name, json_lines(jsonio.get_backend(name)))
+        for name in jsonio.available_backends()[::-1]
+    ]
+    codecs = [("Python", binary._PythonEncoder, binary._PythonDecoder)]
+    if binary.msgpack is not None:
+        codecs.append(("msgpack", binary._MsgpackEncoder,
+                       binary._MsgpackDecoder))
+    for name, encoder, decoder in codecs:
+        formats.append(("binary (%s)" % name,
+                        binary_stream(encoder, decoder)))
+        formats.append(("binary compact (%s)" % name,
+                        binary_stream(encoder, decoder, compact=True)))
+
+    title = "%d Observables" % len(values)
+    print(title)
+    print("-" * len(title))
+    for label, (dump, load) in formats:
+        data = dump(values)
+        assert load(data) == values
+        print("%-30s %9d bytes" % (label, len(data)))
+    print("")
+
+    report("Encode " + title, [
+        (label, best_of(lambda: dump(values)))
+        for label, (dump, load) in formats
+    ])
+    report("Decode " + title, [
+        (label, best_of(lambda: load(data)))
+        for label, (dump, load), data in
+        [(label, f, f[0](values)) for label, f in formats]
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Time the generated binding classes building documents full of deeply
+nested, many-child elements (network packet headers and PE headers).
+
+Only ``build()`` on already-parsed XML is timed, so the numbers reflect the
+cost of the generated ``buildChildren()`` methods rather than of lxml.
+
+For comparison, the bindings of an earlier revision of this repository are
+timed too, by default those from before ``buildChildren()`` dispatched
+through :data:`cybox.bindings.child_builders` rather than an if/elif chain.
+They are read with ``git archive`` and imported as a separate package.
+
+Example usage:
+    python benchmarks/build_children.py [copies] [revision]
+"""
+
+import atexit
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from mixbox.vendor.six import BytesIO
+from mixbox.xml import get_etree_root
+
+import cybox.bindings.cybox_core as core_binding
+from cybox.core import Observable, Observables
+from cybox.objects.win_executable_file_object import (
+    DataDirectory, DOSHeader, PEFileHeader, PEOptionalHeader,
+    PESectionHeaderStruct, WinExecutableFile
+)
+
+from fixtures import best_of, make_xml, report
+
+# The last revision whose bindings dispatch child elements through if/elif
+# chains.
+BASELINE_REVISION = "798b18d^"
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def baseline_bindings(revision):
+    """Import the bindings of `revision` as the ``baseline_bindings``
+    package, and return its ``cybox_core`` module, or ``None`` if they
+    cannot be read from git."""
+    try:
+        archive = subprocess.check_output(
+            ["git", "archive", revision, "cybox/bindings"], cwd=REPO_DIR
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    directory = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, directory)
+    tarfile.open(fileobj=BytesIO(archive)).extractall(directory)
+    os.rename(os.path.join(directory, "cybox", "bindings"),
+              os.path.join(directory, "baseline_bindings"))
+
+    sys.path.insert(0, directory)
+    return importlib.import_module("baseline_bindings.cybox_core")
+
+
+def _hex_fields(klass):
+    return dict(
+        (f.key_name, "0000010A") for f in klass.typed_fields()
+        if f.type_ is not None and f.type_.__name__ == "HexBinary"
+    )
+
+
+def pe_file():
+    """Return a WinExecutableFile with every PE header field filled in."""
+    optional_header = _hex_fields(PEOptionalHeader)
+    optional_header["data_directory"] = dict(
+        (f.key_name, {"virtual_address": "00001000", "size": 512})
+        for f in DataDirectory.typed_fields()
+    )
+
+    section = {"section_header": _hex_fields(PESectionHeaderStruct)}
+    section["section_header"]["name"] = ".text"
+
+    return WinExecutableFile.from_dict({
+        "file_name": "example.exe",
+        "headers": {
+            "dos_header": _hex_fields(DOSHeader),
+            "file_header": _hex_fields(PEFileHeader),
+            "optional_header": optional_header,
+            "signature": "00004550",
+        },
+        "sections": [section] * 4,
+    })
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    revision = sys.argv[2] if len(sys.argv) > 2 else BASELINE_REVISION
+    baseline = baseline_bindings(revision)
+    if baseline is None:
+        print("The bindings of %s could not be read from git.\n" % revision)
+
+    packets = make_xml(copies, ["NetworkPacketObjectType"])
+    executables = Observables(
+        [Observable(pe_file()) for _ in range(copies)]
+    ).to_xml()
+
+    for name, xml in [("NetworkPacketObjectType", packets),
+                      ("WindowsExecutableFileObjectType", executables)]:
+        root = get_etree_root(BytesIO(xml))
+
+        def builder(module):
+            return lambda: module.ObservablesType.factory().build(root)
+
+        results = []
+        if baseline is not None:
+            results.append(("%s bindings" % revision,
+                            best_of(builder(baseline))))
+        results.append(("current bindings", best_of(builder(core_binding))))
+
+        title = "%s: %d Observables (%d bytes)" % (name, copies, len(xml))
+        report(title, results)
+
+
+if __name__ == "__main__":
+    main()
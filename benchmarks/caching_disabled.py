@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare building many Observables with the object cache on and off.
+
+Every Object is put in the global cache when its ID is set, so building
+Observables which are then thrown away still keeps all of their Objects
+alive. This times building them with caching on and within
+cybox.utils.caching_disabled(), and measures the memory still allocated
+once they have been built and dropped.
+
+Example usage:
+    python benchmarks/caching_disabled.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import cybox.utils
+from cybox.core import Observable
+from cybox.objects.address_object import Address
+
+from fixtures import best_of, report
+
+
+def build(count):
+    """Build `count` Observables of an Address, and drop them."""
+    for i in range(count):
+        Observable(Address("10.%d.%d.%d" % (i >> 16 & 255, i >> 8 & 255,
+                                            i & 255), Address.CAT_IPV4))
+
+
+def build_uncached(count):
+    with cybox.utils.caching_disabled():
+        build(count)
+
+
+def retained_memory(func):
+    """Return the memory (in bytes) still allocated after `func` returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        cybox.utils.cache_clear()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    report("Building %d Observables" % count, [
+        ("caching on", best_of(lambda: build(count), repeat=3)),
+        ("caching_disabled()", best_of(lambda: build_uncached(count),
+                                       repeat=3)),
+    ])
+
+    print("Memory retained")
+    print("---------------")
+    for label, func in [("caching on", build),
+                        ("caching_disabled()", build_uncached)]:
+        size = retained_memory(lambda: func(count))
+        print("%-30s %9.1f MB" % (label, size / 1e6))
+
+
+if __name__ == "__main__":
+    main()
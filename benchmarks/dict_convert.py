@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare to_dict() and from_dict() of an Observables using the generic
+mixbox methods and the per-class converters of cybox.utils.dictconv.
+
+Example usage:
+    python benchmarks/dict_convert.py [copies]
+"""
+
+import sys
+
+from cybox.core import Observables
+from cybox.utils.dictconv import FastDictMixin
+
+from fixtures import best_of, make_observables, report
+
+
+def generic(function):
+    """Call `function` with the mixbox to_dict() and from_dict()."""
+    to_dict = FastDictMixin.__dict__["to_dict"]
+    from_dict = FastDictMixin.__dict__["from_dict"]
+    del FastDictMixin.to_dict, FastDictMixin.from_dict
+    try:
+        return function()
+    finally:
+        FastDictMixin.to_dict = to_dict
+        FastDictMixin.from_dict = from_dict
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    observables = make_observables(copies)
+    observables_dict = observables.to_dict()
+
+    def to_dict():
+        return observables.to_dict()
+
+    def from_dict():
+        return Observables.from_dict(observables_dict)
+
+    assert generic(to_dict) == to_dict()
+    assert generic(lambda: from_dict().to_dict()) == observables_dict
+
+    for title, function in (("to_dict()", to_dict),
+                            ("from_dict()", from_dict)):
+        report("%s of %d Observables" % (title, len(observables)), [
+            ("mixbox", generic(lambda: best_of(function))),
+            ("cybox.utils.dictconv", best_of(function)),
+        ])
+
+
+if __name__ == "__main__":
+    main()
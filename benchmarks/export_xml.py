@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare the binding export step of to_xml() with the mixbox helpers and
+a StringIO buffer against the cybox.bindings helpers and a joined list.
+
+Only the export of already converted binding objects is timed, since that
+is the part of to_xml() these helpers affect.
+
+Example usage:
+    python benchmarks/export_xml.py [copies]
+"""
+
+import sys
+
+from mixbox import binding_utils
+from mixbox.entities import NamespaceCollector
+from mixbox.vendor import six
+
+import cybox.bindings
+from cybox.bindings import export_xml
+
+from fixtures import best_of, make_observables, report
+
+_HELPERS = ("quote_xml", "quote_attrib", "showIndent")
+
+
+def binding_modules():
+    return [module for name, module in list(sys.modules.items())
+            if module is not None and name.startswith("cybox.bindings.")]
+
+
+def use_helpers(source):
+    """Make the loaded binding modules use the helpers in `source`."""
+    for module in binding_modules():
+        for name in _HELPERS:
+            setattr(module, name, getattr(source, name))
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    observables = make_observables(copies)
+    obj = observables.to_obj(ns_info=NamespaceCollector())
+
+    def stringio(pretty):
+        def export():
+            out = six.StringIO()
+            obj.export(out.write, 0, pretty_print=pretty)
+            return out.getvalue()
+        return export
+
+    def joined(pretty):
+        return lambda: export_xml(obj, pretty_print=pretty)
+
+    for pretty in (True, False):
+        use_helpers(binding_utils)
+        try:
+            baseline = best_of(stringio(pretty))
+            expected = stringio(pretty)()
+        finally:
+            use_helpers(cybox.bindings)
+        assert expected == joined(pretty)()
+
+        title = "Export %d Observables (pretty=%s)" % (len(observables),
+                                                       pretty)
+        report(title, [
+            ("mixbox helpers, StringIO", baseline),
+            ("cybox.bindings, join", best_of(joined(pretty))),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Shared helpers for the benchmark scripts.
+
+Benchmark documents are assembled from the ``_full_dict`` fixtures of the
+Object unit tests in ``cybox.test.objects``, so every Object type with a test
+is represented.
+"""
+
+import importlib
+import os
+import pkgutil
+import timeit
+
+import cybox.test.objects
+import cybox.utils
+from cybox.core import Observable, Observables
+from cybox.test.objects import ObjectTestCase
+
+
+def object_fixtures(object_types=None):
+    """Yield ``(ObjectProperties subclass, dictionary)`` test fixtures.
+
+    Args:
+        object_types: If given, only yield fixtures whose ``object_type``
+            (e.g., "FileObjectType") is in this collection.
+    """
+    path = os.path.dirname(cybox.test.objects.__file__)
+
+    for _, name, _ in sorted(pkgutil.iter_modules([path])):
+        module = importlib.import_module("cybox.test.objects." + name)
+
+        for value in sorted(vars(module).values(), key=repr):
+            if not isinstance(value, type):
+                continue
+            if not issubclass(value, ObjectTestCase) or value is ObjectTestCase:
+                continue
+            if object_types and value.object_type not in object_types:
+                continue
+            yield value.klass, value._full_dict
+
+
+def make_observables(copies=1, object_types=None):
+    """Return an Observables with `copies` Observables for every fixture."""
+    fixtures = list(object_fixtures(object_types))
+    observables = Observables()
+
+    for _ in range(copies):
+        for klass, full_dict in fixtures:
+            observables.add(Observable(klass.from_dict(full_dict)))
+
+    cybox.utils.cache_clear()
+    return observables
+
+
+def make_xml(copies=1, object_types=None):
+    """Return a serialized Observables document (bytes)."""
+    return make_observables(copies, object_types).to_xml()
+
+
+def best_of(func, repeat=5, number=1):
+    """Return the fastest time (in seconds) of `repeat` runs of `func`."""
+    def run():
+        func()
+        cybox.utils.cache_clear()
+
+    return min(timeit.repeat(run, repeat=repeat, number=number)) / number
+
+
+def report(title, results):
+    """Print `(label, seconds)` timings relative to the first one."""
+    print(title)
+    print("-" * len(title))
+
+    baseline = results[0][1]
+    for label, seconds in results:
+        print("%-30s %9.4fs  %5.2fx" % (label, seconds, baseline / seconds))
+    print("")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Measure the cold-start cost of ``cybox.bindings.cybox_core``.
+
+Each scenario runs in a fresh interpreter. "all Object bindings" imports
+every Object binding module, which is what importing ``cybox_core`` used to
+do; the other scenarios only load the bindings they use. On Python 3.6 and
+older, which lack module ``__getattr__`` (PEP 562), ``cybox_core`` still
+imports every Object binding, so all the scenarios load them all.
+
+Run ``python -m compileall cybox`` first so that bytecode compilation is not
+included in the timings.
+
+Example usage:
+    python benchmarks/import_time.py [repeat]
+"""
+
+import os
+import subprocess
+import sys
+
+from fixtures import report
+
+SCRIPT = """
+import resource, sys, time
+start = time.time()
+%s
+elapsed = time.time() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+loaded = len([m for m in sys.modules if m.startswith("cybox.bindings.")])
+print("%%f %%d %%d" %% (elapsed, rss, loaded))
+"""
+
+BASELINE = "import mixbox.binding_utils"
+
+CORE = BASELINE + "\nimport cybox.bindings.cybox_core as core"
+
+SCENARIOS = [
+    ("all bindings", CORE + "\nfor n in core._OBJECT_BINDINGS: getattr(core, n)"),
+    ("cybox_core", CORE),
+    ("parse Address", CORE + """
+from mixbox.vendor.six import BytesIO
+core.parse(BytesIO(b'''<cybox:Observables
+    xmlns:cybox="http://cybox.mitre.org/cybox-2"
+    xmlns:AddressObj="http://cybox.mitre.org/objects#AddressObject-2"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    cybox_major_version="2" cybox_minor_version="1">
+  <cybox:Observable id="example:Observable-1"><cybox:Object>
+    <cybox:Properties xsi:type="AddressObj:AddressObjectType" category="ipv4-addr">
+      <AddressObj:Address_Value>10.0.0.1</AddressObj:Address_Value>
+    </cybox:Properties>
+  </cybox:Object></cybox:Observable>
+</cybox:Observables>'''))
+"""),
+]
+
+
+def run(code, repeat):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] +
+        [p for p in [env.get("PYTHONPATH")] if p]
+    )
+
+    best = None
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, "-c", SCRIPT % code],
+                                      env=env)
+        result = [float(x) for x in out.split()]
+        if best is None or result[0] < best[0]:
+            best = result
+    return best
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline = run(BASELINE, repeat)[0]
+
+    results = []
+    for label, code in SCENARIOS:
+        seconds, rss, loaded = run(code, repeat)
+        # ru_maxrss is in kilobytes on Linux.
+        label = "%-13s %2d mods %3dMB" % (label, loaded, rss // 1024)
+        results.append((label, seconds - baseline))
+
+    report("Import time after mixbox.binding_utils", results)
+
+
+if __name__ == "__main__":
+    main()
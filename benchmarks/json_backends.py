@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare encoding and decoding the JSON of an Observables with each
+available cybox.utils.jsonio backend.
+
+Only the JSON step is timed; to_dict() and from_dict() are the same for
+every backend.
+
+Example usage:
+    python benchmarks/json_backends.py [copies]
+"""
+
+import sys
+
+from cybox.utils import jsonio
+
+from fixtures import best_of, make_observables, report
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    observables = make_observables(copies)
+    observables_dict = observables.to_dict()
+    doc = jsonio.dumps(observables_dict, "json")
+    names = jsonio.available_backends()[::-1]
+
+    for name in names:
+        assert jsonio.loads(jsonio.dumps(observables_dict, name)) == \
+            observables_dict
+
+    title = "%d Observables, %d bytes of JSON" % (len(observables), len(doc))
+    report("Encode " + title, [
+        (name, best_of(lambda: jsonio.dumps(observables_dict, name)))
+        for name in names
+    ])
+    report("Decode " + title, [
+        (name, best_of(lambda: jsonio.loads(doc, name)))
+        for name in names
+    ])
+
+
+if __name__ == "__main__":
+    main()
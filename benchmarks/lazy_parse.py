@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare eager and lazy (``lazy=True``) parsing for a triage-style workload
+that only looks at the ObjectProperties type of each Observable.
+
+Example usage:
+    python benchmarks/lazy_parse.py [copies]
+"""
+
+import sys
+
+from mixbox.vendor.six import BytesIO
+
+from cybox.core import Observables
+
+from fixtures import best_of, make_xml, report
+
+
+def triage(observables):
+    types = []
+    for observable in observables:
+        obj = observable.object_
+        if obj is not None and obj.properties is not None:
+            types.append(obj.properties._XSI_TYPE)
+    return types
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    xml = make_xml(copies)
+
+    def run(**kwargs):
+        return lambda: triage(Observables.from_xml(BytesIO(xml), **kwargs))
+
+    title = "Parse and read each Object's properties type (%d bytes)" % len(xml)
+    report(title, [
+        ("bindings + from_obj()", best_of(run())),
+        ("fast=True", best_of(run(fast=True))),
+        ("lazy=True", best_of(run(lazy=True))),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare collecting namespaces during to_xml() with the mixbox
+NamespaceCollector against cybox.utils.nscollector.
+
+The first comparison times to_obj() of a large Observables with each
+collector, and the second exporting its Observables one at a time, where
+the namespace declarations of each one are worked out afresh by mixbox and
+looked up by class with the cybox collector.
+
+Example usage:
+    python benchmarks/namespace_collect.py [copies]
+"""
+
+import sys
+
+from mixbox.entities import NamespaceCollector
+
+from cybox.bindings import export_xml
+from cybox.utils.nscollector import ClassNamespaceCollector
+
+from fixtures import best_of, make_observables, report
+
+
+def mixbox_to_xml(entity):
+    """Entity.to_xml() before cybox.utils.nscollector."""
+    collector = NamespaceCollector()
+    obj = entity.to_obj(ns_info=collector)
+    collector.finalize()
+    namespace_def = (collector.get_xmlns_string("\n\t") + "\n\t" +
+                     collector.get_schema_location_string("\n\t"))
+    return export_xml(obj, namespacedef_=namespace_def).encode("utf-8")
+
+
+def normalize(xml):
+    """Return `xml` with the order of its root declarations dropped, since
+    mixbox does not keep it from one run to the next."""
+    head, _, body = xml.partition(b">")
+    head = head.replace(b'xsi:schemaLocation="', b"").replace(b'"', b"")
+    return sorted(head.split()), body
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    observables = make_observables(copies)
+    items = list(observables.observables)
+
+    for observable in items:
+        assert (normalize(mixbox_to_xml(observable)) ==
+                normalize(observable.to_xml()))
+
+    report("to_obj() of %d Observables" % len(items), [
+        ("mixbox NamespaceCollector",
+         best_of(lambda: observables.to_obj(ns_info=NamespaceCollector()))),
+        ("ClassNamespaceCollector",
+         best_of(lambda: observables.to_obj(
+             ns_info=ClassNamespaceCollector()))),
+    ])
+    report("to_xml() of %d Observables, one at a time" % len(items), [
+        ("mixbox NamespaceCollector",
+         best_of(lambda: [mixbox_to_xml(x) for x in items])),
+        ("ClassNamespaceCollector",
+         best_of(lambda: [x.to_xml() for x in items])),
+    ])
+
+
+if __name__ == "__main__":
+    main()
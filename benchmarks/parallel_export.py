@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare exporting an Observables as XML and JSON in this process and in
+pools of worker processes (see cybox.core.parallel).
+
+The speedup depends on the number of CPUs available; with a single CPU the
+parallel export is slower, since the output is sent back from the workers.
+
+Example usage:
+    python benchmarks/parallel_export.py [copies] [workers]
+"""
+
+import multiprocessing
+import sys
+
+from fixtures import best_of, make_observables, report
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    if len(sys.argv) > 2:
+        most = int(sys.argv[2])
+    else:
+        most = multiprocessing.cpu_count()
+    observables = make_observables(copies)
+    pools = sorted(set([2, max(most, 2)]))
+
+    for workers in pools:
+        assert observables.to_xml(workers=workers) == observables.to_xml()
+        assert observables.to_json(workers=workers) == observables.to_json()
+
+    title = "%d Observables" % len(observables)
+    for method in ("to_xml", "to_json"):
+        export = getattr(observables, method)
+        results = [("serial", best_of(export, 3))]
+        for n in pools:
+            results.append(
+                ("%d workers" % n, best_of(lambda: export(workers=n), 3))
+            )
+        report("%s() of %s" % (method, title), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare the binding-based and direct (``fast=True``) XML parsers.
+
+Example usage:
+    python benchmarks/parse_xml.py [copies]
+"""
+
+import sys
+
+from mixbox.vendor.six import BytesIO
+
+from cybox.core import Observables
+
+from fixtures import best_of, make_xml, report
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    xml = make_xml(copies)
+
+    def parse(fast):
+        return lambda: Observables.from_xml(BytesIO(xml), fast=fast)
+
+    title = "Observables.from_xml() (%d bytes)" % len(xml)
+    report(title, [
+        ("bindings + from_obj()", best_of(parse(False))),
+        ("fast=True", best_of(parse(True))),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Resolve idrefs to Objects stored in a cybox.utils.sqlitecache database.
+
+A database is filled with Objects built from the Object test fixtures, and
+idrefs to them are then resolved in random order by a fresh SQLiteCache,
+with the Objects read back from disk, against resolving them in the
+in-memory DictCache holding every Object. The size of the values each
+cache holds in memory once the lookups are done is reported as well.
+
+Reading an Object back costs about as much as its from_dict(), so the time
+taken depends on the size of the Objects and on how often the same ones are
+looked up.
+
+Example usage:
+    python benchmarks/sqlite_cache.py [copies] [lookups]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import cybox.utils
+from cybox.core import RelatedObject
+from cybox.utils.caches import DictCache, sizeof
+from cybox.utils.sqlitecache import SQLiteCache
+
+from fixtures import make_observables, report
+
+
+def resolve(cache, related):
+    """Return the time (in seconds) taken to resolve the RelatedObjects
+    `related` with `cache`."""
+    start = time.time()
+    with cybox.utils.cache_scope(cache):
+        for rel in related:
+            rel.get_properties()
+    return time.time() - start
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "objects.db")
+    try:
+        with cybox.utils.caching_disabled():
+            observables = make_observables(copies)
+            objects = [x.object_ for x in observables.observables]
+            related = [RelatedObject(idref=random.choice(objects).id_)
+                       for _ in range(lookups)]
+
+        start = time.time()
+        cache = SQLiteCache(path)
+        for obj in objects:
+            cache.put(obj)
+        cache.close()
+        print("Wrote %d Objects in %.2fs (%.1f MB)\n" % (
+            len(objects), time.time() - start,
+            os.path.getsize(path) / 1e6))
+
+        memory = DictCache()
+        for obj in objects:
+            memory.put(obj)
+        memory_time = resolve(memory, related)
+        memory_size = sum(sizeof(obj) for obj in objects)
+
+        disk = SQLiteCache(path)
+        disk_time = resolve(disk, related)
+        disk_size = sum(sizeof(obj) for obj in disk._inner.values())
+        disk.close()
+
+        report("Resolving %d idrefs" % lookups, [
+            ("DictCache (all in memory)", memory_time),
+            ("SQLiteCache", disk_time),
+        ])
+        print("Size of the values in memory")
+        print("----------------------------")
+        print("%-30s %9.1f MB" % ("DictCache (all in memory)",
+                                  memory_size / 1e6))
+        print("%-30s %9.1f MB" % ("SQLiteCache", disk_size / 1e6))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
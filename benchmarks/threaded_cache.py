@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Stress the object cache with several threads creating Objects and
+resolving RelatedObject idrefs at once.
+
+Each thread creates Objects with IDs of its own, and RelatedObjects
+referring to them, and then resolves every idref with get_properties(),
+checking that it finds the Object it refers to. This is timed with all the
+threads sharing the global cache, and with each thread in a cache_scope()
+of its own, against the same work done in a single thread.
+
+Example usage:
+    python benchmarks/threaded_cache.py [threads] [objects]
+"""
+
+import sys
+import threading
+
+import cybox.utils
+from cybox.core import Object, RelatedObject
+from cybox.objects.file_object import File
+
+from fixtures import best_of, report
+
+
+def work(index, count, scope=False):
+    """Create `count` Objects and RelatedObjects, and resolve them."""
+    if scope:
+        with cybox.utils.cache_scope():
+            return work(index, count)
+
+    related = []
+    for i in range(count):
+        f = File()
+        f.file_name = "file-%d-%d.txt" % (index, i)
+        obj = Object(f, id_="example:Object-%d-%d" % (index, i))
+        related.append(RelatedObject(idref=obj.id_))
+
+    for i, rel in enumerate(related):
+        if rel.get_properties().file_name != "file-%d-%d.txt" % (index, i):
+            raise AssertionError("Wrong Object for %s" % rel.idref)
+
+
+def in_threads(threads, count, scope=False):
+    errors = []
+
+    def run(index):
+        try:
+            work(index, count, scope)
+        except Exception as ex:
+            errors.append(ex)
+
+    pool = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    # Switch threads as often as possible, to make races likely.
+    if hasattr(sys, "setswitchinterval"):
+        sys.setswitchinterval(1e-6)
+
+    in_threads(threads, count)
+    assert cybox.utils.cache_count() >= threads * count
+    cybox.utils.cache_clear()
+
+    report("%d threads, %d Objects each" % (threads, count), [
+        ("1 thread",
+         best_of(lambda: [work(i, count) for i in range(threads)])),
+        ("global cache",
+         best_of(lambda: in_threads(threads, count))),
+        ("cache_scope() per thread",
+         best_of(lambda: in_threads(threads, count, scope=True))),
+    ])
+
+
+if __name__ == "__main__":
+    main()
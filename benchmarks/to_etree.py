@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare Observables.to_etree() for an Observables document parsed with
+lazy=True, which copies the parsed element tree, against one parsed
+eagerly, which serializes the document and parses it again.
+
+Example usage:
+    python benchmarks/to_etree.py [copies]
+"""
+
+import sys
+
+from mixbox.vendor.six import BytesIO
+
+from cybox.core import Observables
+
+from fixtures import best_of, make_xml, report
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    xml = make_xml(copies)
+
+    eager = Observables.from_xml(BytesIO(xml))
+    lazy = Observables.from_xml(BytesIO(xml), lazy=True)
+
+    title = "Element tree for %d Observables" % len(eager)
+    report(title, [
+        ("eager to_etree()",
+         best_of(lambda: eager.to_etree(), repeat=3)),
+        ("lazy to_etree()",
+         best_of(lambda: lazy.to_etree(), repeat=3)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+"""Compare Observables.to_xml() with streaming output through
+ObservablesWriter, by time and by peak memory allocated while serializing.
+
+Example usage:
+    python benchmarks/write_xml.py [copies]
+"""
+
+import sys
+import tracemalloc
+
+from cybox.core import Observables, ObservablesWriter
+
+from fixtures import best_of, make_observables, report
+
+
+class NullFile(object):
+    """A file that counts and discards what is written to it."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+
+def peak_memory(func):
+    """Return the peak memory (in bytes) allocated by `func`."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    observables = list(make_observables(copies))
+
+    def batch():
+        NullFile().write(Observables(observables).to_xml())
+
+    def stream():
+        with ObservablesWriter(NullFile()) as writer:
+            for observable in observables:
+                writer.write(observable)
+
+    title = "Serialize %d Observables" % len(observables)
+    report(title, [
+        ("Observables.to_xml()", best_of(batch, repeat=3)),
+        ("ObservablesWriter", best_of(stream, repeat=3)),
+    ])
+
+    print("Peak memory while serializing")
+    print("-----------------------------")
+    print("%-30s %9.1f MB" % ("Observables.to_xml()", peak_memory(batch) / 1e6))
+    print("%-30s %9.1f MB" % ("ObservablesWriter", peak_memory(stream) / 1e6))
+
+
+if __name__ == "__main__":
+    main()
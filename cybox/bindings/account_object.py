@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -85,22 +87,25 @@ class AuthenticationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Authentication_Type':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Type(obj_)
-        elif nodeName_ == 'Authentication_Data':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Data(obj_)
-        elif nodeName_ == 'Authentication_Token_Protection_Mechanism':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Token_Protection_Mechanism(obj_)
-        elif nodeName_ == 'Structured_Authentication_Mechanism':
-            obj_ = StructuredAuthenticationMechanismType.factory()
-            obj_.build(child_)
-            self.set_Structured_Authentication_Mechanism(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Authentication_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Type(obj_)
+    def buildChild_Authentication_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Data(obj_)
+    def buildChild_Authentication_Token_Protection_Mechanism(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Token_Protection_Mechanism(obj_)
+    def buildChild_Structured_Authentication_Mechanism(self, child_, node, nodeName_):
+        obj_ = StructuredAuthenticationMechanismType.factory()
+        obj_.build(child_)
+        self.set_Structured_Authentication_Mechanism(obj_)
 # end class AuthenticationType
 
 class StructuredAuthenticationMechanismType(GeneratedsSuper):
@@ -166,10 +171,13 @@ class StructuredAuthenticationMechanismType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
 # end class StructuredAuthenticationMechanismType
 
 
@@ -303,31 +311,33 @@ class AccountObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(AccountObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Domain':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Domain(obj_)
-        elif nodeName_ == 'Authentication':
-            obj_ = AuthenticationType.factory()
-            obj_.build(child_)
-            self.Authentication.append(obj_)
-        elif nodeName_ == 'Creation_Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Date(obj_)
-        elif nodeName_ == 'Modified_Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Modified_Date(obj_)
-        elif nodeName_ == 'Last_Accessed_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Accessed_Time(obj_)
-        super(AccountObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Domain(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Domain(obj_)
+    def buildChild_Authentication(self, child_, node, nodeName_):
+        obj_ = AuthenticationType.factory()
+        obj_.build(child_)
+        self.Authentication.append(obj_)
+    def buildChild_Creation_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Date(obj_)
+    def buildChild_Modified_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Modified_Date(obj_)
+    def buildChild_Last_Accessed_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Accessed_Time(obj_)
 # end class AccountObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -143,19 +145,21 @@ class AddressObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(AddressObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Address_Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address_Value(obj_)
-        elif nodeName_ == 'VLAN_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_VLAN_Name(obj_)
-        elif nodeName_ == 'VLAN_Num':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_VLAN_Num(obj_)
-        super(AddressObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Address_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address_Value(obj_)
+    def buildChild_VLAN_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_VLAN_Name(obj_)
+    def buildChild_VLAN_Num(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_VLAN_Num(obj_)
 # end class AddressObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -98,27 +100,29 @@ class APIObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(APIObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Function_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Function_Name(obj_)
-        elif nodeName_ == 'Normalized_Function_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Normalized_Function_Name(obj_)
-        elif nodeName_ == 'Platform':
-            obj_ = cybox_common.PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Platform(obj_)
-        elif nodeName_ == 'Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address(obj_)
-        super(APIObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Function_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Function_Name(obj_)
+    def buildChild_Normalized_Function_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Normalized_Function_Name(obj_)
+    def buildChild_Platform(self, child_, node, nodeName_):
+        obj_ = cybox_common.PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Platform(obj_)
+    def buildChild_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address(obj_)
 # end class APIObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import file_object
 
@@ -185,35 +187,37 @@ class ArchiveFileObjectType(file_object.FileObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(ArchiveFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Archive_Format':
-            obj_ = ArchiveFileFormatType.factory()
-            obj_.build(child_)
-            self.set_Archive_Format(obj_)
-        elif nodeName_ == 'Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'File_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Count(obj_)
-        elif nodeName_ == 'Encryption_Algorithm':
-            obj_ = cybox_common.CipherType.factory()
-            obj_.build(child_)
-            self.set_Encryption_Algorithm(obj_)
-        elif nodeName_ == 'Decryption_Key':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Decryption_Key(obj_)
-        elif nodeName_ == 'Comment':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Comment(obj_)
-        elif nodeName_ == 'Archived_File':
-            obj_ = file_object.FileObjectType.factory()
-            obj_.build(child_)
-            self.Archived_File.append(obj_)
-        super(ArchiveFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Archive_Format(self, child_, node, nodeName_):
+        obj_ = ArchiveFileFormatType.factory()
+        obj_.build(child_)
+        self.set_Archive_Format(obj_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_File_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Count(obj_)
+    def buildChild_Encryption_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.CipherType.factory()
+        obj_.build(child_)
+        self.set_Encryption_Algorithm(obj_)
+    def buildChild_Decryption_Key(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Decryption_Key(obj_)
+    def buildChild_Comment(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Comment(obj_)
+    def buildChild_Archived_File(self, child_, node, nodeName_):
+        obj_ = file_object.FileObjectType.factory()
+        obj_.build(child_)
+        self.Archived_File.append(obj_)
 # end class ArchiveFileObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import system_object
@@ -91,22 +93,25 @@ class ARPCacheEntryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
-        elif nodeName_ == 'Physical_Address':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Physical_Address(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = ARPCacheEntryTypeType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Network_Interface':
-            obj_ = system_object.NetworkInterfaceType.factory()
-            obj_.build(child_)
-            self.set_Network_Interface(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
+    def buildChild_Physical_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Physical_Address(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = ARPCacheEntryTypeType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Network_Interface(self, child_, node, nodeName_):
+        obj_ = system_object.NetworkInterfaceType.factory()
+        obj_.build(child_)
+        self.set_Network_Interface(obj_)
 # end class ARPCacheEntryType
 
 class ARPCacheEntryTypeType(cybox_common.BaseObjectPropertyType):
@@ -249,11 +254,13 @@ class ARPCacheObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(ARPCacheObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ARP_Cache_Entry':
-            obj_ = ARPCacheEntryType.factory()
-            obj_.build(child_)
-            self.ARP_Cache_Entry.append(obj_)
-        super(ARPCacheObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ARP_Cache_Entry(self, child_, node, nodeName_):
+        obj_ = ARPCacheEntryType.factory()
+        obj_.build(child_)
+        self.ARP_Cache_Entry.append(obj_)
 # end class ARPCacheObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -190,18 +192,21 @@ class PackagingType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Compression':
-            obj_ = CompressionType.factory()
-            obj_.build(child_)
-            self.Compression.append(obj_)
-        elif nodeName_ == 'Encryption':
-            obj_ = EncryptionType.factory()
-            obj_.build(child_)
-            self.Encryption.append(obj_)
-        elif nodeName_ == 'Encoding':
-            obj_ = EncodingType.factory()
-            obj_.build(child_)
-            self.Encoding.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Compression(self, child_, node, nodeName_):
+        obj_ = CompressionType.factory()
+        obj_.build(child_)
+        self.Compression.append(obj_)
+    def buildChild_Encryption(self, child_, node, nodeName_):
+        obj_ = EncryptionType.factory()
+        obj_.build(child_)
+        self.Encryption.append(obj_)
+    def buildChild_Encoding(self, child_, node, nodeName_):
+        obj_ = EncodingType.factory()
+        obj_.build(child_)
+        self.Encoding.append(obj_)
 # end class PackagingType
 
 class CompressionType(GeneratedsSuper):
@@ -605,23 +610,25 @@ class ArtifactObjectType(cybox_common.ObjectPropertiesType):
             self.content_type = value
         super(ArtifactObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Packaging':
-            obj_ = PackagingType.factory()
-            obj_.build(child_)
-            self.set_Packaging(obj_)
-        elif nodeName_ == 'Raw_Artifact':
-            obj_ = RawArtifactType.factory()
-            obj_.build(child_)
-            self.set_Raw_Artifact(obj_)
-        elif nodeName_ == 'Raw_Artifact_Reference':
-            Raw_Artifact_Reference_ = child_.text
-            Raw_Artifact_Reference_ = self.gds_validate_string(Raw_Artifact_Reference_, node, 'Raw_Artifact_Reference')
-            self.Raw_Artifact_Reference = Raw_Artifact_Reference_
-        super(ArtifactObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Packaging(self, child_, node, nodeName_):
+        obj_ = PackagingType.factory()
+        obj_.build(child_)
+        self.set_Packaging(obj_)
+    def buildChild_Raw_Artifact(self, child_, node, nodeName_):
+        obj_ = RawArtifactType.factory()
+        obj_.build(child_)
+        self.set_Raw_Artifact(obj_)
+    def buildChild_Raw_Artifact_Reference(self, child_, node, nodeName_):
+        Raw_Artifact_Reference_ = child_.text
+        Raw_Artifact_Reference_ = self.gds_validate_string(Raw_Artifact_Reference_, node, 'Raw_Artifact_Reference')
+        self.Raw_Artifact_Reference = Raw_Artifact_Reference_
 # end class ArtifactObjectType
 
 GDSClassesMapping = {
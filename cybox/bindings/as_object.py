@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -94,23 +96,25 @@ class ASObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(ASObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Number':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Handle':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Handle(obj_)
-        elif nodeName_ == 'Regional_Internet_Registry':
-            obj_ = cybox_common.RegionalRegistryType.factory()
-            obj_.build(child_)
-            self.set_Regional_Internet_Registry(obj_)
-        super(ASObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Handle(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Handle(obj_)
+    def buildChild_Regional_Internet_Registry(self, child_, node, nodeName_):
+        obj_ = cybox_common.RegionalRegistryType.factory()
+        obj_.build(child_)
+        self.set_Regional_Internet_Registry(obj_)
 # end class ASObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -143,10 +145,13 @@ class TargetedPlatformsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Targeted_Platform':
-            obj_ = cybox_common.PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.Targeted_Platform.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Targeted_Platform(self, child_, node, nodeName_):
+        obj_ = cybox_common.PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.Targeted_Platform.append(obj_)
 # end class TargetedPlatformsType
 
 class ProcessorTypeType(cybox_common.BaseObjectPropertyType):
@@ -594,55 +599,57 @@ class CodeObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(CodeObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = CodeTypeType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Purpose':
-            obj_ = CodePurposeType.factory()
-            obj_.build(child_)
-            self.set_Purpose(obj_)
-        elif nodeName_ == 'Code_Language':
-            obj_ = CodeLanguageType.factory()
-            obj_.build(child_)
-            self.set_Code_Language(obj_)
-        elif nodeName_ == 'Targeted_Platforms':
-            obj_ = TargetedPlatformsType.factory()
-            obj_.build(child_)
-            self.set_Targeted_Platforms(obj_)
-        elif nodeName_ == 'Processor_Family':
-            obj_ = ProcessorTypeType.factory()
-            obj_.build(child_)
-            self.Processor_Family.append(obj_)
-        elif nodeName_ == 'Discovery_Method':
-            obj_ = cybox_common.MeasureSourceType.factory()
-            obj_.build(child_)
-            self.set_Discovery_Method(obj_)
-        elif nodeName_ == 'Start_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Start_Address(obj_)
-        elif nodeName_ == 'Code_Segment':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Code_Segment(obj_)
-        elif nodeName_ == 'Code_Segment_XOR':
-            obj_ = CodeSegmentXORType.factory()
-            obj_.build(child_)
-            self.set_Code_Segment_XOR(obj_)
-        elif nodeName_ == 'Digital_Signatures':
-            obj_ = cybox_common.DigitalSignaturesType.factory()
-            obj_.build(child_)
-            self.set_Digital_Signatures(obj_)
-        elif nodeName_ == 'Extracted_Features':
-            obj_ = cybox_common.ExtractedFeaturesType.factory()
-            obj_.build(child_)
-            self.set_Extracted_Features(obj_)
-        super(CodeObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = CodeTypeType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Purpose(self, child_, node, nodeName_):
+        obj_ = CodePurposeType.factory()
+        obj_.build(child_)
+        self.set_Purpose(obj_)
+    def buildChild_Code_Language(self, child_, node, nodeName_):
+        obj_ = CodeLanguageType.factory()
+        obj_.build(child_)
+        self.set_Code_Language(obj_)
+    def buildChild_Targeted_Platforms(self, child_, node, nodeName_):
+        obj_ = TargetedPlatformsType.factory()
+        obj_.build(child_)
+        self.set_Targeted_Platforms(obj_)
+    def buildChild_Processor_Family(self, child_, node, nodeName_):
+        obj_ = ProcessorTypeType.factory()
+        obj_.build(child_)
+        self.Processor_Family.append(obj_)
+    def buildChild_Discovery_Method(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.set_Discovery_Method(obj_)
+    def buildChild_Start_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Start_Address(obj_)
+    def buildChild_Code_Segment(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Code_Segment(obj_)
+    def buildChild_Code_Segment_XOR(self, child_, node, nodeName_):
+        obj_ = CodeSegmentXORType.factory()
+        obj_.build(child_)
+        self.set_Code_Segment_XOR(obj_)
+    def buildChild_Digital_Signatures(self, child_, node, nodeName_):
+        obj_ = cybox_common.DigitalSignaturesType.factory()
+        obj_.build(child_)
+        self.set_Digital_Signatures(obj_)
+    def buildChild_Extracted_Features(self, child_, node, nodeName_):
+        obj_ = cybox_common.ExtractedFeaturesType.factory()
+        obj_.build(child_)
+        self.set_Extracted_Features(obj_)
 # end class CodeObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -90,11 +92,13 @@ class CustomObjectType(cybox_common.ObjectPropertiesType):
             self.custom_name = value
         super(CustomObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        super(CustomObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
 # end class CustomObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 
 #List delimiter value for lists captured in *ObjectPropertyTypes
 __LIST_DELIMITER__ = "##comma##"
@@ -238,10 +240,13 @@ class LocationType(GeneratedsSuper):
 
             self.id = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            Name_ = child_.text
-            Name_ = self.gds_validate_string(Name_, node, 'Name')
-            self.Name = Name_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        Name_ = child_.text
+        Name_ = self.gds_validate_string(Name_, node, 'Name')
+        self.Name = Name_
 # end class LocationType
 
 class MeasureSourceType(GeneratedsSuper):
@@ -409,108 +414,111 @@ class MeasureSourceType(GeneratedsSuper):
 
             self.name = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Information_Source_Type':
-            obj_ = ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Information_Source_Type(obj_)
-        elif nodeName_ == 'Tool_Type':
-            obj_ = ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Tool_Type(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Contributors':
-            obj_ = PersonnelType.factory()
-            obj_.build(child_)
-            self.set_Contributors(obj_)
-        elif nodeName_ == 'Time':
-            obj_ = TimeType.factory()
-            obj_.build(child_)
-            self.set_Time(obj_)
-        elif nodeName_ == 'Observation_Location':
-            type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-
-                if type_name_ == "CIQAddress3.0InstanceType":
-                    import cybox.bindings.extensions.location.ciq_address_3_0 as ciq_address_binding
-                    obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Information_Source_Type(self, child_, node, nodeName_):
+        obj_ = ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Information_Source_Type(obj_)
+    def buildChild_Tool_Type(self, child_, node, nodeName_):
+        obj_ = ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Tool_Type(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Contributors(self, child_, node, nodeName_):
+        obj_ = PersonnelType.factory()
+        obj_.build(child_)
+        self.set_Contributors(obj_)
+    def buildChild_Time(self, child_, node, nodeName_):
+        obj_ = TimeType.factory()
+        obj_.build(child_)
+        self.set_Time(obj_)
+    def buildChild_Observation_Location(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                obj_ = LocationType.factory()
-
-            obj_.build(child_)
-            self.set_Observation_Location(obj_)
-        elif nodeName_ == 'Tools':
-            obj_ = ToolsInformationType.factory()
-            obj_.build(child_)
-            self.set_Tools(obj_)
-        elif nodeName_ == 'Platform':
-            obj_ = PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Platform(obj_)
-        elif nodeName_ == 'System':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+                type_name_ = type_names_[1]
+
+            if type_name_ == "CIQAddress3.0InstanceType":
+                import cybox.bindings.extensions.location.ciq_address_3_0 as ciq_address_binding
+                obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        else:
+            obj_ = LocationType.factory()
+
+        obj_.build(child_)
+        self.set_Observation_Location(obj_)
+    def buildChild_Tools(self, child_, node, nodeName_):
+        obj_ = ToolsInformationType.factory()
+        obj_.build(child_)
+        self.set_Tools(obj_)
+    def buildChild_Platform(self, child_, node, nodeName_):
+        obj_ = PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Platform(obj_)
+    def buildChild_System(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <System> element')
-            self.set_System(obj_)
-        elif nodeName_ == 'Instance':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <System> element')
+        self.set_System(obj_)
+    def buildChild_Instance(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Instance> element')
-            self.set_Instance(obj_)
-        elif nodeName_ == 'Observable_Location':
-            type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-
-                if type_name_ == "CIQAddress3.0InstanceType":
-                    import cybox.bindings.extensions.location.ciq_address_3_0 as ciq_address_binding
-                    obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Instance> element')
+        self.set_Instance(obj_)
+    def buildChild_Observable_Location(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                obj_ = LocationType.factory()
+                type_name_ = type_names_[1]
 
-            obj_.build(child_)
-            self.set_Observable_Location(obj_)
+            if type_name_ == "CIQAddress3.0InstanceType":
+                import cybox.bindings.extensions.location.ciq_address_3_0 as ciq_address_binding
+                obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        else:
+            obj_ = LocationType.factory()
+
+        obj_.build(child_)
+        self.set_Observable_Location(obj_)
 # end class MeasureSourceType
 
 class ContributorType(GeneratedsSuper):
@@ -613,34 +621,37 @@ class ContributorType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Role':
-            Role_ = child_.text
-            Role_ = self.gds_validate_string(Role_, node, 'Role')
-            self.Role = Role_
-        elif nodeName_ == 'Name':
-            Name_ = child_.text
-            Name_ = self.gds_validate_string(Name_, node, 'Name')
-            self.Name = Name_
-        elif nodeName_ == 'Email':
-            Email_ = child_.text
-            Email_ = self.gds_validate_string(Email_, node, 'Email')
-            self.Email = Email_
-        elif nodeName_ == 'Phone':
-            Phone_ = child_.text
-            Phone_ = self.gds_validate_string(Phone_, node, 'Phone')
-            self.Phone = Phone_
-        elif nodeName_ == 'Organization':
-            Organization_ = child_.text
-            Organization_ = self.gds_validate_string(Organization_, node, 'Organization')
-            self.Organization = Organization_
-        elif nodeName_ == 'Date':
-            obj_ = DateRangeType.factory()
-            obj_.build(child_)
-            self.set_Date(obj_)
-        elif nodeName_ == 'Contribution_Location':
-            Contribution_Location_ = child_.text
-            Contribution_Location_ = self.gds_validate_string(Contribution_Location_, node, 'Contribution_Location')
-            self.Contribution_Location = Contribution_Location_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Role(self, child_, node, nodeName_):
+        Role_ = child_.text
+        Role_ = self.gds_validate_string(Role_, node, 'Role')
+        self.Role = Role_
+    def buildChild_Name(self, child_, node, nodeName_):
+        Name_ = child_.text
+        Name_ = self.gds_validate_string(Name_, node, 'Name')
+        self.Name = Name_
+    def buildChild_Email(self, child_, node, nodeName_):
+        Email_ = child_.text
+        Email_ = self.gds_validate_string(Email_, node, 'Email')
+        self.Email = Email_
+    def buildChild_Phone(self, child_, node, nodeName_):
+        Phone_ = child_.text
+        Phone_ = self.gds_validate_string(Phone_, node, 'Phone')
+        self.Phone = Phone_
+    def buildChild_Organization(self, child_, node, nodeName_):
+        Organization_ = child_.text
+        Organization_ = self.gds_validate_string(Organization_, node, 'Organization')
+        self.Organization = Organization_
+    def buildChild_Date(self, child_, node, nodeName_):
+        obj_ = DateRangeType.factory()
+        obj_.build(child_)
+        self.set_Date(obj_)
+    def buildChild_Contribution_Location(self, child_, node, nodeName_):
+        Contribution_Location_ = child_.text
+        Contribution_Location_ = self.gds_validate_string(Contribution_Location_, node, 'Contribution_Location')
+        self.Contribution_Location = Contribution_Location_
 # end class ContributorType
 
 class DateRangeType(GeneratedsSuper):
@@ -705,14 +716,17 @@ class DateRangeType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Start_Date':
-            obj_ = DateWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_Start_Date(obj_)
-        elif nodeName_ == 'End_Date':
-            obj_ = DateWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_End_Date(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Start_Date(self, child_, node, nodeName_):
+        obj_ = DateWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Start_Date(obj_)
+    def buildChild_End_Date(self, child_, node, nodeName_):
+        obj_ = DateWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_End_Date(obj_)
 # end class DateRangeType
 
 class PersonnelType(GeneratedsSuper):
@@ -778,10 +792,13 @@ class PersonnelType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Contributor':
-            obj_ = ContributorType.factory()
-            obj_.build(child_)
-            self.Contributor.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Contributor(self, child_, node, nodeName_):
+        obj_ = ContributorType.factory()
+        obj_.build(child_)
+        self.Contributor.append(obj_)
 # end class PersonnelType
 
 class TimeType(GeneratedsSuper):
@@ -858,22 +875,25 @@ class TimeType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Start_Time':
-            obj_ = DateTimeWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_Start_Time(obj_)
-        elif nodeName_ == 'End_Time':
-            obj_ = DateTimeWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_End_Time(obj_)
-        elif nodeName_ == 'Produced_Time':
-            obj_ = DateTimeWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_Produced_Time(obj_)
-        elif nodeName_ == 'Received_Time':
-            obj_ = DateTimeWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_Received_Time(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Start_Time(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Start_Time(obj_)
+    def buildChild_End_Time(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_End_Time(obj_)
+    def buildChild_Produced_Time(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Produced_Time(obj_)
+    def buildChild_Received_Time(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Received_Time(obj_)
 # end class TimeType
 
 class ToolSpecificDataType(GeneratedsSuper):
@@ -994,10 +1014,13 @@ class ToolsInformationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Tool':
-            obj_ = ToolInformationType.factory()
-            obj_.build(child_)
-            self.Tool.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Tool(self, child_, node, nodeName_):
+        obj_ = ToolInformationType.factory()
+        obj_.build(child_)
+        self.Tool.append(obj_)
 # end class ToolsInformationType
 
 class ToolInformationType(GeneratedsSuper):
@@ -1170,76 +1193,79 @@ class ToolInformationType(GeneratedsSuper):
 
             self.id = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            Name_ = child_.text
-            Name_ = self.gds_validate_string(Name_, node, 'Name')
-            self.Name = Name_
-        elif nodeName_ == 'Type':
-            obj_ = ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.Type.append(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'References':
-            obj_ = ToolReferencesType.factory()
-            obj_.build(child_)
-            self.set_References(obj_)
-        elif nodeName_ == 'Vendor':
-            Vendor_ = child_.text
-            Vendor_ = self.gds_validate_string(Vendor_, node, 'Vendor')
-            self.Vendor = Vendor_
-        elif nodeName_ == 'Version':
-            Version_ = child_.text
-            Version_ = self.gds_validate_string(Version_, node, 'Version')
-            self.Version = Version_
-        elif nodeName_ == 'Service_Pack':
-            Service_Pack_ = child_.text
-            Service_Pack_ = self.gds_validate_string(Service_Pack_, node, 'Service_Pack')
-            self.Service_Pack = Service_Pack_
-        elif nodeName_ == 'Tool_Specific_Data':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        Name_ = child_.text
+        Name_ = self.gds_validate_string(Name_, node, 'Name')
+        self.Name = Name_
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.Type.append(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_References(self, child_, node, nodeName_):
+        obj_ = ToolReferencesType.factory()
+        obj_.build(child_)
+        self.set_References(obj_)
+    def buildChild_Vendor(self, child_, node, nodeName_):
+        Vendor_ = child_.text
+        Vendor_ = self.gds_validate_string(Vendor_, node, 'Vendor')
+        self.Vendor = Vendor_
+    def buildChild_Version(self, child_, node, nodeName_):
+        Version_ = child_.text
+        Version_ = self.gds_validate_string(Version_, node, 'Version')
+        self.Version = Version_
+    def buildChild_Service_Pack(self, child_, node, nodeName_):
+        Service_Pack_ = child_.text
+        Service_Pack_ = self.gds_validate_string(Service_Pack_, node, 'Service_Pack')
+        self.Service_Pack = Service_Pack_
+    def buildChild_Tool_Specific_Data(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Tool_Specific_Data> element')
-            self.set_Tool_Specific_Data(obj_)
-        elif nodeName_ == 'Tool_Hashes':
-            obj_ = HashListType.factory()
-            obj_.build(child_)
-            self.set_Tool_Hashes(obj_)
-        elif nodeName_ == 'Tool_Configuration':
-            obj_ = ToolConfigurationType.factory()
-            obj_.build(child_)
-            self.set_Tool_Configuration(obj_)
-        elif nodeName_ == 'Execution_Environment':
-            obj_ = ExecutionEnvironmentType.factory()
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Execution_Environment(obj_)
-        elif nodeName_ == 'Errors':
-            obj_ = ErrorsType.factory()
-            obj_.build(child_)
-            self.set_Errors(obj_)
-        elif nodeName_ == 'Metadata':
-            obj_ = MetadataType.factory()
-            obj_.build(child_)
-            self.Metadata.append(obj_)
-        elif nodeName_ == 'Compensation_Model':
-            obj_ = CompensationModelType.factory()
-            obj_.build(child_)
-            self.set_Compensation_Model(obj_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Tool_Specific_Data> element')
+        self.set_Tool_Specific_Data(obj_)
+    def buildChild_Tool_Hashes(self, child_, node, nodeName_):
+        obj_ = HashListType.factory()
+        obj_.build(child_)
+        self.set_Tool_Hashes(obj_)
+    def buildChild_Tool_Configuration(self, child_, node, nodeName_):
+        obj_ = ToolConfigurationType.factory()
+        obj_.build(child_)
+        self.set_Tool_Configuration(obj_)
+    def buildChild_Execution_Environment(self, child_, node, nodeName_):
+        obj_ = ExecutionEnvironmentType.factory()
+        obj_.build(child_)
+        self.set_Execution_Environment(obj_)
+    def buildChild_Errors(self, child_, node, nodeName_):
+        obj_ = ErrorsType.factory()
+        obj_.build(child_)
+        self.set_Errors(obj_)
+    def buildChild_Metadata(self, child_, node, nodeName_):
+        obj_ = MetadataType.factory()
+        obj_.build(child_)
+        self.Metadata.append(obj_)
+    def buildChild_Compensation_Model(self, child_, node, nodeName_):
+        obj_ = CompensationModelType.factory()
+        obj_.build(child_)
+        self.set_Compensation_Model(obj_)
 # end class ToolInformationType
 
 class ToolReferencesType(GeneratedsSuper):
@@ -1305,10 +1331,13 @@ class ToolReferencesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Reference':
-            obj_ = ToolReferenceType.factory()
-            obj_.build(child_)
-            self.Reference.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Reference(self, child_, node, nodeName_):
+        obj_ = ToolReferenceType.factory()
+        obj_.build(child_)
+        self.Reference.append(obj_)
 # end class ToolReferencesType
 
 class ToolReferenceType(GeneratedsSuper):
@@ -1458,26 +1487,29 @@ class ToolConfigurationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Configuration_Settings':
-            obj_ = ConfigurationSettingsType.factory()
-            obj_.build(child_)
-            self.set_Configuration_Settings(obj_)
-        elif nodeName_ == 'Dependencies':
-            obj_ = DependenciesType.factory()
-            obj_.build(child_)
-            self.set_Dependencies(obj_)
-        elif nodeName_ == 'Usage_Context_Assumptions':
-            obj_ = UsageContextAssumptionsType.factory()
-            obj_.build(child_)
-            self.set_Usage_Context_Assumptions(obj_)
-        elif nodeName_ == 'Internationalization_Settings':
-            obj_ = InternationalizationSettingsType.factory()
-            obj_.build(child_)
-            self.set_Internationalization_Settings(obj_)
-        elif nodeName_ == 'Build_Information':
-            obj_ = BuildInformationType.factory()
-            obj_.build(child_)
-            self.set_Build_Information(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Configuration_Settings(self, child_, node, nodeName_):
+        obj_ = ConfigurationSettingsType.factory()
+        obj_.build(child_)
+        self.set_Configuration_Settings(obj_)
+    def buildChild_Dependencies(self, child_, node, nodeName_):
+        obj_ = DependenciesType.factory()
+        obj_.build(child_)
+        self.set_Dependencies(obj_)
+    def buildChild_Usage_Context_Assumptions(self, child_, node, nodeName_):
+        obj_ = UsageContextAssumptionsType.factory()
+        obj_.build(child_)
+        self.set_Usage_Context_Assumptions(obj_)
+    def buildChild_Internationalization_Settings(self, child_, node, nodeName_):
+        obj_ = InternationalizationSettingsType.factory()
+        obj_.build(child_)
+        self.set_Internationalization_Settings(obj_)
+    def buildChild_Build_Information(self, child_, node, nodeName_):
+        obj_ = BuildInformationType.factory()
+        obj_.build(child_)
+        self.set_Build_Information(obj_)
 # end class ToolConfigurationType
 
 class ConfigurationSettingsType(GeneratedsSuper):
@@ -1544,10 +1576,13 @@ class ConfigurationSettingsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Configuration_Setting':
-            obj_ = ConfigurationSettingType.factory()
-            obj_.build(child_)
-            self.Configuration_Setting.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Configuration_Setting(self, child_, node, nodeName_):
+        obj_ = ConfigurationSettingType.factory()
+        obj_.build(child_)
+        self.Configuration_Setting.append(obj_)
 # end class ConfigurationSettingsType
 
 class ConfigurationSettingType(GeneratedsSuper):
@@ -1632,22 +1667,25 @@ class ConfigurationSettingType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Item_Name':
-            Item_Name_ = child_.text
-            Item_Name_ = self.gds_validate_string(Item_Name_, node, 'Item_Name')
-            self.Item_Name = Item_Name_
-        elif nodeName_ == 'Item_Value':
-            Item_Value_ = child_.text
-            Item_Value_ = self.gds_validate_string(Item_Value_, node, 'Item_Value')
-            self.Item_Value = Item_Value_
-        elif nodeName_ == 'Item_Type':
-            Item_Type_ = child_.text
-            Item_Type_ = self.gds_validate_string(Item_Type_, node, 'Item_Type')
-            self.Item_Type = Item_Type_
-        elif nodeName_ == 'Item_Description':
-            Item_Description_ = child_.text
-            Item_Description_ = self.gds_validate_string(Item_Description_, node, 'Item_Description')
-            self.Item_Description = Item_Description_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Item_Name(self, child_, node, nodeName_):
+        Item_Name_ = child_.text
+        Item_Name_ = self.gds_validate_string(Item_Name_, node, 'Item_Name')
+        self.Item_Name = Item_Name_
+    def buildChild_Item_Value(self, child_, node, nodeName_):
+        Item_Value_ = child_.text
+        Item_Value_ = self.gds_validate_string(Item_Value_, node, 'Item_Value')
+        self.Item_Value = Item_Value_
+    def buildChild_Item_Type(self, child_, node, nodeName_):
+        Item_Type_ = child_.text
+        Item_Type_ = self.gds_validate_string(Item_Type_, node, 'Item_Type')
+        self.Item_Type = Item_Type_
+    def buildChild_Item_Description(self, child_, node, nodeName_):
+        Item_Description_ = child_.text
+        Item_Description_ = self.gds_validate_string(Item_Description_, node, 'Item_Description')
+        self.Item_Description = Item_Description_
 # end class ConfigurationSettingType
 
 class DependenciesType(GeneratedsSuper):
@@ -1713,10 +1751,13 @@ class DependenciesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Dependency':
-            obj_ = DependencyType.factory()
-            obj_.build(child_)
-            self.Dependency.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Dependency(self, child_, node, nodeName_):
+        obj_ = DependencyType.factory()
+        obj_.build(child_)
+        self.Dependency.append(obj_)
 # end class DependenciesType
 
 class DependencyType(GeneratedsSuper):
@@ -1784,14 +1825,17 @@ class DependencyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Dependency_Type':
-            Dependency_Type_ = child_.text
-            Dependency_Type_ = self.gds_validate_string(Dependency_Type_, node, 'Dependency_Type')
-            self.Dependency_Type = Dependency_Type_
-        elif nodeName_ == 'Dependency_Description':
-            obj_ = StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Dependency_Description(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Dependency_Type(self, child_, node, nodeName_):
+        Dependency_Type_ = child_.text
+        Dependency_Type_ = self.gds_validate_string(Dependency_Type_, node, 'Dependency_Type')
+        self.Dependency_Type = Dependency_Type_
+    def buildChild_Dependency_Description(self, child_, node, nodeName_):
+        obj_ = StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Dependency_Description(obj_)
 # end class DependencyType
 
 class UsageContextAssumptionsType(GeneratedsSuper):
@@ -1857,10 +1901,13 @@ class UsageContextAssumptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Usage_Context_Assumption':
-            obj_ = StructuredTextType.factory()
-            obj_.build(child_)
-            self.Usage_Context_Assumption.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Usage_Context_Assumption(self, child_, node, nodeName_):
+        obj_ = StructuredTextType.factory()
+        obj_.build(child_)
+        self.Usage_Context_Assumption.append(obj_)
 # end class UsageContextAssumptionsType
 
 class InternationalizationSettingsType(GeneratedsSuper):
@@ -1926,10 +1973,13 @@ class InternationalizationSettingsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Internal_Strings':
-            obj_ = InternalStringsType.factory()
-            obj_.build(child_)
-            self.Internal_Strings.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Internal_Strings(self, child_, node, nodeName_):
+        obj_ = InternalStringsType.factory()
+        obj_.build(child_)
+        self.Internal_Strings.append(obj_)
 # end class InternationalizationSettingsType
 
 class InternalStringsType(GeneratedsSuper):
@@ -1998,14 +2048,17 @@ class InternalStringsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Key':
-            Key_ = child_.text
-            Key_ = self.gds_validate_string(Key_, node, 'Key')
-            self.Key = Key_
-        elif nodeName_ == 'Content':
-            Content_ = child_.text
-            Content_ = self.gds_validate_string(Content_, node, 'Content')
-            self.Content = Content_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Key(self, child_, node, nodeName_):
+        Key_ = child_.text
+        Key_ = self.gds_validate_string(Key_, node, 'Key')
+        self.Key = Key_
+    def buildChild_Content(self, child_, node, nodeName_):
+        Content_ = child_.text
+        Content_ = self.gds_validate_string(Content_, node, 'Content')
+        self.Content = Content_
 # end class InternalStringsType
 
 class BuildInformationType(GeneratedsSuper):
@@ -2131,50 +2184,53 @@ class BuildInformationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Build_ID':
-            Build_ID_ = child_.text
-            Build_ID_ = self.gds_validate_string(Build_ID_, node, 'Build_ID')
-            self.Build_ID = Build_ID_
-        elif nodeName_ == 'Build_Project':
-            Build_Project_ = child_.text
-            Build_Project_ = self.gds_validate_string(Build_Project_, node, 'Build_Project')
-            self.Build_Project = Build_Project_
-        elif nodeName_ == 'Build_Utility':
-            obj_ = BuildUtilityType.factory()
-            obj_.build(child_)
-            self.set_Build_Utility(obj_)
-        elif nodeName_ == 'Build_Version':
-            Build_Version_ = child_.text
-            Build_Version_ = self.gds_validate_string(Build_Version_, node, 'Build_Version')
-            self.Build_Version = Build_Version_
-        elif nodeName_ == 'Build_Label':
-            Build_Label_ = child_.text
-            Build_Label_ = self.gds_validate_string(Build_Label_, node, 'Build_Label')
-            self.Build_Label = Build_Label_
-        elif nodeName_ == 'Compilers':
-            obj_ = CompilersType.factory()
-            obj_.build(child_)
-            self.set_Compilers(obj_)
-        elif nodeName_ == 'Compilation_Date':
-            obj_ = DateTimeWithPrecisionType.factory()
-            obj_.build(child_)
-            self.set_Compilation_Date(obj_)
-        elif nodeName_ == 'Build_Configuration':
-            obj_ = BuildConfigurationType.factory()
-            obj_.build(child_)
-            self.set_Build_Configuration(obj_)
-        elif nodeName_ == 'Build_Script':
-            Build_Script_ = child_.text
-            Build_Script_ = self.gds_validate_string(Build_Script_, node, 'Build_Script')
-            self.Build_Script = Build_Script_
-        elif nodeName_ == 'Libraries':
-            obj_ = LibrariesType.factory()
-            obj_.build(child_)
-            self.set_Libraries(obj_)
-        elif nodeName_ == 'Build_Output_Log':
-            Build_Output_Log_ = child_.text
-            Build_Output_Log_ = self.gds_validate_string(Build_Output_Log_, node, 'Build_Output_Log')
-            self.Build_Output_Log = Build_Output_Log_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Build_ID(self, child_, node, nodeName_):
+        Build_ID_ = child_.text
+        Build_ID_ = self.gds_validate_string(Build_ID_, node, 'Build_ID')
+        self.Build_ID = Build_ID_
+    def buildChild_Build_Project(self, child_, node, nodeName_):
+        Build_Project_ = child_.text
+        Build_Project_ = self.gds_validate_string(Build_Project_, node, 'Build_Project')
+        self.Build_Project = Build_Project_
+    def buildChild_Build_Utility(self, child_, node, nodeName_):
+        obj_ = BuildUtilityType.factory()
+        obj_.build(child_)
+        self.set_Build_Utility(obj_)
+    def buildChild_Build_Version(self, child_, node, nodeName_):
+        Build_Version_ = child_.text
+        Build_Version_ = self.gds_validate_string(Build_Version_, node, 'Build_Version')
+        self.Build_Version = Build_Version_
+    def buildChild_Build_Label(self, child_, node, nodeName_):
+        Build_Label_ = child_.text
+        Build_Label_ = self.gds_validate_string(Build_Label_, node, 'Build_Label')
+        self.Build_Label = Build_Label_
+    def buildChild_Compilers(self, child_, node, nodeName_):
+        obj_ = CompilersType.factory()
+        obj_.build(child_)
+        self.set_Compilers(obj_)
+    def buildChild_Compilation_Date(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Compilation_Date(obj_)
+    def buildChild_Build_Configuration(self, child_, node, nodeName_):
+        obj_ = BuildConfigurationType.factory()
+        obj_.build(child_)
+        self.set_Build_Configuration(obj_)
+    def buildChild_Build_Script(self, child_, node, nodeName_):
+        Build_Script_ = child_.text
+        Build_Script_ = self.gds_validate_string(Build_Script_, node, 'Build_Script')
+        self.Build_Script = Build_Script_
+    def buildChild_Libraries(self, child_, node, nodeName_):
+        obj_ = LibrariesType.factory()
+        obj_.build(child_)
+        self.set_Libraries(obj_)
+    def buildChild_Build_Output_Log(self, child_, node, nodeName_):
+        Build_Output_Log_ = child_.text
+        Build_Output_Log_ = self.gds_validate_string(Build_Output_Log_, node, 'Build_Output_Log')
+        self.Build_Output_Log = Build_Output_Log_
 # end class BuildInformationType
 
 class BuildUtilityType(GeneratedsSuper):
@@ -2242,14 +2298,17 @@ class BuildUtilityType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Build_Utility_Name':
-            Build_Utility_Name_ = child_.text
-            Build_Utility_Name_ = self.gds_validate_string(Build_Utility_Name_, node, 'Build_Utility_Name')
-            self.Build_Utility_Name = Build_Utility_Name_
-        elif nodeName_ == 'Build_Utility_Platform_Specification':
-            obj_ = PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Build_Utility_Platform_Specification(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Build_Utility_Name(self, child_, node, nodeName_):
+        Build_Utility_Name_ = child_.text
+        Build_Utility_Name_ = self.gds_validate_string(Build_Utility_Name_, node, 'Build_Utility_Name')
+        self.Build_Utility_Name = Build_Utility_Name_
+    def buildChild_Build_Utility_Platform_Specification(self, child_, node, nodeName_):
+        obj_ = PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Build_Utility_Platform_Specification(obj_)
 # end class BuildUtilityType
 
 class CompilersType(GeneratedsSuper):
@@ -2315,10 +2374,13 @@ class CompilersType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Compiler':
-            obj_ = CompilerType.factory()
-            obj_.build(child_)
-            self.Compiler.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Compiler(self, child_, node, nodeName_):
+        obj_ = CompilerType.factory()
+        obj_.build(child_)
+        self.Compiler.append(obj_)
 # end class CompilersType
 
 class CompilerType(GeneratedsSuper):
@@ -2385,14 +2447,17 @@ class CompilerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Compiler_Informal_Description':
-            obj_ = CompilerInformalDescriptionType.factory()
-            obj_.build(child_)
-            self.set_Compiler_Informal_Description(obj_)
-        elif nodeName_ == 'Compiler_Platform_Specification':
-            obj_ = PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Compiler_Platform_Specification(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Compiler_Informal_Description(self, child_, node, nodeName_):
+        obj_ = CompilerInformalDescriptionType.factory()
+        obj_.build(child_)
+        self.set_Compiler_Informal_Description(obj_)
+    def buildChild_Compiler_Platform_Specification(self, child_, node, nodeName_):
+        obj_ = PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Compiler_Platform_Specification(obj_)
 # end class CompilerType
 
 class CompilerInformalDescriptionType(GeneratedsSuper):
@@ -2461,14 +2526,17 @@ class CompilerInformalDescriptionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Compiler_Name':
-            Compiler_Name_ = child_.text
-            Compiler_Name_ = self.gds_validate_string(Compiler_Name_, node, 'Compiler_Name')
-            self.Compiler_Name = Compiler_Name_
-        elif nodeName_ == 'Compiler_Version':
-            Compiler_Version_ = child_.text
-            Compiler_Version_ = self.gds_validate_string(Compiler_Version_, node, 'Compiler_Version')
-            self.Compiler_Version = Compiler_Version_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Compiler_Name(self, child_, node, nodeName_):
+        Compiler_Name_ = child_.text
+        Compiler_Name_ = self.gds_validate_string(Compiler_Name_, node, 'Compiler_Name')
+        self.Compiler_Name = Compiler_Name_
+    def buildChild_Compiler_Version(self, child_, node, nodeName_):
+        Compiler_Version_ = child_.text
+        Compiler_Version_ = self.gds_validate_string(Compiler_Version_, node, 'Compiler_Version')
+        self.Compiler_Version = Compiler_Version_
 # end class CompilerInformalDescriptionType
 
 class BuildConfigurationType(GeneratedsSuper):
@@ -2536,14 +2604,17 @@ class BuildConfigurationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Configuration_Setting_Description':
-            Configuration_Setting_Description_ = child_.text
-            Configuration_Setting_Description_ = self.gds_validate_string(Configuration_Setting_Description_, node, 'Configuration_Setting_Description')
-            self.Configuration_Setting_Description = Configuration_Setting_Description_
-        elif nodeName_ == 'Configuration_Settings':
-            obj_ = ConfigurationSettingsType.factory()
-            obj_.build(child_)
-            self.set_Configuration_Settings(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Configuration_Setting_Description(self, child_, node, nodeName_):
+        Configuration_Setting_Description_ = child_.text
+        Configuration_Setting_Description_ = self.gds_validate_string(Configuration_Setting_Description_, node, 'Configuration_Setting_Description')
+        self.Configuration_Setting_Description = Configuration_Setting_Description_
+    def buildChild_Configuration_Settings(self, child_, node, nodeName_):
+        obj_ = ConfigurationSettingsType.factory()
+        obj_.build(child_)
+        self.set_Configuration_Settings(obj_)
 # end class BuildConfigurationType
 
 class LibrariesType(GeneratedsSuper):
@@ -2604,10 +2675,13 @@ class LibrariesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Library':
-            obj_ = LibraryType.factory()
-            obj_.build(child_)
-            self.set_Library(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Library(self, child_, node, nodeName_):
+        obj_ = LibraryType.factory()
+        obj_.build(child_)
+        self.set_Library(obj_)
 # end class LibrariesType
 
 class LibraryType(GeneratedsSuper):
@@ -2758,50 +2832,53 @@ class ExecutionEnvironmentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'System':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_System(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <System> element')
-            self.set_System(obj_)
-        elif nodeName_ == 'User_Account_Info':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <System> element')
+        self.set_System(obj_)
+    def buildChild_User_Account_Info(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <User_Account_Info> element')
-            self.set_User_Account_Info(obj_)
-        elif nodeName_ == 'Command_Line':
-            Command_Line_ = child_.text
-            Command_Line_ = self.gds_validate_string(Command_Line_, node, 'Command_Line')
-            self.Command_Line = Command_Line_
-        elif nodeName_ == 'Start_Time':
-            obj_ = DateTimeWithPrecisionType.factory()
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Start_Time(obj_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <User_Account_Info> element')
+        self.set_User_Account_Info(obj_)
+    def buildChild_Command_Line(self, child_, node, nodeName_):
+        Command_Line_ = child_.text
+        Command_Line_ = self.gds_validate_string(Command_Line_, node, 'Command_Line')
+        self.Command_Line = Command_Line_
+    def buildChild_Start_Time(self, child_, node, nodeName_):
+        obj_ = DateTimeWithPrecisionType.factory()
+        obj_.build(child_)
+        self.set_Start_Time(obj_)
 # end class ExecutionEnvironmentType
 
 class ErrorsType(GeneratedsSuper):
@@ -2867,10 +2944,13 @@ class ErrorsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Error':
-            obj_ = ErrorType.factory()
-            obj_.build(child_)
-            self.Error.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Error(self, child_, node, nodeName_):
+        obj_ = ErrorType.factory()
+        obj_.build(child_)
+        self.Error.append(obj_)
 # end class ErrorsType
 
 class ErrorType(GeneratedsSuper):
@@ -2945,22 +3025,25 @@ class ErrorType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Error_Type':
-            Error_Type_ = child_.text
-            Error_Type_ = self.gds_validate_string(Error_Type_, node, 'Error_Type')
-            self.Error_Type = Error_Type_
-        elif nodeName_ == 'Error_Count':
-            sval_ = child_.text
-            try:
-                ival_ = int(sval_)
-            except (TypeError, ValueError) as exp:
-                raise_parse_error(child_, 'requires integer: %s' % exp)
-            ival_ = self.gds_validate_integer(ival_, node, 'Error_Count')
-            self.Error_Count = ival_
-        elif nodeName_ == 'Error_Instances':
-            obj_ = ErrorInstancesType.factory()
-            obj_.build(child_)
-            self.set_Error_Instances(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Error_Type(self, child_, node, nodeName_):
+        Error_Type_ = child_.text
+        Error_Type_ = self.gds_validate_string(Error_Type_, node, 'Error_Type')
+        self.Error_Type = Error_Type_
+    def buildChild_Error_Count(self, child_, node, nodeName_):
+        sval_ = child_.text
+        try:
+            ival_ = int(sval_)
+        except (TypeError, ValueError) as exp:
+            raise_parse_error(child_, 'requires integer: %s' % exp)
+        ival_ = self.gds_validate_integer(ival_, node, 'Error_Count')
+        self.Error_Count = ival_
+    def buildChild_Error_Instances(self, child_, node, nodeName_):
+        obj_ = ErrorInstancesType.factory()
+        obj_.build(child_)
+        self.set_Error_Instances(obj_)
 # end class ErrorType
 
 class ErrorInstancesType(GeneratedsSuper):
@@ -3027,10 +3110,13 @@ class ErrorInstancesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Error_Instance':
-            Error_Instance_ = child_.text
-            Error_Instance_ = self.gds_validate_string(Error_Instance_, node, 'Error_Instance')
-            self.Error_Instance.append(Error_Instance_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Error_Instance(self, child_, node, nodeName_):
+        Error_Instance_ = child_.text
+        Error_Instance_ = self.gds_validate_string(Error_Instance_, node, 'Error_Instance')
+        self.Error_Instance.append(Error_Instance_)
 # end class ErrorInstancesType
 
 class ObjectPropertiesType(GeneratedsSuper):
@@ -3129,10 +3215,13 @@ class ObjectPropertiesType(GeneratedsSuper):
 
             self.xsi_type = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Custom_Properties':
-            obj_ = CustomPropertiesType.factory()
-            obj_.build(child_)
-            self.set_Custom_Properties(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Custom_Properties(self, child_, node, nodeName_):
+        obj_ = CustomPropertiesType.factory()
+        obj_.build(child_)
+        self.set_Custom_Properties(obj_)
 # end class ObjectPropertiesType
 
 class CustomPropertiesType(GeneratedsSuper):
@@ -3199,10 +3288,13 @@ class CustomPropertiesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Property':
-            obj_ = PropertyType.factory()
-            obj_.build(child_)
-            self.Property.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Property(self, child_, node, nodeName_):
+        obj_ = PropertyType.factory()
+        obj_.build(child_)
+        self.Property.append(obj_)
 # end class CustomPropertiesType
 
 class BaseObjectPropertyType(GeneratedsSuper):
@@ -5190,22 +5282,25 @@ class ExtractedFeaturesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Strings':
-            obj_ = ExtractedStringsType.factory()
-            obj_.build(child_)
-            self.set_Strings(obj_)
-        elif nodeName_ == 'Imports':
-            obj_ = ImportsType.factory()
-            obj_.build(child_)
-            self.set_Imports(obj_)
-        elif nodeName_ == 'Functions':
-            obj_ = FunctionsType.factory()
-            obj_.build(child_)
-            self.set_Functions(obj_)
-        elif nodeName_ == 'Code_Snippets':
-            obj_ = CodeSnippetsType.factory()
-            obj_.build(child_)
-            self.set_Code_Snippets(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Strings(self, child_, node, nodeName_):
+        obj_ = ExtractedStringsType.factory()
+        obj_.build(child_)
+        self.set_Strings(obj_)
+    def buildChild_Imports(self, child_, node, nodeName_):
+        obj_ = ImportsType.factory()
+        obj_.build(child_)
+        self.set_Imports(obj_)
+    def buildChild_Functions(self, child_, node, nodeName_):
+        obj_ = FunctionsType.factory()
+        obj_.build(child_)
+        self.set_Functions(obj_)
+    def buildChild_Code_Snippets(self, child_, node, nodeName_):
+        obj_ = CodeSnippetsType.factory()
+        obj_.build(child_)
+        self.set_Code_Snippets(obj_)
 # end class ExtractedFeaturesType
 
 class ExtractedStringsType(GeneratedsSuper):
@@ -5271,10 +5366,13 @@ class ExtractedStringsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'String':
-            obj_ = ExtractedStringType.factory()
-            obj_.build(child_)
-            self.String.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_String(self, child_, node, nodeName_):
+        obj_ = ExtractedStringType.factory()
+        obj_.build(child_)
+        self.String.append(obj_)
 # end class ExtractedStringsType
 
 class ExtractedStringType(GeneratedsSuper):
@@ -5386,38 +5484,41 @@ class ExtractedStringType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Encoding':
-            obj_ = ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Encoding(obj_)
-        elif nodeName_ == 'String_Value':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_String_Value(obj_)
-        elif nodeName_ == 'Byte_String_Value':
-            obj_ = HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Byte_String_Value(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Address':
-            obj_ = HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Language':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Language(obj_)
-        elif nodeName_ == 'English_Translation':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_English_Translation(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Encoding(self, child_, node, nodeName_):
+        obj_ = ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Encoding(obj_)
+    def buildChild_String_Value(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_String_Value(obj_)
+    def buildChild_Byte_String_Value(self, child_, node, nodeName_):
+        obj_ = HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Byte_String_Value(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Address(self, child_, node, nodeName_):
+        obj_ = HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Language(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Language(obj_)
+    def buildChild_English_Translation(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_English_Translation(obj_)
 # end class ExtractedStringType
 
 class ImportsType(GeneratedsSuper):
@@ -5486,10 +5587,13 @@ class ImportsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Import':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Import.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Import(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Import.append(obj_)
 # end class ImportsType
 
 class FunctionsType(GeneratedsSuper):
@@ -5558,10 +5662,13 @@ class FunctionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Function':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Function.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Function(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Function.append(obj_)
 # end class FunctionsType
 
 class CodeSnippetsType(GeneratedsSuper):
@@ -5627,24 +5734,27 @@ class CodeSnippetsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Code_Snippet':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Code_Snippet(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Code_Snippet> element')
-            self.Code_Snippet.append(obj_)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Code_Snippet> element')
+        self.Code_Snippet.append(obj_)
 # end class CodeSnippetsType
 
 class ByteRunsType(GeneratedsSuper):
@@ -5710,10 +5820,13 @@ class ByteRunsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Byte_Run':
-            obj_ = ByteRunType.factory()
-            obj_.build(child_)
-            self.Byte_Run.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Byte_Run(self, child_, node, nodeName_):
+        obj_ = ByteRunType.factory()
+        obj_.build(child_)
+        self.Byte_Run.append(obj_)
 # end class ByteRunsType
 
 class ByteRunType(GeneratedsSuper):
@@ -5816,34 +5929,37 @@ class ByteRunType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Offset':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset(obj_)
-        elif nodeName_ == 'Byte_Order':
-            obj_ = EndiannessType.factory()
-            obj_.build(child_)
-            self.set_Byte_Order(obj_)
-        elif nodeName_ == 'File_System_Offset':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_System_Offset(obj_)
-        elif nodeName_ == 'Image_Offset':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Offset(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Byte_Run_Data':
-            Byte_Run_Data_ = child_.text
-            Byte_Run_Data_ = self.gds_validate_string(Byte_Run_Data_, node, 'Byte_Run_Data')
-            self.Byte_Run_Data = Byte_Run_Data_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Offset(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset(obj_)
+    def buildChild_Byte_Order(self, child_, node, nodeName_):
+        obj_ = EndiannessType.factory()
+        obj_.build(child_)
+        self.set_Byte_Order(obj_)
+    def buildChild_File_System_Offset(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_System_Offset(obj_)
+    def buildChild_Image_Offset(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Offset(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Byte_Run_Data(self, child_, node, nodeName_):
+        Byte_Run_Data_ = child_.text
+        Byte_Run_Data_ = self.gds_validate_string(Byte_Run_Data_, node, 'Byte_Run_Data')
+        self.Byte_Run_Data = Byte_Run_Data_
 # end class ByteRunType
 
 class HashListType(GeneratedsSuper):
@@ -5909,10 +6025,13 @@ class HashListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hash':
-            obj_ = HashType.factory()
-            obj_.build(child_)
-            self.Hash.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hash(self, child_, node, nodeName_):
+        obj_ = HashType.factory()
+        obj_.build(child_)
+        self.Hash.append(obj_)
 # end class HashListType
 
 class HashValueType(GeneratedsSuper):
@@ -5979,14 +6098,17 @@ class HashValueType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Simple_Hash_Value':
-            obj_ = HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Simple_Hash_Value(obj_)
-        elif nodeName_ == 'Fuzzy_Hash_Value':
-            obj_ = FuzzyHashValueType.factory()
-            obj_.build(child_)
-            self.set_Fuzzy_Hash_Value(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Simple_Hash_Value(self, child_, node, nodeName_):
+        obj_ = HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Simple_Hash_Value(obj_)
+    def buildChild_Fuzzy_Hash_Value(self, child_, node, nodeName_):
+        obj_ = FuzzyHashValueType.factory()
+        obj_.build(child_)
+        self.set_Fuzzy_Hash_Value(obj_)
 # end class HashValueType
 
 class SimpleHashValueType(HexBinaryObjectPropertyType):
@@ -6174,14 +6296,17 @@ class FuzzyHashStructureType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Block_Size':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Block_Size(obj_)
-        elif nodeName_ == 'Block_Hash':
-            obj_ = FuzzyHashBlockType.factory()
-            obj_.build(child_)
-            self.set_Block_Hash(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Block_Size(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Block_Size(obj_)
+    def buildChild_Block_Hash(self, child_, node, nodeName_):
+        obj_ = FuzzyHashBlockType.factory()
+        obj_.build(child_)
+        self.set_Block_Hash(obj_)
 # end class FuzzyHashStructureType
 
 class FuzzyHashBlockType(GeneratedsSuper):
@@ -6258,18 +6383,21 @@ class FuzzyHashBlockType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Block_Hash_Value':
-            obj_ = HashValueType.factory()
-            obj_.build(child_)
-            self.set_Block_Hash_Value(obj_)
-        elif nodeName_ == 'Segment_Count':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Segment_Count(obj_)
-        elif nodeName_ == 'Segments':
-            obj_ = HashSegmentsType.factory()
-            obj_.build(child_)
-            self.set_Segments(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Block_Hash_Value(self, child_, node, nodeName_):
+        obj_ = HashValueType.factory()
+        obj_.build(child_)
+        self.set_Block_Hash_Value(obj_)
+    def buildChild_Segment_Count(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Segment_Count(obj_)
+    def buildChild_Segments(self, child_, node, nodeName_):
+        obj_ = HashSegmentsType.factory()
+        obj_.build(child_)
+        self.set_Segments(obj_)
 # end class FuzzyHashBlockType
 
 class HashSegmentsType(GeneratedsSuper):
@@ -6336,10 +6464,13 @@ class HashSegmentsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Segment':
-            obj_ = HashSegmentType.factory()
-            obj_.build(child_)
-            self.Segment.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Segment(self, child_, node, nodeName_):
+        obj_ = HashSegmentType.factory()
+        obj_.build(child_)
+        self.Segment.append(obj_)
 # end class HashSegmentsType
 
 class HashSegmentType(GeneratedsSuper):
@@ -6417,18 +6548,21 @@ class HashSegmentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Trigger_Point':
-            obj_ = HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Point(obj_)
-        elif nodeName_ == 'Segment_Hash':
-            obj_ = HashValueType.factory()
-            obj_.build(child_)
-            self.set_Segment_Hash(obj_)
-        elif nodeName_ == 'Raw_Segment_Content':
-            Raw_Segment_Content_ = child_.text
-            Raw_Segment_Content_ = self.gds_validate_string(Raw_Segment_Content_, node, 'Raw_Segment_Content')
-            self.Raw_Segment_Content = Raw_Segment_Content_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Trigger_Point(self, child_, node, nodeName_):
+        obj_ = HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Point(obj_)
+    def buildChild_Segment_Hash(self, child_, node, nodeName_):
+        obj_ = HashValueType.factory()
+        obj_.build(child_)
+        self.set_Segment_Hash(obj_)
+    def buildChild_Raw_Segment_Content(self, child_, node, nodeName_):
+        Raw_Segment_Content_ = child_.text
+        Raw_Segment_Content_ = self.gds_validate_string(Raw_Segment_Content_, node, 'Raw_Segment_Content')
+        self.Raw_Segment_Content = Raw_Segment_Content_
 # end class HashSegmentType
 
 class HashType(GeneratedsSuper):
@@ -6511,22 +6645,25 @@ class HashType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Simple_Hash_Value':
-            obj_ = HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Simple_Hash_Value(obj_)
-        elif nodeName_ == 'Fuzzy_Hash_Value':
-            obj_ = FuzzyHashValueType.factory()
-            obj_.build(child_)
-            self.set_Fuzzy_Hash_Value(obj_)
-        elif nodeName_ == 'Fuzzy_Hash_Structure':
-            obj_ = FuzzyHashStructureType.factory()
-            obj_.build(child_)
-            self.Fuzzy_Hash_Structure.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Simple_Hash_Value(self, child_, node, nodeName_):
+        obj_ = HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Simple_Hash_Value(obj_)
+    def buildChild_Fuzzy_Hash_Value(self, child_, node, nodeName_):
+        obj_ = FuzzyHashValueType.factory()
+        obj_.build(child_)
+        self.set_Fuzzy_Hash_Value(obj_)
+    def buildChild_Fuzzy_Hash_Structure(self, child_, node, nodeName_):
+        obj_ = FuzzyHashStructureType.factory()
+        obj_.build(child_)
+        self.Fuzzy_Hash_Structure.append(obj_)
 # end class HashType
 
 class StructuredTextType(GeneratedsSuper):
@@ -6721,34 +6858,37 @@ class DataSegmentType(GeneratedsSuper):
 
             self.id = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Data_Format':
-            Data_Format = child_.text
-            Data_Format = self.gds_validate_string(Data_Format, node, 'Data_Format')
-            self.Data_Format = Data_Format
-        elif nodeName_ == 'Data_Size':
-            obj_ = DataSizeType.factory()
-            obj_.build(child_)
-            self.set_Data_Size(obj_)
-        elif nodeName_ == 'Byte_Order':
-            obj_ = EndiannessType.factory()
-            obj_.build(child_)
-            self.set_Byte_Order(obj_)
-        elif nodeName_ == 'Data_Segment':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data_Segment(obj_)
-        elif nodeName_ == 'Offset':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset(obj_)
-        elif nodeName_ == 'Search_Distance':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Search_Distance(obj_)
-        elif nodeName_ == 'Search_Within':
-            obj_ = IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Search_Within(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Data_Format(self, child_, node, nodeName_):
+        Data_Format = child_.text
+        Data_Format = self.gds_validate_string(Data_Format, node, 'Data_Format')
+        self.Data_Format = Data_Format
+    def buildChild_Data_Size(self, child_, node, nodeName_):
+        obj_ = DataSizeType.factory()
+        obj_.build(child_)
+        self.set_Data_Size(obj_)
+    def buildChild_Byte_Order(self, child_, node, nodeName_):
+        obj_ = EndiannessType.factory()
+        obj_.build(child_)
+        self.set_Byte_Order(obj_)
+    def buildChild_Data_Segment(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data_Segment(obj_)
+    def buildChild_Offset(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset(obj_)
+    def buildChild_Search_Distance(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Search_Distance(obj_)
+    def buildChild_Search_Within(self, child_, node, nodeName_):
+        obj_ = IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Search_Within(obj_)
 # end class DataSegmentType
 
 class DataSizeType(StringObjectPropertyType):
@@ -6896,14 +7036,17 @@ class PlatformSpecificationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Identifier':
-            obj_ = PlatformIdentifierType.factory()
-            obj_.build(child_)
-            self.Identifier.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Identifier(self, child_, node, nodeName_):
+        obj_ = PlatformIdentifierType.factory()
+        obj_.build(child_)
+        self.Identifier.append(obj_)
 # end class PlatformSpecificationType
 
 class PlatformIdentifierType(StringObjectPropertyType):
@@ -7070,14 +7213,17 @@ class MetadataType(GeneratedsSuper):
 
             self.type_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Value':
-            Value_ = child_.text
-            Value_ = self.gds_validate_string(Value_, node, 'Value')
-            self.Value = Value_
-        elif nodeName_ == 'SubDatum':
-            obj_ = MetadataType.factory()
-            obj_.build(child_)
-            self.SubDatum.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        Value_ = child_.text
+        Value_ = self.gds_validate_string(Value_, node, 'Value')
+        self.Value = Value_
+    def buildChild_SubDatum(self, child_, node, nodeName_):
+        obj_ = MetadataType.factory()
+        obj_.build(child_)
+        self.SubDatum.append(obj_)
 # end class MetadataType
 
 class EnvironmentVariableListType(GeneratedsSuper):
@@ -7143,10 +7289,13 @@ class EnvironmentVariableListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Environment_Variable':
-            obj_ = EnvironmentVariableType.factory()
-            obj_.build(child_)
-            self.Environment_Variable.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Environment_Variable(self, child_, node, nodeName_):
+        obj_ = EnvironmentVariableType.factory()
+        obj_.build(child_)
+        self.Environment_Variable.append(obj_)
 # end class EnvironmentVariableListType
 
 class EnvironmentVariableType(GeneratedsSuper):
@@ -7216,14 +7365,17 @@ class EnvironmentVariableType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Value':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Value(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Value(obj_)
 # end class EnvironmentVariableType
 
 class DigitalSignaturesType(GeneratedsSuper):
@@ -7289,10 +7441,13 @@ class DigitalSignaturesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Digital_Signature':
-            obj_ = DigitalSignatureInfoType.factory()
-            obj_.build(child_)
-            self.Digital_Signature.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Digital_Signature(self, child_, node, nodeName_):
+        obj_ = DigitalSignatureInfoType.factory()
+        obj_.build(child_)
+        self.Digital_Signature.append(obj_)
 # end class DigitalSignaturesType
 
 class DigitalSignatureInfoType(GeneratedsSuper):
@@ -7398,18 +7553,21 @@ class DigitalSignatureInfoType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Certificate_Issuer':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Certificate_Issuer(obj_)
-        elif nodeName_ == 'Certificate_Subject':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Certificate_Subject(obj_)
-        elif nodeName_ == 'Signature_Description':
-            obj_ = StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature_Description(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Certificate_Issuer(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Certificate_Issuer(obj_)
+    def buildChild_Certificate_Subject(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Certificate_Subject(obj_)
+    def buildChild_Signature_Description(self, child_, node, nodeName_):
+        obj_ = StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature_Description(obj_)
 # end class DigitalSignatureInfoType
 
 class PatternableFieldType(GeneratedsSuper):
@@ -2,99 +2,45 @@
 # See LICENSE.txt for complete terms.
 
 from __future__ import absolute_import
+import importlib
 import sys
 
 from mixbox.binding_utils import *
+from cybox.utils.typecache import type_cache
+from cybox.utils.fileio import parse_xml, parse_xml_string
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
+from .object_types import OBJ_LIST
 
-#Object Imports
-from .account_object import AccountObjectType
-from .address_object import AddressObjectType
-from .api_object import APIObjectType
-from .archive_file_object import ArchiveFileObjectType
-from .arp_cache_object import ARPCacheObjectType
-from .artifact_object import ArtifactObjectType
-from .as_object import ASObjectType
-from .code_object import CodeObjectType
-from .custom_object import CustomObjectType
-from .device_object import DeviceObjectType
-from .disk_object import DiskObjectType
-from .disk_partition_object import DiskPartitionObjectType
-from .dns_cache_object import DNSCacheObjectType
-from .dns_query_object import DNSQueryObjectType
-from .dns_record_object import DNSRecordObjectType
-from .domain_name_object import DomainNameObjectType
-from .email_message_object import EmailMessageObjectType
-from .file_object import FileObjectType
-from .gui_dialogbox_object import GUIDialogboxObjectType
-from .gui_object import GUIObjectType
-from .gui_window_object import GUIWindowObjectType
-from .hostname_object import HostnameObjectType
-from .http_session_object import HTTPSessionObjectType
-from .image_file_object import ImageFileObjectType
-from .library_object import LibraryObjectType
-from .link_object import LinkObjectType
-from .linux_package_object import LinuxPackageObjectType
-from .memory_object import MemoryObjectType
-from .mutex_object import MutexObjectType
-from .network_connection_object import NetworkConnectionObjectType
-from .network_flow_object import NetworkFlowObjectType
-from .network_packet_object import NetworkPacketObjectType
-from .network_route_entry_object import NetworkRouteEntryObjectType
-from .network_route_object import NetRouteObjectType
-from .network_socket_object import NetworkSocketObjectType
-from .network_subnet_object import NetworkSubnetObjectType
-from .pdf_file_object import PDFFileObjectType
-from .pipe_object import PipeObjectType
-from .port_object import PortObjectType
-from .product_object import ProductObjectType
-from .process_object import ProcessObjectType
-from .semaphore_object import SemaphoreObjectType
-from .sms_message_object import SMSMessageObjectType
-from .socket_address_object import SocketAddressObjectType
-from .system_object import SystemObjectType
-from .unix_file_object import UnixFileObjectType
-from .unix_network_route_entry_object import UnixNetworkRouteEntryObjectType
-from .unix_pipe_object import UnixPipeObjectType
-from .unix_process_object import UnixProcessObjectType
-from .unix_user_account_object import UnixUserAccountObjectType
-from .unix_volume_object import UnixVolumeObjectType
-from .uri_object import URIObjectType
-from .url_history_object import URLHistoryObjectType
-from .user_account_object import UserAccountObjectType
-from .volume_object import VolumeObjectType
-from .whois_object import WhoisObjectType
-from .win_computer_account_object import WindowsComputerAccountObjectType
-from .win_critical_section_object import WindowsCriticalSectionObjectType
-from .win_driver_object import WindowsDriverObjectType
-from .win_event_log_object import WindowsEventLogObjectType
-from .win_event_object import WindowsEventObjectType
-from .win_executable_file_object import WindowsExecutableFileObjectType
-from .win_file_object import WindowsFileObjectType
-from .win_filemapping_object import WindowsFilemappingObjectType
-from .win_handle_object import WindowsHandleObjectType
-from .win_hook_object import WindowsHookObjectType
-from .win_kernel_hook_object import WindowsKernelHookObjectType
-from .win_kernel_object import WindowsKernelObjectType
-from .win_mailslot_object import WindowsMailslotObjectType
-from .win_memory_page_region_object import WindowsMemoryPageRegionObjectType
-from .win_mutex_object import WindowsMutexObjectType
-from .win_network_route_entry_object import WindowsNetworkRouteEntryObjectType
-from .win_network_share_object import WindowsNetworkShareObjectType
-from .win_pipe_object import WindowsPipeObjectType
-from .win_prefetch_object import WindowsPrefetchObjectType
-from .win_process_object import WindowsProcessObjectType
-from .win_registry_key_object import WindowsRegistryKeyObjectType
-from .win_semaphore_object import WindowsSemaphoreObjectType
-from .win_service_object import WindowsServiceObjectType
-from .win_system_object import WindowsSystemObjectType
-from .win_system_restore_object import WindowsSystemRestoreObjectType
-from .win_task_object import WindowsTaskObjectType
-from .win_thread_object import WindowsThreadObjectType
-from .win_user_account_object import WindowsUserAccountObjectType
-from .win_volume_object import WindowsVolumeObjectType
-from .win_waitable_timer_object import WindowsWaitableTimerObjectType
-from .x509_certificate_object import X509CertificateObjectType
+# Object binding modules (e.g., address_object) are only imported when one
+# of their classes is first looked up on this module. This maps the Object
+# binding class names to the modules that define them.
+_OBJECT_BINDINGS = dict((x[0], x[2]) for x in OBJ_LIST)
+
+
+def _load_object_binding(name):
+    module = importlib.import_module("." + _OBJECT_BINDINGS[name], __package__)
+    klass = getattr(module, name)
+    globals()[name] = klass
+    return klass
+
+
+def __getattr__(name):
+    if name in _OBJECT_BINDINGS:
+        return _load_object_binding(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_OBJECT_BINDINGS))
+
+
+# Module __getattr__ needs Python 3.7 (PEP 562). Load every Object binding
+# up front on older versions.
+if sys.version_info < (3, 7):
+    for _name in _OBJECT_BINDINGS:
+        _load_object_binding(_name)
 
 
 class ObservablesType(GeneratedsSuper):
@@ -206,18 +152,21 @@ class ObservablesType(GeneratedsSuper):
 
             self.cybox_major_version = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Observable_Package_Source':
-            obj_ = cybox_common.MeasureSourceType.factory()
-            obj_.build(child_)
-            self.set_Observable_Package_Source(obj_)
-        elif nodeName_ == 'Observable':
-            obj_ = ObservableType.factory()
-            obj_.build(child_)
-            self.Observable.append(obj_)
-        elif nodeName_ == 'Pools':
-            obj_ = PoolsType.factory()
-            obj_.build(child_)
-            self.set_Pools(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Observable_Package_Source(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.set_Observable_Package_Source(obj_)
+    def buildChild_Observable(self, child_, node, nodeName_):
+        obj_ = ObservableType.factory()
+        obj_.build(child_)
+        self.Observable.append(obj_)
+    def buildChild_Pools(self, child_, node, nodeName_):
+        obj_ = PoolsType.factory()
+        obj_.build(child_)
+        self.set_Pools(obj_)
 # end class ObservablesType
 
 class ObservableType(GeneratedsSuper):
@@ -385,38 +334,41 @@ class ObservableType(GeneratedsSuper):
                 raise_parse_error(node, 'Invalid PositiveInteger')
 
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Title':
-            Title_ = child_.text
-            Title_ = self.gds_validate_string(Title_, node, 'Title')
-            self.Title = Title_
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Keywords':
-            obj_ = KeywordsType.factory()
-            obj_.build(child_)
-            self.set_Keywords(obj_)
-        elif nodeName_ == 'Observable_Source':
-            obj_ = cybox_common.MeasureSourceType.factory()
-            obj_.build(child_)
-            self.Observable_Source.append(obj_)
-        elif nodeName_ == 'Object':
-            obj_ = ObjectType.factory()
-            obj_.build(child_)
-            self.set_Object(obj_)
-        elif nodeName_ == 'Event':
-            obj_ = EventType.factory()
-            obj_.build(child_)
-            self.set_Event(obj_)
-        elif nodeName_ == 'Observable_Composition':
-            obj_ = ObservableCompositionType.factory()
-            obj_.build(child_)
-            self.set_Observable_Composition(obj_)
-        elif nodeName_ == 'Pattern_Fidelity':
-            obj_ = PatternFidelityType.factory()
-            obj_.build(child_)
-            self.set_Pattern_Fidelity(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Title(self, child_, node, nodeName_):
+        Title_ = child_.text
+        Title_ = self.gds_validate_string(Title_, node, 'Title')
+        self.Title = Title_
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Keywords(self, child_, node, nodeName_):
+        obj_ = KeywordsType.factory()
+        obj_.build(child_)
+        self.set_Keywords(obj_)
+    def buildChild_Observable_Source(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.Observable_Source.append(obj_)
+    def buildChild_Object(self, child_, node, nodeName_):
+        obj_ = ObjectType.factory()
+        obj_.build(child_)
+        self.set_Object(obj_)
+    def buildChild_Event(self, child_, node, nodeName_):
+        obj_ = EventType.factory()
+        obj_.build(child_)
+        self.set_Event(obj_)
+    def buildChild_Observable_Composition(self, child_, node, nodeName_):
+        obj_ = ObservableCompositionType.factory()
+        obj_.build(child_)
+        self.set_Observable_Composition(obj_)
+    def buildChild_Pattern_Fidelity(self, child_, node, nodeName_):
+        obj_ = PatternFidelityType.factory()
+        obj_.build(child_)
+        self.set_Pattern_Fidelity(obj_)
 # end class ObservableType
 
 class EventType(GeneratedsSuper):
@@ -541,49 +493,52 @@ class EventType(GeneratedsSuper):
 
             self.id = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Observation_Method':
-            obj_ = cybox_common.MeasureSourceType.factory()
-            obj_.build(child_)
-            self.set_Observation_Method(obj_)
-        elif nodeName_ == 'Actions':
-            obj_ = ActionsType.factory()
-            obj_.build(child_)
-            self.set_Actions(obj_)
-        elif nodeName_ == 'Location':
-            type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-
-                if type_name_ == "CIQAddress3.0InstanceType":
-                    from .extensions.location import ciq_address_3_0 as ciq_address_binding
-                    obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Observation_Method(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.set_Observation_Method(obj_)
+    def buildChild_Actions(self, child_, node, nodeName_):
+        obj_ = ActionsType.factory()
+        obj_.build(child_)
+        self.set_Actions(obj_)
+    def buildChild_Location(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
-
-            obj_.build(child_)
-            self.set_Location(obj_)
-        elif nodeName_ == 'Frequency':
-            obj_ = FrequencyType.factory()
-            obj_.build(child_)
-            self.set_Frequency(obj_)
-        elif nodeName_ == 'Event':
-            obj_ = EventType.factory()
-            obj_.build(child_)
-            self.Event.append(obj_)
+                type_name_ = type_names_[1]
+
+            if type_name_ == "CIQAddress3.0InstanceType":
+                from .extensions.location import ciq_address_3_0 as ciq_address_binding
+                obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        else:
+            obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
+
+        obj_.build(child_)
+        self.set_Location(obj_)
+    def buildChild_Frequency(self, child_, node, nodeName_):
+        obj_ = FrequencyType.factory()
+        obj_.build(child_)
+        self.set_Frequency(obj_)
+    def buildChild_Event(self, child_, node, nodeName_):
+        obj_ = EventType.factory()
+        obj_.build(child_)
+        self.Event.append(obj_)
 # end class EventType
 
 class FrequencyType(GeneratedsSuper):
@@ -751,10 +706,13 @@ class ActionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action':
-            obj_ = ActionType.factory()
-            obj_.build(child_)
-            self.Action.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action(self, child_, node, nodeName_):
+        obj_ = ActionType.factory()
+        obj_.build(child_)
+        self.Action.append(obj_)
 # end class ActionsType
 
 class ActionType(GeneratedsSuper):
@@ -950,61 +908,64 @@ class ActionType(GeneratedsSuper):
 
             self.id = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Action_Aliases':
-            obj_ = ActionAliasesType.factory()
-            obj_.build(child_)
-            self.set_Action_Aliases(obj_)
-        elif nodeName_ == 'Action_Arguments':
-            obj_ = ActionArgumentsType.factory()
-            obj_.build(child_)
-            self.set_Action_Arguments(obj_)
-        elif nodeName_ == 'Location':
-            type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-
-                if type_name_ == "CIQAddress3.0InstanceType":
-                    from .extensions.location import iq_address_3_0 as ciq_address_binding
-                    obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Action_Aliases(self, child_, node, nodeName_):
+        obj_ = ActionAliasesType.factory()
+        obj_.build(child_)
+        self.set_Action_Aliases(obj_)
+    def buildChild_Action_Arguments(self, child_, node, nodeName_):
+        obj_ = ActionArgumentsType.factory()
+        obj_.build(child_)
+        self.set_Action_Arguments(obj_)
+    def buildChild_Location(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
-
-            obj_.build(child_)
-            self.set_Location(obj_)
-        elif nodeName_ == 'Discovery_Method':
-            obj_ = cybox_common.MeasureSourceType.factory()
-            obj_.build(child_)
-            self.set_Discovery_Method(obj_)
-        elif nodeName_ == 'Associated_Objects':
-            obj_ = AssociatedObjectsType.factory()
-            obj_.build(child_)
-            self.set_Associated_Objects(obj_)
-        elif nodeName_ == 'Relationships':
-            obj_ = ActionRelationshipsType.factory()
-            obj_.build(child_)
-            self.set_Relationships(obj_)
-        elif nodeName_ == 'Frequency':
-            obj_ = FrequencyType.factory()
-            obj_.build(child_)
-            self.set_Frequency(obj_)
+                type_name_ = type_names_[1]
+
+            if type_name_ == "CIQAddress3.0InstanceType":
+                from .extensions.location import iq_address_3_0 as ciq_address_binding
+                obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        else:
+            obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
+
+        obj_.build(child_)
+        self.set_Location(obj_)
+    def buildChild_Discovery_Method(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.set_Discovery_Method(obj_)
+    def buildChild_Associated_Objects(self, child_, node, nodeName_):
+        obj_ = AssociatedObjectsType.factory()
+        obj_.build(child_)
+        self.set_Associated_Objects(obj_)
+    def buildChild_Relationships(self, child_, node, nodeName_):
+        obj_ = ActionRelationshipsType.factory()
+        obj_.build(child_)
+        self.set_Relationships(obj_)
+    def buildChild_Frequency(self, child_, node, nodeName_):
+        obj_ = FrequencyType.factory()
+        obj_.build(child_)
+        self.set_Frequency(obj_)
 # end class ActionType
 
 class ActionAliasesType(GeneratedsSuper):
@@ -1071,10 +1032,13 @@ class ActionAliasesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action_Alias':
-            Action_Alias_ = child_.text
-            Action_Alias_ = self.gds_validate_string(Action_Alias_, node, 'Action_Alias')
-            self.Action_Alias.append(Action_Alias_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action_Alias(self, child_, node, nodeName_):
+        Action_Alias_ = child_.text
+        Action_Alias_ = self.gds_validate_string(Action_Alias_, node, 'Action_Alias')
+        self.Action_Alias.append(Action_Alias_)
 # end class ActionAliasesType
 
 class ActionArgumentsType(GeneratedsSuper):
@@ -1140,10 +1104,13 @@ class ActionArgumentsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action_Argument':
-            obj_ = ActionArgumentType.factory()
-            obj_.build(child_)
-            self.Action_Argument.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action_Argument(self, child_, node, nodeName_):
+        obj_ = ActionArgumentType.factory()
+        obj_.build(child_)
+        self.Action_Argument.append(obj_)
 # end class ActionArgumentsType
 
 class ActionArgumentType(GeneratedsSuper):
@@ -1210,14 +1177,17 @@ class ActionArgumentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Argument_Name':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Argument_Name(obj_)
-        elif nodeName_ == 'Argument_Value':
-            Argument_Value_ = child_.text
-            Argument_Value_ = self.gds_validate_string(Argument_Value_, node, 'Argument_Value')
-            self.Argument_Value = Argument_Value_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Argument_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Argument_Name(obj_)
+    def buildChild_Argument_Value(self, child_, node, nodeName_):
+        Argument_Value_ = child_.text
+        Argument_Value_ = self.gds_validate_string(Argument_Value_, node, 'Argument_Value')
+        self.Argument_Value = Argument_Value_
 # end class ActionArgumentType
 
 class AssociatedObjectsType(GeneratedsSuper):
@@ -1283,10 +1253,13 @@ class AssociatedObjectsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Associated_Object':
-            obj_ = AssociatedObjectType.factory()
-            obj_.build(child_)
-            self.Associated_Object.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Associated_Object(self, child_, node, nodeName_):
+        obj_ = AssociatedObjectType.factory()
+        obj_.build(child_)
+        self.Associated_Object.append(obj_)
 # end class AssociatedObjectsType
 
 class ActionPertinentObjectPropertiesType(GeneratedsSuper):
@@ -1353,10 +1326,13 @@ class ActionPertinentObjectPropertiesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Property':
-            obj_ = ActionPertinentObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Property.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Property(self, child_, node, nodeName_):
+        obj_ = ActionPertinentObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Property.append(obj_)
 # end class ActionPertinentObjectPropertiesType
 
 class ActionPertinentObjectPropertyType(GeneratedsSuper):
@@ -1496,10 +1472,13 @@ class ActionRelationshipsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Relationship':
-            obj_ = ActionRelationshipType.factory()
-            obj_.build(child_)
-            self.Relationship.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Relationship(self, child_, node, nodeName_):
+        obj_ = ActionRelationshipType.factory()
+        obj_.build(child_)
+        self.Relationship.append(obj_)
 # end class ActionRelationshipsType
 
 class ActionRelationshipType(GeneratedsSuper):
@@ -1571,14 +1550,17 @@ class ActionRelationshipType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Action_Reference':
-            obj_ = ActionReferenceType.factory()
-            obj_.build(child_)
-            self.Action_Reference.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Action_Reference(self, child_, node, nodeName_):
+        obj_ = ActionReferenceType.factory()
+        obj_.build(child_)
+        self.Action_Reference.append(obj_)
 # end class ActionRelationshipType
 
 class ActionReferenceType(GeneratedsSuper):
@@ -1787,95 +1769,83 @@ class ObjectType(GeneratedsSuper):
 
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'State':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_State(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_State(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_State(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Properties(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            class_ = type_cache.binding_class(type_name_, child_)
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Properties':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
-            else:
-                raise NotImplementedError(
-                    'Class not implemented for <Properties> element')
-            self.set_Properties(obj_)
-        elif nodeName_ == 'Domain_Specific_Object_Properties':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
-            else:
-                raise NotImplementedError(
-                    'Class not implemented for <Domain_Specific_Object_Properties> element')
-            self.set_Domain_Specific_Object_Properties(obj_)
-        elif nodeName_ == 'Location':
-            type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-
-                if type_name_ == "CIQAddress3.0InstanceType":
-                    from .extensions.location import ciq_address_3_0 as ciq_address_binding
-                    obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
-            else:
-                obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
-
-            obj_.build(child_)
-            self.set_Location(obj_)
-        elif nodeName_ == 'Related_Objects':
-            obj_ = RelatedObjectsType.factory()
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Properties> element')
+        self.set_Properties(obj_)
+    def buildChild_Domain_Specific_Object_Properties(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            class_ = type_cache.binding_class(type_name_, child_)
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Related_Objects(obj_)
-        elif nodeName_ == 'Defined_Effect':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Domain_Specific_Object_Properties> element')
+        self.set_Domain_Specific_Object_Properties(obj_)
+    def buildChild_Location(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Defined_Effect> element')
-            self.set_Defined_Effect(obj_)
-        elif nodeName_ == 'Discovery_Method':
-            obj_ = cybox_common.MeasureSourceType.factory()
+                type_name_ = type_names_[1]
+
+            if type_name_ == "CIQAddress3.0InstanceType":
+                from .extensions.location import ciq_address_3_0 as ciq_address_binding
+                obj_ = ciq_address_binding.CIQAddress3_0InstanceType.factory()
+        else:
+            obj_ = cybox_common.LocationType.factory() # IdentityType is not abstract
+
+        obj_.build(child_)
+        self.set_Location(obj_)
+    def buildChild_Related_Objects(self, child_, node, nodeName_):
+        obj_ = RelatedObjectsType.factory()
+        obj_.build(child_)
+        self.set_Related_Objects(obj_)
+    def buildChild_Defined_Effect(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            class_ = type_cache.binding_class(type_name_, child_)
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Discovery_Method(obj_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Defined_Effect> element')
+        self.set_Defined_Effect(obj_)
+    def buildChild_Discovery_Method(self, child_, node, nodeName_):
+        obj_ = cybox_common.MeasureSourceType.factory()
+        obj_.build(child_)
+        self.set_Discovery_Method(obj_)
 # end class ObjectType
 
 class DomainSpecificObjectPropertiesType(GeneratedsSuper):
@@ -2007,10 +1977,13 @@ class RelatedObjectsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Related_Object':
-            obj_ = RelatedObjectType.factory()
-            obj_.build(child_)
-            self.Related_Object.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Related_Object(self, child_, node, nodeName_):
+        obj_ = RelatedObjectType.factory()
+        obj_.build(child_)
+        self.Related_Object.append(obj_)
 # end class RelatedObjectsType
 
 class RelatedObjectType(ObjectType):
@@ -2075,11 +2048,13 @@ class RelatedObjectType(ObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(RelatedObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Relationship':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Relationship(obj_)
-        super(RelatedObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Relationship(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Relationship(obj_)
 # end class RelatedObjectType
 
 class DefinedEffectType(GeneratedsSuper):
@@ -2228,15 +2203,17 @@ class StateChangeEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(StateChangeEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Old_Object':
-            obj_ = ObjectType.factory()
-            obj_.build(child_)
-            self.set_Old_Object(obj_)
-        elif nodeName_ == 'New_Object':
-            obj_ = ObjectType.factory()
-            obj_.build(child_)
-            self.set_New_Object(obj_)
-        super(StateChangeEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Old_Object(self, child_, node, nodeName_):
+        obj_ = ObjectType.factory()
+        obj_.build(child_)
+        self.set_Old_Object(obj_)
+    def buildChild_New_Object(self, child_, node, nodeName_):
+        obj_ = ObjectType.factory()
+        obj_.build(child_)
+        self.set_New_Object(obj_)
 # end class StateChangeEffectType
 
 class DataReadEffectType(DefinedEffectType):
@@ -2301,11 +2278,13 @@ class DataReadEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DataReadEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        super(DataReadEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class DataReadEffectType
 
 class DataWrittenEffectType(DefinedEffectType):
@@ -2370,11 +2349,13 @@ class DataWrittenEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DataWrittenEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        super(DataWrittenEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class DataWrittenEffectType
 
 class DataSentEffectType(DefinedEffectType):
@@ -2439,11 +2420,13 @@ class DataSentEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DataSentEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        super(DataSentEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class DataSentEffectType
 
 class DataReceivedEffectType(DefinedEffectType):
@@ -2508,11 +2491,13 @@ class DataReceivedEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DataReceivedEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        super(DataReceivedEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class DataReceivedEffectType
 
 class PropertyReadEffectType(DefinedEffectType):
@@ -2584,15 +2569,17 @@ class PropertyReadEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(PropertyReadEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Value':
-            Value_ = child_.text
-            Value_ = self.gds_validate_string(Value_, node, 'Value')
-            self.Value = Value_
-        super(PropertyReadEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        Value_ = child_.text
+        Value_ = self.gds_validate_string(Value_, node, 'Value')
+        self.Value = Value_
 # end class PropertyReadEffectType
 
 class PropertiesEnumeratedEffectType(DefinedEffectType):
@@ -2658,11 +2645,13 @@ class PropertiesEnumeratedEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(PropertiesEnumeratedEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Properties':
-            obj_ = cybox_common.ObjectPropertiesType.factory()
-            obj_.build(child_)
-            self.set_Properties(obj_)
-        super(PropertiesEnumeratedEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Properties(self, child_, node, nodeName_):
+        obj_ = cybox_common.ObjectPropertiesType.factory()
+        obj_.build(child_)
+        self.set_Properties(obj_)
 # end class PropertiesEnumeratedEffectType
 
 class PropertiesType(GeneratedsSuper):
@@ -2728,10 +2717,13 @@ class PropertiesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Property':
-            obj_ = ActionPertinentObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Property.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Property(self, child_, node, nodeName_):
+        obj_ = ActionPertinentObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Property.append(obj_)
 # end class PropertiesType
 
 class ValuesEnumeratedEffectType(DefinedEffectType):
@@ -2796,11 +2788,13 @@ class ValuesEnumeratedEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(ValuesEnumeratedEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Values':
-            obj_ = ValuesType.factory()
-            obj_.build(child_)
-            self.set_Values(obj_)
-        super(ValuesEnumeratedEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Values(self, child_, node, nodeName_):
+        obj_ = ValuesType.factory()
+        obj_.build(child_)
+        self.set_Values(obj_)
 # end class ValuesEnumeratedEffectType
 
 class ValuesType(GeneratedsSuper):
@@ -2867,10 +2861,13 @@ class ValuesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Value':
-            Value_ = child_.text
-            Value_ = self.gds_validate_string(Value_, node, 'Value')
-            self.Value.append(Value_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        Value_ = child_.text
+        Value_ = self.gds_validate_string(Value_, node, 'Value')
+        self.Value.append(Value_)
 # end class ValuesType
 
 class SendControlCodeEffectType(DefinedEffectType):
@@ -2938,11 +2935,13 @@ class SendControlCodeEffectType(DefinedEffectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(SendControlCodeEffectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Control_Code':
-            Control_Code_ = child_.text
-            Control_Code_ = self.gds_validate_string(Control_Code_, node, 'Control_Code')
-            self.Control_Code = Control_Code_
-        super(SendControlCodeEffectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Control_Code(self, child_, node, nodeName_):
+        Control_Code_ = child_.text
+        Control_Code_ = self.gds_validate_string(Control_Code_, node, 'Control_Code')
+        self.Control_Code = Control_Code_
 # end class SendControlCodeEffectType
 
 class ObservableCompositionType(GeneratedsSuper):
@@ -3020,10 +3019,13 @@ class ObservableCompositionType(GeneratedsSuper):
 
             self.operator = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Observable':
-            obj_ = ObservableType.factory()
-            obj_.build(child_)
-            self.Observable.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Observable(self, child_, node, nodeName_):
+        obj_ = ObservableType.factory()
+        obj_.build(child_)
+        self.Observable.append(obj_)
 # end class ObservableCompositionType
 
 class PoolsType(GeneratedsSuper):
@@ -3105,22 +3107,25 @@ class PoolsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Event_Pool':
-            obj_ = EventPoolType.factory()
-            obj_.build(child_)
-            self.set_Event_Pool(obj_)
-        elif nodeName_ == 'Action_Pool':
-            obj_ = ActionPoolType.factory()
-            obj_.build(child_)
-            self.set_Action_Pool(obj_)
-        elif nodeName_ == 'Object_Pool':
-            obj_ = ObjectPoolType.factory()
-            obj_.build(child_)
-            self.set_Object_Pool(obj_)
-        elif nodeName_ == 'Property_Pool':
-            obj_ = PropertyPoolType.factory()
-            obj_.build(child_)
-            self.set_Property_Pool(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Event_Pool(self, child_, node, nodeName_):
+        obj_ = EventPoolType.factory()
+        obj_.build(child_)
+        self.set_Event_Pool(obj_)
+    def buildChild_Action_Pool(self, child_, node, nodeName_):
+        obj_ = ActionPoolType.factory()
+        obj_.build(child_)
+        self.set_Action_Pool(obj_)
+    def buildChild_Object_Pool(self, child_, node, nodeName_):
+        obj_ = ObjectPoolType.factory()
+        obj_.build(child_)
+        self.set_Object_Pool(obj_)
+    def buildChild_Property_Pool(self, child_, node, nodeName_):
+        obj_ = PropertyPoolType.factory()
+        obj_.build(child_)
+        self.set_Property_Pool(obj_)
 # end class PoolsType
 
 class EventPoolType(GeneratedsSuper):
@@ -3190,10 +3195,13 @@ class EventPoolType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Event':
-            obj_ = EventType.factory()
-            obj_.build(child_)
-            self.Event.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Event(self, child_, node, nodeName_):
+        obj_ = EventType.factory()
+        obj_.build(child_)
+        self.Event.append(obj_)
 # end class EventPoolType
 
 class ActionPoolType(GeneratedsSuper):
@@ -3263,10 +3271,13 @@ class ActionPoolType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action':
-            obj_ = ActionType.factory()
-            obj_.build(child_)
-            self.Action.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action(self, child_, node, nodeName_):
+        obj_ = ActionType.factory()
+        obj_.build(child_)
+        self.Action.append(obj_)
 # end class ActionPoolType
 
 class ObjectPoolType(GeneratedsSuper):
@@ -3336,10 +3347,13 @@ class ObjectPoolType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Object':
-            obj_ = ObjectType.factory()
-            obj_.build(child_)
-            self.set_Object(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Object(self, child_, node, nodeName_):
+        obj_ = ObjectType.factory()
+        obj_.build(child_)
+        self.set_Object(obj_)
 # end class ObjectPoolType
 
 class PropertyPoolType(GeneratedsSuper):
@@ -3409,10 +3423,13 @@ class PropertyPoolType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Property':
-            obj_ = ActionPertinentObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Property.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Property(self, child_, node, nodeName_):
+        obj_ = ActionPertinentObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Property.append(obj_)
 # end class PropertyPoolType
 
 class ObfuscationTechniquesType(GeneratedsSuper):
@@ -3479,10 +3496,13 @@ class ObfuscationTechniquesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Obfuscation_Technique':
-            obj_ = ObfuscationTechniqueType.factory()
-            obj_.build(child_)
-            self.Obfuscation_Technique.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Obfuscation_Technique(self, child_, node, nodeName_):
+        obj_ = ObfuscationTechniqueType.factory()
+        obj_.build(child_)
+        self.Obfuscation_Technique.append(obj_)
 # end class ObfuscationTechniquesType
 
 class ObfuscationTechniqueType(GeneratedsSuper):
@@ -3549,14 +3569,17 @@ class ObfuscationTechniqueType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Observables':
-            obj_ = ObservablesType.factory()
-            obj_.build(child_)
-            self.set_Observables(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Observables(self, child_, node, nodeName_):
+        obj_ = ObservablesType.factory()
+        obj_.build(child_)
+        self.set_Observables(obj_)
 # end class ObfuscationTechniqueType
 
 class KeywordsType(GeneratedsSuper):
@@ -3621,10 +3644,13 @@ class KeywordsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Keyword':
-            Keyword_ = child_.text
-            Keyword_ = self.gds_validate_string(Keyword_, node, 'Keyword')
-            self.Keyword.append(Keyword_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Keyword(self, child_, node, nodeName_):
+        Keyword_ = child_.text
+        Keyword_ = self.gds_validate_string(Keyword_, node, 'Keyword')
+        self.Keyword.append(Keyword_)
 # end class KeywordsType
 
 class PatternFidelityType(GeneratedsSuper):
@@ -3701,18 +3727,21 @@ class PatternFidelityType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Noisiness':
-            text_ = child_.text
-            text_ = self.gds_validate_string(text_, node, 'Noisiness')
-            self.set_Noisiness(text_)
-        elif nodeName_ == 'Ease_of_Evasion':
-            text_ = child_.text
-            text_ = self.gds_validate_string(text_, node, 'Ease_of_Evasion')
-            self.set_Ease_of_Evasion(text_)
-        elif nodeName_ == 'Evasion_Techniques':
-            obj_ = ObfuscationTechniquesType.factory()
-            obj_.build(child_)
-            self.set_Evasion_Techniques(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Noisiness(self, child_, node, nodeName_):
+        text_ = child_.text
+        text_ = self.gds_validate_string(text_, node, 'Noisiness')
+        self.set_Noisiness(text_)
+    def buildChild_Ease_of_Evasion(self, child_, node, nodeName_):
+        text_ = child_.text
+        text_ = self.gds_validate_string(text_, node, 'Ease_of_Evasion')
+        self.set_Ease_of_Evasion(text_)
+    def buildChild_Evasion_Techniques(self, child_, node, nodeName_):
+        obj_ = ObfuscationTechniquesType.factory()
+        obj_.build(child_)
+        self.set_Evasion_Techniques(obj_)
 # end class PatternFidelityType
 
 class AssociatedObjectType(ObjectType):
@@ -3783,15 +3812,17 @@ class AssociatedObjectType(ObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(AssociatedObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Association_Type':
-            obj_ = cybox_common.ControlledVocabularyStringType.factory()
-            obj_.build(child_)
-            self.set_Association_Type(obj_)
-        elif nodeName_ == 'Action_Pertinent_Object_Properties':
-            obj_ = ActionPertinentObjectPropertiesType.factory()
-            obj_.build(child_)
-            self.set_Action_Pertinent_Object_Properties(obj_)
-        super(AssociatedObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Association_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.ControlledVocabularyStringType.factory()
+        obj_.build(child_)
+        self.set_Association_Type(obj_)
+    def buildChild_Action_Pertinent_Object_Properties(self, child_, node, nodeName_):
+        obj_ = ActionPertinentObjectPropertiesType.factory()
+        obj_.build(child_)
+        self.set_Action_Pertinent_Object_Properties(obj_)
 # end class AssociatedObjectType
 
 GDSClassesMapping = {
@@ -3938,14 +3969,10 @@ def usage():
     sys.exit(1)
 
 def get_root_tag(node):
-    tag = Tag_pattern_.match(node.tag).groups()[-1]
-    rootClass = GDSClassesMapping.get(tag)
-    if rootClass is None:
-        rootClass = globals().get(tag)
-    return tag, rootClass
+    return type_cache.root_class(node.tag)
 
 def parse(inFileName):
-    doc = parsexml_(inFileName)
+    doc = parse_xml(inFileName)
     rootNode = doc.getroot()
     rootTag, rootClass = get_root_tag(rootNode)
     if rootClass is None:
@@ -3962,7 +3989,7 @@ def parse(inFileName):
     return rootObj
 
 def parseEtree(inFileName):
-    doc = parsexml_(inFileName)
+    doc = parse_xml(inFileName)
     rootNode = doc.getroot()
     rootTag, rootClass = get_root_tag(rootNode)
     if rootClass is None:
@@ -3980,8 +4007,7 @@ def parseEtree(inFileName):
     return rootObj, rootElement
 
 def parseString(inString):
-    from mixbox.vendor.six import StringIO
-    doc = parsexml_(StringIO(inString))
+    doc = parse_xml_string(inString)
     rootNode = doc.getroot()
     rootTag, rootClass = get_root_tag(rootNode)
     if rootClass is None:
@@ -4070,3 +4096,4 @@ def add_external_class(klass, name=None):
 
     module = sys.modules[__name__]
     setattr(module, name, klass)
+    type_cache.clear()
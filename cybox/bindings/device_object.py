@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -107,49 +109,51 @@ class DeviceObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DeviceObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Device_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Type(obj_)
-        elif nodeName_ == 'Manufacturer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Manufacturer(obj_)
-        elif nodeName_ == 'Model':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Model(obj_)
-        elif nodeName_ == 'Serial_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Serial_Number(obj_)
-        elif nodeName_ == 'Firmware_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Firmware_Version(obj_)
-        elif nodeName_ == 'System_Details':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Device_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Type(obj_)
+    def buildChild_Manufacturer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Manufacturer(obj_)
+    def buildChild_Model(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Model(obj_)
+    def buildChild_Serial_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Serial_Number(obj_)
+    def buildChild_Firmware_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Firmware_Version(obj_)
+    def buildChild_System_Details(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <System_Details> element')
-            self.set_System_Details(obj_)
-        super(DeviceObjectType, self).buildChildren(child_, node, nodeName_, True)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <System_Details> element')
+        self.set_System_Details(obj_)
 # end class DeviceObjectType
 
 GDSClassesMapping = {
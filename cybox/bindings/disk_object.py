@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import disk_partition_object
 
@@ -70,10 +72,13 @@ class PartitionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Partition':
-            obj_ = disk_partition_object.DiskPartitionObjectType.factory()
-            obj_.build(child_)
-            self.Partition.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Partition(self, child_, node, nodeName_):
+        obj_ = disk_partition_object.DiskPartitionObjectType.factory()
+        obj_.build(child_)
+        self.Partition.append(obj_)
 # end class PartitionListType
 
 class DiskType(cybox_common.BaseObjectPropertyType):
@@ -243,27 +248,29 @@ class DiskObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DiskObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Disk_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Disk_Name(obj_)
-        elif nodeName_ == 'Disk_Size':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Disk_Size(obj_)
-        elif nodeName_ == 'Free_Space':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Free_Space(obj_)
-        elif nodeName_ == 'Partition_List':
-            obj_ = PartitionListType.factory()
-            obj_.build(child_)
-            self.set_Partition_List(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = DiskType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(DiskObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Disk_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Disk_Name(obj_)
+    def buildChild_Disk_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Disk_Size(obj_)
+    def buildChild_Free_Space(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Free_Space(obj_)
+    def buildChild_Partition_List(self, child_, node, nodeName_):
+        obj_ = PartitionListType.factory()
+        obj_.build(child_)
+        self.set_Partition_List(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = DiskType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class DiskObjectType
 
 GDSClassesMapping = {
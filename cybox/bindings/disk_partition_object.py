@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -214,47 +216,49 @@ class DiskPartitionObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DiskPartitionObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Created':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Created(obj_)
-        elif nodeName_ == 'Device_Name':
-            obj_ = cybox_common.NameObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Name(obj_)
-        elif nodeName_ == 'Mount_Point':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Mount_Point(obj_)
-        elif nodeName_ == 'Partition_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Partition_ID(obj_)
-        elif nodeName_ == 'Partition_Length':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Partition_Length(obj_)
-        elif nodeName_ == 'Partition_Offset':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Partition_Offset(obj_)
-        elif nodeName_ == 'Space_Left':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Space_Left(obj_)
-        elif nodeName_ == 'Space_Used':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Space_Used(obj_)
-        elif nodeName_ == 'Total_Space':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Total_Space(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = PartitionType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(DiskPartitionObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Created(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Created(obj_)
+    def buildChild_Device_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.NameObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Name(obj_)
+    def buildChild_Mount_Point(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Mount_Point(obj_)
+    def buildChild_Partition_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Partition_ID(obj_)
+    def buildChild_Partition_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Partition_Length(obj_)
+    def buildChild_Partition_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Partition_Offset(obj_)
+    def buildChild_Space_Left(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Space_Left(obj_)
+    def buildChild_Space_Used(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Space_Used(obj_)
+    def buildChild_Total_Space(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Total_Space(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = PartitionType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class DiskPartitionObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import dns_record_object
 
@@ -75,14 +77,17 @@ class DNSCacheEntryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'DNS_Entry':
-            obj_ = dns_record_object.DNSRecordObjectType.factory()
-            obj_.build(child_)
-            self.set_DNS_Entry(obj_)
-        elif nodeName_ == 'TTL':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TTL(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_DNS_Entry(self, child_, node, nodeName_):
+        obj_ = dns_record_object.DNSRecordObjectType.factory()
+        obj_.build(child_)
+        self.set_DNS_Entry(obj_)
+    def buildChild_TTL(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TTL(obj_)
 # end class DNSCacheEntryType
 
 class DNSCacheObjectType(cybox_common.ObjectPropertiesType):
@@ -151,11 +156,13 @@ class DNSCacheObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DNSCacheObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'DNS_Cache_Entry':
-            obj_ = DNSCacheEntryType.factory()
-            obj_.build(child_)
-            self.DNS_Cache_Entry.append(obj_)
-        super(DNSCacheObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_DNS_Cache_Entry(self, child_, node, nodeName_):
+        obj_ = DNSCacheEntryType.factory()
+        obj_.build(child_)
+        self.DNS_Cache_Entry.append(obj_)
 # end class DNSCacheObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import dns_record_object
 from . import uri_object
@@ -85,18 +87,21 @@ class DNSQuestionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'QName':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_QName(obj_)
-        elif nodeName_ == 'QType':
-            obj_ = DNSRecordType.factory()
-            obj_.build(child_)
-            self.set_QType(obj_)
-        elif nodeName_ == 'QClass':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_QClass(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_QName(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_QName(obj_)
+    def buildChild_QType(self, child_, node, nodeName_):
+        obj_ = DNSRecordType.factory()
+        obj_.build(child_)
+        self.set_QType(obj_)
+    def buildChild_QClass(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_QClass(obj_)
 # end class DNSQuestionType
 
 class DNSResourceRecordsType(GeneratedsSuper):
@@ -162,10 +167,13 @@ class DNSResourceRecordsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Resource_Record':
-            obj_ = dns_record_object.DNSRecordObjectType.factory()
-            obj_.build(child_)
-            self.Resource_Record.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Resource_Record(self, child_, node, nodeName_):
+        obj_ = dns_record_object.DNSRecordObjectType.factory()
+        obj_.build(child_)
+        self.Resource_Record.append(obj_)
 # end class DNSResourceRecordsType
 
 class DNSRecordType(cybox_common.BaseObjectPropertyType):
@@ -361,35 +369,37 @@ class DNSQueryObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(DNSQueryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Transaction_ID':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Transaction_ID(obj_)
-        elif nodeName_ == 'Question':
-            obj_ = DNSQuestionType.factory()
-            obj_.build(child_)
-            self.set_Question(obj_)
-        elif nodeName_ == 'Answer_Resource_Records':
-            obj_ = DNSResourceRecordsType.factory()
-            obj_.build(child_)
-            self.set_Answer_Resource_Records(obj_)
-        elif nodeName_ == 'Authority_Resource_Records':
-            obj_ = DNSResourceRecordsType.factory()
-            obj_.build(child_)
-            self.set_Authority_Resource_Records(obj_)
-        elif nodeName_ == 'Additional_Records':
-            obj_ = DNSResourceRecordsType.factory()
-            obj_.build(child_)
-            self.set_Additional_Records(obj_)
-        elif nodeName_ == 'Date_Ran':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Date_Ran(obj_)
-        elif nodeName_ == 'Service_Used':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_Used(obj_)
-        super(DNSQueryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Transaction_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Transaction_ID(obj_)
+    def buildChild_Question(self, child_, node, nodeName_):
+        obj_ = DNSQuestionType.factory()
+        obj_.build(child_)
+        self.set_Question(obj_)
+    def buildChild_Answer_Resource_Records(self, child_, node, nodeName_):
+        obj_ = DNSResourceRecordsType.factory()
+        obj_.build(child_)
+        self.set_Answer_Resource_Records(obj_)
+    def buildChild_Authority_Resource_Records(self, child_, node, nodeName_):
+        obj_ = DNSResourceRecordsType.factory()
+        obj_.build(child_)
+        self.set_Authority_Resource_Records(obj_)
+    def buildChild_Additional_Records(self, child_, node, nodeName_):
+        obj_ = DNSResourceRecordsType.factory()
+        obj_.build(child_)
+        self.set_Additional_Records(obj_)
+    def buildChild_Date_Ran(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Date_Ran(obj_)
+    def buildChild_Service_Used(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_Used(obj_)
 # end class DNSQueryObjectType
 
 GDSClassesMapping = {
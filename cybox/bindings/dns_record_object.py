@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import uri_object
@@ -146,55 +148,57 @@ class DNSRecordObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(DNSRecordObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Queried_Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Queried_Date(obj_)
-        elif nodeName_ == 'Domain_Name':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Domain_Name(obj_)
-        elif nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
-        elif nodeName_ == 'Address_Class':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address_Class(obj_)
-        elif nodeName_ == 'Entry_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Entry_Type(obj_)
-        elif nodeName_ == 'Record_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Record_Name(obj_)
-        elif nodeName_ == 'Record_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Record_Type(obj_)
-        elif nodeName_ == 'TTL':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TTL(obj_)
-        elif nodeName_ == 'Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flags(obj_)
-        elif nodeName_ == 'Data_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data_Length(obj_)
-        elif nodeName_ == 'Record_Data':
-            Record_Data_ = child_.text
-            Record_Data_ = self.gds_validate_string(Record_Data_, node, 'Record_Data')
-            self.Record_Data = Record_Data_
-        super(DNSRecordObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Queried_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Queried_Date(obj_)
+    def buildChild_Domain_Name(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Domain_Name(obj_)
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
+    def buildChild_Address_Class(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address_Class(obj_)
+    def buildChild_Entry_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Entry_Type(obj_)
+    def buildChild_Record_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Record_Name(obj_)
+    def buildChild_Record_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Record_Type(obj_)
+    def buildChild_TTL(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TTL(obj_)
+    def buildChild_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flags(obj_)
+    def buildChild_Data_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data_Length(obj_)
+    def buildChild_Record_Data(self, child_, node, nodeName_):
+        Record_Data_ = child_.text
+        Record_Data_ = self.gds_validate_string(Record_Data_, node, 'Record_Data')
+        self.Record_Data = Record_Data_
 # end class DNSRecordObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 
@@ -71,10 +73,13 @@ class AttachmentsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File':
-            obj_ = AttachmentReferenceType.factory()
-            obj_.build(child_)
-            self.File.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File(self, child_, node, nodeName_):
+        obj_ = AttachmentReferenceType.factory()
+        obj_.build(child_)
+        self.File.append(obj_)
 # end class AttachmentsType
 
 class EmailHeaderType(GeneratedsSuper):
@@ -258,86 +263,89 @@ class EmailHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Received_Lines':
-            obj_ = EmailReceivedLineListType.factory()
-            obj_.build(child_)
-            self.set_Received_Lines(obj_)
-        elif nodeName_ == 'To':
-            obj_ = EmailRecipientsType.factory()
-            obj_.build(child_)
-            self.set_To(obj_)
-        elif nodeName_ == 'CC':
-            obj_ = EmailRecipientsType.factory()
-            obj_.build(child_)
-            self.set_CC(obj_)
-        elif nodeName_ == 'BCC':
-            obj_ = EmailRecipientsType.factory()
-            obj_.build(child_)
-            self.set_BCC(obj_)
-        elif nodeName_ == 'From':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_From(obj_)
-        elif nodeName_ == 'Subject':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject(obj_)
-        elif nodeName_ == 'In_Reply_To':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_In_Reply_To(obj_)
-        elif nodeName_ == 'Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Date(obj_)
-        elif nodeName_ == 'Message_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Message_ID(obj_)
-        elif nodeName_ == 'Sender':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Sender(obj_)
-        elif nodeName_ == 'Reply_To':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Reply_To(obj_)
-        elif nodeName_ == 'Errors_To':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Errors_To(obj_)
-        elif nodeName_ == 'Boundary':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Boundary(obj_)
-        elif nodeName_ == 'Content_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Type(obj_)
-        elif nodeName_ == 'MIME_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_MIME_Version(obj_)
-        elif nodeName_ == 'Precedence':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Precedence(obj_)
-        elif nodeName_ == 'User_Agent':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Agent(obj_)
-        elif nodeName_ == 'X_Mailer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Mailer(obj_)
-        elif nodeName_ == 'X_Originating_IP':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_X_Originating_IP(obj_)
-        elif nodeName_ == 'X_Priority':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Priority(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Received_Lines(self, child_, node, nodeName_):
+        obj_ = EmailReceivedLineListType.factory()
+        obj_.build(child_)
+        self.set_Received_Lines(obj_)
+    def buildChild_To(self, child_, node, nodeName_):
+        obj_ = EmailRecipientsType.factory()
+        obj_.build(child_)
+        self.set_To(obj_)
+    def buildChild_CC(self, child_, node, nodeName_):
+        obj_ = EmailRecipientsType.factory()
+        obj_.build(child_)
+        self.set_CC(obj_)
+    def buildChild_BCC(self, child_, node, nodeName_):
+        obj_ = EmailRecipientsType.factory()
+        obj_.build(child_)
+        self.set_BCC(obj_)
+    def buildChild_From(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_From(obj_)
+    def buildChild_Subject(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject(obj_)
+    def buildChild_In_Reply_To(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_In_Reply_To(obj_)
+    def buildChild_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Date(obj_)
+    def buildChild_Message_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Message_ID(obj_)
+    def buildChild_Sender(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Sender(obj_)
+    def buildChild_Reply_To(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Reply_To(obj_)
+    def buildChild_Errors_To(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Errors_To(obj_)
+    def buildChild_Boundary(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Boundary(obj_)
+    def buildChild_Content_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Type(obj_)
+    def buildChild_MIME_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_MIME_Version(obj_)
+    def buildChild_Precedence(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Precedence(obj_)
+    def buildChild_User_Agent(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Agent(obj_)
+    def buildChild_X_Mailer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Mailer(obj_)
+    def buildChild_X_Originating_IP(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_X_Originating_IP(obj_)
+    def buildChild_X_Priority(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Priority(obj_)
 # end class EmailHeaderType
 
 class EmailRecipientsType(GeneratedsSuper):
@@ -403,10 +411,13 @@ class EmailRecipientsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Recipient':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.Recipient.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Recipient(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.Recipient.append(obj_)
 # end class EmailRecipientsType
 
 class LinksType(GeneratedsSuper):
@@ -472,10 +483,13 @@ class LinksType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Link':
-            obj_ = LinkReferenceType.factory()
-            obj_.build(child_)
-            self.Link.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Link(self, child_, node, nodeName_):
+        obj_ = LinkReferenceType.factory()
+        obj_.build(child_)
+        self.Link.append(obj_)
 # end class LinksType
 
 class EmailReceivedLineType(GeneratedsSuper):
@@ -574,34 +588,37 @@ class EmailReceivedLineType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'From':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_From(obj_)
-        elif nodeName_ == 'By':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_By(obj_)
-        elif nodeName_ == 'Via':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Via(obj_)
-        elif nodeName_ == 'With':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_With(obj_)
-        elif nodeName_ == 'For':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_For(obj_)
-        elif nodeName_ == 'ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ID(obj_)
-        elif nodeName_ == 'Timestamp':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Timestamp(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_From(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_From(obj_)
+    def buildChild_By(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_By(obj_)
+    def buildChild_Via(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Via(obj_)
+    def buildChild_With(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_With(obj_)
+    def buildChild_For(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_For(obj_)
+    def buildChild_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ID(obj_)
+    def buildChild_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Timestamp(obj_)
 # end class EmailReceivedLineType
 
 class EmailReceivedLineListType(GeneratedsSuper):
@@ -667,10 +684,13 @@ class EmailReceivedLineListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Received':
-            obj_ = EmailReceivedLineType.factory()
-            obj_.build(child_)
-            self.Received.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Received(self, child_, node, nodeName_):
+        obj_ = EmailReceivedLineType.factory()
+        obj_.build(child_)
+        self.Received.append(obj_)
 # end class EmailReceivedLineListType
 
 class AttachmentReferenceType(GeneratedsSuper):
@@ -906,31 +926,33 @@ class EmailMessageObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(EmailMessageObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Header':
-            obj_ = EmailHeaderType.factory()
-            obj_.build(child_)
-            self.set_Header(obj_)
-        elif nodeName_ == 'Email_Server':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Email_Server(obj_)
-        elif nodeName_ == 'Raw_Body':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Body(obj_)
-        elif nodeName_ == 'Raw_Header':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Header(obj_)
-        elif nodeName_ == 'Attachments':
-            obj_ = AttachmentsType.factory()
-            obj_.build(child_)
-            self.set_Attachments(obj_)
-        elif nodeName_ == 'Links':
-            obj_ = LinksType.factory()
-            obj_.build(child_)
-            self.set_Links(obj_)
-        super(EmailMessageObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Header(self, child_, node, nodeName_):
+        obj_ = EmailHeaderType.factory()
+        obj_.build(child_)
+        self.set_Header(obj_)
+    def buildChild_Email_Server(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Email_Server(obj_)
+    def buildChild_Raw_Body(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Body(obj_)
+    def buildChild_Raw_Header(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Header(obj_)
+    def buildChild_Attachments(self, child_, node, nodeName_):
+        obj_ = AttachmentsType.factory()
+        obj_.build(child_)
+        self.set_Attachments(obj_)
+    def buildChild_Links(self, child_, node, nodeName_):
+        obj_ = LinksType.factory()
+        obj_.build(child_)
+        self.set_Links(obj_)
 # end class EmailMessageObjectType
 
 GDSClassesMapping = {
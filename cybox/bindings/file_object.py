@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -259,10 +261,13 @@ class PackerListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Packer':
-            obj_ = PackerType.factory()
-            obj_.build(child_)
-            self.Packer.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Packer(self, child_, node, nodeName_):
+        obj_ = PackerType.factory()
+        obj_.build(child_)
+        self.Packer.append(obj_)
 # end class PackerListType
 
 class PackerType(GeneratedsSuper):
@@ -368,34 +373,37 @@ class PackerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Entry_Point':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Entry_Point(obj_)
-        elif nodeName_ == 'Signature':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = PackerClassType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Detected_Entrypoint_Signatures':
-            obj_ = EntryPointSignatureListType.factory()
-            obj_.build(child_)
-            self.set_Detected_Entrypoint_Signatures(obj_)
-        elif nodeName_ == 'EP_Jump_Codes':
-            obj_ = EPJumpCodeType.factory()
-            obj_.build(child_)
-            self.set_EP_Jump_Codes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Entry_Point(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Entry_Point(obj_)
+    def buildChild_Signature(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = PackerClassType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Detected_Entrypoint_Signatures(self, child_, node, nodeName_):
+        obj_ = EntryPointSignatureListType.factory()
+        obj_.build(child_)
+        self.set_Detected_Entrypoint_Signatures(obj_)
+    def buildChild_EP_Jump_Codes(self, child_, node, nodeName_):
+        obj_ = EPJumpCodeType.factory()
+        obj_.build(child_)
+        self.set_EP_Jump_Codes(obj_)
 # end class PackerType
 
 class EPJumpCodeType(GeneratedsSuper):
@@ -467,14 +475,17 @@ class EPJumpCodeType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Depth':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Depth(obj_)
-        elif nodeName_ == 'Opcodes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Opcodes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Depth(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Depth(obj_)
+    def buildChild_Opcodes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Opcodes(obj_)
 # end class EPJumpCodeType
 
 class EntryPointSignatureType(GeneratedsSuper):
@@ -546,14 +557,17 @@ class EntryPointSignatureType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Type':
-            Type = child_.text
-            Type = self.gds_validate_string(Type, node, 'Type')
-            self.Type = Type
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        Type = child_.text
+        Type = self.gds_validate_string(Type, node, 'Type')
+        self.Type = Type
 # end class EntryPointSignatureType
 
 class EntryPointSignatureListType(GeneratedsSuper):
@@ -618,10 +632,13 @@ class EntryPointSignatureListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Entry_Point_Signature':
-            obj_ = EntryPointSignatureType.factory()
-            obj_.build(child_)
-            self.Entry_Point_Signature.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Entry_Point_Signature(self, child_, node, nodeName_):
+        obj_ = EntryPointSignatureType.factory()
+        obj_.build(child_)
+        self.Entry_Point_Signature.append(obj_)
 # end class EntryPointSignatureListType
 
 class SymLinksListType(GeneratedsSuper):
@@ -689,10 +706,13 @@ class SymLinksListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Sym_Link':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Sym_Link.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Sym_Link(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Sym_Link.append(obj_)
 # end class SymLinksListType
 
 class PackerClassType(cybox_common.BaseObjectPropertyType):
@@ -1027,139 +1047,141 @@ class FileObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(FileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Name(obj_)
-        elif nodeName_ == 'File_Path':
-            obj_ = FilePathType.factory()
-            obj_.build(child_)
-            self.set_File_Path(obj_)
-        elif nodeName_ == 'Device_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Path(obj_)
-        elif nodeName_ == 'Full_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Full_Path(obj_)
-        elif nodeName_ == 'File_Extension':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Extension(obj_)
-        elif nodeName_ == 'Size_In_Bytes':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_In_Bytes(obj_)
-        elif nodeName_ == 'Magic_Number':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Magic_Number(obj_)
-        elif nodeName_ == 'File_Format':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Format(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Digital_Signatures':
-            obj_ = cybox_common.DigitalSignaturesType.factory()
-            obj_.build(child_)
-            self.set_Digital_Signatures(obj_)
-        elif nodeName_ == 'Modified_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Modified_Time(obj_)
-        elif nodeName_ == 'Accessed_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accessed_Time(obj_)
-        elif nodeName_ == 'Created_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Created_Time(obj_)
-        elif nodeName_ == 'File_Attributes_List':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
-            else:
-                raise NotImplementedError(
-                    'Class not implemented for <File_Attributes_List> element')
-            self.set_File_Attributes_List(obj_)
-        elif nodeName_ == 'Permissions':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Name(obj_)
+    def buildChild_File_Path(self, child_, node, nodeName_):
+        obj_ = FilePathType.factory()
+        obj_.build(child_)
+        self.set_File_Path(obj_)
+    def buildChild_Device_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Path(obj_)
+    def buildChild_Full_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Full_Path(obj_)
+    def buildChild_File_Extension(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Extension(obj_)
+    def buildChild_Size_In_Bytes(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_In_Bytes(obj_)
+    def buildChild_Magic_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Magic_Number(obj_)
+    def buildChild_File_Format(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Format(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Digital_Signatures(self, child_, node, nodeName_):
+        obj_ = cybox_common.DigitalSignaturesType.factory()
+        obj_.build(child_)
+        self.set_Digital_Signatures(obj_)
+    def buildChild_Modified_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Modified_Time(obj_)
+    def buildChild_Accessed_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accessed_Time(obj_)
+    def buildChild_Created_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Created_Time(obj_)
+    def buildChild_File_Attributes_List(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Permissions> element')
-            self.set_Permissions(obj_)
-        elif nodeName_ == 'User_Owner':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Owner(obj_)
-        elif nodeName_ == 'Packer_List':
-            obj_ = PackerListType.factory()
-            obj_.build(child_)
-            self.set_Packer_List(obj_)
-        elif nodeName_ == 'Peak_Entropy':
-            obj_ = cybox_common.DoubleObjectPropertyType.factory()
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Peak_Entropy(obj_)
-        elif nodeName_ == 'Sym_Links':
-            obj_ = SymLinksListType.factory()
-            obj_.build(child_)
-            self.set_Sym_Links(obj_)
-        elif nodeName_ == 'Byte_Runs':
-            obj_ = cybox_common.ByteRunsType.factory()
-            obj_.build(child_)
-            self.set_Byte_Runs(obj_)
-        elif nodeName_ == 'Extracted_Features':
-            obj_ = cybox_common.ExtractedFeaturesType.factory()
-            obj_.build(child_)
-            self.set_Extracted_Features(obj_)
-        elif nodeName_ == 'Encryption_Algorithm':
-            obj_ = cybox_common.CipherType.factory()
-            obj_.build(child_)
-            self.set_Encryption_Algorithm(obj_)
-        elif nodeName_ == 'Decryption_Key':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Decryption_Key(obj_)
-        elif nodeName_ == 'Compression_Method':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Compression_Method(obj_)
-        elif nodeName_ == 'Compression_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Compression_Version(obj_)
-        elif nodeName_ == 'Compression_Comment':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <File_Attributes_List> element')
+        self.set_File_Attributes_List(obj_)
+    def buildChild_Permissions(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
+            else:
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_Compression_Comment(obj_)
-        super(FileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Permissions> element')
+        self.set_Permissions(obj_)
+    def buildChild_User_Owner(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Owner(obj_)
+    def buildChild_Packer_List(self, child_, node, nodeName_):
+        obj_ = PackerListType.factory()
+        obj_.build(child_)
+        self.set_Packer_List(obj_)
+    def buildChild_Peak_Entropy(self, child_, node, nodeName_):
+        obj_ = cybox_common.DoubleObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Peak_Entropy(obj_)
+    def buildChild_Sym_Links(self, child_, node, nodeName_):
+        obj_ = SymLinksListType.factory()
+        obj_.build(child_)
+        self.set_Sym_Links(obj_)
+    def buildChild_Byte_Runs(self, child_, node, nodeName_):
+        obj_ = cybox_common.ByteRunsType.factory()
+        obj_.build(child_)
+        self.set_Byte_Runs(obj_)
+    def buildChild_Extracted_Features(self, child_, node, nodeName_):
+        obj_ = cybox_common.ExtractedFeaturesType.factory()
+        obj_.build(child_)
+        self.set_Extracted_Features(obj_)
+    def buildChild_Encryption_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.CipherType.factory()
+        obj_.build(child_)
+        self.set_Encryption_Algorithm(obj_)
+    def buildChild_Decryption_Key(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Decryption_Key(obj_)
+    def buildChild_Compression_Method(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compression_Method(obj_)
+    def buildChild_Compression_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compression_Version(obj_)
+    def buildChild_Compression_Comment(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compression_Comment(obj_)
 # end class FileObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import gui_object
 
@@ -78,15 +80,17 @@ class GUIDialogboxObjectType(gui_object.GUIObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(GUIDialogboxObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Box_Caption':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Box_Caption(obj_)
-        elif nodeName_ == 'Box_Text':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Box_Text(obj_)
-        super(GUIDialogboxObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Box_Caption(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Box_Caption(obj_)
+    def buildChild_Box_Text(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Box_Text(obj_)
 # end class GUIDialogboxObjectType
 
 GDSClassesMapping = {
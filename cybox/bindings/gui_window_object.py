@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import gui_object
 
@@ -83,19 +85,21 @@ class GUIWindowObjectType(gui_object.GUIObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(GUIWindowObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Owner_Window':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Owner_Window(obj_)
-        elif nodeName_ == 'Parent_Window':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Parent_Window(obj_)
-        elif nodeName_ == 'Window_Display_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Window_Display_Name(obj_)
-        super(GUIWindowObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Owner_Window(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Owner_Window(obj_)
+    def buildChild_Parent_Window(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Parent_Window(obj_)
+    def buildChild_Window_Display_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Window_Display_Name(obj_)
 # end class GUIWindowObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import port_object
@@ -95,18 +97,21 @@ class HTTPRequestResponseType(GeneratedsSuper):
             if self.ordinal_position < 0:
                 raise_parse_error(node, 'Invalid NonNegativeInteger')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Client_Request':
-            obj_ = HTTPClientRequestType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Client_Request(obj_)
-        elif nodeName_ == 'HTTP_Provisional_Server_Response':
-            obj_ = HTTPServerResponseType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Provisional_Server_Response(obj_)
-        elif nodeName_ == 'HTTP_Server_Response':
-            obj_ = HTTPServerResponseType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Server_Response(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Client_Request(self, child_, node, nodeName_):
+        obj_ = HTTPClientRequestType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Client_Request(obj_)
+    def buildChild_HTTP_Provisional_Server_Response(self, child_, node, nodeName_):
+        obj_ = HTTPServerResponseType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Provisional_Server_Response(obj_)
+    def buildChild_HTTP_Server_Response(self, child_, node, nodeName_):
+        obj_ = HTTPServerResponseType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Server_Response(obj_)
 
 class HTTPClientRequestType(GeneratedsSuper):
     """The HTTPClientRequestType field captures the details of an HTTP
@@ -178,18 +183,21 @@ class HTTPClientRequestType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Request_Line':
-            obj_ = HTTPRequestLineType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Request_Line(obj_)
-        elif nodeName_ == 'HTTP_Request_Header':
-            obj_ = HTTPRequestHeaderType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Request_Header(obj_)
-        elif nodeName_ == 'HTTP_Message_Body':
-            obj_ = HTTPMessageType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Message_Body(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Request_Line(self, child_, node, nodeName_):
+        obj_ = HTTPRequestLineType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Request_Line(obj_)
+    def buildChild_HTTP_Request_Header(self, child_, node, nodeName_):
+        obj_ = HTTPRequestHeaderType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Request_Header(obj_)
+    def buildChild_HTTP_Message_Body(self, child_, node, nodeName_):
+        obj_ = HTTPMessageType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Message_Body(obj_)
 # end class HTTPClientRequestType
 
 class HTTPServerResponseType(GeneratedsSuper):
@@ -262,18 +270,21 @@ class HTTPServerResponseType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Status_Line':
-            obj_ = HTTPStatusLineType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Status_Line(obj_)
-        elif nodeName_ == 'HTTP_Response_Header':
-            obj_ = HTTPResponseHeaderType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Response_Header(obj_)
-        elif nodeName_ == 'HTTP_Message_Body':
-            obj_ = HTTPMessageType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Message_Body(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Status_Line(self, child_, node, nodeName_):
+        obj_ = HTTPStatusLineType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Status_Line(obj_)
+    def buildChild_HTTP_Response_Header(self, child_, node, nodeName_):
+        obj_ = HTTPResponseHeaderType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Response_Header(obj_)
+    def buildChild_HTTP_Message_Body(self, child_, node, nodeName_):
+        obj_ = HTTPMessageType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Message_Body(obj_)
 # end class HTTPServerResponseType
 
 class HTTPRequestLineType(GeneratedsSuper):
@@ -353,18 +364,21 @@ class HTTPRequestLineType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Method':
-            obj_ = HTTPMethodType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Method(obj_)
-        elif nodeName_ == 'Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Value(obj_)
-        elif nodeName_ == 'Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Method(self, child_, node, nodeName_):
+        obj_ = HTTPMethodType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Method(obj_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Value(obj_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
 # end class HTTPRequestLineType
 
 class HTTPRequestHeaderType(GeneratedsSuper):
@@ -439,14 +453,17 @@ class HTTPRequestHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Raw_Header':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Header(obj_)
-        elif nodeName_ == 'Parsed_Header':
-            obj_ = HTTPRequestHeaderFieldsType.factory()
-            obj_.build(child_)
-            self.set_Parsed_Header(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Raw_Header(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Header(obj_)
+    def buildChild_Parsed_Header(self, child_, node, nodeName_):
+        obj_ = HTTPRequestHeaderFieldsType.factory()
+        obj_.build(child_)
+        self.set_Parsed_Header(obj_)
 # end class HTTPRequestHeaderType
 
 class HTTPRequestHeaderFieldsType(GeneratedsSuper):
@@ -726,150 +743,153 @@ class HTTPRequestHeaderFieldsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Accept':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept(obj_)
-        elif nodeName_ == 'Accept_Charset':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept_Charset(obj_)
-        elif nodeName_ == 'Accept_Language':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept_Language(obj_)
-        elif nodeName_ == 'Accept_Datetime':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept_Datetime(obj_)
-        elif nodeName_ == 'Accept_Encoding':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept_Encoding(obj_)
-        elif nodeName_ == 'Authorization':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Authorization(obj_)
-        elif nodeName_ == 'Cache_Control':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Cache_Control(obj_)
-        elif nodeName_ == 'Connection':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Connection(obj_)
-        elif nodeName_ == 'Cookie':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Cookie(obj_)
-        elif nodeName_ == 'Content_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Length(obj_)
-        elif nodeName_ == 'Content_MD5':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_MD5(obj_)
-        elif nodeName_ == 'Content_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Type(obj_)
-        elif nodeName_ == 'Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Date(obj_)
-        elif nodeName_ == 'Expect':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Expect(obj_)
-        elif nodeName_ == 'From':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_From(obj_)
-        elif nodeName_ == 'Host':
-            obj_ = HostFieldType.factory()
-            obj_.build(child_)
-            self.set_Host(obj_)
-        elif nodeName_ == 'If_Match':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_If_Match(obj_)
-        elif nodeName_ == 'If_Modified_Since':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_If_Modified_Since(obj_)
-        elif nodeName_ == 'If_None_Match':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_If_None_Match(obj_)
-        elif nodeName_ == 'If_Range':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_If_Range(obj_)
-        elif nodeName_ == 'If_Unmodified_Since':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_If_Unmodified_Since(obj_)
-        elif nodeName_ == 'Max_Forwards':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Max_Forwards(obj_)
-        elif nodeName_ == 'Pragma':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pragma(obj_)
-        elif nodeName_ == 'Proxy_Authorization':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Proxy_Authorization(obj_)
-        elif nodeName_ == 'Range':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Range(obj_)
-        elif nodeName_ == 'Referer':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Referer(obj_)
-        elif nodeName_ == 'TE':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TE(obj_)
-        elif nodeName_ == 'User_Agent':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Agent(obj_)
-        elif nodeName_ == 'Via':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Via(obj_)
-        elif nodeName_ == 'Warning':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Warning(obj_)
-        elif nodeName_ == 'DNT':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_DNT(obj_)
-        elif nodeName_ == 'X_Requested_With':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Requested_With(obj_)
-        elif nodeName_ == 'X_Forwarded_For':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Forwarded_For(obj_)
-        elif nodeName_ == 'X_Forwarded_Proto':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Forwarded_Proto(obj_)
-        elif nodeName_ == 'X_ATT_DeviceId':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_ATT_DeviceId(obj_)
-        elif nodeName_ == 'X_Wap_Profile':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_X_Wap_Profile(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Accept(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept(obj_)
+    def buildChild_Accept_Charset(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept_Charset(obj_)
+    def buildChild_Accept_Language(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept_Language(obj_)
+    def buildChild_Accept_Datetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept_Datetime(obj_)
+    def buildChild_Accept_Encoding(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept_Encoding(obj_)
+    def buildChild_Authorization(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Authorization(obj_)
+    def buildChild_Cache_Control(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Cache_Control(obj_)
+    def buildChild_Connection(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Connection(obj_)
+    def buildChild_Cookie(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Cookie(obj_)
+    def buildChild_Content_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Length(obj_)
+    def buildChild_Content_MD5(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_MD5(obj_)
+    def buildChild_Content_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Type(obj_)
+    def buildChild_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Date(obj_)
+    def buildChild_Expect(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Expect(obj_)
+    def buildChild_From(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_From(obj_)
+    def buildChild_Host(self, child_, node, nodeName_):
+        obj_ = HostFieldType.factory()
+        obj_.build(child_)
+        self.set_Host(obj_)
+    def buildChild_If_Match(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_If_Match(obj_)
+    def buildChild_If_Modified_Since(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_If_Modified_Since(obj_)
+    def buildChild_If_None_Match(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_If_None_Match(obj_)
+    def buildChild_If_Range(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_If_Range(obj_)
+    def buildChild_If_Unmodified_Since(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_If_Unmodified_Since(obj_)
+    def buildChild_Max_Forwards(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Max_Forwards(obj_)
+    def buildChild_Pragma(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pragma(obj_)
+    def buildChild_Proxy_Authorization(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Proxy_Authorization(obj_)
+    def buildChild_Range(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Range(obj_)
+    def buildChild_Referer(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Referer(obj_)
+    def buildChild_TE(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TE(obj_)
+    def buildChild_User_Agent(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Agent(obj_)
+    def buildChild_Via(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Via(obj_)
+    def buildChild_Warning(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Warning(obj_)
+    def buildChild_DNT(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_DNT(obj_)
+    def buildChild_X_Requested_With(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Requested_With(obj_)
+    def buildChild_X_Forwarded_For(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Forwarded_For(obj_)
+    def buildChild_X_Forwarded_Proto(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Forwarded_Proto(obj_)
+    def buildChild_X_ATT_DeviceId(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_ATT_DeviceId(obj_)
+    def buildChild_X_Wap_Profile(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_X_Wap_Profile(obj_)
 # end class HTTPRequestHeaderFieldsType
 
 class HTTPResponseHeaderType(GeneratedsSuper):
@@ -944,14 +964,17 @@ class HTTPResponseHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Raw_Header':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Header(obj_)
-        elif nodeName_ == 'Parsed_Header':
-            obj_ = HTTPResponseHeaderFieldsType.factory()
-            obj_.build(child_)
-            self.set_Parsed_Header(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Raw_Header(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Header(obj_)
+    def buildChild_Parsed_Header(self, child_, node, nodeName_):
+        obj_ = HTTPResponseHeaderFieldsType.factory()
+        obj_.build(child_)
+        self.set_Parsed_Header(obj_)
 # end class HTTPResponseHeaderType
 
 class HTTPResponseHeaderFieldsType(GeneratedsSuper):
@@ -1243,158 +1266,161 @@ class HTTPResponseHeaderFieldsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Access_Control_Allow_Origin':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Access_Control_Allow_Origin(obj_)
-        elif nodeName_ == 'Accept_Ranges':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Accept_Ranges(obj_)
-        elif nodeName_ == 'Age':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Age(obj_)
-        elif nodeName_ == 'Cache_Control':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Cache_Control(obj_)
-        elif nodeName_ == 'Connection':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Connection(obj_)
-        elif nodeName_ == 'Content_Encoding':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Encoding(obj_)
-        elif nodeName_ == 'Content_Language':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Language(obj_)
-        elif nodeName_ == 'Content_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Length(obj_)
-        elif nodeName_ == 'Content_Location':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Location(obj_)
-        elif nodeName_ == 'Content_MD5':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_MD5(obj_)
-        elif nodeName_ == 'Content_Disposition':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Disposition(obj_)
-        elif nodeName_ == 'Content_Range':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Range(obj_)
-        elif nodeName_ == 'Content_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Content_Type(obj_)
-        elif nodeName_ == 'Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Date(obj_)
-        elif nodeName_ == 'ETag':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ETag(obj_)
-        elif nodeName_ == 'Expires':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Expires(obj_)
-        elif nodeName_ == 'Last_Modified':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Modified(obj_)
-        elif nodeName_ == 'Link':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Link(obj_)
-        elif nodeName_ == 'Location':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Location(obj_)
-        elif nodeName_ == 'P3P':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_P3P(obj_)
-        elif nodeName_ == 'Pragma':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pragma(obj_)
-        elif nodeName_ == 'Proxy_Authenticate':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Proxy_Authenticate(obj_)
-        elif nodeName_ == 'Refresh':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Refresh(obj_)
-        elif nodeName_ == 'Retry_After':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Retry_After(obj_)
-        elif nodeName_ == 'Server':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Server(obj_)
-        elif nodeName_ == 'Set_Cookie':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Set_Cookie(obj_)
-        elif nodeName_ == 'Strict_Transport_Security':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Strict_Transport_Security(obj_)
-        elif nodeName_ == 'Trailer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trailer(obj_)
-        elif nodeName_ == 'Transfer_Encoding':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Transfer_Encoding(obj_)
-        elif nodeName_ == 'Vary':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Vary(obj_)
-        elif nodeName_ == 'Via':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Via(obj_)
-        elif nodeName_ == 'Warning':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Warning(obj_)
-        elif nodeName_ == 'WWW_Authenticate':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_WWW_Authenticate(obj_)
-        elif nodeName_ == 'X_Frame_Options':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Frame_Options(obj_)
-        elif nodeName_ == 'X_XSS_Protection':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_XSS_Protection(obj_)
-        elif nodeName_ == 'X_Content_Type_Options':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Content_Type_Options(obj_)
-        elif nodeName_ == 'X_Powered_By':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_Powered_By(obj_)
-        elif nodeName_ == 'X_UA_Compatible':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_X_UA_Compatible(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Access_Control_Allow_Origin(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Access_Control_Allow_Origin(obj_)
+    def buildChild_Accept_Ranges(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Accept_Ranges(obj_)
+    def buildChild_Age(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Age(obj_)
+    def buildChild_Cache_Control(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Cache_Control(obj_)
+    def buildChild_Connection(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Connection(obj_)
+    def buildChild_Content_Encoding(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Encoding(obj_)
+    def buildChild_Content_Language(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Language(obj_)
+    def buildChild_Content_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Length(obj_)
+    def buildChild_Content_Location(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Location(obj_)
+    def buildChild_Content_MD5(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_MD5(obj_)
+    def buildChild_Content_Disposition(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Disposition(obj_)
+    def buildChild_Content_Range(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Range(obj_)
+    def buildChild_Content_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Content_Type(obj_)
+    def buildChild_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Date(obj_)
+    def buildChild_ETag(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ETag(obj_)
+    def buildChild_Expires(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Expires(obj_)
+    def buildChild_Last_Modified(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Modified(obj_)
+    def buildChild_Link(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Link(obj_)
+    def buildChild_Location(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Location(obj_)
+    def buildChild_P3P(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_P3P(obj_)
+    def buildChild_Pragma(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pragma(obj_)
+    def buildChild_Proxy_Authenticate(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Proxy_Authenticate(obj_)
+    def buildChild_Refresh(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Refresh(obj_)
+    def buildChild_Retry_After(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Retry_After(obj_)
+    def buildChild_Server(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Server(obj_)
+    def buildChild_Set_Cookie(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Set_Cookie(obj_)
+    def buildChild_Strict_Transport_Security(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Strict_Transport_Security(obj_)
+    def buildChild_Trailer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trailer(obj_)
+    def buildChild_Transfer_Encoding(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Transfer_Encoding(obj_)
+    def buildChild_Vary(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Vary(obj_)
+    def buildChild_Via(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Via(obj_)
+    def buildChild_Warning(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Warning(obj_)
+    def buildChild_WWW_Authenticate(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_WWW_Authenticate(obj_)
+    def buildChild_X_Frame_Options(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Frame_Options(obj_)
+    def buildChild_X_XSS_Protection(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_XSS_Protection(obj_)
+    def buildChild_X_Content_Type_Options(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Content_Type_Options(obj_)
+    def buildChild_X_Powered_By(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_Powered_By(obj_)
+    def buildChild_X_UA_Compatible(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_X_UA_Compatible(obj_)
 # end class HTTPResponseHeaderFieldsType
 
 class HTTPMessageType(GeneratedsSuper):
@@ -1467,14 +1493,17 @@ class HTTPMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Message_Body':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Message_Body(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Message_Body(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Message_Body(obj_)
 # end class HTTPMessageType
 
 class HTTPStatusLineType(GeneratedsSuper):
@@ -1552,18 +1581,21 @@ class HTTPStatusLineType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Status_Code':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Status_Code(obj_)
-        elif nodeName_ == 'Reason_Phrase':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reason_Phrase(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Status_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Status_Code(obj_)
+    def buildChild_Reason_Phrase(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reason_Phrase(obj_)
 # end class HTTPStatusLineType
 
 class HostFieldType(GeneratedsSuper):
@@ -1630,14 +1662,17 @@ class HostFieldType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Domain_Name':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Domain_Name(obj_)
-        elif nodeName_ == 'Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_Port(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Domain_Name(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Domain_Name(obj_)
+    def buildChild_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_Port(obj_)
 # end class HostFieldType
 
 class HTTPMethodType(cybox_common.BaseObjectPropertyType):
@@ -1780,11 +1815,13 @@ class HTTPSessionObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(HTTPSessionObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Request_Response':
-            obj_ = HTTPRequestResponseType.factory()
-            obj_.build(child_)
-            self.HTTP_Request_Response.append(obj_)
-        super(HTTPSessionObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Request_Response(self, child_, node, nodeName_):
+        obj_ = HTTPRequestResponseType.factory()
+        obj_.build(child_)
+        self.HTTP_Request_Response.append(obj_)
 # end class HTTPSessionObjectType
 
 GDSClassesMapping = {
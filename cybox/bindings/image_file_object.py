@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import file_object
 
@@ -184,27 +186,29 @@ class ImageFileObjectType(file_object.FileObjectType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(ImageFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Image_File_Format':
-            obj_ = ImageFileFormatType.factory()
-            obj_.build(child_)
-            self.set_Image_File_Format(obj_)
-        elif nodeName_ == 'Image_Height':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Height(obj_)
-        elif nodeName_ == 'Image_Width':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Width(obj_)
-        elif nodeName_ == 'Bits_Per_Pixel':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Bits_Per_Pixel(obj_)
-        elif nodeName_ == 'Compression_Algorithm':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Compression_Algorithm(obj_)
-        super(ImageFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Image_File_Format(self, child_, node, nodeName_):
+        obj_ = ImageFileFormatType.factory()
+        obj_.build(child_)
+        self.set_Image_File_Format(obj_)
+    def buildChild_Image_Height(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Height(obj_)
+    def buildChild_Image_Width(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Width(obj_)
+    def buildChild_Bits_Per_Pixel(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Bits_Per_Pixel(obj_)
+    def buildChild_Compression_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compression_Algorithm(obj_)
 # end class ImageFileObjectType
 
 GDSClassesMapping = {
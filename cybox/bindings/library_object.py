@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -184,35 +186,37 @@ class LibraryObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(LibraryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Path(obj_)
-        elif nodeName_ == 'Size':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = cybox_common.LibraryType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Base_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Base_Address(obj_)
-        elif nodeName_ == 'Extracted_Features':
-            obj_ = cybox_common.ExtractedFeaturesType.factory()
-            obj_.build(child_)
-            self.set_Extracted_Features(obj_)
-        super(LibraryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Path(obj_)
+    def buildChild_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.LibraryType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Base_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Base_Address(obj_)
+    def buildChild_Extracted_Features(self, child_, node, nodeName_):
+        obj_ = cybox_common.ExtractedFeaturesType.factory()
+        obj_.build(child_)
+        self.set_Extracted_Features(obj_)
 # end class LibraryObjectType
 
 GDSClassesMapping = {
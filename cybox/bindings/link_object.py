@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import uri_object
 
@@ -129,11 +131,13 @@ class LinkObjectType(uri_object.URIObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(LinkObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'URL_Label':
-            obj_ = URLLabelType.factory()
-            obj_.build(child_)
-            self.set_URL_Label(obj_)
-        super(LinkObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_URL_Label(self, child_, node, nodeName_):
+        obj_ = URLLabelType.factory()
+        obj_.build(child_)
+        self.set_URL_Label(obj_)
 
 # end class LinkObjectType
 
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -262,39 +264,41 @@ class MemoryObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(MemoryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Memory_Source':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Memory_Source(obj_)
-        elif nodeName_ == 'Region_Size':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Region_Size(obj_)
-        elif nodeName_ == 'Block_Type':
-            obj_ = BlockType.factory()
-            obj_.build(child_)
-            self.set_Block_Type(obj_)
-        elif nodeName_ == 'Region_Start_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Region_Start_Address(obj_)
-        elif nodeName_ == 'Region_End_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Region_End_Address(obj_)
-        elif nodeName_ == 'Extracted_Features':
-            obj_ = cybox_common.ExtractedFeaturesType.factory()
-            obj_.build(child_)
-            self.set_Extracted_Features(obj_)
-        super(MemoryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Memory_Source(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Memory_Source(obj_)
+    def buildChild_Region_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Region_Size(obj_)
+    def buildChild_Block_Type(self, child_, node, nodeName_):
+        obj_ = BlockType.factory()
+        obj_.build(child_)
+        self.set_Block_Type(obj_)
+    def buildChild_Region_Start_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Region_Start_Address(obj_)
+    def buildChild_Region_End_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Region_End_Address(obj_)
+    def buildChild_Extracted_Features(self, child_, node, nodeName_):
+        obj_ = cybox_common.ExtractedFeaturesType.factory()
+        obj_.build(child_)
+        self.set_Extracted_Features(obj_)
 # end class MemoryObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import dns_query_object
 from . import http_session_object
@@ -80,14 +82,17 @@ class Layer7ConnectionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'HTTP_Session':
-            obj_ = http_session_object.HTTPSessionObjectType.factory()
-            obj_.build(child_)
-            self.set_HTTP_Session(obj_)
-        elif nodeName_ == 'DNS_Query':
-            obj_ = dns_query_object.DNSQueryObjectType.factory()
-            obj_.build(child_)
-            self.DNS_Query.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_HTTP_Session(self, child_, node, nodeName_):
+        obj_ = http_session_object.HTTPSessionObjectType.factory()
+        obj_.build(child_)
+        self.set_HTTP_Session(obj_)
+    def buildChild_DNS_Query(self, child_, node, nodeName_):
+        obj_ = dns_query_object.DNSQueryObjectType.factory()
+        obj_.build(child_)
+        self.DNS_Query.append(obj_)
 # end class Layer7ConnectionsType
 
 class Layer7ProtocolType(cybox_common.BaseObjectPropertyType):
@@ -382,43 +387,45 @@ class NetworkConnectionObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(NetworkConnectionObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Creation_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Time(obj_)
-        elif nodeName_ == 'Layer3_Protocol':
-            obj_ = Layer3ProtocolType.factory()
-            obj_.build(child_)
-            self.set_Layer3_Protocol(obj_)
-        elif nodeName_ == 'Layer4_Protocol':
-            obj_ = cybox_common.Layer4ProtocolType.factory()
-            obj_.build(child_)
-            self.set_Layer4_Protocol(obj_)
-        elif nodeName_ == 'Layer7_Protocol':
-            obj_ = Layer7ProtocolType.factory()
-            obj_.build(child_)
-            self.set_Layer7_Protocol(obj_)
-        elif nodeName_ == 'Source_Socket_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Source_Socket_Address(obj_)
-        elif nodeName_ == 'Source_TCP_State':
-            Source_TCP_State_ = child_.text
-            Source_TCP_State_ = self.gds_validate_string(Source_TCP_State_, node, 'Source_TCP_State')
-            self.Source_TCP_State = Source_TCP_State_
-        elif nodeName_ == 'Destination_Socket_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Destination_Socket_Address(obj_)
-        elif nodeName_ == 'Destination_TCP_State':
-            Destination_TCP_State_ = child_.text
-            Destination_TCP_State_ = self.gds_validate_string(Destination_TCP_State_, node, 'Destination_TCP_State')
-            self.Destination_TCP_State = Destination_TCP_State_
-        elif nodeName_ == 'Layer7_Connections':
-            obj_ = Layer7ConnectionsType.factory()
-            obj_.build(child_)
-            self.set_Layer7_Connections(obj_)
-        super(NetworkConnectionObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Creation_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Time(obj_)
+    def buildChild_Layer3_Protocol(self, child_, node, nodeName_):
+        obj_ = Layer3ProtocolType.factory()
+        obj_.build(child_)
+        self.set_Layer3_Protocol(obj_)
+    def buildChild_Layer4_Protocol(self, child_, node, nodeName_):
+        obj_ = cybox_common.Layer4ProtocolType.factory()
+        obj_.build(child_)
+        self.set_Layer4_Protocol(obj_)
+    def buildChild_Layer7_Protocol(self, child_, node, nodeName_):
+        obj_ = Layer7ProtocolType.factory()
+        obj_.build(child_)
+        self.set_Layer7_Protocol(obj_)
+    def buildChild_Source_Socket_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Source_Socket_Address(obj_)
+    def buildChild_Source_TCP_State(self, child_, node, nodeName_):
+        Source_TCP_State_ = child_.text
+        Source_TCP_State_ = self.gds_validate_string(Source_TCP_State_, node, 'Source_TCP_State')
+        self.Source_TCP_State = Source_TCP_State_
+    def buildChild_Destination_Socket_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Destination_Socket_Address(obj_)
+    def buildChild_Destination_TCP_State(self, child_, node, nodeName_):
+        Destination_TCP_State_ = child_.text
+        Destination_TCP_State_ = self.gds_validate_string(Destination_TCP_State_, node, 'Destination_TCP_State')
+        self.Destination_TCP_State = Destination_TCP_State_
+    def buildChild_Layer7_Connections(self, child_, node, nodeName_):
+        obj_ = Layer7ConnectionsType.factory()
+        obj_.build(child_)
+        self.set_Layer7_Connections(obj_)
 # end class NetworkConnectionObjectType
 
 GDSClassesMapping = {
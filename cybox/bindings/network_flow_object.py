@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import network_packet_object
@@ -93,18 +95,21 @@ class NetworkLayerInfoType(GeneratedsSuper):
 
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Src_Socket_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Src_Socket_Address(obj_)
-        elif nodeName_ == 'Dest_Socket_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Dest_Socket_Address(obj_)
-        elif nodeName_ == 'IP_Protocol':
-            obj_ = network_packet_object.IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_IP_Protocol(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Src_Socket_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Src_Socket_Address(obj_)
+    def buildChild_Dest_Socket_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Dest_Socket_Address(obj_)
+    def buildChild_IP_Protocol(self, child_, node, nodeName_):
+        obj_ = network_packet_object.IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_IP_Protocol(obj_)
 # end class NetworkLayerInfoType
 
 class NetworkFlowLabelType(NetworkLayerInfoType):
@@ -193,19 +198,21 @@ class NetworkFlowLabelType(NetworkLayerInfoType):
     def buildAttributes(self, node, attrs, already_processed):
         super(NetworkFlowLabelType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Ingress_Interface_Index':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Ingress_Interface_Index(obj_)
-        elif nodeName_ == 'Egress_Interface_Index':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Egress_Interface_Index(obj_)
-        elif nodeName_ == 'IP_Type_Of_Service':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IP_Type_Of_Service(obj_)
-        super(NetworkFlowLabelType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Ingress_Interface_Index(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Ingress_Interface_Index(obj_)
+    def buildChild_Egress_Interface_Index(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Egress_Interface_Index(obj_)
+    def buildChild_IP_Type_Of_Service(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IP_Type_Of_Service(obj_)
 # end class NetworkFlowLabelType
 
 class UnidirectionalRecordType(GeneratedsSuper):
@@ -283,22 +290,25 @@ class UnidirectionalRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IPFIX_Message':
-            obj_ = IPFIXMessageType.factory()
-            obj_.build(child_)
-            self.set_IPFIX_Message(obj_)
-        elif nodeName_ == 'NetflowV9_Export_Packet':
-            obj_ = NetflowV9ExportPacketType.factory()
-            obj_.build(child_)
-            self.set_NetflowV9_Export_Packet(obj_)
-        elif nodeName_ == 'NetflowV5_Packet':
-            obj_ = NetflowV5PacketType.factory()
-            obj_.build(child_)
-            self.set_NetflowV5_Packet(obj_)
-        elif nodeName_ == 'SiLK_Record':
-            obj_ = SiLKRecordType.factory()
-            obj_.build(child_)
-            self.set_SiLK_Record(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IPFIX_Message(self, child_, node, nodeName_):
+        obj_ = IPFIXMessageType.factory()
+        obj_.build(child_)
+        self.set_IPFIX_Message(obj_)
+    def buildChild_NetflowV9_Export_Packet(self, child_, node, nodeName_):
+        obj_ = NetflowV9ExportPacketType.factory()
+        obj_.build(child_)
+        self.set_NetflowV9_Export_Packet(obj_)
+    def buildChild_NetflowV5_Packet(self, child_, node, nodeName_):
+        obj_ = NetflowV5PacketType.factory()
+        obj_.build(child_)
+        self.set_NetflowV5_Packet(obj_)
+    def buildChild_SiLK_Record(self, child_, node, nodeName_):
+        obj_ = SiLKRecordType.factory()
+        obj_.build(child_)
+        self.set_SiLK_Record(obj_)
 # end class UnidirectionalRecordType
 
 class BidirectionalRecordType(GeneratedsSuper):
@@ -362,10 +372,13 @@ class BidirectionalRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'YAF_Record':
-            obj_ = YAFRecordType.factory()
-            obj_.build(child_)
-            self.set_YAF_Record(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_YAF_Record(self, child_, node, nodeName_):
+        obj_ = YAFRecordType.factory()
+        obj_.build(child_)
+        self.set_YAF_Record(obj_)
 # end class BidirectionalRecordType
 
 class IPFIXMessageType(GeneratedsSuper):
@@ -437,14 +450,17 @@ class IPFIXMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Message_Header':
-            obj_ = IPFIXMessageHeaderType.factory()
-            obj_.build(child_)
-            self.set_Message_Header(obj_)
-        elif nodeName_ == 'Set':
-            obj_ = IPFIXSetType.factory()
-            obj_.build(child_)
-            self.Set.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Message_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXMessageHeaderType.factory()
+        obj_.build(child_)
+        self.set_Message_Header(obj_)
+    def buildChild_Set(self, child_, node, nodeName_):
+        obj_ = IPFIXSetType.factory()
+        obj_.build(child_)
+        self.Set.append(obj_)
 # end class IPFIXMessageType
 
 class IPFIXMessageHeaderType(GeneratedsSuper):
@@ -538,26 +554,29 @@ class IPFIXMessageHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Byte_Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Byte_Length(obj_)
-        elif nodeName_ == 'Export_Timestamp':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Export_Timestamp(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
-        elif nodeName_ == 'Observation_Domain_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Observation_Domain_ID(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Byte_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Byte_Length(obj_)
+    def buildChild_Export_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Export_Timestamp(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
+    def buildChild_Observation_Domain_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Observation_Domain_ID(obj_)
 # end class IPFIXMessageHeaderType
 
 class IPFIXSetType(GeneratedsSuper):
@@ -632,18 +651,21 @@ class IPFIXSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_Set':
-            obj_ = IPFIXTemplateSetType.factory()
-            obj_.build(child_)
-            self.set_Template_Set(obj_)
-        elif nodeName_ == 'Options_Template_Set':
-            obj_ = IPFIXOptionsTemplateSetType.factory()
-            obj_.build(child_)
-            self.set_Options_Template_Set(obj_)
-        elif nodeName_ == 'Data_Set':
-            obj_ = IPFIXDataSetType.factory()
-            obj_.build(child_)
-            self.set_Data_Set(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_Set(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateSetType.factory()
+        obj_.build(child_)
+        self.set_Template_Set(obj_)
+    def buildChild_Options_Template_Set(self, child_, node, nodeName_):
+        obj_ = IPFIXOptionsTemplateSetType.factory()
+        obj_.build(child_)
+        self.set_Options_Template_Set(obj_)
+    def buildChild_Data_Set(self, child_, node, nodeName_):
+        obj_ = IPFIXDataSetType.factory()
+        obj_.build(child_)
+        self.set_Data_Set(obj_)
 # end class IPFIXSetType
 
 class IPFIXTemplateSetType(GeneratedsSuper):
@@ -726,18 +748,21 @@ class IPFIXTemplateSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Set_Header':
-            obj_ = IPFIXSetHeaderType.factory()
-            obj_.build(child_)
-            self.set_Set_Header(obj_)
-        elif nodeName_ == 'Template_Record':
-            obj_ = IPFIXTemplateRecordType.factory()
-            obj_.build(child_)
-            self.Template_Record.append(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Set_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXSetHeaderType.factory()
+        obj_.build(child_)
+        self.set_Set_Header(obj_)
+    def buildChild_Template_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateRecordType.factory()
+        obj_.build(child_)
+        self.Template_Record.append(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
 # end class IPFIXTemplateSetType
 
 class IPFIXOptionsTemplateSetType(GeneratedsSuper):
@@ -821,18 +846,21 @@ class IPFIXOptionsTemplateSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Set_Header':
-            obj_ = IPFIXSetHeaderType.factory()
-            obj_.build(child_)
-            self.set_Set_Header(obj_)
-        elif nodeName_ == 'Options_Template_Record':
-            obj_ = IPFIXOptionsTemplateRecordType.factory()
-            obj_.build(child_)
-            self.Options_Template_Record.append(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Set_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXSetHeaderType.factory()
+        obj_.build(child_)
+        self.set_Set_Header(obj_)
+    def buildChild_Options_Template_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXOptionsTemplateRecordType.factory()
+        obj_.build(child_)
+        self.Options_Template_Record.append(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
 # end class IPFIXOptionsTemplateSetType
 
 class IPFIXDataSetType(GeneratedsSuper):
@@ -915,18 +943,21 @@ class IPFIXDataSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Set_Header':
-            obj_ = IPFIXSetHeaderType.factory()
-            obj_.build(child_)
-            self.set_Set_Header(obj_)
-        elif nodeName_ == 'Data_Record':
-            obj_ = IPFIXDataRecordType.factory()
-            obj_.build(child_)
-            self.Data_Record.append(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Set_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXSetHeaderType.factory()
+        obj_.build(child_)
+        self.set_Set_Header(obj_)
+    def buildChild_Data_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXDataRecordType.factory()
+        obj_.build(child_)
+        self.Data_Record.append(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
 # end class IPFIXDataSetType
 
 class IPFIXSetHeaderType(GeneratedsSuper):
@@ -995,14 +1026,17 @@ class IPFIXSetHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Set_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Set_ID(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Set_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Set_ID(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
 # end class IPFIXSetHeaderType
 
 class IPFIXTemplateRecordType(GeneratedsSuper):
@@ -1076,14 +1110,17 @@ class IPFIXTemplateRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_Record_Header':
-            obj_ = IPFIXTemplateRecordHeaderType.factory()
-            obj_.build(child_)
-            self.set_Template_Record_Header(obj_)
-        elif nodeName_ == 'Field_Specifier':
-            obj_ = IPFIXTemplateRecordFieldSpecifiersType.factory()
-            obj_.build(child_)
-            self.Field_Specifier.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_Record_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateRecordHeaderType.factory()
+        obj_.build(child_)
+        self.set_Template_Record_Header(obj_)
+    def buildChild_Field_Specifier(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateRecordFieldSpecifiersType.factory()
+        obj_.build(child_)
+        self.Field_Specifier.append(obj_)
 # end class IPFIXTemplateRecordType
 
 class IPFIXTemplateRecordHeaderType(GeneratedsSuper):
@@ -1156,14 +1193,17 @@ class IPFIXTemplateRecordHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Template_ID(obj_)
-        elif nodeName_ == 'Field_Count':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Field_Count(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Template_ID(obj_)
+    def buildChild_Field_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Field_Count(obj_)
 # end class IPFIXTemplateRecordHeaderType
 
 class IPFIXTemplateRecordFieldSpecifiersType(GeneratedsSuper):
@@ -1246,28 +1286,31 @@ class IPFIXTemplateRecordFieldSpecifiersType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Enterprise_Bit':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Enterprise_Bit')
-            self.Enterprise_Bit = ival_
-        elif nodeName_ == 'Information_Element_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Information_Element_ID(obj_)
-        elif nodeName_ == 'Field_Length':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Field_Length(obj_)
-        elif nodeName_ == 'Enterprise_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Enterprise_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Enterprise_Bit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Enterprise_Bit')
+        self.Enterprise_Bit = ival_
+    def buildChild_Information_Element_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Information_Element_ID(obj_)
+    def buildChild_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Field_Length(obj_)
+    def buildChild_Enterprise_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Enterprise_Number(obj_)
 # end class IPFIXTemplateRecordFieldSpecifiersType
 
 class IPFIXOptionsTemplateRecordType(GeneratedsSuper):
@@ -1341,14 +1384,17 @@ class IPFIXOptionsTemplateRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Options_Template_Record_Header':
-            obj_ = IPFIXOptionsTemplateRecordHeaderType.factory()
-            obj_.build(child_)
-            self.set_Options_Template_Record_Header(obj_)
-        elif nodeName_ == 'Field_Specifier':
-            obj_ = IPFIXTemplateRecordFieldSpecifiersType.factory()
-            obj_.build(child_)
-            self.Field_Specifier.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Options_Template_Record_Header(self, child_, node, nodeName_):
+        obj_ = IPFIXOptionsTemplateRecordHeaderType.factory()
+        obj_.build(child_)
+        self.set_Options_Template_Record_Header(obj_)
+    def buildChild_Field_Specifier(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateRecordFieldSpecifiersType.factory()
+        obj_.build(child_)
+        self.Field_Specifier.append(obj_)
 # end class IPFIXOptionsTemplateRecordType
 
 class IPFIXOptionsTemplateRecordHeaderType(GeneratedsSuper):
@@ -1429,18 +1475,21 @@ class IPFIXOptionsTemplateRecordHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Template_ID(obj_)
-        elif nodeName_ == 'Field_Count':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Field_Count(obj_)
-        elif nodeName_ == 'Scope_Field_Count':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Field_Count(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Template_ID(obj_)
+    def buildChild_Field_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Field_Count(obj_)
+    def buildChild_Scope_Field_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Field_Count(obj_)
 # end class IPFIXOptionsTemplateRecordHeaderType
 
 class IPFIXOptionsTemplateRecordFieldSpecifiersType(GeneratedsSuper):
@@ -1553,50 +1602,53 @@ class IPFIXOptionsTemplateRecordFieldSpecifiersType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Scope_Enterprise_Bit':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Scope_Enterprise_Bit')
-            self.Scope_Enterprise_Bit = ival_
-        elif nodeName_ == 'Scope_Information_Element_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Information_Element_ID(obj_)
-        elif nodeName_ == 'Scope_Field_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Field_Length(obj_)
-        elif nodeName_ == 'Scope_Enterprise_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Enterprise_Number(obj_)
-        elif nodeName_ == 'Option_Enterprise_Bit':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Option_Enterprise_Bit')
-            self.Option_Enterprise_Bit = ival_
-        elif nodeName_ == 'Option_Information_Element_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Information_Element_ID(obj_)
-        elif nodeName_ == 'Option_Field_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Field_Length(obj_)
-        elif nodeName_ == 'Option_Enterprise_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Enterprise_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Scope_Enterprise_Bit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Scope_Enterprise_Bit')
+        self.Scope_Enterprise_Bit = ival_
+    def buildChild_Scope_Information_Element_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Information_Element_ID(obj_)
+    def buildChild_Scope_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Field_Length(obj_)
+    def buildChild_Scope_Enterprise_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Enterprise_Number(obj_)
+    def buildChild_Option_Enterprise_Bit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Option_Enterprise_Bit')
+        self.Option_Enterprise_Bit = ival_
+    def buildChild_Option_Information_Element_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Information_Element_ID(obj_)
+    def buildChild_Option_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Field_Length(obj_)
+    def buildChild_Option_Enterprise_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Enterprise_Number(obj_)
 # end class IPFIXOptionsTemplateRecordFieldSpecifiersType
 
 class IPFIXDataRecordType(GeneratedsSuper):
@@ -1665,10 +1717,13 @@ class IPFIXDataRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Field_Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Field_Value.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Field_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Field_Value.append(obj_)
 # end class IPFIXDataRecordType
 
 class NetflowV9ExportPacketType(GeneratedsSuper):
@@ -1740,14 +1795,17 @@ class NetflowV9ExportPacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Packet_Header':
-            obj_ = NetflowV9PacketHeaderType.factory()
-            obj_.build(child_)
-            self.set_Packet_Header(obj_)
-        elif nodeName_ == 'Flow_Set':
-            obj_ = NetflowV9FlowSetType.factory()
-            obj_.build(child_)
-            self.Flow_Set.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Packet_Header(self, child_, node, nodeName_):
+        obj_ = NetflowV9PacketHeaderType.factory()
+        obj_.build(child_)
+        self.set_Packet_Header(obj_)
+    def buildChild_Flow_Set(self, child_, node, nodeName_):
+        obj_ = NetflowV9FlowSetType.factory()
+        obj_.build(child_)
+        self.Flow_Set.append(obj_)
 # end class NetflowV9ExportPacketType
 
 class NetflowV9PacketHeaderType(GeneratedsSuper):
@@ -1845,30 +1903,33 @@ class NetflowV9PacketHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Record_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Record_Count(obj_)
-        elif nodeName_ == 'Sys_Up_Time':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sys_Up_Time(obj_)
-        elif nodeName_ == 'Unix_Secs':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Unix_Secs(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
-        elif nodeName_ == 'Source_ID':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Source_ID(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Record_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Record_Count(obj_)
+    def buildChild_Sys_Up_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sys_Up_Time(obj_)
+    def buildChild_Unix_Secs(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Unix_Secs(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
+    def buildChild_Source_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Source_ID(obj_)
 # end class NetflowV9PacketHeaderType
 
 class NetflowV9FlowSetType(GeneratedsSuper):
@@ -1943,18 +2004,21 @@ class NetflowV9FlowSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_Flow_Set':
-            obj_ = NetflowV9TemplateFlowSetType.factory()
-            obj_.build(child_)
-            self.set_Template_Flow_Set(obj_)
-        elif nodeName_ == 'Options_Template_Flow_Set':
-            obj_ = NetflowV9OptionsTemplateFlowSetType.factory()
-            obj_.build(child_)
-            self.set_Options_Template_Flow_Set(obj_)
-        elif nodeName_ == 'Data_Flow_Set':
-            obj_ = NetflowV9DataFlowSetType.factory()
-            obj_.build(child_)
-            self.set_Data_Flow_Set(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_Flow_Set(self, child_, node, nodeName_):
+        obj_ = NetflowV9TemplateFlowSetType.factory()
+        obj_.build(child_)
+        self.set_Template_Flow_Set(obj_)
+    def buildChild_Options_Template_Flow_Set(self, child_, node, nodeName_):
+        obj_ = NetflowV9OptionsTemplateFlowSetType.factory()
+        obj_.build(child_)
+        self.set_Options_Template_Flow_Set(obj_)
+    def buildChild_Data_Flow_Set(self, child_, node, nodeName_):
+        obj_ = NetflowV9DataFlowSetType.factory()
+        obj_.build(child_)
+        self.set_Data_Flow_Set(obj_)
 # end class NetflowV9FlowSetType
 
 class NetflowV9TemplateFlowSetType(GeneratedsSuper):
@@ -2037,18 +2101,21 @@ class NetflowV9TemplateFlowSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Set_ID':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Set_ID(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Template_Record':
-            obj_ = IPFIXTemplateRecordType.factory()
-            obj_.build(child_)
-            self.Template_Record.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Set_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Set_ID(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Template_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXTemplateRecordType.factory()
+        obj_.build(child_)
+        self.Template_Record.append(obj_)
 # end class NetflowV9TemplateFlowSetType
 
 class NetflowV9TemplateRecordType(GeneratedsSuper):
@@ -2137,22 +2204,25 @@ class NetflowV9TemplateRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Template_ID(obj_)
-        elif nodeName_ == 'Field_Count':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Field_Count(obj_)
-        elif nodeName_ == 'Field_Type':
-            obj_ = NetflowV9FieldType.factory()
-            obj_.build(child_)
-            self.set_Field_Type(obj_)
-        elif nodeName_ == 'Field_Length':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Field_Length(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Template_ID(obj_)
+    def buildChild_Field_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Field_Count(obj_)
+    def buildChild_Field_Type(self, child_, node, nodeName_):
+        obj_ = NetflowV9FieldType.factory()
+        obj_.build(child_)
+        self.set_Field_Type(obj_)
+    def buildChild_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Field_Length(obj_)
 # end class NetflowV9TemplateRecordType
 
 class NetflowV9OptionsTemplateFlowSetType(GeneratedsSuper):
@@ -2243,22 +2313,25 @@ class NetflowV9OptionsTemplateFlowSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Set_ID':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Set_ID(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Options_Template_Record':
-            obj_ = IPFIXOptionsTemplateRecordType.factory()
-            obj_.build(child_)
-            self.Options_Template_Record.append(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Set_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Set_ID(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Options_Template_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXOptionsTemplateRecordType.factory()
+        obj_.build(child_)
+        self.Options_Template_Record.append(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
 # end class NetflowV9OptionsTemplateFlowSetType
 
 class NetflowV9OptionsTemplateRecordType(GeneratedsSuper):
@@ -2368,34 +2441,37 @@ class NetflowV9OptionsTemplateRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Template_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Template_ID(obj_)
-        elif nodeName_ == 'Option_Scope_Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Scope_Length(obj_)
-        elif nodeName_ == 'Option_Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Length(obj_)
-        elif nodeName_ == 'Scope_Field_Type':
-            obj_ = NetflowV9ScopeFieldType.factory()
-            obj_.build(child_)
-            self.set_Scope_Field_Type(obj_)
-        elif nodeName_ == 'Scope_Field_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Field_Length(obj_)
-        elif nodeName_ == 'Option_Field_Type':
-            obj_ = NetflowV9FieldType.factory()
-            obj_.build(child_)
-            self.set_Option_Field_Type(obj_)
-        elif nodeName_ == 'Option_Field_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Field_Length(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Template_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Template_ID(obj_)
+    def buildChild_Option_Scope_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Scope_Length(obj_)
+    def buildChild_Option_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Length(obj_)
+    def buildChild_Scope_Field_Type(self, child_, node, nodeName_):
+        obj_ = NetflowV9ScopeFieldType.factory()
+        obj_.build(child_)
+        self.set_Scope_Field_Type(obj_)
+    def buildChild_Scope_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Field_Length(obj_)
+    def buildChild_Option_Field_Type(self, child_, node, nodeName_):
+        obj_ = NetflowV9FieldType.factory()
+        obj_.build(child_)
+        self.set_Option_Field_Type(obj_)
+    def buildChild_Option_Field_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Field_Length(obj_)
 # end class NetflowV9OptionsTemplateRecordType
 
 class NetflowV9DataFlowSetType(GeneratedsSuper):
@@ -2488,22 +2564,25 @@ class NetflowV9DataFlowSetType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Set_ID_Template_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Set_ID_Template_ID(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Data_Record':
-            obj_ = IPFIXDataRecordType.factory()
-            obj_.build(child_)
-            self.Data_Record.append(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Set_ID_Template_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Set_ID_Template_ID(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Data_Record(self, child_, node, nodeName_):
+        obj_ = IPFIXDataRecordType.factory()
+        obj_.build(child_)
+        self.Data_Record.append(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
 # end class NetflowV9DataFlowSetType
 
 class NetflowV9DataRecordType(GeneratedsSuper):
@@ -2583,14 +2662,17 @@ class NetflowV9DataRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Data_Record':
-            obj_ = FlowDataRecordType.factory()
-            obj_.build(child_)
-            self.Flow_Data_Record.append(obj_)
-        elif nodeName_ == 'Options_Data_Record':
-            obj_ = OptionsDataRecordType.factory()
-            obj_.build(child_)
-            self.Options_Data_Record.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Data_Record(self, child_, node, nodeName_):
+        obj_ = FlowDataRecordType.factory()
+        obj_.build(child_)
+        self.Flow_Data_Record.append(obj_)
+    def buildChild_Options_Data_Record(self, child_, node, nodeName_):
+        obj_ = OptionsDataRecordType.factory()
+        obj_.build(child_)
+        self.Options_Data_Record.append(obj_)
 # end class NetflowV9DataRecordType
 
 class FlowDataRecordType(GeneratedsSuper):
@@ -2656,10 +2738,13 @@ class FlowDataRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Record_Collection_Element':
-            obj_ = FlowCollectionElementType.factory()
-            obj_.build(child_)
-            self.Flow_Record_Collection_Element.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Record_Collection_Element(self, child_, node, nodeName_):
+        obj_ = FlowCollectionElementType.factory()
+        obj_.build(child_)
+        self.Flow_Record_Collection_Element.append(obj_)
 # end class FlowDataRecordType
 
 class FlowCollectionElementType(GeneratedsSuper):
@@ -2728,10 +2813,13 @@ class FlowCollectionElementType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Record_Field_Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Flow_Record_Field_Value.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Record_Field_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Flow_Record_Field_Value.append(obj_)
 # end class FlowCollectionElementType
 
 class OptionsDataRecordType(GeneratedsSuper):
@@ -2807,14 +2895,17 @@ class OptionsDataRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Scope_Field_Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Scope_Field_Value(obj_)
-        elif nodeName_ == 'Option_Record_Collection_Element':
-            obj_ = OptionCollectionElementType.factory()
-            obj_.build(child_)
-            self.Option_Record_Collection_Element.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Scope_Field_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Scope_Field_Value(obj_)
+    def buildChild_Option_Record_Collection_Element(self, child_, node, nodeName_):
+        obj_ = OptionCollectionElementType.factory()
+        obj_.build(child_)
+        self.Option_Record_Collection_Element.append(obj_)
 # end class OptionsDataRecordType
 
 class OptionCollectionElementType(GeneratedsSuper):
@@ -2883,10 +2974,13 @@ class OptionCollectionElementType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Option_Record_Field_Value':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Option_Record_Field_Value.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Option_Record_Field_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Option_Record_Field_Value.append(obj_)
 # end class OptionCollectionElementType
 
 class NetflowV5PacketType(GeneratedsSuper):
@@ -2960,14 +3054,17 @@ class NetflowV5PacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Header':
-            obj_ = NetflowV5FlowHeaderType.factory()
-            obj_.build(child_)
-            self.set_Flow_Header(obj_)
-        elif nodeName_ == 'Flow_Record':
-            obj_ = NetflowV5FlowRecordType.factory()
-            obj_.build(child_)
-            self.Flow_Record.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Header(self, child_, node, nodeName_):
+        obj_ = NetflowV5FlowHeaderType.factory()
+        obj_.build(child_)
+        self.set_Flow_Header(obj_)
+    def buildChild_Flow_Record(self, child_, node, nodeName_):
+        obj_ = NetflowV5FlowRecordType.factory()
+        obj_.build(child_)
+        self.Flow_Record.append(obj_)
 # end class NetflowV5PacketType
 
 class NetflowV5FlowHeaderType(GeneratedsSuper):
@@ -3088,42 +3185,45 @@ class NetflowV5FlowHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Count(obj_)
-        elif nodeName_ == 'Sys_Up_Time':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sys_Up_Time(obj_)
-        elif nodeName_ == 'Unix_Secs':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Unix_Secs(obj_)
-        elif nodeName_ == 'Unix_Nsecs':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Unix_Nsecs(obj_)
-        elif nodeName_ == 'Flow_Sequence':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Sequence(obj_)
-        elif nodeName_ == 'Engine_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Engine_Type(obj_)
-        elif nodeName_ == 'Engine_ID':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Engine_ID(obj_)
-        elif nodeName_ == 'Sampling_Interval':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sampling_Interval(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Count(obj_)
+    def buildChild_Sys_Up_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sys_Up_Time(obj_)
+    def buildChild_Unix_Secs(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Unix_Secs(obj_)
+    def buildChild_Unix_Nsecs(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Unix_Nsecs(obj_)
+    def buildChild_Flow_Sequence(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Sequence(obj_)
+    def buildChild_Engine_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Engine_Type(obj_)
+    def buildChild_Engine_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Engine_ID(obj_)
+    def buildChild_Sampling_Interval(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sampling_Interval(obj_)
 # end class NetflowV5FlowHeaderType
 
 class NetflowV5FlowRecordType(GeneratedsSuper):
@@ -3261,54 +3361,57 @@ class NetflowV5FlowRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Nexthop_IPv4_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Nexthop_IPv4_Addr(obj_)
-        elif nodeName_ == 'Packet_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Packet_Count(obj_)
-        elif nodeName_ == 'Byte_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Byte_Count(obj_)
-        elif nodeName_ == 'SysUpTime_Start':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SysUpTime_Start(obj_)
-        elif nodeName_ == 'SysUpTime_End':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SysUpTime_End(obj_)
-        elif nodeName_ == 'Padding1':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding1(obj_)
-        elif nodeName_ == 'TCP_Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TCP_Flags(obj_)
-        elif nodeName_ == 'Src_Autonomous_System':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Src_Autonomous_System(obj_)
-        elif nodeName_ == 'Dest_Autonomous_System':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Dest_Autonomous_System(obj_)
-        elif nodeName_ == 'Src_IP_Mask_Bit_Count':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Src_IP_Mask_Bit_Count(obj_)
-        elif nodeName_ == 'Dest_IP_Mask_Bit_Count':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Dest_IP_Mask_Bit_Count(obj_)
-        elif nodeName_ == 'Padding2':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding2(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Nexthop_IPv4_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Nexthop_IPv4_Addr(obj_)
+    def buildChild_Packet_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Packet_Count(obj_)
+    def buildChild_Byte_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Byte_Count(obj_)
+    def buildChild_SysUpTime_Start(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SysUpTime_Start(obj_)
+    def buildChild_SysUpTime_End(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SysUpTime_End(obj_)
+    def buildChild_Padding1(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding1(obj_)
+    def buildChild_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TCP_Flags(obj_)
+    def buildChild_Src_Autonomous_System(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Src_Autonomous_System(obj_)
+    def buildChild_Dest_Autonomous_System(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Dest_Autonomous_System(obj_)
+    def buildChild_Src_IP_Mask_Bit_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Src_IP_Mask_Bit_Count(obj_)
+    def buildChild_Dest_IP_Mask_Bit_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Dest_IP_Mask_Bit_Count(obj_)
+    def buildChild_Padding2(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding2(obj_)
 # end class NetflowV5FlowRecordType
 
 class SiLKRecordType(GeneratedsSuper):
@@ -3509,86 +3612,89 @@ class SiLKRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Packet_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Packet_Count(obj_)
-        elif nodeName_ == 'Byte_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Byte_Count(obj_)
-        elif nodeName_ == 'TCP_Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TCP_Flags(obj_)
-        elif nodeName_ == 'Start_Time':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Start_Time(obj_)
-        elif nodeName_ == 'Duration':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Duration(obj_)
-        elif nodeName_ == 'End_Time':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_End_Time(obj_)
-        elif nodeName_ == 'Sensor_Info':
-            obj_ = SiLKSensorInfoType.factory()
-            obj_.build(child_)
-            self.set_Sensor_Info(obj_)
-        elif nodeName_ == 'ICMP_Type':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ICMP_Type(obj_)
-        elif nodeName_ == 'ICMP_Code':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ICMP_Code(obj_)
-        elif nodeName_ == 'Router_Next_Hop_IP':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Router_Next_Hop_IP(obj_)
-        elif nodeName_ == 'Initial_TCP_Flags':
-            obj_ = network_packet_object.TCPFlagsType.factory()
-            obj_.build(child_)
-            self.set_Initial_TCP_Flags(obj_)
-        elif nodeName_ == 'Session_TCP_Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Session_TCP_Flags(obj_)
-        elif nodeName_ == 'Flow_Attributes':
-            obj_ = SiLKFlowAttributesType.factory()
-            obj_.build(child_)
-            self.set_Flow_Attributes(obj_)
-        elif nodeName_ == 'Flow_Application':
-            obj_ = network_packet_object.IANAPortNumberRegistryType.factory()
-            obj_.build(child_)
-            self.set_Flow_Application(obj_)
-        elif nodeName_ == 'Src_IP_Type':
-            obj_ = SiLKAddressType.factory()
-            obj_.build(child_)
-            self.set_Src_IP_Type(obj_)
-        elif nodeName_ == 'Dest_IP_Type':
-            obj_ = SiLKAddressType.factory()
-            obj_.build(child_)
-            self.set_Dest_IP_Type(obj_)
-        elif nodeName_ == 'Src_Country_Code':
-            obj_ = SiLKCountryCodeType.factory()
-            obj_.build(child_)
-            self.set_Src_Country_Code(obj_)
-        elif nodeName_ == 'Dest_Country_Code':
-            obj_ = SiLKCountryCodeType.factory()
-            obj_.build(child_)
-            self.set_Dest_Country_Code(obj_)
-        elif nodeName_ == 'Src_MAPNAME':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Src_MAPNAME(obj_)
-        elif nodeName_ == 'Dest_MAPNAME':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Dest_MAPNAME(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Packet_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Packet_Count(obj_)
+    def buildChild_Byte_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Byte_Count(obj_)
+    def buildChild_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TCP_Flags(obj_)
+    def buildChild_Start_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Start_Time(obj_)
+    def buildChild_Duration(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Duration(obj_)
+    def buildChild_End_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_End_Time(obj_)
+    def buildChild_Sensor_Info(self, child_, node, nodeName_):
+        obj_ = SiLKSensorInfoType.factory()
+        obj_.build(child_)
+        self.set_Sensor_Info(obj_)
+    def buildChild_ICMP_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ICMP_Type(obj_)
+    def buildChild_ICMP_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ICMP_Code(obj_)
+    def buildChild_Router_Next_Hop_IP(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Router_Next_Hop_IP(obj_)
+    def buildChild_Initial_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = network_packet_object.TCPFlagsType.factory()
+        obj_.build(child_)
+        self.set_Initial_TCP_Flags(obj_)
+    def buildChild_Session_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Session_TCP_Flags(obj_)
+    def buildChild_Flow_Attributes(self, child_, node, nodeName_):
+        obj_ = SiLKFlowAttributesType.factory()
+        obj_.build(child_)
+        self.set_Flow_Attributes(obj_)
+    def buildChild_Flow_Application(self, child_, node, nodeName_):
+        obj_ = network_packet_object.IANAPortNumberRegistryType.factory()
+        obj_.build(child_)
+        self.set_Flow_Application(obj_)
+    def buildChild_Src_IP_Type(self, child_, node, nodeName_):
+        obj_ = SiLKAddressType.factory()
+        obj_.build(child_)
+        self.set_Src_IP_Type(obj_)
+    def buildChild_Dest_IP_Type(self, child_, node, nodeName_):
+        obj_ = SiLKAddressType.factory()
+        obj_.build(child_)
+        self.set_Dest_IP_Type(obj_)
+    def buildChild_Src_Country_Code(self, child_, node, nodeName_):
+        obj_ = SiLKCountryCodeType.factory()
+        obj_.build(child_)
+        self.set_Src_Country_Code(obj_)
+    def buildChild_Dest_Country_Code(self, child_, node, nodeName_):
+        obj_ = SiLKCountryCodeType.factory()
+        obj_.build(child_)
+        self.set_Dest_Country_Code(obj_)
+    def buildChild_Src_MAPNAME(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Src_MAPNAME(obj_)
+    def buildChild_Dest_MAPNAME(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Dest_MAPNAME(obj_)
 # end class SiLKRecordType
 
 class SiLKSensorInfoType(GeneratedsSuper):
@@ -3669,18 +3775,21 @@ class SiLKSensorInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Sensor_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sensor_ID(obj_)
-        elif nodeName_ == 'Class':
-            obj_ = SiLKSensorClassType.factory()
-            obj_.build(child_)
-            self.set_Class(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = SiLKDirectionType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Sensor_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sensor_ID(obj_)
+    def buildChild_Class(self, child_, node, nodeName_):
+        obj_ = SiLKSensorClassType.factory()
+        obj_.build(child_)
+        self.set_Class(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = SiLKDirectionType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class SiLKSensorInfoType
 
 class YAFRecordType(GeneratedsSuper):
@@ -3751,14 +3860,17 @@ class YAFRecordType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow':
-            obj_ = YAFFlowType.factory()
-            obj_.build(child_)
-            self.set_Flow(obj_)
-        elif nodeName_ == 'Reverse_Flow':
-            obj_ = YAFReverseFlowType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Flow(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow(self, child_, node, nodeName_):
+        obj_ = YAFFlowType.factory()
+        obj_.build(child_)
+        self.set_Flow(obj_)
+    def buildChild_Reverse_Flow(self, child_, node, nodeName_):
+        obj_ = YAFReverseFlowType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Flow(obj_)
 # end class YAFRecordType
 
 class YAFFlowType(GeneratedsSuper):
@@ -3905,62 +4017,65 @@ class YAFFlowType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flow_Start_Milliseconds':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Start_Milliseconds(obj_)
-        elif nodeName_ == 'Flow_End_Milliseconds':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_End_Milliseconds(obj_)
-        elif nodeName_ == 'Octet_Total_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Octet_Total_Count(obj_)
-        elif nodeName_ == 'Packet_Total_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Packet_Total_Count(obj_)
-        elif nodeName_ == 'Flow_End_Reason':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_End_Reason(obj_)
-        elif nodeName_ == 'SiLK_App_Label':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SiLK_App_Label(obj_)
-        elif nodeName_ == 'Payload_Entropy':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Payload_Entropy(obj_)
-        elif nodeName_ == 'ML_App_Label':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ML_App_Label(obj_)
-        elif nodeName_ == 'TCP_Flow':
-            obj_ = YAFTCPFlowType.factory()
-            obj_.build(child_)
-            self.set_TCP_Flow(obj_)
-        elif nodeName_ == 'Vlan_ID_MAC_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Vlan_ID_MAC_Addr(obj_)
-        elif nodeName_ == 'Passive_OS_Fingerprinting':
-            obj_ = cybox_common.PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Passive_OS_Fingerprinting(obj_)
-        elif nodeName_ == 'First_Packet_Banner':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_First_Packet_Banner(obj_)
-        elif nodeName_ == 'Second_Packet_Banner':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Second_Packet_Banner(obj_)
-        elif nodeName_ == 'N_Bytes_Payload':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_N_Bytes_Payload(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flow_Start_Milliseconds(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Start_Milliseconds(obj_)
+    def buildChild_Flow_End_Milliseconds(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_End_Milliseconds(obj_)
+    def buildChild_Octet_Total_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Octet_Total_Count(obj_)
+    def buildChild_Packet_Total_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Packet_Total_Count(obj_)
+    def buildChild_Flow_End_Reason(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_End_Reason(obj_)
+    def buildChild_SiLK_App_Label(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SiLK_App_Label(obj_)
+    def buildChild_Payload_Entropy(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Payload_Entropy(obj_)
+    def buildChild_ML_App_Label(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ML_App_Label(obj_)
+    def buildChild_TCP_Flow(self, child_, node, nodeName_):
+        obj_ = YAFTCPFlowType.factory()
+        obj_.build(child_)
+        self.set_TCP_Flow(obj_)
+    def buildChild_Vlan_ID_MAC_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Vlan_ID_MAC_Addr(obj_)
+    def buildChild_Passive_OS_Fingerprinting(self, child_, node, nodeName_):
+        obj_ = cybox_common.PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Passive_OS_Fingerprinting(obj_)
+    def buildChild_First_Packet_Banner(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_First_Packet_Banner(obj_)
+    def buildChild_Second_Packet_Banner(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Second_Packet_Banner(obj_)
+    def buildChild_N_Bytes_Payload(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_N_Bytes_Payload(obj_)
 # end class YAFFlowType
 
 class YAFReverseFlowType(GeneratedsSuper):
@@ -4075,42 +4190,45 @@ class YAFReverseFlowType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Reverse_Octet_Total_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Octet_Total_Count(obj_)
-        elif nodeName_ == 'Reverse_Packet_Total_Count':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Packet_Total_Count(obj_)
-        elif nodeName_ == 'Reverse_Payload_Entropy':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Payload_Entropy(obj_)
-        elif nodeName_ == 'Reverse_Flow_Delta_Milliseconds':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Flow_Delta_Milliseconds(obj_)
-        elif nodeName_ == 'TCP_Reverse_Flow':
-            obj_ = YAFTCPFlowType.factory()
-            obj_.build(child_)
-            self.set_TCP_Reverse_Flow(obj_)
-        elif nodeName_ == 'Reverse_Vlan_ID_MAC_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Vlan_ID_MAC_Addr(obj_)
-        elif nodeName_ == 'Reverse_Passive_OS_Fingerprinting':
-            obj_ = cybox_common.PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Reverse_Passive_OS_Fingerprinting(obj_)
-        elif nodeName_ == 'Reverse_First_Packet':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_First_Packet(obj_)
-        elif nodeName_ == 'Reverse_N_Bytes_Payload':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reverse_N_Bytes_Payload(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Reverse_Octet_Total_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Octet_Total_Count(obj_)
+    def buildChild_Reverse_Packet_Total_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Packet_Total_Count(obj_)
+    def buildChild_Reverse_Payload_Entropy(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Payload_Entropy(obj_)
+    def buildChild_Reverse_Flow_Delta_Milliseconds(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Flow_Delta_Milliseconds(obj_)
+    def buildChild_TCP_Reverse_Flow(self, child_, node, nodeName_):
+        obj_ = YAFTCPFlowType.factory()
+        obj_.build(child_)
+        self.set_TCP_Reverse_Flow(obj_)
+    def buildChild_Reverse_Vlan_ID_MAC_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Vlan_ID_MAC_Addr(obj_)
+    def buildChild_Reverse_Passive_OS_Fingerprinting(self, child_, node, nodeName_):
+        obj_ = cybox_common.PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Reverse_Passive_OS_Fingerprinting(obj_)
+    def buildChild_Reverse_First_Packet(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_First_Packet(obj_)
+    def buildChild_Reverse_N_Bytes_Payload(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reverse_N_Bytes_Payload(obj_)
 # end class YAFReverseFlowType
 
 class YAFTCPFlowType(GeneratedsSuper):
@@ -4188,18 +4306,21 @@ class YAFTCPFlowType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'TCP_Sequence_Number':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TCP_Sequence_Number(obj_)
-        elif nodeName_ == 'Initial_TCP_Flags':
-            obj_ = network_packet_object.TCPFlagsType.factory()
-            obj_.build(child_)
-            self.set_Initial_TCP_Flags(obj_)
-        elif nodeName_ == 'Union_TCP_Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Union_TCP_Flags(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_TCP_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TCP_Sequence_Number(obj_)
+    def buildChild_Initial_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = network_packet_object.TCPFlagsType.factory()
+        obj_.build(child_)
+        self.set_Initial_TCP_Flags(obj_)
+    def buildChild_Union_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Union_TCP_Flags(obj_)
 # end class YAFTCPFlowType
 
 class SiLKSensorClassType(cybox_common.BaseObjectPropertyType):
@@ -4799,19 +4920,21 @@ class NetworkFlowObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(NetworkFlowObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network_Flow_Label':
-            obj_ = NetworkFlowLabelType.factory()
-            obj_.build(child_)
-            self.set_Network_Flow_Label(obj_)
-        elif nodeName_ == 'Unidirectional_Flow_Record':
-            obj_ = UnidirectionalRecordType.factory()
-            obj_.build(child_)
-            self.set_Unidirectional_Flow_Record(obj_)
-        elif nodeName_ == 'Bidirectional_Flow_Record':
-            obj_ = BidirectionalRecordType.factory()
-            obj_.build(child_)
-            self.set_Bidirectional_Flow_Record(obj_)
-        super(NetworkFlowObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Network_Flow_Label(self, child_, node, nodeName_):
+        obj_ = NetworkFlowLabelType.factory()
+        obj_.build(child_)
+        self.set_Network_Flow_Label(obj_)
+    def buildChild_Unidirectional_Flow_Record(self, child_, node, nodeName_):
+        obj_ = UnidirectionalRecordType.factory()
+        obj_.build(child_)
+        self.set_Unidirectional_Flow_Record(obj_)
+    def buildChild_Bidirectional_Flow_Record(self, child_, node, nodeName_):
+        obj_ = BidirectionalRecordType.factory()
+        obj_.build(child_)
+        self.set_Bidirectional_Flow_Record(obj_)
 # end class NetworkFlowObjectType
 
 GDSClassesMapping = {
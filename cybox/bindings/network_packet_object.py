@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import port_object
@@ -73,14 +75,17 @@ class LinkLayerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Physical_Interface':
-            obj_ = PhysicalInterfaceType.factory()
-            obj_.build(child_)
-            self.set_Physical_Interface(obj_)
-        elif nodeName_ == 'Logical_Protocols':
-            obj_ = LogicalProtocolType.factory()
-            obj_.build(child_)
-            self.set_Logical_Protocols(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Physical_Interface(self, child_, node, nodeName_):
+        obj_ = PhysicalInterfaceType.factory()
+        obj_.build(child_)
+        self.set_Physical_Interface(obj_)
+    def buildChild_Logical_Protocols(self, child_, node, nodeName_):
+        obj_ = LogicalProtocolType.factory()
+        obj_.build(child_)
+        self.set_Logical_Protocols(obj_)
 # end class LinkLayerType
 
 class PhysicalInterfaceType(GeneratedsSuper):
@@ -141,10 +146,13 @@ class PhysicalInterfaceType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Ethernet':
-            obj_ = EthernetInterfaceType.factory()
-            obj_.build(child_)
-            self.set_Ethernet(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Ethernet(self, child_, node, nodeName_):
+        obj_ = EthernetInterfaceType.factory()
+        obj_.build(child_)
+        self.set_Ethernet(obj_)
 # end class PhysicalInterfaceType
 
 class LogicalProtocolType(GeneratedsSuper):
@@ -211,14 +219,17 @@ class LogicalProtocolType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ARP_RARP':
-            obj_ = ARPType.factory()
-            obj_.build(child_)
-            self.set_ARP_RARP(obj_)
-        elif nodeName_ == 'NDP':
-            obj_ = NDPType.factory()
-            obj_.build(child_)
-            self.set_NDP(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ARP_RARP(self, child_, node, nodeName_):
+        obj_ = ARPType.factory()
+        obj_.build(child_)
+        self.set_ARP_RARP(obj_)
+    def buildChild_NDP(self, child_, node, nodeName_):
+        obj_ = NDPType.factory()
+        obj_.build(child_)
+        self.set_NDP(obj_)
 # end class LogicalProtocolType
 
 class EthernetInterfaceType(GeneratedsSuper):
@@ -280,10 +291,13 @@ class EthernetInterfaceType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Ethernet_Header':
-            obj_ = EthernetHeaderType.factory()
-            obj_.build(child_)
-            self.set_Ethernet_Header(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Ethernet_Header(self, child_, node, nodeName_):
+        obj_ = EthernetHeaderType.factory()
+        obj_.build(child_)
+        self.set_Ethernet_Header(obj_)
 # end class EthernetInterfaceType
 
 class EthernetHeaderType(GeneratedsSuper):
@@ -366,22 +380,25 @@ class EthernetHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Destination_MAC_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Destination_MAC_Addr(obj_)
-        elif nodeName_ == 'Source_MAC_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Source_MAC_Addr(obj_)
-        elif nodeName_ == 'Type_Or_Length':
-            obj_ = TypeLengthType.factory()
-            obj_.build(child_)
-            self.set_Type_Or_Length(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Destination_MAC_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Destination_MAC_Addr(obj_)
+    def buildChild_Source_MAC_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Source_MAC_Addr(obj_)
+    def buildChild_Type_Or_Length(self, child_, node, nodeName_):
+        obj_ = TypeLengthType.factory()
+        obj_.build(child_)
+        self.set_Type_Or_Length(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
 # end class EthernetHeaderType
 
 class TypeLengthType(GeneratedsSuper):
@@ -454,14 +471,17 @@ class TypeLengthType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Internet_Layer_Type':
-            obj_ = IANAEtherType.factory()
-            obj_.build(child_)
-            self.set_Internet_Layer_Type(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Internet_Layer_Type(self, child_, node, nodeName_):
+        obj_ = IANAEtherType.factory()
+        obj_.build(child_)
+        self.set_Internet_Layer_Type(obj_)
 # end class TypeLengthType
 
 class ARPType(GeneratedsSuper):
@@ -586,42 +606,45 @@ class ARPType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hardware_Addr_Type':
-            obj_ = IANAHardwareType.factory()
-            obj_.build(child_)
-            self.set_Hardware_Addr_Type(obj_)
-        elif nodeName_ == 'Proto_Addr_Type':
-            obj_ = IANAEtherType.factory()
-            obj_.build(child_)
-            self.set_Proto_Addr_Type(obj_)
-        elif nodeName_ == 'Hardware_Addr_Size':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hardware_Addr_Size(obj_)
-        elif nodeName_ == 'Proto_Addr_Size':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Proto_Addr_Size(obj_)
-        elif nodeName_ == 'Op_Type':
-            obj_ = ARPOpType.factory()
-            obj_.build(child_)
-            self.set_Op_Type(obj_)
-        elif nodeName_ == 'Sender_Hardware_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Sender_Hardware_Addr(obj_)
-        elif nodeName_ == 'Sender_Protocol_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Sender_Protocol_Addr(obj_)
-        elif nodeName_ == 'Recip_Hardware_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Recip_Hardware_Addr(obj_)
-        elif nodeName_ == 'Recip_Protocol_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Recip_Protocol_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hardware_Addr_Type(self, child_, node, nodeName_):
+        obj_ = IANAHardwareType.factory()
+        obj_.build(child_)
+        self.set_Hardware_Addr_Type(obj_)
+    def buildChild_Proto_Addr_Type(self, child_, node, nodeName_):
+        obj_ = IANAEtherType.factory()
+        obj_.build(child_)
+        self.set_Proto_Addr_Type(obj_)
+    def buildChild_Hardware_Addr_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hardware_Addr_Size(obj_)
+    def buildChild_Proto_Addr_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Proto_Addr_Size(obj_)
+    def buildChild_Op_Type(self, child_, node, nodeName_):
+        obj_ = ARPOpType.factory()
+        obj_.build(child_)
+        self.set_Op_Type(obj_)
+    def buildChild_Sender_Hardware_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Sender_Hardware_Addr(obj_)
+    def buildChild_Sender_Protocol_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Sender_Protocol_Addr(obj_)
+    def buildChild_Recip_Hardware_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Recip_Hardware_Addr(obj_)
+    def buildChild_Recip_Protocol_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Recip_Protocol_Addr(obj_)
 # end class ARPType
 
 class NDPType(GeneratedsSuper):
@@ -713,30 +736,33 @@ class NDPType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ICMPv6_Header':
-            obj_ = ICMPv6HeaderType.factory()
-            obj_.build(child_)
-            self.set_ICMPv6_Header(obj_)
-        elif nodeName_ == 'Router_Solicitation':
-            obj_ = RouterSolicitationType.factory()
-            obj_.build(child_)
-            self.set_Router_Solicitation(obj_)
-        elif nodeName_ == 'Router_Advertisement':
-            obj_ = RouterAdvertisementType.factory()
-            obj_.build(child_)
-            self.set_Router_Advertisement(obj_)
-        elif nodeName_ == 'Neighbor_Solicitation':
-            obj_ = NeighborSolicitationType.factory()
-            obj_.build(child_)
-            self.set_Neighbor_Solicitation(obj_)
-        elif nodeName_ == 'Neighbor_Advertisement':
-            obj_ = NeighborAdvertisementType.factory()
-            obj_.build(child_)
-            self.set_Neighbor_Advertisement(obj_)
-        elif nodeName_ == 'Redirect':
-            obj_ = RedirectType.factory()
-            obj_.build(child_)
-            self.set_Redirect(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ICMPv6_Header(self, child_, node, nodeName_):
+        obj_ = ICMPv6HeaderType.factory()
+        obj_.build(child_)
+        self.set_ICMPv6_Header(obj_)
+    def buildChild_Router_Solicitation(self, child_, node, nodeName_):
+        obj_ = RouterSolicitationType.factory()
+        obj_.build(child_)
+        self.set_Router_Solicitation(obj_)
+    def buildChild_Router_Advertisement(self, child_, node, nodeName_):
+        obj_ = RouterAdvertisementType.factory()
+        obj_.build(child_)
+        self.set_Router_Advertisement(obj_)
+    def buildChild_Neighbor_Solicitation(self, child_, node, nodeName_):
+        obj_ = NeighborSolicitationType.factory()
+        obj_.build(child_)
+        self.set_Neighbor_Solicitation(obj_)
+    def buildChild_Neighbor_Advertisement(self, child_, node, nodeName_):
+        obj_ = NeighborAdvertisementType.factory()
+        obj_.build(child_)
+        self.set_Neighbor_Advertisement(obj_)
+    def buildChild_Redirect(self, child_, node, nodeName_):
+        obj_ = RedirectType.factory()
+        obj_.build(child_)
+        self.set_Redirect(obj_)
 # end class NDPType
 
 class RouterSolicitationType(GeneratedsSuper):
@@ -802,10 +828,13 @@ class RouterSolicitationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Options':
-            obj_ = RouterSolicitationOptionsType.factory()
-            obj_.build(child_)
-            self.Options.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = RouterSolicitationOptionsType.factory()
+        obj_.build(child_)
+        self.Options.append(obj_)
 # end class RouterSolicitationType
 
 class RouterSolicitationOptionsType(GeneratedsSuper):
@@ -866,10 +895,13 @@ class RouterSolicitationOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Src_Link_Addr':
-            obj_ = NDPLinkAddrType.factory()
-            obj_.build(child_)
-            self.set_Src_Link_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Src_Link_Addr(self, child_, node, nodeName_):
+        obj_ = NDPLinkAddrType.factory()
+        obj_.build(child_)
+        self.set_Src_Link_Addr(obj_)
 # end class RouterSolicitationOptionsType
 
 class RouterAdvertisementType(GeneratedsSuper):
@@ -994,26 +1026,29 @@ class RouterAdvertisementType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Cur_Hop_Limit':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Cur_Hop_Limit(obj_)
-        elif nodeName_ == 'Router_Lifetime':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Router_Lifetime(obj_)
-        elif nodeName_ == 'Reachable_Time':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reachable_Time(obj_)
-        elif nodeName_ == 'Retrans_Timer':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Retrans_Timer(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = RouterAdvertisementOptionsType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Cur_Hop_Limit(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Cur_Hop_Limit(obj_)
+    def buildChild_Router_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Router_Lifetime(obj_)
+    def buildChild_Reachable_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reachable_Time(obj_)
+    def buildChild_Retrans_Timer(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Retrans_Timer(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = RouterAdvertisementOptionsType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
 # end class RouterAdvertisementType
 
 class RouterAdvertisementOptionsType(GeneratedsSuper):
@@ -1086,18 +1121,21 @@ class RouterAdvertisementOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Src_Link_Addr':
-            obj_ = NDPLinkAddrType.factory()
-            obj_.build(child_)
-            self.set_Src_Link_Addr(obj_)
-        elif nodeName_ == 'MTU':
-            obj_ = NDPMTUType.factory()
-            obj_.build(child_)
-            self.set_MTU(obj_)
-        elif nodeName_ == 'Prefix_Info':
-            obj_ = NDPPrefixInfoType.factory()
-            obj_.build(child_)
-            self.set_Prefix_Info(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Src_Link_Addr(self, child_, node, nodeName_):
+        obj_ = NDPLinkAddrType.factory()
+        obj_.build(child_)
+        self.set_Src_Link_Addr(obj_)
+    def buildChild_MTU(self, child_, node, nodeName_):
+        obj_ = NDPMTUType.factory()
+        obj_.build(child_)
+        self.set_MTU(obj_)
+    def buildChild_Prefix_Info(self, child_, node, nodeName_):
+        obj_ = NDPPrefixInfoType.factory()
+        obj_.build(child_)
+        self.set_Prefix_Info(obj_)
 # end class RouterAdvertisementOptionsType
 
 class NeighborSolicitationType(GeneratedsSuper):
@@ -1168,14 +1206,17 @@ class NeighborSolicitationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Target_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Target_IPv6_Addr(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = NeighborSolicitationOptionsType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Target_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Target_IPv6_Addr(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = NeighborSolicitationOptionsType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
 # end class NeighborSolicitationType
 
 class NeighborSolicitationOptionsType(GeneratedsSuper):
@@ -1236,10 +1277,13 @@ class NeighborSolicitationOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Src_Link_Addr':
-            obj_ = NDPLinkAddrType.factory()
-            obj_.build(child_)
-            self.set_Src_Link_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Src_Link_Addr(self, child_, node, nodeName_):
+        obj_ = NDPLinkAddrType.factory()
+        obj_.build(child_)
+        self.set_Src_Link_Addr(obj_)
 # end class NeighborSolicitationOptionsType
 
 class NeighborAdvertisementType(GeneratedsSuper):
@@ -1360,14 +1404,17 @@ class NeighborAdvertisementType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Target_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Target_IPv6_Addr(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = NeighborOptionsType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Target_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Target_IPv6_Addr(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = NeighborOptionsType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
 # end class NeighborAdvertisementType
 
 class NeighborOptionsType(GeneratedsSuper):
@@ -1428,10 +1475,13 @@ class NeighborOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Target_Link_Addr':
-            obj_ = NDPLinkAddrType.factory()
-            obj_.build(child_)
-            self.set_Target_Link_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Target_Link_Addr(self, child_, node, nodeName_):
+        obj_ = NDPLinkAddrType.factory()
+        obj_.build(child_)
+        self.set_Target_Link_Addr(obj_)
 # end class NeighborOptionsType
 
 class RedirectType(GeneratedsSuper):
@@ -1508,18 +1558,21 @@ class RedirectType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Target_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Target_IPv6_Addr(obj_)
-        elif nodeName_ == 'Dest_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Dest_IPv6_Addr(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = RedirectOptionsType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Target_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Target_IPv6_Addr(obj_)
+    def buildChild_Dest_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Dest_IPv6_Addr(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = RedirectOptionsType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
 # end class RedirectType
 
 class RedirectOptionsType(GeneratedsSuper):
@@ -1586,14 +1639,17 @@ class RedirectOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Target_Link_Addr':
-            obj_ = NDPLinkAddrType.factory()
-            obj_.build(child_)
-            self.set_Target_Link_Addr(obj_)
-        elif nodeName_ == 'Redirected_Header':
-            obj_ = NDPRedirectedHeaderType.factory()
-            obj_.build(child_)
-            self.set_Redirected_Header(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Target_Link_Addr(self, child_, node, nodeName_):
+        obj_ = NDPLinkAddrType.factory()
+        obj_.build(child_)
+        self.set_Target_Link_Addr(obj_)
+    def buildChild_Redirected_Header(self, child_, node, nodeName_):
+        obj_ = NDPRedirectedHeaderType.factory()
+        obj_.build(child_)
+        self.set_Redirected_Header(obj_)
 # end class RedirectOptionsType
 
 class NDPLinkAddrType(GeneratedsSuper):
@@ -1660,14 +1716,17 @@ class NDPLinkAddrType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Link_Layer_MAC_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Link_Layer_MAC_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Link_Layer_MAC_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Link_Layer_MAC_Addr(obj_)
 # end class NDPLinkAddrType
 
 class NDPPrefixInfoType(GeneratedsSuper):
@@ -1790,26 +1849,29 @@ class NDPPrefixInfoType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Prefix_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Prefix_Length(obj_)
-        elif nodeName_ == 'Valid_Lifetime':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Valid_Lifetime(obj_)
-        elif nodeName_ == 'Preferred_Lifetime':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Preferred_Lifetime(obj_)
-        elif nodeName_ == 'Prefix':
-            obj_ = PrefixType.factory()
-            obj_.build(child_)
-            self.set_Prefix(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Prefix_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Prefix_Length(obj_)
+    def buildChild_Valid_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Valid_Lifetime(obj_)
+    def buildChild_Preferred_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Preferred_Lifetime(obj_)
+    def buildChild_Prefix(self, child_, node, nodeName_):
+        obj_ = PrefixType.factory()
+        obj_.build(child_)
+        self.set_Prefix(obj_)
 # end class NDPPrefixInfoType
 
 class NDPRedirectedHeaderType(GeneratedsSuper):
@@ -1883,14 +1945,17 @@ class NDPRedirectedHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'IPHeader_And_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IPHeader_And_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_IPHeader_And_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IPHeader_And_Data(obj_)
 # end class NDPRedirectedHeaderType
 
 class NDPMTUType(GeneratedsSuper):
@@ -1961,14 +2026,17 @@ class NDPMTUType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'MTU':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_MTU(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_MTU(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_MTU(obj_)
 # end class NDPMTUType
 
 class InternetLayerType(GeneratedsSuper):
@@ -2051,22 +2119,25 @@ class InternetLayerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IPv4':
-            obj_ = IPv4PacketType.factory()
-            obj_.build(child_)
-            self.set_IPv4(obj_)
-        elif nodeName_ == 'ICMPv4':
-            obj_ = ICMPv4PacketType.factory()
-            obj_.build(child_)
-            self.set_ICMPv4(obj_)
-        elif nodeName_ == 'IPv6':
-            obj_ = IPv6PacketType.factory()
-            obj_.build(child_)
-            self.set_IPv6(obj_)
-        elif nodeName_ == 'ICMPv6':
-            obj_ = ICMPv6PacketType.factory()
-            obj_.build(child_)
-            self.set_ICMPv6(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IPv4(self, child_, node, nodeName_):
+        obj_ = IPv4PacketType.factory()
+        obj_.build(child_)
+        self.set_IPv4(obj_)
+    def buildChild_ICMPv4(self, child_, node, nodeName_):
+        obj_ = ICMPv4PacketType.factory()
+        obj_.build(child_)
+        self.set_ICMPv4(obj_)
+    def buildChild_IPv6(self, child_, node, nodeName_):
+        obj_ = IPv6PacketType.factory()
+        obj_.build(child_)
+        self.set_IPv6(obj_)
+    def buildChild_ICMPv6(self, child_, node, nodeName_):
+        obj_ = ICMPv6PacketType.factory()
+        obj_.build(child_)
+        self.set_ICMPv6(obj_)
 # end class InternetLayerType
 
 class IPv4PacketType(GeneratedsSuper):
@@ -2137,14 +2208,17 @@ class IPv4PacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IPv4_Header':
-            obj_ = IPv4HeaderType.factory()
-            obj_.build(child_)
-            self.set_IPv4_Header(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IPv4_Header(self, child_, node, nodeName_):
+        obj_ = IPv4HeaderType.factory()
+        obj_.build(child_)
+        self.set_IPv4_Header(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class IPv4PacketType
 
 class IPv4HeaderType(GeneratedsSuper):
@@ -2305,62 +2379,65 @@ class IPv4HeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Version':
-            obj_ = IPVersionType.factory()
-            obj_.build(child_)
-            self.set_IP_Version(obj_)
-        elif nodeName_ == 'Header_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Header_Length(obj_)
-        elif nodeName_ == 'DSCP':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_DSCP(obj_)
-        elif nodeName_ == 'ECN':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ECN(obj_)
-        elif nodeName_ == 'Total_Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Total_Length(obj_)
-        elif nodeName_ == 'Identification':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Identification(obj_)
-        elif nodeName_ == 'Flags':
-            obj_ = IPv4FlagsType.factory()
-            obj_.build(child_)
-            self.set_Flags(obj_)
-        elif nodeName_ == 'Fragment_Offset':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Fragment_Offset(obj_)
-        elif nodeName_ == 'TTL':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TTL(obj_)
-        elif nodeName_ == 'Protocol':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Protocol(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
-        elif nodeName_ == 'Src_IPv4_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Src_IPv4_Addr(obj_)
-        elif nodeName_ == 'Dest_IPv4_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Dest_IPv4_Addr(obj_)
-        elif nodeName_ == 'Option':
-            obj_ = IPv4OptionType.factory()
-            obj_.build(child_)
-            self.Option.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Version(self, child_, node, nodeName_):
+        obj_ = IPVersionType.factory()
+        obj_.build(child_)
+        self.set_IP_Version(obj_)
+    def buildChild_Header_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Header_Length(obj_)
+    def buildChild_DSCP(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_DSCP(obj_)
+    def buildChild_ECN(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ECN(obj_)
+    def buildChild_Total_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Total_Length(obj_)
+    def buildChild_Identification(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Identification(obj_)
+    def buildChild_Flags(self, child_, node, nodeName_):
+        obj_ = IPv4FlagsType.factory()
+        obj_.build(child_)
+        self.set_Flags(obj_)
+    def buildChild_Fragment_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Fragment_Offset(obj_)
+    def buildChild_TTL(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TTL(obj_)
+    def buildChild_Protocol(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Protocol(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
+    def buildChild_Src_IPv4_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Src_IPv4_Addr(obj_)
+    def buildChild_Dest_IPv4_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Dest_IPv4_Addr(obj_)
+    def buildChild_Option(self, child_, node, nodeName_):
+        obj_ = IPv4OptionType.factory()
+        obj_.build(child_)
+        self.Option.append(obj_)
 # end class IPv4HeaderType
 
 class IPv4FlagsType(GeneratedsSuper):
@@ -2444,18 +2521,21 @@ class IPv4FlagsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Reserved':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reserved(obj_)
-        elif nodeName_ == 'Do_Not_Fragment':
-            obj_ = DoNotFragmentType.factory()
-            obj_.build(child_)
-            self.set_Do_Not_Fragment(obj_)
-        elif nodeName_ == 'More_Fragments':
-            obj_ = MoreFragmentsType.factory()
-            obj_.build(child_)
-            self.set_More_Fragments(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Reserved(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reserved(obj_)
+    def buildChild_Do_Not_Fragment(self, child_, node, nodeName_):
+        obj_ = DoNotFragmentType.factory()
+        obj_.build(child_)
+        self.set_Do_Not_Fragment(obj_)
+    def buildChild_More_Fragments(self, child_, node, nodeName_):
+        obj_ = MoreFragmentsType.factory()
+        obj_.build(child_)
+        self.set_More_Fragments(obj_)
 # end class IPv4FlagsType
 
 class IPv4OptionType(GeneratedsSuper):
@@ -2537,18 +2617,21 @@ class IPv4OptionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Copy_Flag':
-            obj_ = IPv4CopyFlagType.factory()
-            obj_.build(child_)
-            self.set_Copy_Flag(obj_)
-        elif nodeName_ == 'Class':
-            obj_ = IPv4ClassType.factory()
-            obj_.build(child_)
-            self.set_Class(obj_)
-        elif nodeName_ == 'Option':
-            obj_ = IPv4OptionsType.factory()
-            obj_.build(child_)
-            self.set_Option(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Copy_Flag(self, child_, node, nodeName_):
+        obj_ = IPv4CopyFlagType.factory()
+        obj_.build(child_)
+        self.set_Copy_Flag(obj_)
+    def buildChild_Class(self, child_, node, nodeName_):
+        obj_ = IPv4ClassType.factory()
+        obj_.build(child_)
+        self.set_Class(obj_)
+    def buildChild_Option(self, child_, node, nodeName_):
+        obj_ = IPv4OptionsType.factory()
+        obj_.build(child_)
+        self.set_Option(obj_)
 # end class IPv4OptionType
 
 class IPv6PacketType(GeneratedsSuper):
@@ -2628,18 +2711,21 @@ class IPv6PacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IPv6_Header':
-            obj_ = IPv6HeaderType.factory()
-            obj_.build(child_)
-            self.set_IPv6_Header(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        elif nodeName_ == 'Ext_Headers':
-            obj_ = IPv6ExtHeaderType.factory()
-            obj_.build(child_)
-            self.Ext_Headers.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IPv6_Header(self, child_, node, nodeName_):
+        obj_ = IPv6HeaderType.factory()
+        obj_.build(child_)
+        self.set_IPv6_Header(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
+    def buildChild_Ext_Headers(self, child_, node, nodeName_):
+        obj_ = IPv6ExtHeaderType.factory()
+        obj_.build(child_)
+        self.Ext_Headers.append(obj_)
 # end class IPv6PacketType
 
 class IPv6HeaderType(GeneratedsSuper):
@@ -2753,38 +2839,41 @@ class IPv6HeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Version':
-            obj_ = IPVersionType.factory()
-            obj_.build(child_)
-            self.set_IP_Version(obj_)
-        elif nodeName_ == 'Traffic_Class':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Traffic_Class(obj_)
-        elif nodeName_ == 'Flow_Label':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flow_Label(obj_)
-        elif nodeName_ == 'Payload_Length':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Payload_Length(obj_)
-        elif nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'TTL':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_TTL(obj_)
-        elif nodeName_ == 'Src_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Src_IPv6_Addr(obj_)
-        elif nodeName_ == 'Dest_IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Dest_IPv6_Addr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Version(self, child_, node, nodeName_):
+        obj_ = IPVersionType.factory()
+        obj_.build(child_)
+        self.set_IP_Version(obj_)
+    def buildChild_Traffic_Class(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Traffic_Class(obj_)
+    def buildChild_Flow_Label(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flow_Label(obj_)
+    def buildChild_Payload_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Payload_Length(obj_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_TTL(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_TTL(obj_)
+    def buildChild_Src_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Src_IPv6_Addr(obj_)
+    def buildChild_Dest_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Dest_IPv6_Addr(obj_)
 # end class IPv6HeaderType
 
 class IPv6ExtHeaderType(GeneratedsSuper):
@@ -2884,30 +2973,33 @@ class IPv6ExtHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hop_by_Hop_Options':
-            obj_ = HopByHopOptionsType.factory()
-            obj_.build(child_)
-            self.set_Hop_by_Hop_Options(obj_)
-        elif nodeName_ == 'Routing':
-            obj_ = RoutingType.factory()
-            obj_.build(child_)
-            self.set_Routing(obj_)
-        elif nodeName_ == 'Fragment':
-            obj_ = FragmentType.factory()
-            obj_.build(child_)
-            self.set_Fragment(obj_)
-        elif nodeName_ == 'Destination_Options':
-            obj_ = DestinationOptionsType.factory()
-            obj_.build(child_)
-            self.Destination_Options.append(obj_)
-        elif nodeName_ == 'Authentication_Header':
-            obj_ = AuthenticationHeaderType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Header(obj_)
-        elif nodeName_ == 'Encapsulating_Security_Payload':
-            obj_ = EncapsulatingSecurityPayloadType.factory()
-            obj_.build(child_)
-            self.set_Encapsulating_Security_Payload(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hop_by_Hop_Options(self, child_, node, nodeName_):
+        obj_ = HopByHopOptionsType.factory()
+        obj_.build(child_)
+        self.set_Hop_by_Hop_Options(obj_)
+    def buildChild_Routing(self, child_, node, nodeName_):
+        obj_ = RoutingType.factory()
+        obj_.build(child_)
+        self.set_Routing(obj_)
+    def buildChild_Fragment(self, child_, node, nodeName_):
+        obj_ = FragmentType.factory()
+        obj_.build(child_)
+        self.set_Fragment(obj_)
+    def buildChild_Destination_Options(self, child_, node, nodeName_):
+        obj_ = DestinationOptionsType.factory()
+        obj_.build(child_)
+        self.Destination_Options.append(obj_)
+    def buildChild_Authentication_Header(self, child_, node, nodeName_):
+        obj_ = AuthenticationHeaderType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Header(obj_)
+    def buildChild_Encapsulating_Security_Payload(self, child_, node, nodeName_):
+        obj_ = EncapsulatingSecurityPayloadType.factory()
+        obj_.build(child_)
+        self.set_Encapsulating_Security_Payload(obj_)
 # end class IPv6ExtHeaderType
 
 class IPv6OptionType(GeneratedsSuper):
@@ -2988,18 +3080,21 @@ class IPv6OptionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Do_Not_Recogn_Action':
-            obj_ = IPv6DoNotRecogActionType.factory()
-            obj_.build(child_)
-            self.set_Do_Not_Recogn_Action(obj_)
-        elif nodeName_ == 'Packet_Change':
-            obj_ = IPv6PacketChangeType.factory()
-            obj_.build(child_)
-            self.set_Packet_Change(obj_)
-        elif nodeName_ == 'Option_Byte':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Byte(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Do_Not_Recogn_Action(self, child_, node, nodeName_):
+        obj_ = IPv6DoNotRecogActionType.factory()
+        obj_.build(child_)
+        self.set_Do_Not_Recogn_Action(obj_)
+    def buildChild_Packet_Change(self, child_, node, nodeName_):
+        obj_ = IPv6PacketChangeType.factory()
+        obj_.build(child_)
+        self.set_Packet_Change(obj_)
+    def buildChild_Option_Byte(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Byte(obj_)
 # end class IPv6OptionType
 
 class TransportLayerType(GeneratedsSuper):
@@ -3066,14 +3161,17 @@ class TransportLayerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'TCP':
-            obj_ = TCPType.factory()
-            obj_.build(child_)
-            self.set_TCP(obj_)
-        elif nodeName_ == 'UDP':
-            obj_ = UDPType.factory()
-            obj_.build(child_)
-            self.set_UDP(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_TCP(self, child_, node, nodeName_):
+        obj_ = TCPType.factory()
+        obj_.build(child_)
+        self.set_TCP(obj_)
+    def buildChild_UDP(self, child_, node, nodeName_):
+        obj_ = UDPType.factory()
+        obj_.build(child_)
+        self.set_UDP(obj_)
 # end class TransportLayerType
 
 class TCPType(GeneratedsSuper):
@@ -3150,18 +3248,21 @@ class TCPType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'TCP_Header':
-            obj_ = TCPHeaderType.factory()
-            obj_.build(child_)
-            self.set_TCP_Header(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_TCP_Header(self, child_, node, nodeName_):
+        obj_ = TCPHeaderType.factory()
+        obj_.build(child_)
+        self.set_TCP_Header(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class TCPType
 
 class UDPType(GeneratedsSuper):
@@ -3232,14 +3333,17 @@ class UDPType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'UDP_Header':
-            obj_ = UDPHeaderType.factory()
-            obj_.build(child_)
-            self.set_UDP_Header(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.DataSegmentType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_UDP_Header(self, child_, node, nodeName_):
+        obj_ = UDPHeaderType.factory()
+        obj_.build(child_)
+        self.set_UDP_Header(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.DataSegmentType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class UDPType
 
 class TCPHeaderType(GeneratedsSuper):
@@ -3358,46 +3462,49 @@ class TCPHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Src_Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_Src_Port(obj_)
-        elif nodeName_ == 'Dest_Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_Dest_Port(obj_)
-        elif nodeName_ == 'Seq_Num':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Seq_Num(obj_)
-        elif nodeName_ == 'ACK_Num':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ACK_Num(obj_)
-        elif nodeName_ == 'Data_Offset':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data_Offset(obj_)
-        elif nodeName_ == 'Reserved':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reserved(obj_)
-        elif nodeName_ == 'TCP_Flags':
-            obj_ = TCPFlagsType.factory()
-            obj_.build(child_)
-            self.set_TCP_Flags(obj_)
-        elif nodeName_ == 'Window':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Window(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
-        elif nodeName_ == 'Urg_Ptr':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Urg_Ptr(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Src_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_Src_Port(obj_)
+    def buildChild_Dest_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_Dest_Port(obj_)
+    def buildChild_Seq_Num(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Seq_Num(obj_)
+    def buildChild_ACK_Num(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ACK_Num(obj_)
+    def buildChild_Data_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data_Offset(obj_)
+    def buildChild_Reserved(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reserved(obj_)
+    def buildChild_TCP_Flags(self, child_, node, nodeName_):
+        obj_ = TCPFlagsType.factory()
+        obj_.build(child_)
+        self.set_TCP_Flags(obj_)
+    def buildChild_Window(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Window(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
+    def buildChild_Urg_Ptr(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Urg_Ptr(obj_)
 # end class TCPHeaderType
 
 class TCPFlagsType(GeneratedsSuper):
@@ -3686,22 +3793,25 @@ class UDPHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'SrcPort':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_SrcPort(obj_)
-        elif nodeName_ == 'DestPort':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_DestPort(obj_)
-        elif nodeName_ == 'Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Length(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_SrcPort(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_SrcPort(obj_)
+    def buildChild_DestPort(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_DestPort(obj_)
+    def buildChild_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Length(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
 # end class UDPHeaderType
 
 class ICMPv4PacketType(GeneratedsSuper):
@@ -3782,22 +3892,25 @@ class ICMPv4PacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ICMPv4_Header':
-            obj_ = ICMPv4HeaderType.factory()
-            obj_.build(child_)
-            self.set_ICMPv4_Header(obj_)
-        elif nodeName_ == 'Error_Msg':
-            obj_ = ICMPv4ErrorMessageType.factory()
-            obj_.build(child_)
-            self.set_Error_Msg(obj_)
-        elif nodeName_ == 'Info_Msg':
-            obj_ = ICMPv4InfoMessageType.factory()
-            obj_.build(child_)
-            self.set_Info_Msg(obj_)
-        elif nodeName_ == 'Traceroute':
-            obj_ = ICMPv4TracerouteType.factory()
-            obj_.build(child_)
-            self.set_Traceroute(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ICMPv4_Header(self, child_, node, nodeName_):
+        obj_ = ICMPv4HeaderType.factory()
+        obj_.build(child_)
+        self.set_ICMPv4_Header(obj_)
+    def buildChild_Error_Msg(self, child_, node, nodeName_):
+        obj_ = ICMPv4ErrorMessageType.factory()
+        obj_.build(child_)
+        self.set_Error_Msg(obj_)
+    def buildChild_Info_Msg(self, child_, node, nodeName_):
+        obj_ = ICMPv4InfoMessageType.factory()
+        obj_.build(child_)
+        self.set_Info_Msg(obj_)
+    def buildChild_Traceroute(self, child_, node, nodeName_):
+        obj_ = ICMPv4TracerouteType.factory()
+        obj_.build(child_)
+        self.set_Traceroute(obj_)
 # end class ICMPv4PacketType
 
 class ICMPv4HeaderType(GeneratedsSuper):
@@ -3873,18 +3986,21 @@ class ICMPv4HeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Code':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Code(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Code(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
 # end class ICMPv4HeaderType
 
 class ICMPv4ErrorMessageType(GeneratedsSuper):
@@ -3969,26 +4085,29 @@ class ICMPv4ErrorMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Destination_Unreachable':
-            obj_ = ICMPv4DestinationUnreachableType.factory()
-            obj_.build(child_)
-            self.set_Destination_Unreachable(obj_)
-        elif nodeName_ == 'Source_Quench':
-            obj_ = ICMPv4SourceQuenchType.factory()
-            obj_.build(child_)
-            self.set_Source_Quench(obj_)
-        elif nodeName_ == 'Redirect_Message':
-            obj_ = ICMPv4RedirectMessageType.factory()
-            obj_.build(child_)
-            self.set_Redirect_Message(obj_)
-        elif nodeName_ == 'Time_Exceeded':
-            obj_ = ICMPv4TimeExceededType.factory()
-            obj_.build(child_)
-            self.set_Time_Exceeded(obj_)
-        elif nodeName_ == 'Error_Msg_Content':
-            obj_ = ICMPv4ErrorMessageContentType.factory()
-            obj_.build(child_)
-            self.set_Error_Msg_Content(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Destination_Unreachable(self, child_, node, nodeName_):
+        obj_ = ICMPv4DestinationUnreachableType.factory()
+        obj_.build(child_)
+        self.set_Destination_Unreachable(obj_)
+    def buildChild_Source_Quench(self, child_, node, nodeName_):
+        obj_ = ICMPv4SourceQuenchType.factory()
+        obj_.build(child_)
+        self.set_Source_Quench(obj_)
+    def buildChild_Redirect_Message(self, child_, node, nodeName_):
+        obj_ = ICMPv4RedirectMessageType.factory()
+        obj_.build(child_)
+        self.set_Redirect_Message(obj_)
+    def buildChild_Time_Exceeded(self, child_, node, nodeName_):
+        obj_ = ICMPv4TimeExceededType.factory()
+        obj_.build(child_)
+        self.set_Time_Exceeded(obj_)
+    def buildChild_Error_Msg_Content(self, child_, node, nodeName_):
+        obj_ = ICMPv4ErrorMessageContentType.factory()
+        obj_.build(child_)
+        self.set_Error_Msg_Content(obj_)
 # end class ICMPv4ErrorMessageType
 
 class ICMPv4ErrorMessageContentType(GeneratedsSuper):
@@ -4058,14 +4177,17 @@ class ICMPv4ErrorMessageContentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Header':
-            obj_ = IPv4HeaderType.factory()
-            obj_.build(child_)
-            self.set_IP_Header(obj_)
-        elif nodeName_ == 'First_Eight_Bytes':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_First_Eight_Bytes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Header(self, child_, node, nodeName_):
+        obj_ = IPv4HeaderType.factory()
+        obj_.build(child_)
+        self.set_IP_Header(obj_)
+    def buildChild_First_Eight_Bytes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_First_Eight_Bytes(obj_)
 # end class ICMPv4ErrorMessageContentType
 
 class ICMPv4InfoMessageType(GeneratedsSuper):
@@ -4162,34 +4284,37 @@ class ICMPv4InfoMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Reply':
-            obj_ = ICMPv4EchoReplyType.factory()
-            obj_.build(child_)
-            self.set_Echo_Reply(obj_)
-        elif nodeName_ == 'Echo_Request':
-            obj_ = ICMPv4EchoRequestType.factory()
-            obj_.build(child_)
-            self.set_Echo_Request(obj_)
-        elif nodeName_ == 'Timestamp_Request':
-            obj_ = ICMPv4TimestampRequestType.factory()
-            obj_.build(child_)
-            self.set_Timestamp_Request(obj_)
-        elif nodeName_ == 'Timestamp_Reply':
-            obj_ = ICMPv4TimestampReplyType.factory()
-            obj_.build(child_)
-            self.set_Timestamp_Reply(obj_)
-        elif nodeName_ == 'Address_Mask_Request':
-            obj_ = ICMPv4AddressMaskRequestType.factory()
-            obj_.build(child_)
-            self.set_Address_Mask_Request(obj_)
-        elif nodeName_ == 'Address_Mask_Reply':
-            obj_ = ICMPv4AddressMaskReplyType.factory()
-            obj_.build(child_)
-            self.set_Address_Mask_Reply(obj_)
-        elif nodeName_ == 'Info_Msg_Content':
-            obj_ = ICMPv4InfoMessageContentType.factory()
-            obj_.build(child_)
-            self.set_Info_Msg_Content(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Reply(self, child_, node, nodeName_):
+        obj_ = ICMPv4EchoReplyType.factory()
+        obj_.build(child_)
+        self.set_Echo_Reply(obj_)
+    def buildChild_Echo_Request(self, child_, node, nodeName_):
+        obj_ = ICMPv4EchoRequestType.factory()
+        obj_.build(child_)
+        self.set_Echo_Request(obj_)
+    def buildChild_Timestamp_Request(self, child_, node, nodeName_):
+        obj_ = ICMPv4TimestampRequestType.factory()
+        obj_.build(child_)
+        self.set_Timestamp_Request(obj_)
+    def buildChild_Timestamp_Reply(self, child_, node, nodeName_):
+        obj_ = ICMPv4TimestampReplyType.factory()
+        obj_.build(child_)
+        self.set_Timestamp_Reply(obj_)
+    def buildChild_Address_Mask_Request(self, child_, node, nodeName_):
+        obj_ = ICMPv4AddressMaskRequestType.factory()
+        obj_.build(child_)
+        self.set_Address_Mask_Request(obj_)
+    def buildChild_Address_Mask_Reply(self, child_, node, nodeName_):
+        obj_ = ICMPv4AddressMaskReplyType.factory()
+        obj_.build(child_)
+        self.set_Address_Mask_Reply(obj_)
+    def buildChild_Info_Msg_Content(self, child_, node, nodeName_):
+        obj_ = ICMPv4InfoMessageContentType.factory()
+        obj_.build(child_)
+        self.set_Info_Msg_Content(obj_)
 # end class ICMPv4InfoMessageType
 
 class ICMPv4InfoMessageContentType(GeneratedsSuper):
@@ -4259,14 +4384,17 @@ class ICMPv4InfoMessageContentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Identifier':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Identifier(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Identifier(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
 # end class ICMPv4InfoMessageContentType
 
 class ICMPv4TracerouteType(GeneratedsSuper):
@@ -4370,46 +4498,49 @@ class ICMPv4TracerouteType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Outbound_Packet_Forward_Success':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Outbound_Packet_Forward_Success')
-            self.Outbound_Packet_Forward_Success = ival_
-        elif nodeName_ == 'Outbound_Packet_no_Route':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Outbound_Packet_no_Route')
-            self.Outbound_Packet_no_Route = ival_
-        elif nodeName_ == 'Identifier':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Identifier(obj_)
-        elif nodeName_ == 'Outbound_Hop_Count':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Outbound_Hop_Count(obj_)
-        elif nodeName_ == 'Return_Hop_Count':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Return_Hop_Count(obj_)
-        elif nodeName_ == 'Output_Link_Speed':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Output_Link_Speed(obj_)
-        elif nodeName_ == 'Output_Link_MTU':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Output_Link_MTU(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Outbound_Packet_Forward_Success(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Outbound_Packet_Forward_Success')
+        self.Outbound_Packet_Forward_Success = ival_
+    def buildChild_Outbound_Packet_no_Route(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Outbound_Packet_no_Route')
+        self.Outbound_Packet_no_Route = ival_
+    def buildChild_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Identifier(obj_)
+    def buildChild_Outbound_Hop_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Outbound_Hop_Count(obj_)
+    def buildChild_Return_Hop_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Return_Hop_Count(obj_)
+    def buildChild_Output_Link_Speed(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Output_Link_Speed(obj_)
+    def buildChild_Output_Link_MTU(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Output_Link_MTU(obj_)
 # end class ICMPv4TracerouteType
 
 class ICMPv6PacketType(GeneratedsSuper):
@@ -4487,18 +4618,21 @@ class ICMPv6PacketType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ICMPv6_Header':
-            obj_ = ICMPv6HeaderType.factory()
-            obj_.build(child_)
-            self.set_ICMPv6_Header(obj_)
-        elif nodeName_ == 'Error_Msg':
-            obj_ = ICMPv6ErrorMessageType.factory()
-            obj_.build(child_)
-            self.set_Error_Msg(obj_)
-        elif nodeName_ == 'Info_Msg':
-            obj_ = ICMPv6InfoMessageType.factory()
-            obj_.build(child_)
-            self.set_Info_Msg(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ICMPv6_Header(self, child_, node, nodeName_):
+        obj_ = ICMPv6HeaderType.factory()
+        obj_.build(child_)
+        self.set_ICMPv6_Header(obj_)
+    def buildChild_Error_Msg(self, child_, node, nodeName_):
+        obj_ = ICMPv6ErrorMessageType.factory()
+        obj_.build(child_)
+        self.set_Error_Msg(obj_)
+    def buildChild_Info_Msg(self, child_, node, nodeName_):
+        obj_ = ICMPv6InfoMessageType.factory()
+        obj_.build(child_)
+        self.set_Info_Msg(obj_)
 # end class ICMPv6PacketType
 
 class ICMPv6HeaderType(GeneratedsSuper):
@@ -4577,18 +4711,21 @@ class ICMPv6HeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Code':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Code(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Code(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
 # end class ICMPv6HeaderType
 
 class ICMPv6ErrorMessageType(GeneratedsSuper):
@@ -4678,26 +4815,29 @@ class ICMPv6ErrorMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Destination_Unreachable':
-            obj_ = ICMPv6DestinationUnreachableType.factory()
-            obj_.build(child_)
-            self.set_Destination_Unreachable(obj_)
-        elif nodeName_ == 'Packet_Too_Big':
-            obj_ = ICMPv6PacketTooBigType.factory()
-            obj_.build(child_)
-            self.set_Packet_Too_Big(obj_)
-        elif nodeName_ == 'Time_Exceeded':
-            obj_ = ICMPv6TimeExceededType.factory()
-            obj_.build(child_)
-            self.set_Time_Exceeded(obj_)
-        elif nodeName_ == 'Parameter_Problem':
-            obj_ = ICMPv6ParameterProblemType.factory()
-            obj_.build(child_)
-            self.set_Parameter_Problem(obj_)
-        elif nodeName_ == 'Invoking_Packet':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Invoking_Packet(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Destination_Unreachable(self, child_, node, nodeName_):
+        obj_ = ICMPv6DestinationUnreachableType.factory()
+        obj_.build(child_)
+        self.set_Destination_Unreachable(obj_)
+    def buildChild_Packet_Too_Big(self, child_, node, nodeName_):
+        obj_ = ICMPv6PacketTooBigType.factory()
+        obj_.build(child_)
+        self.set_Packet_Too_Big(obj_)
+    def buildChild_Time_Exceeded(self, child_, node, nodeName_):
+        obj_ = ICMPv6TimeExceededType.factory()
+        obj_.build(child_)
+        self.set_Time_Exceeded(obj_)
+    def buildChild_Parameter_Problem(self, child_, node, nodeName_):
+        obj_ = ICMPv6ParameterProblemType.factory()
+        obj_.build(child_)
+        self.set_Parameter_Problem(obj_)
+    def buildChild_Invoking_Packet(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Invoking_Packet(obj_)
 # end class ICMPv6ErrorMessageType
 
 class ICMPv6InfoMessageType(GeneratedsSuper):
@@ -4772,18 +4912,21 @@ class ICMPv6InfoMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Request':
-            obj_ = ICMPv4EchoRequestType.factory()
-            obj_.build(child_)
-            self.set_Echo_Request(obj_)
-        elif nodeName_ == 'Echo_Reply':
-            obj_ = ICMPv4EchoReplyType.factory()
-            obj_.build(child_)
-            self.set_Echo_Reply(obj_)
-        elif nodeName_ == 'Info_Msg_Content':
-            obj_ = ICMPv4InfoMessageContentType.factory()
-            obj_.build(child_)
-            self.set_Info_Msg_Content(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Request(self, child_, node, nodeName_):
+        obj_ = ICMPv4EchoRequestType.factory()
+        obj_.build(child_)
+        self.set_Echo_Request(obj_)
+    def buildChild_Echo_Reply(self, child_, node, nodeName_):
+        obj_ = ICMPv4EchoReplyType.factory()
+        obj_.build(child_)
+        self.set_Echo_Reply(obj_)
+    def buildChild_Info_Msg_Content(self, child_, node, nodeName_):
+        obj_ = ICMPv4InfoMessageContentType.factory()
+        obj_.build(child_)
+        self.set_Info_Msg_Content(obj_)
 # end class ICMPv6InfoMessageType
 
 class ICMPv6InfoMessageContentType(GeneratedsSuper):
@@ -4853,14 +4996,17 @@ class ICMPv6InfoMessageContentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Identifier':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Identifier(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Identifier(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
 # end class ICMPv6InfoMessageContentType
 
 class ICMPv4EchoReplyType(GeneratedsSuper):
@@ -4929,20 +5075,23 @@ class ICMPv4EchoReplyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Reply':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Reply')
-            self.Echo_Reply = ival_
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Reply(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Reply')
+        self.Echo_Reply = ival_
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class ICMPv4EchoReplyType
 
 class ICMPv4DestinationUnreachableType(GeneratedsSuper):
@@ -5107,160 +5256,163 @@ class ICMPv4DestinationUnreachableType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Destination_Network_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Network_Unreachable')
-            self.Destination_Network_Unreachable = ival_
-        elif nodeName_ == 'Destination_Host_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Host_Unreachable')
-            self.Destination_Host_Unreachable = ival_
-        elif nodeName_ == 'Destination_Protocol_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Protocol_Unreachable')
-            self.Destination_Protocol_Unreachable = ival_
-        elif nodeName_ == 'Destination_Port_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Port_Unreachable')
-            self.Destination_Port_Unreachable = ival_
-        elif nodeName_ == 'Fragmentation_Required':
-            obj_ = FragmentationRequiredType.factory()
-            obj_.build(child_)
-            self.set_Fragmentation_Required(obj_)
-        elif nodeName_ == 'Source_Route_Failed':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Source_Route_Failed')
-            self.Source_Route_Failed = ival_
-        elif nodeName_ == 'Destination_Network_Unknown':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Network_Unknown')
-            self.Destination_Network_Unknown = ival_
-        elif nodeName_ == 'Destination_Host_Unknown':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Host_Unknown')
-            self.Destination_Host_Unknown = ival_
-        elif nodeName_ == 'Source_Host_Isolated':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Source_Host_Isolated')
-            self.Source_Host_Isolated = ival_
-        elif nodeName_ == 'Network_Administratively_Prohibited':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Network_Administratively_Prohibited')
-            self.Network_Administratively_Prohibited = ival_
-        elif nodeName_ == 'Host_Administratively_Prohibited':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Host_Administratively_Prohibited')
-            self.Host_Administratively_Prohibited = ival_
-        elif nodeName_ == 'Network_Unreachable_For_TOS':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Network_Unreachable_For_TOS')
-            self.Network_Unreachable_For_TOS = ival_
-        elif nodeName_ == 'Host_Unreachable_For_TOS':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Host_Unreachable_For_TOS')
-            self.Host_Unreachable_For_TOS = ival_
-        elif nodeName_ == 'Communication_Administratively_Prohibited':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Communication_Administratively_Prohibited')
-            self.Communication_Administratively_Prohibited = ival_
-        elif nodeName_ == 'Host_Precedence_Violation':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Host_Precedence_Violation')
-            self.Host_Precedence_Violation = ival_
-        elif nodeName_ == 'Precedence_Cutoff_In_Effect':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Precedence_Cutoff_In_Effect')
-            self.Precedence_Cutoff_In_Effect = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Destination_Network_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Network_Unreachable')
+        self.Destination_Network_Unreachable = ival_
+    def buildChild_Destination_Host_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Host_Unreachable')
+        self.Destination_Host_Unreachable = ival_
+    def buildChild_Destination_Protocol_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Protocol_Unreachable')
+        self.Destination_Protocol_Unreachable = ival_
+    def buildChild_Destination_Port_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Port_Unreachable')
+        self.Destination_Port_Unreachable = ival_
+    def buildChild_Fragmentation_Required(self, child_, node, nodeName_):
+        obj_ = FragmentationRequiredType.factory()
+        obj_.build(child_)
+        self.set_Fragmentation_Required(obj_)
+    def buildChild_Source_Route_Failed(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Source_Route_Failed')
+        self.Source_Route_Failed = ival_
+    def buildChild_Destination_Network_Unknown(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Network_Unknown')
+        self.Destination_Network_Unknown = ival_
+    def buildChild_Destination_Host_Unknown(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Destination_Host_Unknown')
+        self.Destination_Host_Unknown = ival_
+    def buildChild_Source_Host_Isolated(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Source_Host_Isolated')
+        self.Source_Host_Isolated = ival_
+    def buildChild_Network_Administratively_Prohibited(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Network_Administratively_Prohibited')
+        self.Network_Administratively_Prohibited = ival_
+    def buildChild_Host_Administratively_Prohibited(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Host_Administratively_Prohibited')
+        self.Host_Administratively_Prohibited = ival_
+    def buildChild_Network_Unreachable_For_TOS(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Network_Unreachable_For_TOS')
+        self.Network_Unreachable_For_TOS = ival_
+    def buildChild_Host_Unreachable_For_TOS(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Host_Unreachable_For_TOS')
+        self.Host_Unreachable_For_TOS = ival_
+    def buildChild_Communication_Administratively_Prohibited(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Communication_Administratively_Prohibited')
+        self.Communication_Administratively_Prohibited = ival_
+    def buildChild_Host_Precedence_Violation(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Host_Precedence_Violation')
+        self.Host_Precedence_Violation = ival_
+    def buildChild_Precedence_Cutoff_In_Effect(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Precedence_Cutoff_In_Effect')
+        self.Precedence_Cutoff_In_Effect = ival_
 # end class ICMPv4DestinationUnreachableType
 
 class FragmentationRequiredType(GeneratedsSuper):
@@ -5331,20 +5483,23 @@ class FragmentationRequiredType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Fragmentation_Required':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Fragmentation_Required')
-            self.Fragmentation_Required = ival_
-        elif nodeName_ == 'Next_Hop_MTU':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Next_Hop_MTU(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Fragmentation_Required(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Fragmentation_Required')
+        self.Fragmentation_Required = ival_
+    def buildChild_Next_Hop_MTU(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Next_Hop_MTU(obj_)
 # end class FragmentationRequiredType
 
 class ICMPv4SourceQuenchType(GeneratedsSuper):
@@ -5404,16 +5559,19 @@ class ICMPv4SourceQuenchType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Source_Quench':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Source_Quench')
-            self.Source_Quench = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Source_Quench(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Source_Quench')
+        self.Source_Quench = ival_
 # end class ICMPv4SourceQuenchType
 
 class ICMPv4RedirectMessageType(GeneratedsSuper):
@@ -5501,50 +5659,53 @@ class ICMPv4RedirectMessageType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network_Redirect':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Network_Redirect')
-            self.Network_Redirect = ival_
-        elif nodeName_ == 'Host_Redirect':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Host_Redirect')
-            self.Host_Redirect = ival_
-        elif nodeName_ == 'ToS_Network_Redirect':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'ToS_Network_Redirect')
-            self.ToS_Network_Redirect = ival_
-        elif nodeName_ == 'ToS_Host_Redirect':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'ToS_Host_Redirect')
-            self.ToS_Host_Redirect = ival_
-        elif nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Network_Redirect(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Network_Redirect')
+        self.Network_Redirect = ival_
+    def buildChild_Host_Redirect(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Host_Redirect')
+        self.Host_Redirect = ival_
+    def buildChild_ToS_Network_Redirect(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'ToS_Network_Redirect')
+        self.ToS_Network_Redirect = ival_
+    def buildChild_ToS_Host_Redirect(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'ToS_Host_Redirect')
+        self.ToS_Host_Redirect = ival_
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
 # end class ICMPv4RedirectMessageType
 
 class ICMPv4EchoRequestType(GeneratedsSuper):
@@ -5613,20 +5774,23 @@ class ICMPv4EchoRequestType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Request':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Request')
-            self.Echo_Request = ival_
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Request(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Request')
+        self.Echo_Request = ival_
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class ICMPv4EchoRequestType
 
 class ICMPv4TimeExceededType(GeneratedsSuper):
@@ -5694,26 +5858,29 @@ class ICMPv4TimeExceededType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'TTL_Exceeded_In_Transit':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'TTL_Exceeded_In_Transit')
-            self.TTL_Exceeded_In_Transit = ival_
-        elif nodeName_ == 'Frag_Reassembly_Time_Exceeded':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Frag_Reassembly_Time_Exceeded')
-            self.Frag_Reassembly_Time_Exceeded = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_TTL_Exceeded_In_Transit(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'TTL_Exceeded_In_Transit')
+        self.TTL_Exceeded_In_Transit = ival_
+    def buildChild_Frag_Reassembly_Time_Exceeded(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Frag_Reassembly_Time_Exceeded')
+        self.Frag_Reassembly_Time_Exceeded = ival_
 # end class ICMPv4TimeExceededType
 
 class ICMPv4TimestampRequestType(GeneratedsSuper):
@@ -5780,20 +5947,23 @@ class ICMPv4TimestampRequestType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Timestamp':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Timestamp')
-            self.Timestamp = ival_
-        elif nodeName_ == 'Originate_Timestamp':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Originate_Timestamp(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Timestamp(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Timestamp')
+        self.Timestamp = ival_
+    def buildChild_Originate_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Originate_Timestamp(obj_)
 # end class ICMPv4TimestampRequestType
 
 class ICMPv4TimestampReplyType(GeneratedsSuper):
@@ -5871,28 +6041,31 @@ class ICMPv4TimestampReplyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Timestamp_Reply':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Timestamp_Reply')
-            self.Timestamp_Reply = ival_
-        elif nodeName_ == 'Originate_Timestamp':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Originate_Timestamp(obj_)
-        elif nodeName_ == 'Receive_Timestamp':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Receive_Timestamp(obj_)
-        elif nodeName_ == 'Transmit_Timestamp':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Transmit_Timestamp(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Timestamp_Reply(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Timestamp_Reply')
+        self.Timestamp_Reply = ival_
+    def buildChild_Originate_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Originate_Timestamp(obj_)
+    def buildChild_Receive_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Receive_Timestamp(obj_)
+    def buildChild_Transmit_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Transmit_Timestamp(obj_)
 # end class ICMPv4TimestampReplyType
 
 class ICMPv4AddressMaskRequestType(GeneratedsSuper):
@@ -5958,20 +6131,23 @@ class ICMPv4AddressMaskRequestType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Address_Mask_Request':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Address_Mask_Request')
-            self.Address_Mask_Request = ival_
-        elif nodeName_ == 'Address_Mask':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Address_Mask(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Address_Mask_Request(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Address_Mask_Request')
+        self.Address_Mask_Request = ival_
+    def buildChild_Address_Mask(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Address_Mask(obj_)
 # end class ICMPv4AddressMaskRequestType
 
 class ICMPv4AddressMaskReplyType(GeneratedsSuper):
@@ -6037,20 +6213,23 @@ class ICMPv4AddressMaskReplyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Address_Mask_Reply':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Address_Mask_Reply')
-            self.Address_Mask_Reply = ival_
-        elif nodeName_ == 'Address_Mask':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Address_Mask(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Address_Mask_Reply(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Address_Mask_Reply')
+        self.Address_Mask_Reply = ival_
+    def buildChild_Address_Mask(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Address_Mask(obj_)
 # end class ICMPv4AddressMaskReplyType
 
 class ICMPv6DestinationUnreachableType(GeneratedsSuper):
@@ -6153,76 +6332,79 @@ class ICMPv6DestinationUnreachableType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'No_Route':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'No_Route')
-            self.No_Route = ival_
-        elif nodeName_ == 'Comm_Prohibited':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Comm_Prohibited')
-            self.Comm_Prohibited = ival_
-        elif nodeName_ == 'Beyond_Scope':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Beyond_Scope')
-            self.Beyond_Scope = ival_
-        elif nodeName_ == 'Address_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Address_Unreachable')
-            self.Address_Unreachable = ival_
-        elif nodeName_ == 'Port_Unreachable':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Port_Unreachable')
-            self.Port_Unreachable = ival_
-        elif nodeName_ == 'Src_Addr_Failed_Policy':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Src_Addr_Failed_Policy')
-            self.Src_Addr_Failed_Policy = ival_
-        elif nodeName_ == 'Reject_Route':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Reject_Route')
-            self.Reject_Route = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_No_Route(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'No_Route')
+        self.No_Route = ival_
+    def buildChild_Comm_Prohibited(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Comm_Prohibited')
+        self.Comm_Prohibited = ival_
+    def buildChild_Beyond_Scope(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Beyond_Scope')
+        self.Beyond_Scope = ival_
+    def buildChild_Address_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Address_Unreachable')
+        self.Address_Unreachable = ival_
+    def buildChild_Port_Unreachable(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Port_Unreachable')
+        self.Port_Unreachable = ival_
+    def buildChild_Src_Addr_Failed_Policy(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Src_Addr_Failed_Policy')
+        self.Src_Addr_Failed_Policy = ival_
+    def buildChild_Reject_Route(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Reject_Route')
+        self.Reject_Route = ival_
 # end class ICMPv6DestinationUnreachableType
 
 class ICMPv6PacketTooBigType(GeneratedsSuper):
@@ -6291,20 +6473,23 @@ class ICMPv6PacketTooBigType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Packet_Too_Big':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Packet_Too_Big')
-            self.Packet_Too_Big = ival_
-        elif nodeName_ == 'MTU':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_MTU(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Packet_Too_Big(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Packet_Too_Big')
+        self.Packet_Too_Big = ival_
+    def buildChild_MTU(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_MTU(obj_)
 # end class ICMPv6PacketTooBigType
 
 class ICMPv6TimeExceededType(GeneratedsSuper):
@@ -6372,26 +6557,29 @@ class ICMPv6TimeExceededType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hop_Limit_Exceeded':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Hop_Limit_Exceeded')
-            self.Hop_Limit_Exceeded = ival_
-        elif nodeName_ == 'Fragment_Reassem_Time_Exceeded':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Fragment_Reassem_Time_Exceeded')
-            self.Fragment_Reassem_Time_Exceeded = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hop_Limit_Exceeded(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Hop_Limit_Exceeded')
+        self.Hop_Limit_Exceeded = ival_
+    def buildChild_Fragment_Reassem_Time_Exceeded(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Fragment_Reassem_Time_Exceeded')
+        self.Fragment_Reassem_Time_Exceeded = ival_
 # end class ICMPv6TimeExceededType
 
 class ICMPv6ParameterProblemType(GeneratedsSuper):
@@ -6475,40 +6663,43 @@ class ICMPv6ParameterProblemType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Erroneous_Header_Field':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Erroneous_Header_Field')
-            self.Erroneous_Header_Field = ival_
-        elif nodeName_ == 'Unrecognized_Next_Header_Type':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Unrecognized_Next_Header_Type')
-            self.Unrecognized_Next_Header_Type = ival_
-        elif nodeName_ == 'Unrecognized_IPv6_Option':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Unrecognized_IPv6_Option')
-            self.Unrecognized_IPv6_Option = ival_
-        elif nodeName_ == 'Pointer':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pointer(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Erroneous_Header_Field(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Erroneous_Header_Field')
+        self.Erroneous_Header_Field = ival_
+    def buildChild_Unrecognized_Next_Header_Type(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Unrecognized_Next_Header_Type')
+        self.Unrecognized_Next_Header_Type = ival_
+    def buildChild_Unrecognized_IPv6_Option(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Unrecognized_IPv6_Option')
+        self.Unrecognized_IPv6_Option = ival_
+    def buildChild_Pointer(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pointer(obj_)
 # end class ICMPv6ParameterProblemType
 
 class ICMPv6EchoRequestType(GeneratedsSuper):
@@ -6577,20 +6768,23 @@ class ICMPv6EchoRequestType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Request':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Request')
-            self.Echo_Request = ival_
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Request(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Request')
+        self.Echo_Request = ival_
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class ICMPv6EchoRequestType
 
 class ICMPv6EchoReplyType(GeneratedsSuper):
@@ -6659,20 +6853,23 @@ class ICMPv6EchoReplyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Echo_Reply':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Reply')
-            self.Echo_Reply = ival_
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Echo_Reply(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Echo_Reply')
+        self.Echo_Reply = ival_
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class ICMPv6EchoReplyType
 
 class PrefixType(GeneratedsSuper):
@@ -6739,14 +6936,17 @@ class PrefixType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IPv6_Addr':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IPv6_Addr(obj_)
-        elif nodeName_ == 'IP_Addr_Prefix':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Addr_Prefix(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IPv6_Addr(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IPv6_Addr(obj_)
+    def buildChild_IP_Addr_Prefix(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Addr_Prefix(obj_)
 # end class PrefixType
 
 class HopByHopOptionsType(GeneratedsSuper):
@@ -6831,18 +7031,21 @@ class HopByHopOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Header_Ext_Len':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Header_Ext_Len(obj_)
-        elif nodeName_ == 'Option_Data':
-            obj_ = OptionDataType.factory()
-            obj_.build(child_)
-            self.Option_Data.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Header_Ext_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Header_Ext_Len(obj_)
+    def buildChild_Option_Data(self, child_, node, nodeName_):
+        obj_ = OptionDataType.factory()
+        obj_.build(child_)
+        self.Option_Data.append(obj_)
 # end class HopByHopOptionsType
 
 class OptionDataType(GeneratedsSuper):
@@ -6926,22 +7129,25 @@ class OptionDataType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Option_Type':
-            obj_ = IPv6OptionType.factory()
-            obj_.build(child_)
-            self.set_Option_Type(obj_)
-        elif nodeName_ == 'Option_Data_Len':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Data_Len(obj_)
-        elif nodeName_ == 'Pad1':
-            obj_ = Pad1Type.factory()
-            obj_.build(child_)
-            self.set_Pad1(obj_)
-        elif nodeName_ == 'PadN':
-            obj_ = PadNType.factory()
-            obj_.build(child_)
-            self.set_PadN(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Option_Type(self, child_, node, nodeName_):
+        obj_ = IPv6OptionType.factory()
+        obj_.build(child_)
+        self.set_Option_Type(obj_)
+    def buildChild_Option_Data_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Data_Len(obj_)
+    def buildChild_Pad1(self, child_, node, nodeName_):
+        obj_ = Pad1Type.factory()
+        obj_.build(child_)
+        self.set_Pad1(obj_)
+    def buildChild_PadN(self, child_, node, nodeName_):
+        obj_ = PadNType.factory()
+        obj_.build(child_)
+        self.set_PadN(obj_)
 # end class OptionDataType
 
 class RoutingType(GeneratedsSuper):
@@ -7040,26 +7246,29 @@ class RoutingType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Header_Ext_Len':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Header_Ext_Len(obj_)
-        elif nodeName_ == 'Routing_Type':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Routing_Type(obj_)
-        elif nodeName_ == 'Segments_Left':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Segments_Left(obj_)
-        elif nodeName_ == 'Type_Specific_Data':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type_Specific_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Header_Ext_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Header_Ext_Len(obj_)
+    def buildChild_Routing_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Routing_Type(obj_)
+    def buildChild_Segments_Left(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Segments_Left(obj_)
+    def buildChild_Type_Specific_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type_Specific_Data(obj_)
 # end class RoutingType
 
 class FragmentType(GeneratedsSuper):
@@ -7130,14 +7339,17 @@ class FragmentType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Fragment_Header':
-            obj_ = FragmentHeaderType.factory()
-            obj_.build(child_)
-            self.set_Fragment_Header(obj_)
-        elif nodeName_ == 'Fragment':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Fragment(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Fragment_Header(self, child_, node, nodeName_):
+        obj_ = FragmentHeaderType.factory()
+        obj_.build(child_)
+        self.set_Fragment_Header(obj_)
+    def buildChild_Fragment(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Fragment(obj_)
 # end class FragmentType
 
 class DestinationOptionsType(GeneratedsSuper):
@@ -7222,18 +7434,21 @@ class DestinationOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Header_Ext_Len':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Header_Ext_Len(obj_)
-        elif nodeName_ == 'Option_Data':
-            obj_ = OptionDataType.factory()
-            obj_.build(child_)
-            self.Option_Data.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Header_Ext_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Header_Ext_Len(obj_)
+    def buildChild_Option_Data(self, child_, node, nodeName_):
+        obj_ = OptionDataType.factory()
+        obj_.build(child_)
+        self.Option_Data.append(obj_)
 # end class DestinationOptionsType
 
 class AuthenticationHeaderType(GeneratedsSuper):
@@ -7326,26 +7541,29 @@ class AuthenticationHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Header_Ext_Len':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Header_Ext_Len(obj_)
-        elif nodeName_ == 'Security_Parameters_Index':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_Parameters_Index(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
-        elif nodeName_ == 'Authentication_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Header_Ext_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Header_Ext_Len(obj_)
+    def buildChild_Security_Parameters_Index(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_Parameters_Index(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
+    def buildChild_Authentication_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Data(obj_)
 # end class AuthenticationHeaderType
 
 class EncapsulatingSecurityPayloadType(GeneratedsSuper):
@@ -7450,34 +7668,37 @@ class EncapsulatingSecurityPayloadType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Security_Parameters_Index':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_Parameters_Index(obj_)
-        elif nodeName_ == 'Sequence_Number':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sequence_Number(obj_)
-        elif nodeName_ == 'Payload_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Payload_Data(obj_)
-        elif nodeName_ == 'Padding':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding(obj_)
-        elif nodeName_ == 'Padding_Len':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Padding_Len(obj_)
-        elif nodeName_ == 'Next_Header':
-            obj_ = IANAAssignedIPNumbersType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Authentication_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Authentication_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Security_Parameters_Index(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_Parameters_Index(obj_)
+    def buildChild_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sequence_Number(obj_)
+    def buildChild_Payload_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Payload_Data(obj_)
+    def buildChild_Padding(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding(obj_)
+    def buildChild_Padding_Len(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Padding_Len(obj_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = IANAAssignedIPNumbersType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Authentication_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Authentication_Data(obj_)
 # end class EncapsulatingSecurityPayloadType
 
 class Pad1Type(GeneratedsSuper):
@@ -7542,10 +7763,13 @@ class Pad1Type(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Octet':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Octet(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Octet(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Octet(obj_)
 # end class Pad1Type
 
 class PadNType(GeneratedsSuper):
@@ -7624,18 +7848,21 @@ class PadNType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Octet':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Octet(obj_)
-        elif nodeName_ == 'Option_Data_Length':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Data_Length(obj_)
-        elif nodeName_ == 'Option_Data':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Option_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Octet(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Octet(obj_)
+    def buildChild_Option_Data_Length(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Data_Length(obj_)
+    def buildChild_Option_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Option_Data(obj_)
 # end class PadNType
 
 class FragmentHeaderType(GeneratedsSuper):
@@ -7721,22 +7948,25 @@ class FragmentHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Next_Header':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Next_Header(obj_)
-        elif nodeName_ == 'Fragment_Offset':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Fragment_Offset(obj_)
-        elif nodeName_ == 'M_Flag':
-            obj_ = MFlagType.factory()
-            obj_.build(child_)
-            self.set_M_Flag(obj_)
-        elif nodeName_ == 'Identification':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Identification(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Next_Header(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Next_Header(obj_)
+    def buildChild_Fragment_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Fragment_Offset(obj_)
+    def buildChild_M_Flag(self, child_, node, nodeName_):
+        obj_ = MFlagType.factory()
+        obj_.build(child_)
+        self.set_M_Flag(obj_)
+    def buildChild_Identification(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Identification(obj_)
 # end class FragmentHeaderType
 
 class MFlagType(cybox_common.BaseObjectPropertyType):
@@ -8858,19 +9088,21 @@ class NetworkPacketObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(NetworkPacketObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Link_Layer':
-            obj_ = LinkLayerType.factory()
-            obj_.build(child_)
-            self.set_Link_Layer(obj_)
-        elif nodeName_ == 'Internet_Layer':
-            obj_ = InternetLayerType.factory()
-            obj_.build(child_)
-            self.set_Internet_Layer(obj_)
-        elif nodeName_ == 'Transport_Layer':
-            obj_ = TransportLayerType.factory()
-            obj_.build(child_)
-            self.set_Transport_Layer(obj_)
-        super(NetworkPacketObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Link_Layer(self, child_, node, nodeName_):
+        obj_ = LinkLayerType.factory()
+        obj_.build(child_)
+        self.set_Link_Layer(obj_)
+    def buildChild_Internet_Layer(self, child_, node, nodeName_):
+        obj_ = InternetLayerType.factory()
+        obj_.build(child_)
+        self.set_Internet_Layer(obj_)
+    def buildChild_Transport_Layer(self, child_, node, nodeName_):
+        obj_ = TransportLayerType.factory()
+        obj_.build(child_)
+        self.set_Transport_Layer(obj_)
 # end class NetworkPacketObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 
@@ -298,51 +300,53 @@ class NetworkRouteEntryObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(NetworkRouteEntryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Destination_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Destination_Address(obj_)
-        elif nodeName_ == 'Origin':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Origin(obj_)
-        elif nodeName_ == 'Netmask':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Netmask(obj_)
-        elif nodeName_ == 'Gateway_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Gateway_Address(obj_)
-        elif nodeName_ == 'Metric':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Metric(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = RouteType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Protocol':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Protocol(obj_)
-        elif nodeName_ == 'Interface':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Interface(obj_)
-        elif nodeName_ == 'Preferred_Lifetime':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Preferred_Lifetime(obj_)
-        elif nodeName_ == 'Valid_Lifetime':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Valid_Lifetime(obj_)
-        elif nodeName_ == 'Route_Age':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Route_Age(obj_)
-        super(NetworkRouteEntryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Destination_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Destination_Address(obj_)
+    def buildChild_Origin(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Origin(obj_)
+    def buildChild_Netmask(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Netmask(obj_)
+    def buildChild_Gateway_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Gateway_Address(obj_)
+    def buildChild_Metric(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Metric(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = RouteType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Protocol(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Protocol(obj_)
+    def buildChild_Interface(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Interface(obj_)
+    def buildChild_Preferred_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Preferred_Lifetime(obj_)
+    def buildChild_Valid_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Valid_Lifetime(obj_)
+    def buildChild_Route_Age(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Route_Age(obj_)
 # end class NetworkRouteEntryObjectType
 
 GDSClassesMapping = {
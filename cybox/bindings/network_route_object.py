@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import network_route_entry_object
 
@@ -71,10 +73,13 @@ class NetworkRouteEntriesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network_Route_Entry':
-            obj_ = network_route_entry_object.NetworkRouteEntryObjectType.factory()
-            obj_.build(child_)
-            self.Network_Route_Entry.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Network_Route_Entry(self, child_, node, nodeName_):
+        obj_ = network_route_entry_object.NetworkRouteEntryObjectType.factory()
+        obj_.build(child_)
+        self.Network_Route_Entry.append(obj_)
 # end class NetworkRouteEntriesType
 
 class NetRouteObjectType(cybox_common.ObjectPropertiesType):
@@ -246,27 +251,29 @@ class NetRouteObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(NetRouteObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Network_Route_Entries':
-            obj_ = NetworkRouteEntriesType.factory()
-            obj_.build(child_)
-            self.set_Network_Route_Entries(obj_)
-        elif nodeName_ == 'Preferred_Lifetime':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Preferred_Lifetime(obj_)
-        elif nodeName_ == 'Valid_Lifetime':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Valid_Lifetime(obj_)
-        elif nodeName_ == 'Route_Age':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Route_Age(obj_)
-        super(NetRouteObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Network_Route_Entries(self, child_, node, nodeName_):
+        obj_ = NetworkRouteEntriesType.factory()
+        obj_.build(child_)
+        self.set_Network_Route_Entries(obj_)
+    def buildChild_Preferred_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Preferred_Lifetime(obj_)
+    def buildChild_Valid_Lifetime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Valid_Lifetime(obj_)
+    def buildChild_Route_Age(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Route_Age(obj_)
 # end class NetRouteObjectType
 
 GDSClassesMapping = {
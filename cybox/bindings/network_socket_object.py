@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import socket_address_object
 
@@ -203,150 +205,153 @@ class SocketOptionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_MULTICAST_IF':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IP_MULTICAST_IF(obj_)
-        elif nodeName_ == 'IP_MULTICAST_IF2':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IP_MULTICAST_IF2(obj_)
-        elif nodeName_ == 'IP_MULTICAST_LOOP':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'IP_MULTICAST_LOOP')
-            self.IP_MULTICAST_LOOP = ival_
-        elif nodeName_ == 'IP_TOS':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IP_TOS(obj_)
-        elif nodeName_ == 'SO_BROADCAST':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_BROADCAST')
-            self.SO_BROADCAST = ival_
-        elif nodeName_ == 'SO_CONDITIONAL_ACCEPT':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_CONDITIONAL_ACCEPT')
-            self.SO_CONDITIONAL_ACCEPT = ival_
-        elif nodeName_ == 'SO_KEEPALIVE':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_KEEPALIVE')
-            self.SO_KEEPALIVE = ival_
-        elif nodeName_ == 'SO_DONTROUTE':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_DONTROUTE')
-            self.SO_DONTROUTE = ival_
-        elif nodeName_ == 'SO_LINGER':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_LINGER(obj_)
-        elif nodeName_ == 'SO_DONTLINGER':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_DONTLINGER')
-            self.SO_DONTLINGER = ival_
-        elif nodeName_ == 'SO_OOBINLINE':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_OOBINLINE')
-            self.SO_OOBINLINE = ival_
-        elif nodeName_ == 'SO_RCVBUF':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_RCVBUF(obj_)
-        elif nodeName_ == 'SO_GROUP_PRIORITY':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_GROUP_PRIORITY(obj_)
-        elif nodeName_ == 'SO_REUSEADDR':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_REUSEADDR')
-            self.SO_REUSEADDR = ival_
-        elif nodeName_ == 'SO_DEBUG':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'SO_DEBUG')
-            self.SO_DEBUG = ival_
-        elif nodeName_ == 'SO_RCVTIMEO':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_RCVTIMEO(obj_)
-        elif nodeName_ == 'SO_SNDBUF':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_SNDBUF(obj_)
-        elif nodeName_ == 'SO_SNDTIMEO':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_SNDTIMEO(obj_)
-        elif nodeName_ == 'SO_UPDATE_ACCEPT_CONTEXT':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_UPDATE_ACCEPT_CONTEXT(obj_)
-        elif nodeName_ == 'SO_TIMEOUT':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SO_TIMEOUT(obj_)
-        elif nodeName_ == 'TCP_NODELAY':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'TCP_NODELAY')
-            self.TCP_NODELAY = ival_
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_MULTICAST_IF(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IP_MULTICAST_IF(obj_)
+    def buildChild_IP_MULTICAST_IF2(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IP_MULTICAST_IF2(obj_)
+    def buildChild_IP_MULTICAST_LOOP(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'IP_MULTICAST_LOOP')
+        self.IP_MULTICAST_LOOP = ival_
+    def buildChild_IP_TOS(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IP_TOS(obj_)
+    def buildChild_SO_BROADCAST(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_BROADCAST')
+        self.SO_BROADCAST = ival_
+    def buildChild_SO_CONDITIONAL_ACCEPT(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_CONDITIONAL_ACCEPT')
+        self.SO_CONDITIONAL_ACCEPT = ival_
+    def buildChild_SO_KEEPALIVE(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_KEEPALIVE')
+        self.SO_KEEPALIVE = ival_
+    def buildChild_SO_DONTROUTE(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_DONTROUTE')
+        self.SO_DONTROUTE = ival_
+    def buildChild_SO_LINGER(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_LINGER(obj_)
+    def buildChild_SO_DONTLINGER(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_DONTLINGER')
+        self.SO_DONTLINGER = ival_
+    def buildChild_SO_OOBINLINE(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_OOBINLINE')
+        self.SO_OOBINLINE = ival_
+    def buildChild_SO_RCVBUF(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_RCVBUF(obj_)
+    def buildChild_SO_GROUP_PRIORITY(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_GROUP_PRIORITY(obj_)
+    def buildChild_SO_REUSEADDR(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_REUSEADDR')
+        self.SO_REUSEADDR = ival_
+    def buildChild_SO_DEBUG(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'SO_DEBUG')
+        self.SO_DEBUG = ival_
+    def buildChild_SO_RCVTIMEO(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_RCVTIMEO(obj_)
+    def buildChild_SO_SNDBUF(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_SNDBUF(obj_)
+    def buildChild_SO_SNDTIMEO(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_SNDTIMEO(obj_)
+    def buildChild_SO_UPDATE_ACCEPT_CONTEXT(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_UPDATE_ACCEPT_CONTEXT(obj_)
+    def buildChild_SO_TIMEOUT(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SO_TIMEOUT(obj_)
+    def buildChild_TCP_NODELAY(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'TCP_NODELAY')
+        self.TCP_NODELAY = ival_
 # end class SocketOptionsType
 
 class ProtocolType(cybox_common.BaseObjectPropertyType):
@@ -792,39 +797,41 @@ class NetworkSocketObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(NetworkSocketObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Address_Family':
-            obj_ = AddressFamilyType.factory()
-            obj_.build(child_)
-            self.set_Address_Family(obj_)
-        elif nodeName_ == 'Domain':
-            obj_ = DomainFamilyType.factory()
-            obj_.build(child_)
-            self.set_Domain(obj_)
-        elif nodeName_ == 'Local_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Local_Address(obj_)
-        elif nodeName_ == 'Options':
-            obj_ = SocketOptionsType.factory()
-            obj_.build(child_)
-            self.set_Options(obj_)
-        elif nodeName_ == 'Protocol':
-            obj_ = ProtocolType.factory()
-            obj_.build(child_)
-            self.set_Protocol(obj_)
-        elif nodeName_ == 'Remote_Address':
-            obj_ = socket_address_object.SocketAddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Remote_Address(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = SocketType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Socket_Descriptor':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Socket_Descriptor(obj_)
-        super(NetworkSocketObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Address_Family(self, child_, node, nodeName_):
+        obj_ = AddressFamilyType.factory()
+        obj_.build(child_)
+        self.set_Address_Family(obj_)
+    def buildChild_Domain(self, child_, node, nodeName_):
+        obj_ = DomainFamilyType.factory()
+        obj_.build(child_)
+        self.set_Domain(obj_)
+    def buildChild_Local_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Local_Address(obj_)
+    def buildChild_Options(self, child_, node, nodeName_):
+        obj_ = SocketOptionsType.factory()
+        obj_.build(child_)
+        self.set_Options(obj_)
+    def buildChild_Protocol(self, child_, node, nodeName_):
+        obj_ = ProtocolType.factory()
+        obj_.build(child_)
+        self.set_Protocol(obj_)
+    def buildChild_Remote_Address(self, child_, node, nodeName_):
+        obj_ = socket_address_object.SocketAddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Remote_Address(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = SocketType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Socket_Descriptor(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Socket_Descriptor(obj_)
 # end class NetworkSocketObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import network_route_entry_object
@@ -71,10 +73,13 @@ class RoutesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Route':
-            obj_ = network_route_entry_object.NetworkRouteEntryObjectType.factory()
-            obj_.build(child_)
-            self.Route.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Route(self, child_, node, nodeName_):
+        obj_ = network_route_entry_object.NetworkRouteEntryObjectType.factory()
+        obj_.build(child_)
+        self.Route.append(obj_)
 # end class RoutesType
 
 class NetworkSubnetObjectType(cybox_common.ObjectPropertiesType):
@@ -162,23 +167,25 @@ class NetworkSubnetObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(NetworkSubnetObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StructuredTextType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'Number_Of_IP_Addresses':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_IP_Addresses(obj_)
-        elif nodeName_ == 'Routes':
-            obj_ = RoutesType.factory()
-            obj_.build(child_)
-            self.set_Routes(obj_)
-        super(NetworkSubnetObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StructuredTextType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_Number_Of_IP_Addresses(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_IP_Addresses(obj_)
+    def buildChild_Routes(self, child_, node, nodeName_):
+        obj_ = RoutesType.factory()
+        obj_.build(child_)
+        self.set_Routes(obj_)
 # end class NetworkSubnetObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import file_object
 
@@ -71,10 +73,13 @@ class PDFXRefTableListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Cross_Reference_Table':
-            obj_ = PDFXRefTableType.factory()
-            obj_.build(child_)
-            self.Cross_Reference_Table.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Cross_Reference_Table(self, child_, node, nodeName_):
+        obj_ = PDFXRefTableType.factory()
+        obj_.build(child_)
+        self.Cross_Reference_Table.append(obj_)
 # end class PDFXRefTableListType
 
 class PDFXRefTableType(GeneratedsSuper):
@@ -151,18 +156,21 @@ class PDFXRefTableType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Subsections':
-            obj_ = PDFXrefTableSubsectionListType.factory()
-            obj_.build(child_)
-            self.set_Subsections(obj_)
-        elif nodeName_ == 'Offset':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Subsections(self, child_, node, nodeName_):
+        obj_ = PDFXrefTableSubsectionListType.factory()
+        obj_.build(child_)
+        self.set_Subsections(obj_)
+    def buildChild_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PDFXRefTableType
 
 class PDFXrefTableSubsectionListType(GeneratedsSuper):
@@ -228,10 +236,13 @@ class PDFXrefTableSubsectionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Subsection':
-            obj_ = PDFXrefTableSubsectionType.factory()
-            obj_.build(child_)
-            self.Subsection.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Subsection(self, child_, node, nodeName_):
+        obj_ = PDFXrefTableSubsectionType.factory()
+        obj_.build(child_)
+        self.Subsection.append(obj_)
 # end class PDFXrefTableSubsectionListType
 
 class PDFXrefTableSubsectionType(GeneratedsSuper):
@@ -307,18 +318,21 @@ class PDFXrefTableSubsectionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'First_Object_Number':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_First_Object_Number(obj_)
-        elif nodeName_ == 'Number_Of_Objects':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Objects(obj_)
-        elif nodeName_ == 'Cross_Reference_Entries':
-            obj_ = PDFXrefEntryListType.factory()
-            obj_.build(child_)
-            self.set_Cross_Reference_Entries(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_First_Object_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_First_Object_Number(obj_)
+    def buildChild_Number_Of_Objects(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Objects(obj_)
+    def buildChild_Cross_Reference_Entries(self, child_, node, nodeName_):
+        obj_ = PDFXrefEntryListType.factory()
+        obj_.build(child_)
+        self.set_Cross_Reference_Entries(obj_)
 # end class PDFXrefTableSubsectionType
 
 class PDFTrailerListType(GeneratedsSuper):
@@ -383,10 +397,13 @@ class PDFTrailerListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Trailer':
-            obj_ = PDFTrailerType.factory()
-            obj_.build(child_)
-            self.Trailer.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Trailer(self, child_, node, nodeName_):
+        obj_ = PDFTrailerType.factory()
+        obj_.build(child_)
+        self.Trailer.append(obj_)
 # end class PDFTrailerListType
 
 class PDFTrailerType(GeneratedsSuper):
@@ -497,42 +514,45 @@ class PDFTrailerType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Size':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size(obj_)
-        elif nodeName_ == 'Prev':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Prev(obj_)
-        elif nodeName_ == 'Root':
-            obj_ = PDFIndirectObjectIDType.factory()
-            obj_.build(child_)
-            self.set_Root(obj_)
-        elif nodeName_ == 'Encrypt':
-            obj_ = PDFDictionaryType.factory()
-            obj_.build(child_)
-            self.set_Encrypt(obj_)
-        elif nodeName_ == 'Info':
-            obj_ = PDFIndirectObjectIDType.factory()
-            obj_.build(child_)
-            self.set_Info(obj_)
-        elif nodeName_ == 'ID':
-            obj_ = PDFFileIDType.factory()
-            obj_.build(child_)
-            self.set_ID(obj_)
-        elif nodeName_ == 'Last_Cross_Reference_Offset':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Cross_Reference_Offset(obj_)
-        elif nodeName_ == 'Offset':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size(obj_)
+    def buildChild_Prev(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Prev(obj_)
+    def buildChild_Root(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectIDType.factory()
+        obj_.build(child_)
+        self.set_Root(obj_)
+    def buildChild_Encrypt(self, child_, node, nodeName_):
+        obj_ = PDFDictionaryType.factory()
+        obj_.build(child_)
+        self.set_Encrypt(obj_)
+    def buildChild_Info(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectIDType.factory()
+        obj_.build(child_)
+        self.set_Info(obj_)
+    def buildChild_ID(self, child_, node, nodeName_):
+        obj_ = PDFFileIDType.factory()
+        obj_.build(child_)
+        self.set_ID(obj_)
+    def buildChild_Last_Cross_Reference_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Cross_Reference_Offset(obj_)
+    def buildChild_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PDFTrailerType
 
 class PDFFileIDType(GeneratedsSuper):
@@ -601,10 +621,13 @@ class PDFFileIDType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ID_String':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.ID_String.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ID_String(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.ID_String.append(obj_)
 # end class PDFFileIDType
 
 class PDFIndirectObjectListType(GeneratedsSuper):
@@ -670,10 +693,13 @@ class PDFIndirectObjectListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Indirect_Object':
-            obj_ = PDFIndirectObjectType.factory()
-            obj_.build(child_)
-            self.Indirect_Object.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Indirect_Object(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectType.factory()
+        obj_.build(child_)
+        self.Indirect_Object.append(obj_)
 # end class PDFIndirectObjectListType
 
 class PDFIndirectObjectType(GeneratedsSuper):
@@ -764,22 +790,25 @@ class PDFIndirectObjectType(GeneratedsSuper):
         if value is not None:
             self.type_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'ID':
-            obj_ = PDFIndirectObjectIDType.factory()
-            obj_.build(child_)
-            self.set_ID(obj_)
-        elif nodeName_ == 'Contents':
-            obj_ = PDFIndirectObjectContentsType.factory()
-            obj_.build(child_)
-            self.set_Contents(obj_)
-        elif nodeName_ == 'Offset':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_ID(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectIDType.factory()
+        obj_.build(child_)
+        self.set_ID(obj_)
+    def buildChild_Contents(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectContentsType.factory()
+        obj_.build(child_)
+        self.set_Contents(obj_)
+    def buildChild_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PDFIndirectObjectType
 
 class PDFIndirectObjectIDType(GeneratedsSuper):
@@ -852,14 +881,17 @@ class PDFIndirectObjectIDType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Object_Number':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Object_Number(obj_)
-        elif nodeName_ == 'Generation_Number':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Generation_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Object_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Object_Number(obj_)
+    def buildChild_Generation_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Generation_Number(obj_)
 # end class PDFIndirectObjectIDType
 
 class PDFIndirectObjectContentsType(GeneratedsSuper):
@@ -934,14 +966,17 @@ class PDFIndirectObjectContentsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Non_Stream_Contents':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Non_Stream_Contents(obj_)
-        elif nodeName_ == 'Stream_Contents':
-            obj_ = PDFStreamType.factory()
-            obj_.build(child_)
-            self.set_Stream_Contents(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Non_Stream_Contents(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Non_Stream_Contents(obj_)
+    def buildChild_Stream_Contents(self, child_, node, nodeName_):
+        obj_ = PDFStreamType.factory()
+        obj_.build(child_)
+        self.set_Stream_Contents(obj_)
 # end class PDFIndirectObjectContentsType
 
 class PDFStreamType(GeneratedsSuper):
@@ -1026,22 +1061,25 @@ class PDFStreamType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Raw_Stream':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Stream(obj_)
-        elif nodeName_ == 'Raw_Stream_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Raw_Stream_Hashes(obj_)
-        elif nodeName_ == 'Decoded_Stream':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Decoded_Stream(obj_)
-        elif nodeName_ == 'Decoded_Stream_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Decoded_Stream_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Raw_Stream(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Stream(obj_)
+    def buildChild_Raw_Stream_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Raw_Stream_Hashes(obj_)
+    def buildChild_Decoded_Stream(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Decoded_Stream(obj_)
+    def buildChild_Decoded_Stream_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Decoded_Stream_Hashes(obj_)
 # end class PDFStreamType
 
 class PDFDocumentInformationDictionaryType(GeneratedsSuper):
@@ -1157,42 +1195,45 @@ class PDFDocumentInformationDictionaryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Title':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Title(obj_)
-        elif nodeName_ == 'Author':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Author(obj_)
-        elif nodeName_ == 'Subject':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject(obj_)
-        elif nodeName_ == 'Keywords':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Keywords(obj_)
-        elif nodeName_ == 'Creator':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creator(obj_)
-        elif nodeName_ == 'Producer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Producer(obj_)
-        elif nodeName_ == 'CreationDate':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_CreationDate(obj_)
-        elif nodeName_ == 'ModDate':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ModDate(obj_)
-        elif nodeName_ == 'Trapped':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trapped(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Title(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Title(obj_)
+    def buildChild_Author(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Author(obj_)
+    def buildChild_Subject(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject(obj_)
+    def buildChild_Keywords(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Keywords(obj_)
+    def buildChild_Creator(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creator(obj_)
+    def buildChild_Producer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Producer(obj_)
+    def buildChild_CreationDate(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_CreationDate(obj_)
+    def buildChild_ModDate(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ModDate(obj_)
+    def buildChild_Trapped(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trapped(obj_)
 # end class PDFDocumentInformationDictionaryType
 
 class PDFXrefEntryListType(GeneratedsSuper):
@@ -1258,10 +1299,13 @@ class PDFXrefEntryListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Cross_Reference_Entry':
-            obj_ = PDFXrefEntryType.factory()
-            obj_.build(child_)
-            self.Cross_Reference_Entry.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Cross_Reference_Entry(self, child_, node, nodeName_):
+        obj_ = PDFXrefEntryType.factory()
+        obj_.build(child_)
+        self.Cross_Reference_Entry.append(obj_)
 # end class PDFXrefEntryListType
 
 class PDFXrefEntryType(GeneratedsSuper):
@@ -1349,18 +1393,21 @@ class PDFXrefEntryType(GeneratedsSuper):
 
             self.type_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Byte_Offset':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Byte_Offset(obj_)
-        elif nodeName_ == 'Object_Number':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Object_Number(obj_)
-        elif nodeName_ == 'Generation_Number':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Generation_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Byte_Offset(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Byte_Offset(obj_)
+    def buildChild_Object_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Object_Number(obj_)
+    def buildChild_Generation_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Generation_Number(obj_)
 # end class PDFXrefEntryType
 
 class PDFDictionaryType(GeneratedsSuper):
@@ -1436,14 +1483,17 @@ class PDFDictionaryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Object_Reference':
-            obj_ = PDFIndirectObjectIDType.factory()
-            obj_.build(child_)
-            self.set_Object_Reference(obj_)
-        elif nodeName_ == 'Raw_Contents':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Contents(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Object_Reference(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectIDType.factory()
+        obj_.build(child_)
+        self.set_Object_Reference(obj_)
+    def buildChild_Raw_Contents(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Contents(obj_)
 # end class PDFDictionaryType
 
 class PDFFileMetadataType(GeneratedsSuper):
@@ -1561,26 +1611,29 @@ class PDFFileMetadataType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Document_Information_Dictionary':
-            obj_ = PDFDocumentInformationDictionaryType.factory()
-            obj_.build(child_)
-            self.set_Document_Information_Dictionary(obj_)
-        elif nodeName_ == 'Number_Of_Indirect_Objects':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Indirect_Objects(obj_)
-        elif nodeName_ == 'Number_Of_Trailers':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Trailers(obj_)
-        elif nodeName_ == 'Number_Of_Cross_Reference_Tables':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Cross_Reference_Tables(obj_)
-        elif nodeName_ == 'Keyword_Counts':
-            obj_ = PDFKeywordCountsType.factory()
-            obj_.build(child_)
-            self.set_Keyword_Counts(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Document_Information_Dictionary(self, child_, node, nodeName_):
+        obj_ = PDFDocumentInformationDictionaryType.factory()
+        obj_.build(child_)
+        self.set_Document_Information_Dictionary(obj_)
+    def buildChild_Number_Of_Indirect_Objects(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Indirect_Objects(obj_)
+    def buildChild_Number_Of_Trailers(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Trailers(obj_)
+    def buildChild_Number_Of_Cross_Reference_Tables(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Cross_Reference_Tables(obj_)
+    def buildChild_Keyword_Counts(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountsType.factory()
+        obj_.build(child_)
+        self.set_Keyword_Counts(obj_)
 # end class PDFFileMetadataType
 
 class PDFKeywordCountsType(GeneratedsSuper):
@@ -1743,78 +1796,81 @@ class PDFKeywordCountsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Page_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_Page_Count(obj_)
-        elif nodeName_ == 'Encrypt_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_Encrypt_Count(obj_)
-        elif nodeName_ == 'ObjStm_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_ObjStm_Count(obj_)
-        elif nodeName_ == 'JS_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_JS_Count(obj_)
-        elif nodeName_ == 'JavaScript_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_JavaScript_Count(obj_)
-        elif nodeName_ == 'AA_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_AA_Count(obj_)
-        elif nodeName_ == 'OpenAction_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_OpenAction_Count(obj_)
-        elif nodeName_ == 'ASCIIHexDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_ASCIIHexDecode_Count(obj_)
-        elif nodeName_ == 'ASCII85Decode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_ASCII85Decode_Count(obj_)
-        elif nodeName_ == 'LZWDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_LZWDecode_Count(obj_)
-        elif nodeName_ == 'FlateDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_FlateDecode_Count(obj_)
-        elif nodeName_ == 'RunLengthDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_RunLengthDecode_Count(obj_)
-        elif nodeName_ == 'JBIG2Decode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_JBIG2Decode_Count(obj_)
-        elif nodeName_ == 'DCTDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_DCTDecode_Count(obj_)
-        elif nodeName_ == 'RichMedia_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_RichMedia_Count(obj_)
-        elif nodeName_ == 'CCITTFaxDecode_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_CCITTFaxDecode_Count(obj_)
-        elif nodeName_ == 'Launch_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_Launch_Count(obj_)
-        elif nodeName_ == 'XFA_Count':
-            obj_ = PDFKeywordCountType.factory()
-            obj_.build(child_)
-            self.set_XFA_Count(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Page_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_Page_Count(obj_)
+    def buildChild_Encrypt_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_Encrypt_Count(obj_)
+    def buildChild_ObjStm_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_ObjStm_Count(obj_)
+    def buildChild_JS_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_JS_Count(obj_)
+    def buildChild_JavaScript_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_JavaScript_Count(obj_)
+    def buildChild_AA_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_AA_Count(obj_)
+    def buildChild_OpenAction_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_OpenAction_Count(obj_)
+    def buildChild_ASCIIHexDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_ASCIIHexDecode_Count(obj_)
+    def buildChild_ASCII85Decode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_ASCII85Decode_Count(obj_)
+    def buildChild_LZWDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_LZWDecode_Count(obj_)
+    def buildChild_FlateDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_FlateDecode_Count(obj_)
+    def buildChild_RunLengthDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_RunLengthDecode_Count(obj_)
+    def buildChild_JBIG2Decode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_JBIG2Decode_Count(obj_)
+    def buildChild_DCTDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_DCTDecode_Count(obj_)
+    def buildChild_RichMedia_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_RichMedia_Count(obj_)
+    def buildChild_CCITTFaxDecode_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_CCITTFaxDecode_Count(obj_)
+    def buildChild_Launch_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_Launch_Count(obj_)
+    def buildChild_XFA_Count(self, child_, node, nodeName_):
+        obj_ = PDFKeywordCountType.factory()
+        obj_.build(child_)
+        self.set_XFA_Count(obj_)
 # end class PDFKeywordCountsType
 
 class PDFKeywordCountType(GeneratedsSuper):
@@ -1884,14 +1940,17 @@ class PDFKeywordCountType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Non_Obfuscated_Count':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Non_Obfuscated_Count(obj_)
-        elif nodeName_ == 'Obfuscated_Count':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Obfuscated_Count(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Non_Obfuscated_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Non_Obfuscated_Count(obj_)
+    def buildChild_Obfuscated_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Obfuscated_Count(obj_)
 # end class PDFKeywordCountType
 
 class PDFFileObjectType(file_object.FileObjectType):
@@ -1982,27 +2041,29 @@ class PDFFileObjectType(file_object.FileObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(PDFFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Metadata':
-            obj_ = PDFFileMetadataType.factory()
-            obj_.build(child_)
-            self.set_Metadata(obj_)
-        elif nodeName_ == 'Version':
-            obj_ = cybox_common.DoubleObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Indirect_Objects':
-            obj_ = PDFIndirectObjectListType.factory()
-            obj_.build(child_)
-            self.set_Indirect_Objects(obj_)
-        elif nodeName_ == 'Cross_Reference_Tables':
-            obj_ = PDFXRefTableListType.factory()
-            obj_.build(child_)
-            self.set_Cross_Reference_Tables(obj_)
-        elif nodeName_ == 'Trailers':
-            obj_ = PDFTrailerListType.factory()
-            obj_.build(child_)
-            self.set_Trailers(obj_)
-        super(PDFFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Metadata(self, child_, node, nodeName_):
+        obj_ = PDFFileMetadataType.factory()
+        obj_.build(child_)
+        self.set_Metadata(obj_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.DoubleObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Indirect_Objects(self, child_, node, nodeName_):
+        obj_ = PDFIndirectObjectListType.factory()
+        obj_.build(child_)
+        self.set_Indirect_Objects(obj_)
+    def buildChild_Cross_Reference_Tables(self, child_, node, nodeName_):
+        obj_ = PDFXRefTableListType.factory()
+        obj_.build(child_)
+        self.set_Cross_Reference_Tables(obj_)
+    def buildChild_Trailers(self, child_, node, nodeName_):
+        obj_ = PDFTrailerListType.factory()
+        obj_.build(child_)
+        self.set_Trailers(obj_)
 # end class PDFFileObjectType
 
 GDSClassesMapping = {
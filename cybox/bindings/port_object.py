@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -155,15 +157,17 @@ class PortObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(PortObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Port_Value':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Port_Value(obj_)
-        elif nodeName_ == 'Layer4_Protocol':
-            obj_ = Layer4ProtocolType.factory()
-            obj_.build(child_)
-            self.set_Layer4_Protocol(obj_)
-        super(PortObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Port_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Port_Value(obj_)
+    def buildChild_Layer4_Protocol(self, child_, node, nodeName_):
+        obj_ = Layer4ProtocolType.factory()
+        obj_.build(child_)
+        self.set_Layer4_Protocol(obj_)
 # end class PortObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import network_connection_object
 from . import port_object
@@ -71,10 +73,13 @@ class NetworkConnectionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network_Connection':
-            obj_ = network_connection_object.NetworkConnectionObjectType.factory()
-            obj_.build(child_)
-            self.Network_Connection.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Network_Connection(self, child_, node, nodeName_):
+        obj_ = network_connection_object.NetworkConnectionObjectType.factory()
+        obj_.build(child_)
+        self.Network_Connection.append(obj_)
 # end class NetworkConnectionListType
 
 class ImageInfoType(GeneratedsSuper):
@@ -155,22 +160,25 @@ class ImageInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Name(obj_)
-        elif nodeName_ == 'Command_Line':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Command_Line(obj_)
-        elif nodeName_ == 'Current_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Current_Directory(obj_)
-        elif nodeName_ == 'Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Path(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Name(obj_)
+    def buildChild_Command_Line(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Command_Line(obj_)
+    def buildChild_Current_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Current_Directory(obj_)
+    def buildChild_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Path(obj_)
 # end class ImageInfoType
 
 class ProcessStatusType(GeneratedsSuper):
@@ -294,10 +302,13 @@ class ChildPIDListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Child_PID':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Child_PID.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Child_PID(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Child_PID.append(obj_)
 # end class ChildPIDListType
 
 class ArgumentListType(GeneratedsSuper):
@@ -366,10 +377,13 @@ class ArgumentListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Argument':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Argument.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Argument(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Argument.append(obj_)
 # end class ArgumentListType
 
 class PortListType(GeneratedsSuper):
@@ -434,10 +448,13 @@ class PortListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.Port.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.Port.append(obj_)
 # end class PortListType
 
 class ProcessObjectType(cybox_common.ObjectPropertiesType):
@@ -619,85 +636,87 @@ class ProcessObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(ProcessObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'PID':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_PID(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Creation_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Time(obj_)
-        elif nodeName_ == 'Parent_PID':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Parent_PID(obj_)
-        elif nodeName_ == 'Child_PID_List':
-            obj_ = ChildPIDListType.factory()
-            obj_.build(child_)
-            self.set_Child_PID_List(obj_)
-        elif nodeName_ == 'Image_Info':
-            obj_ = ImageInfoType.factory()
-            obj_.build(child_)
-            self.set_Image_Info(obj_)
-        elif nodeName_ == 'Argument_List':
-            obj_ = ArgumentListType.factory()
-            obj_.build(child_)
-            self.set_Argument_List(obj_)
-        elif nodeName_ == 'Environment_Variable_List':
-            obj_ = cybox_common.EnvironmentVariableListType.factory()
-            obj_.build(child_)
-            self.set_Environment_Variable_List(obj_)
-        elif nodeName_ == 'Kernel_Time':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Kernel_Time(obj_)
-        elif nodeName_ == 'Port_List':
-            obj_ = PortListType.factory()
-            obj_.build(child_)
-            self.set_Port_List(obj_)
-        elif nodeName_ == 'Network_Connection_List':
-            obj_ = NetworkConnectionListType.factory()
-            obj_.build(child_)
-            self.set_Network_Connection_List(obj_)
-        elif nodeName_ == 'Start_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Start_Time(obj_)
-        elif nodeName_ == 'Status':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_PID(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_PID(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Creation_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Time(obj_)
+    def buildChild_Parent_PID(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Parent_PID(obj_)
+    def buildChild_Child_PID_List(self, child_, node, nodeName_):
+        obj_ = ChildPIDListType.factory()
+        obj_.build(child_)
+        self.set_Child_PID_List(obj_)
+    def buildChild_Image_Info(self, child_, node, nodeName_):
+        obj_ = ImageInfoType.factory()
+        obj_.build(child_)
+        self.set_Image_Info(obj_)
+    def buildChild_Argument_List(self, child_, node, nodeName_):
+        obj_ = ArgumentListType.factory()
+        obj_.build(child_)
+        self.set_Argument_List(obj_)
+    def buildChild_Environment_Variable_List(self, child_, node, nodeName_):
+        obj_ = cybox_common.EnvironmentVariableListType.factory()
+        obj_.build(child_)
+        self.set_Environment_Variable_List(obj_)
+    def buildChild_Kernel_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Kernel_Time(obj_)
+    def buildChild_Port_List(self, child_, node, nodeName_):
+        obj_ = PortListType.factory()
+        obj_.build(child_)
+        self.set_Port_List(obj_)
+    def buildChild_Network_Connection_List(self, child_, node, nodeName_):
+        obj_ = NetworkConnectionListType.factory()
+        obj_.build(child_)
+        self.set_Network_Connection_List(obj_)
+    def buildChild_Start_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Start_Time(obj_)
+    def buildChild_Status(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Status> element')
-            self.set_Status(obj_)
-        elif nodeName_ == 'Username':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Username(obj_)
-        elif nodeName_ == 'User_Time':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
             obj_.build(child_)
-            self.set_User_Time(obj_)
-        elif nodeName_ == 'Extracted_Features':
-            obj_ = cybox_common.ExtractedFeaturesType.factory()
-            obj_.build(child_)
-            self.set_Extracted_Features(obj_)
-        super(ProcessObjectType, self).buildChildren(child_, node, nodeName_, True)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Status> element')
+        self.set_Status(obj_)
+    def buildChild_Username(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Username(obj_)
+    def buildChild_User_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Time(obj_)
+    def buildChild_Extracted_Features(self, child_, node, nodeName_):
+        obj_ = cybox_common.ExtractedFeaturesType.factory()
+        obj_.build(child_)
+        self.set_Extracted_Features(obj_)
 # end class ProcessObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -105,19 +107,21 @@ class SemaphoreObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(SemaphoreObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Current_Count':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Current_Count(obj_)
-        elif nodeName_ == 'Maximum_Count':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Maximum_Count(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        super(SemaphoreObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Current_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Current_Count(obj_)
+    def buildChild_Maximum_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Maximum_Count(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
 # end class SemaphoreObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import hostname_object
@@ -83,19 +85,21 @@ class SocketAddressObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(SocketAddressObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
-        elif nodeName_ == 'Hostname':
-            obj_ = hostname_object.HostnameObjectType.factory()
-            obj_.build(child_)
-            self.set_Hostname(obj_)
-        elif nodeName_ == 'Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_Port(obj_)
-        super(SocketAddressObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
+    def buildChild_Hostname(self, child_, node, nodeName_):
+        obj_ = hostname_object.HostnameObjectType.factory()
+        obj_.build(child_)
+        self.set_Hostname(obj_)
+    def buildChild_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_Port(obj_)
 # end class SocketAddressObjectType
 
 GDSClassesMapping = {
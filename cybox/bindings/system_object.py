@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 
@@ -95,26 +97,29 @@ class BIOSInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'BIOS_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Date(obj_)
-        elif nodeName_ == 'BIOS_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Version(obj_)
-        elif nodeName_ == 'BIOS_Manufacturer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Manufacturer(obj_)
-        elif nodeName_ == 'BIOS_Release_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Release_Date(obj_)
-        elif nodeName_ == 'BIOS_Serial_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Serial_Number(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_BIOS_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Date(obj_)
+    def buildChild_BIOS_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Version(obj_)
+    def buildChild_BIOS_Manufacturer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Manufacturer(obj_)
+    def buildChild_BIOS_Release_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Release_Date(obj_)
+    def buildChild_BIOS_Serial_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Serial_Number(obj_)
 # end class BIOSInfoType
 
 class NetworkInterfaceListType(GeneratedsSuper):
@@ -180,10 +185,13 @@ class NetworkInterfaceListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Network_Interface':
-            obj_ = NetworkInterfaceType.factory()
-            obj_.build(child_)
-            self.Network_Interface.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Network_Interface(self, child_, node, nodeName_):
+        obj_ = NetworkInterfaceType.factory()
+        obj_.build(child_)
+        self.Network_Interface.append(obj_)
 # end class NetworkInterfaceListType
 
 class IPGatewayListType(GeneratedsSuper):
@@ -249,10 +257,13 @@ class IPGatewayListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Gateway_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.IP_Gateway_Address.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Gateway_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.IP_Gateway_Address.append(obj_)
 # end class IPGatewayListType
 
 class NetworkInterfaceType(GeneratedsSuper):
@@ -361,38 +372,41 @@ class NetworkInterfaceType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Adapter':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Adapter(obj_)
-        elif nodeName_ == 'Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Description(obj_)
-        elif nodeName_ == 'DHCP_Lease_Expires':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_DHCP_Lease_Expires(obj_)
-        elif nodeName_ == 'DHCP_Lease_Obtained':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_DHCP_Lease_Obtained(obj_)
-        elif nodeName_ == 'DHCP_Server_List':
-            obj_ = DHCPServerListType.factory()
-            obj_.build(child_)
-            self.set_DHCP_Server_List(obj_)
-        elif nodeName_ == 'IP_Gateway_List':
-            obj_ = IPGatewayListType.factory()
-            obj_.build(child_)
-            self.set_IP_Gateway_List(obj_)
-        elif nodeName_ == 'IP_List':
-            obj_ = IPInfoListType.factory()
-            obj_.build(child_)
-            self.set_IP_List(obj_)
-        elif nodeName_ == 'MAC':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_MAC(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Adapter(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Adapter(obj_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Description(obj_)
+    def buildChild_DHCP_Lease_Expires(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_DHCP_Lease_Expires(obj_)
+    def buildChild_DHCP_Lease_Obtained(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_DHCP_Lease_Obtained(obj_)
+    def buildChild_DHCP_Server_List(self, child_, node, nodeName_):
+        obj_ = DHCPServerListType.factory()
+        obj_.build(child_)
+        self.set_DHCP_Server_List(obj_)
+    def buildChild_IP_Gateway_List(self, child_, node, nodeName_):
+        obj_ = IPGatewayListType.factory()
+        obj_.build(child_)
+        self.set_IP_Gateway_List(obj_)
+    def buildChild_IP_List(self, child_, node, nodeName_):
+        obj_ = IPInfoListType.factory()
+        obj_.build(child_)
+        self.set_IP_List(obj_)
+    def buildChild_MAC(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_MAC(obj_)
 # end class NetworkInterfaceType
 
 class IPInfoListType(GeneratedsSuper):
@@ -458,10 +472,13 @@ class IPInfoListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Info':
-            obj_ = IPInfoType.factory()
-            obj_.build(child_)
-            self.IP_Info.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Info(self, child_, node, nodeName_):
+        obj_ = IPInfoType.factory()
+        obj_.build(child_)
+        self.IP_Info.append(obj_)
 # end class IPInfoListType
 
 class IPInfoType(GeneratedsSuper):
@@ -528,14 +545,17 @@ class IPInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
-        elif nodeName_ == 'Subnet_Mask':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Subnet_Mask(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
+    def buildChild_Subnet_Mask(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Subnet_Mask(obj_)
 # end class IPInfoType
 
 class DHCPServerListType(GeneratedsSuper):
@@ -601,10 +621,13 @@ class DHCPServerListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'DHCP_Server_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.DHCP_Server_Address.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_DHCP_Server_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.DHCP_Server_Address.append(obj_)
 # end class DHCPServerListType
 
 class BitnessType(cybox_common.BaseObjectPropertyType):
@@ -856,31 +879,33 @@ class OSType(cybox_common.PlatformSpecificationType):
     def buildAttributes(self, node, attrs, already_processed):
         super(OSType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Bitness':
-            obj_ = BitnessType.factory()
-            obj_.build(child_)
-            self.set_Bitness(obj_)
-        elif nodeName_ == 'Build_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Build_Number(obj_)
-        elif nodeName_ == 'Environment_Variable_List':
-            obj_ = cybox_common.EnvironmentVariableListType.factory()
-            obj_.build(child_)
-            self.set_Environment_Variable_List(obj_)
-        elif nodeName_ == 'Install_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Install_Date(obj_)
-        elif nodeName_ == 'Patch_Level':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Patch_Level(obj_)
-        elif nodeName_ == 'Platform':
-            obj_ = cybox_common.PlatformSpecificationType.factory()
-            obj_.build(child_)
-            self.set_Platform(obj_)
-        super(OSType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Bitness(self, child_, node, nodeName_):
+        obj_ = BitnessType.factory()
+        obj_.build(child_)
+        self.set_Bitness(obj_)
+    def buildChild_Build_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Build_Number(obj_)
+    def buildChild_Environment_Variable_List(self, child_, node, nodeName_):
+        obj_ = cybox_common.EnvironmentVariableListType.factory()
+        obj_.build(child_)
+        self.set_Environment_Variable_List(obj_)
+    def buildChild_Install_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Install_Date(obj_)
+    def buildChild_Patch_Level(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Patch_Level(obj_)
+    def buildChild_Platform(self, child_, node, nodeName_):
+        obj_ = cybox_common.PlatformSpecificationType.factory()
+        obj_.build(child_)
+        self.set_Platform(obj_)
 # end class OSType
 
 class SystemObjectType(cybox_common.ObjectPropertiesType):
@@ -1046,67 +1071,69 @@ class SystemObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(SystemObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Available_Physical_Memory':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Available_Physical_Memory(obj_)
-        elif nodeName_ == 'BIOS_Info':
-            obj_ = BIOSInfoType.factory()
-            obj_.build(child_)
-            self.set_BIOS_Info(obj_)
-        elif nodeName_ == 'Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Date(obj_)
-        elif nodeName_ == 'Hostname':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hostname(obj_)
-        elif nodeName_ == 'Local_Time':
-            obj_ = cybox_common.TimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Local_Time(obj_)
-        elif nodeName_ == 'Network_Interface_List':
-            obj_ = NetworkInterfaceListType.factory()
-            obj_.build(child_)
-            self.set_Network_Interface_List(obj_)
-        elif nodeName_ == 'OS':
-            obj_ = OSType.factory()
-            obj_.build(child_)
-            self.set_OS(obj_)
-        elif nodeName_ == 'Processor':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Processor(obj_)
-        elif nodeName_ == 'Processor_Architecture':
-            obj_ = ProcessorArchType.factory()
-            obj_.build(child_)
-            self.set_Processor_Architecture(obj_)
-        elif nodeName_ == 'System_Time':
-            obj_ = cybox_common.TimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_System_Time(obj_)
-        elif nodeName_ == 'Timezone_DST':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Timezone_DST(obj_)
-        elif nodeName_ == 'Timezone_Standard':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Timezone_Standard(obj_)
-        elif nodeName_ == 'Total_Physical_Memory':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Total_Physical_Memory(obj_)
-        elif nodeName_ == 'Uptime':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Uptime(obj_)
-        elif nodeName_ == 'Username':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Username(obj_)
-        super(SystemObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Available_Physical_Memory(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Available_Physical_Memory(obj_)
+    def buildChild_BIOS_Info(self, child_, node, nodeName_):
+        obj_ = BIOSInfoType.factory()
+        obj_.build(child_)
+        self.set_BIOS_Info(obj_)
+    def buildChild_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Date(obj_)
+    def buildChild_Hostname(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hostname(obj_)
+    def buildChild_Local_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.TimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Local_Time(obj_)
+    def buildChild_Network_Interface_List(self, child_, node, nodeName_):
+        obj_ = NetworkInterfaceListType.factory()
+        obj_.build(child_)
+        self.set_Network_Interface_List(obj_)
+    def buildChild_OS(self, child_, node, nodeName_):
+        obj_ = OSType.factory()
+        obj_.build(child_)
+        self.set_OS(obj_)
+    def buildChild_Processor(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Processor(obj_)
+    def buildChild_Processor_Architecture(self, child_, node, nodeName_):
+        obj_ = ProcessorArchType.factory()
+        obj_.build(child_)
+        self.set_Processor_Architecture(obj_)
+    def buildChild_System_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.TimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_System_Time(obj_)
+    def buildChild_Timezone_DST(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Timezone_DST(obj_)
+    def buildChild_Timezone_Standard(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Timezone_Standard(obj_)
+    def buildChild_Total_Physical_Memory(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Total_Physical_Memory(obj_)
+    def buildChild_Uptime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Uptime(obj_)
+    def buildChild_Username(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Username(obj_)
 # end class SystemObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import file_object
 
@@ -400,19 +402,21 @@ class UnixFileObjectType(file_object.FileObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Group_Owner':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Group_Owner(obj_)
-        elif nodeName_ == 'INode':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_INode(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = UnixFileType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(UnixFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Group_Owner(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Group_Owner(obj_)
+    def buildChild_INode(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_INode(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = UnixFileType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class UnixFileObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import network_route_entry_object
 
@@ -102,27 +104,29 @@ class UnixNetworkRouteEntryObjectType(network_route_entry_object.NetworkRouteEnt
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixNetworkRouteEntryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Flags':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Flags(obj_)
-        elif nodeName_ == 'MSS':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_MSS(obj_)
-        elif nodeName_ == 'Ref':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Ref(obj_)
-        elif nodeName_ == 'Use':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Use(obj_)
-        elif nodeName_ == 'Window':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Window(obj_)
-        super(UnixNetworkRouteEntryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Flags(obj_)
+    def buildChild_MSS(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_MSS(obj_)
+    def buildChild_Ref(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Ref(obj_)
+    def buildChild_Use(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Use(obj_)
+    def buildChild_Window(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Window(obj_)
 # end class UnixNetworkRouteEntryObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import pipe_object
 
@@ -71,11 +73,13 @@ class UnixPipeObjectType(pipe_object.PipeObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixPipeObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Permission_Mode':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Permission_Mode(obj_)
-        super(UnixPipeObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Permission_Mode(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Permission_Mode(obj_)
 # end class UnixPipeObjectType
 
 GDSClassesMapping = {
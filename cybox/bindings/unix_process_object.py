@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import process_object
 
@@ -74,10 +76,13 @@ class FileDescriptorListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File_Descriptor':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.File_Descriptor.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File_Descriptor(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.File_Descriptor.append(obj_)
 # end class FileDescriptorListType
 
 class UnixProcessStateType(cybox_common.BaseObjectPropertyType):
@@ -229,15 +234,17 @@ class UnixProcessStatusType(process_object.ProcessStatusType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixProcessStatusType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Current_Status':
-            obj_ = UnixProcessStateType.factory()
-            obj_.build(child_)
-            self.set_Current_Status(obj_)
-        elif nodeName_ == 'Timestamp':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Timestamp(obj_)
-        super(UnixProcessStatusType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Current_Status(self, child_, node, nodeName_):
+        obj_ = UnixProcessStateType.factory()
+        obj_.build(child_)
+        self.set_Current_Status(obj_)
+    def buildChild_Timestamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Timestamp(obj_)
 # end class UnixProcessStatusType
 
 class UnixProcessObjectType(process_object.ProcessObjectType):
@@ -322,23 +329,25 @@ class UnixProcessObjectType(process_object.ProcessObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixProcessObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Open_File_Descriptor_List':
-            obj_ = FileDescriptorListType.factory()
-            obj_.build(child_)
-            self.set_Open_File_Descriptor_List(obj_)
-        elif nodeName_ == 'Priority':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Priority(obj_)
-        elif nodeName_ == 'RUID':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_RUID(obj_)
-        elif nodeName_ == 'Session_ID':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Session_ID(obj_)
-        super(UnixProcessObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Open_File_Descriptor_List(self, child_, node, nodeName_):
+        obj_ = FileDescriptorListType.factory()
+        obj_.build(child_)
+        self.set_Open_File_Descriptor_List(obj_)
+    def buildChild_Priority(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Priority(obj_)
+    def buildChild_RUID(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_RUID(obj_)
+    def buildChild_Session_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Session_ID(obj_)
 # end class UnixProcessObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import user_account_object
 
@@ -84,11 +86,13 @@ class UnixPrivilegeType(user_account_object.PrivilegeType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixPrivilegeType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Permissions_Mask':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Permissions_Mask(obj_)
-        super(UnixPrivilegeType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Permissions_Mask(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Permissions_Mask(obj_)
 # end class UnixPrivilegeType
 
 class UnixGroupType(user_account_object.GroupType):
@@ -164,11 +168,13 @@ class UnixGroupType(user_account_object.GroupType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixGroupType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Group_ID':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Group_ID(obj_)
-        super(UnixGroupType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Group_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Group_ID(obj_)
 # end class UnixGroupType
 
 class UnixUserAccountObjectType(user_account_object.UserAccountObjectType):
@@ -250,19 +256,21 @@ class UnixUserAccountObjectType(user_account_object.UserAccountObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(UnixUserAccountObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Group_ID':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Group_ID(obj_)
-        elif nodeName_ == 'User_ID':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_ID(obj_)
-        elif nodeName_ == 'Login_Shell':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Login_Shell(obj_)
-        super(UnixUserAccountObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Group_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Group_ID(obj_)
+    def buildChild_User_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_ID(obj_)
+    def buildChild_Login_Shell(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Login_Shell(obj_)
 # end class UnixUserAccountObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -82,11 +84,13 @@ class URIObjectType(cybox_common.ObjectPropertiesType):
             self.type_ = value
         super(URIObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Value':
-            obj_ = cybox_common.AnyURIObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Value(obj_)
-        super(URIObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.AnyURIObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Value(obj_)
 # end class URIObjectType
 
 GDSClassesMapping = {
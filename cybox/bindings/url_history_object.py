@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import hostname_object
 from . import uri_object
@@ -133,50 +135,53 @@ class URLHistoryEntryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'URL':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_URL(obj_)
-        elif nodeName_ == 'Hostname':
-            obj_ = hostname_object.HostnameObjectType.factory()
-            obj_.build(child_)
-            self.set_Hostname(obj_)
-        elif nodeName_ == 'Referrer_URL':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Referrer_URL(obj_)
-        elif nodeName_ == 'Page_Title':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Page_Title(obj_)
-        elif nodeName_ == 'User_Profile_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Profile_Name(obj_)
-        elif nodeName_ == 'Visit_Count':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Visit_Count(obj_)
-        elif nodeName_ == 'Manually_Entered_Count':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Manually_Entered_Count(obj_)
-        elif nodeName_ == 'Modification_DateTime':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Modification_DateTime(obj_)
-        elif nodeName_ == 'Expiration_DateTime':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Expiration_DateTime(obj_)
-        elif nodeName_ == 'First_Visit_DateTime':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_First_Visit_DateTime(obj_)
-        elif nodeName_ == 'Last_Visit_DateTime':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Visit_DateTime(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_URL(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_URL(obj_)
+    def buildChild_Hostname(self, child_, node, nodeName_):
+        obj_ = hostname_object.HostnameObjectType.factory()
+        obj_.build(child_)
+        self.set_Hostname(obj_)
+    def buildChild_Referrer_URL(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Referrer_URL(obj_)
+    def buildChild_Page_Title(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Page_Title(obj_)
+    def buildChild_User_Profile_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Profile_Name(obj_)
+    def buildChild_Visit_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Visit_Count(obj_)
+    def buildChild_Manually_Entered_Count(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Manually_Entered_Count(obj_)
+    def buildChild_Modification_DateTime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Modification_DateTime(obj_)
+    def buildChild_Expiration_DateTime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Expiration_DateTime(obj_)
+    def buildChild_First_Visit_DateTime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_First_Visit_DateTime(obj_)
+    def buildChild_Last_Visit_DateTime(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Visit_DateTime(obj_)
 # end class URLHistoryEntryType
 
 class URLHistoryObjectType(cybox_common.ObjectPropertiesType):
@@ -251,15 +256,17 @@ class URLHistoryObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(URLHistoryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Browser_Information':
-            obj_ = cybox_common.ToolInformationType.factory()
-            obj_.build(child_)
-            self.set_Browser_Information(obj_)
-        elif nodeName_ == 'URL_History_Entry':
-            obj_ = URLHistoryEntryType.factory()
-            obj_.build(child_)
-            self.URL_History_Entry.append(obj_)
-        super(URLHistoryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Browser_Information(self, child_, node, nodeName_):
+        obj_ = cybox_common.ToolInformationType.factory()
+        obj_.build(child_)
+        self.set_Browser_Information(obj_)
+    def buildChild_URL_History_Entry(self, child_, node, nodeName_):
+        obj_ = URLHistoryEntryType.factory()
+        obj_.build(child_)
+        self.URL_History_Entry.append(obj_)
 # end class URLHistoryObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import account_object
 
@@ -71,24 +73,27 @@ class PrivilegeListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Privilege':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Privilege(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Privilege> element')
-            self.Privilege.append(obj_)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Privilege> element')
+        self.Privilege.append(obj_)
 # end class PrivilegeListType
 
 class PrivilegeType(GeneratedsSuper):
@@ -209,24 +214,27 @@ class GroupListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Group':
-            type_name_ = child_.attrib.get(
-                '{http://www.w3.org/2001/XMLSchema-instance}type')
-            if type_name_ is None:
-                type_name_ = child_.attrib.get('type')
-            if type_name_ is not None:
-                type_names_ = type_name_.split(':')
-                if len(type_names_) == 1:
-                    type_name_ = type_names_[0]
-                else:
-                    type_name_ = type_names_[1]
-                class_ = globals()[type_name_]
-                obj_ = class_.factory()
-                obj_.build(child_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Group(self, child_, node, nodeName_):
+        type_name_ = child_.attrib.get(
+            '{http://www.w3.org/2001/XMLSchema-instance}type')
+        if type_name_ is None:
+            type_name_ = child_.attrib.get('type')
+        if type_name_ is not None:
+            type_names_ = type_name_.split(':')
+            if len(type_names_) == 1:
+                type_name_ = type_names_[0]
             else:
-                raise NotImplementedError(
-                    'Class not implemented for <Group> element')
-            self.Group.append(obj_)
+                type_name_ = type_names_[1]
+            class_ = globals()[type_name_]
+            obj_ = class_.factory()
+            obj_.build(child_)
+        else:
+            raise NotImplementedError(
+                'Class not implemented for <Group> element')
+        self.Group.append(obj_)
 # end class GroupListType
 
 class GroupType(GeneratedsSuper):
@@ -412,39 +420,41 @@ class UserAccountObjectType(account_object.AccountObjectType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(UserAccountObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Full_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Full_Name(obj_)
-        elif nodeName_ == 'Group_List':
-            obj_ = GroupListType.factory()
-            obj_.build(child_)
-            self.set_Group_List(obj_)
-        elif nodeName_ == 'Home_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Home_Directory(obj_)
-        elif nodeName_ == 'Last_Login':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Login(obj_)
-        elif nodeName_ == 'Privilege_List':
-            obj_ = PrivilegeListType.factory()
-            obj_.build(child_)
-            self.set_Privilege_List(obj_)
-        elif nodeName_ == 'Script_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Script_Path(obj_)
-        elif nodeName_ == 'Username':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Username(obj_)
-        elif nodeName_ == 'User_Password_Age':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Password_Age(obj_)
-        super(UserAccountObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Full_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Full_Name(obj_)
+    def buildChild_Group_List(self, child_, node, nodeName_):
+        obj_ = GroupListType.factory()
+        obj_.build(child_)
+        self.set_Group_List(obj_)
+    def buildChild_Home_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Home_Directory(obj_)
+    def buildChild_Last_Login(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Login(obj_)
+    def buildChild_Privilege_List(self, child_, node, nodeName_):
+        obj_ = PrivilegeListType.factory()
+        obj_.build(child_)
+        self.set_Privilege_List(obj_)
+    def buildChild_Script_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Script_Path(obj_)
+    def buildChild_Username(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Username(obj_)
+    def buildChild_User_Password_Age(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Password_Age(obj_)
 # end class UserAccountObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -128,10 +130,13 @@ class FileSystemFlagListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File_System_Flag':
-            obj_ = VolumeFileSystemFlagType.factory()
-            obj_.build(child_)
-            self.File_System_Flag.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File_System_Flag(self, child_, node, nodeName_):
+        obj_ = VolumeFileSystemFlagType.factory()
+        obj_.build(child_)
+        self.File_System_Flag.append(obj_)
 # end class FileSystemFlagListType
 
 class VolumeFileSystemFlagType(cybox_common.BaseObjectPropertyType):
@@ -354,47 +359,49 @@ class VolumeObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(VolumeObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Device_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Path(obj_)
-        elif nodeName_ == 'File_System_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_System_Type(obj_)
-        elif nodeName_ == 'Total_Allocation_Units':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Total_Allocation_Units(obj_)
-        elif nodeName_ == 'Sectors_Per_Allocation_Unit':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sectors_Per_Allocation_Unit(obj_)
-        elif nodeName_ == 'Bytes_Per_Sector':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Bytes_Per_Sector(obj_)
-        elif nodeName_ == 'Actual_Available_Allocation_Units':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Actual_Available_Allocation_Units(obj_)
-        elif nodeName_ == 'Creation_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Time(obj_)
-        elif nodeName_ == 'File_System_Flag_List':
-            obj_ = FileSystemFlagListType.factory()
-            obj_.build(child_)
-            self.set_File_System_Flag_List(obj_)
-        elif nodeName_ == 'Serial_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Serial_Number(obj_)
-        super(VolumeObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Device_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Path(obj_)
+    def buildChild_File_System_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_System_Type(obj_)
+    def buildChild_Total_Allocation_Units(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Total_Allocation_Units(obj_)
+    def buildChild_Sectors_Per_Allocation_Unit(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sectors_Per_Allocation_Unit(obj_)
+    def buildChild_Bytes_Per_Sector(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Bytes_Per_Sector(obj_)
+    def buildChild_Actual_Available_Allocation_Units(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Actual_Available_Allocation_Units(obj_)
+    def buildChild_Creation_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Time(obj_)
+    def buildChild_File_System_Flag_List(self, child_, node, nodeName_):
+        obj_ = FileSystemFlagListType.factory()
+        obj_.build(child_)
+        self.set_File_System_Flag_List(obj_)
+    def buildChild_Serial_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Serial_Number(obj_)
 # end class VolumeObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import uri_object
@@ -116,42 +118,45 @@ class WhoisRegistrarInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Registrar_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Registrar_ID(obj_)
-        elif nodeName_ == 'Registrar_GUID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Registrar_GUID(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Address':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address(obj_)
-        elif nodeName_ == 'Email_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Email_Address(obj_)
-        elif nodeName_ == 'Phone_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Phone_Number(obj_)
-        elif nodeName_ == 'Whois_Server':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Whois_Server(obj_)
-        elif nodeName_ == 'Referral_URL':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Referral_URL(obj_)
-        elif nodeName_ == 'Contacts':
-            obj_ = WhoisContactsType.factory()
-            obj_.build(child_)
-            self.set_Contacts(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Registrar_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Registrar_ID(obj_)
+    def buildChild_Registrar_GUID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Registrar_GUID(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address(obj_)
+    def buildChild_Email_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Email_Address(obj_)
+    def buildChild_Phone_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Phone_Number(obj_)
+    def buildChild_Whois_Server(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Whois_Server(obj_)
+    def buildChild_Referral_URL(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Referral_URL(obj_)
+    def buildChild_Contacts(self, child_, node, nodeName_):
+        obj_ = WhoisContactsType.factory()
+        obj_.build(child_)
+        self.set_Contacts(obj_)
 # end class WhoisRegistrarInfoType
 
 class WhoisContactsType(GeneratedsSuper):
@@ -217,10 +222,13 @@ class WhoisContactsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Contact':
-            obj_ = WhoisContactType.factory()
-            obj_.build(child_)
-            self.add_Contact(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Contact(self, child_, node, nodeName_):
+        obj_ = WhoisContactType.factory()
+        obj_.build(child_)
+        self.add_Contact(obj_)
 # end class WhoisContactsType
 
 class WhoisContactType(GeneratedsSuper):
@@ -339,34 +347,37 @@ class WhoisContactType(GeneratedsSuper):
 
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Contact_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Contact_ID(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Email_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_Email_Address(obj_)
-        elif nodeName_ == 'Phone_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Phone_Number(obj_)
-        elif nodeName_ == 'Fax_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Fax_Number(obj_)
-        elif nodeName_ == 'Address':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address(obj_)
-        elif nodeName_ == 'Organization':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Organization(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Contact_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Contact_ID(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Email_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_Email_Address(obj_)
+    def buildChild_Phone_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Phone_Number(obj_)
+    def buildChild_Fax_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Fax_Number(obj_)
+    def buildChild_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address(obj_)
+    def buildChild_Organization(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Organization(obj_)
 # end class WhoisContactType
 
 class WhoisStatusesType(GeneratedsSuper):
@@ -434,10 +445,13 @@ class WhoisStatusesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Status':
-            obj_ = WhoisStatusType.factory()
-            obj_.build(child_)
-            self.Status.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Status(self, child_, node, nodeName_):
+        obj_ = WhoisStatusType.factory()
+        obj_.build(child_)
+        self.Status.append(obj_)
 # end class WhoisStatusesType
 
 class WhoisNameserversType(GeneratedsSuper):
@@ -503,10 +517,13 @@ class WhoisNameserversType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Nameserver':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.Nameserver.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Nameserver(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.Nameserver.append(obj_)
 # end class WhoisNameserversType
 
 class WhoisRegistrantInfoType(WhoisContactType):
@@ -571,11 +588,13 @@ class WhoisRegistrantInfoType(WhoisContactType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WhoisRegistrantInfoType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Registrant_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Registrant_ID(obj_)
-        super(WhoisRegistrantInfoType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Registrant_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Registrant_ID(obj_)
 # end class WhoisRegistrantInfoType
 
 class WhoisRegistrantsType(GeneratedsSuper):
@@ -641,10 +660,13 @@ class WhoisRegistrantsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Registrant':
-            obj_ = WhoisRegistrantInfoType.factory()
-            obj_.build(child_)
-            self.Registrant.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Registrant(self, child_, node, nodeName_):
+        obj_ = WhoisRegistrantInfoType.factory()
+        obj_.build(child_)
+        self.Registrant.append(obj_)
 # end class WhoisRegistrantsType
 
 class RegionalRegistryType(cybox_common.BaseObjectPropertyType):
@@ -941,75 +963,77 @@ class WhoisObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WhoisObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Lookup_Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Lookup_Date(obj_)
-        elif nodeName_ == 'Domain_Name':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Domain_Name(obj_)
-        elif nodeName_ == 'Domain_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Domain_ID(obj_)
-        elif nodeName_ == 'Server_Name':
-            obj_ = uri_object.URIObjectType.factory()
-            obj_.build(child_)
-            self.set_Server_Name(obj_)
-        elif nodeName_ == 'IP_Address':
-            obj_ = address_object.AddressObjectType.factory()
-            obj_.build(child_)
-            self.set_IP_Address(obj_)
-        elif nodeName_ == 'DNSSEC':
-            DNSSEC = child_.text
-            DNSSEC = self.gds_validate_string(DNSSEC, node, 'DNSSEC')
-            self.DNSSEC = DNSSEC
-        elif nodeName_ == 'Nameservers':
-            obj_ = WhoisNameserversType.factory()
-            obj_.build(child_)
-            self.set_Nameservers(obj_)
-        elif nodeName_ == 'Status':
-            obj_ = WhoisStatusesType.factory()
-            obj_.build(child_)
-            self.set_Status(obj_)
-        elif nodeName_ == 'Updated_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Updated_Date(obj_)
-        elif nodeName_ == 'Creation_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Date(obj_)
-        elif nodeName_ == 'Expiration_Date':
-            obj_ = cybox_common.DateObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Expiration_Date(obj_)
-        elif nodeName_ == 'Regional_Internet_Registry':
-            obj_ = RegionalRegistryType.factory()
-            obj_.build(child_)
-            self.set_Regional_Internet_Registry(obj_)
-        elif nodeName_ == 'Sponsoring_Registrar':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sponsoring_Registrar(obj_)
-        elif nodeName_ == 'Registrar_Info':
-            obj_ = WhoisRegistrarInfoType.factory()
-            obj_.build(child_)
-            self.set_Registrar_Info(obj_)
-        elif nodeName_ == 'Registrants':
-            obj_ = WhoisRegistrantsType.factory()
-            obj_.build(child_)
-            self.set_Registrants(obj_)
-        elif nodeName_ == 'Contact_Info':
-            obj_ = WhoisContactType.factory()
-            obj_.build(child_)
-            self.set_Contact_Info(obj_)
-        elif nodeName_ == 'Remarks':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Remarks(obj_)
-        super(WhoisObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Lookup_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Lookup_Date(obj_)
+    def buildChild_Domain_Name(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Domain_Name(obj_)
+    def buildChild_Domain_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Domain_ID(obj_)
+    def buildChild_Server_Name(self, child_, node, nodeName_):
+        obj_ = uri_object.URIObjectType.factory()
+        obj_.build(child_)
+        self.set_Server_Name(obj_)
+    def buildChild_IP_Address(self, child_, node, nodeName_):
+        obj_ = address_object.AddressObjectType.factory()
+        obj_.build(child_)
+        self.set_IP_Address(obj_)
+    def buildChild_DNSSEC(self, child_, node, nodeName_):
+        DNSSEC = child_.text
+        DNSSEC = self.gds_validate_string(DNSSEC, node, 'DNSSEC')
+        self.DNSSEC = DNSSEC
+    def buildChild_Nameservers(self, child_, node, nodeName_):
+        obj_ = WhoisNameserversType.factory()
+        obj_.build(child_)
+        self.set_Nameservers(obj_)
+    def buildChild_Status(self, child_, node, nodeName_):
+        obj_ = WhoisStatusesType.factory()
+        obj_.build(child_)
+        self.set_Status(obj_)
+    def buildChild_Updated_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Updated_Date(obj_)
+    def buildChild_Creation_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Date(obj_)
+    def buildChild_Expiration_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Expiration_Date(obj_)
+    def buildChild_Regional_Internet_Registry(self, child_, node, nodeName_):
+        obj_ = RegionalRegistryType.factory()
+        obj_.build(child_)
+        self.set_Regional_Internet_Registry(obj_)
+    def buildChild_Sponsoring_Registrar(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sponsoring_Registrar(obj_)
+    def buildChild_Registrar_Info(self, child_, node, nodeName_):
+        obj_ = WhoisRegistrarInfoType.factory()
+        obj_.build(child_)
+        self.set_Registrar_Info(obj_)
+    def buildChild_Registrants(self, child_, node, nodeName_):
+        obj_ = WhoisRegistrantsType.factory()
+        obj_.build(child_)
+        self.set_Registrants(obj_)
+    def buildChild_Contact_Info(self, child_, node, nodeName_):
+        obj_ = WhoisContactType.factory()
+        obj_.build(child_)
+        self.set_Contact_Info(obj_)
+    def buildChild_Remarks(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Remarks(obj_)
 # end class WhoisObjectType
 
 GDSClassesMapping = {
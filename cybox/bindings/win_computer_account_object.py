@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import account_object
 from . import port_object
@@ -76,14 +78,17 @@ class FullyQualifiedNameType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'NetBEUI_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_NetBEUI_Name(obj_)
-        elif nodeName_ == 'Full_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Full_Name(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_NetBEUI_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_NetBEUI_Name(obj_)
+    def buildChild_Full_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Full_Name(obj_)
 # end class FullyQualifiedNameType
 
 class KerberosType(GeneratedsSuper):
@@ -153,14 +158,17 @@ class KerberosType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Delegation':
-            obj_ = KerberosDelegationType.factory()
-            obj_.build(child_)
-            self.set_Delegation(obj_)
-        elif nodeName_ == 'Ticket':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Ticket(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Delegation(self, child_, node, nodeName_):
+        obj_ = KerberosDelegationType.factory()
+        obj_.build(child_)
+        self.set_Delegation(obj_)
+    def buildChild_Ticket(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Ticket(obj_)
 # end class KerberosType
 
 class KerberosDelegationType(GeneratedsSuper):
@@ -230,14 +238,17 @@ class KerberosDelegationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Bitmask':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Bitmask(obj_)
-        elif nodeName_ == 'Service':
-            obj_ = KerberosServiceType.factory()
-            obj_.build(child_)
-            self.set_Service(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Bitmask(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Bitmask(obj_)
+    def buildChild_Service(self, child_, node, nodeName_):
+        obj_ = KerberosServiceType.factory()
+        obj_.build(child_)
+        self.set_Service(obj_)
 # end class KerberosDelegationType
 
 class KerberosServiceType(GeneratedsSuper):
@@ -319,22 +330,25 @@ class KerberosServiceType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Computer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Computer(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Port':
-            obj_ = port_object.PortObjectType.factory()
-            obj_.build(child_)
-            self.set_Port(obj_)
-        elif nodeName_ == 'User':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Computer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Computer(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Port(self, child_, node, nodeName_):
+        obj_ = port_object.PortObjectType.factory()
+        obj_.build(child_)
+        self.set_Port(obj_)
+    def buildChild_User(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User(obj_)
 # end class KerberosServiceType
 
 class WindowsComputerAccountObjectType(account_object.AccountObjectType):
@@ -428,27 +442,29 @@ class WindowsComputerAccountObjectType(account_object.AccountObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsComputerAccountObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Fully_Qualified_Name':
-            obj_ = FullyQualifiedNameType.factory()
-            obj_.build(child_)
-            self.set_Fully_Qualified_Name(obj_)
-        elif nodeName_ == 'Kerberos':
-            obj_ = KerberosType.factory()
-            obj_.build(child_)
-            self.set_Kerberos(obj_)
-        elif nodeName_ == 'Security_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_ID(obj_)
-        elif nodeName_ == 'Security_Type':
-            obj_ = cybox_common.SIDType.factory()
-            obj_.build(child_)
-            self.set_Security_Type(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(WindowsComputerAccountObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Fully_Qualified_Name(self, child_, node, nodeName_):
+        obj_ = FullyQualifiedNameType.factory()
+        obj_.build(child_)
+        self.set_Fully_Qualified_Name(obj_)
+    def buildChild_Kerberos(self, child_, node, nodeName_):
+        obj_ = KerberosType.factory()
+        obj_.build(child_)
+        self.set_Kerberos(obj_)
+    def buildChild_Security_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_ID(obj_)
+    def buildChild_Security_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.SIDType.factory()
+        obj_.build(child_)
+        self.set_Security_Type(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class WindowsComputerAccountObjectType
 
 GDSClassesMapping = {
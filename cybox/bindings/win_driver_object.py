@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_executable_file_object
 
@@ -117,38 +119,41 @@ class DeviceObjectStructType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Attached_Device_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_Device_Name(obj_)
-        elif nodeName_ == 'Attached_Device_Object':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_Device_Object(obj_)
-        elif nodeName_ == 'Attached_To_Device_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_To_Device_Name(obj_)
-        elif nodeName_ == 'Attached_To_Device_Object':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_To_Device_Object(obj_)
-        elif nodeName_ == 'Attached_To_Driver_Object':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_To_Driver_Object(obj_)
-        elif nodeName_ == 'Attached_To_Driver_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Attached_To_Driver_Name(obj_)
-        elif nodeName_ == 'Device_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Name(obj_)
-        elif nodeName_ == 'Device_Object':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Device_Object(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Attached_Device_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_Device_Name(obj_)
+    def buildChild_Attached_Device_Object(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_Device_Object(obj_)
+    def buildChild_Attached_To_Device_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_To_Device_Name(obj_)
+    def buildChild_Attached_To_Device_Object(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_To_Device_Object(obj_)
+    def buildChild_Attached_To_Driver_Object(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_To_Driver_Object(obj_)
+    def buildChild_Attached_To_Driver_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Attached_To_Driver_Name(obj_)
+    def buildChild_Device_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Name(obj_)
+    def buildChild_Device_Object(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Device_Object(obj_)
 # end class DeviceObjectStructType
 
 class DeviceObjectListType(GeneratedsSuper):
@@ -213,10 +218,13 @@ class DeviceObjectListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Device_Object_Struct':
-            obj_ = DeviceObjectStructType.factory()
-            obj_.build(child_)
-            self.Device_Object_Struct.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Device_Object_Struct(self, child_, node, nodeName_):
+        obj_ = DeviceObjectStructType.factory()
+        obj_.build(child_)
+        self.Device_Object_Struct.append(obj_)
 # end class DeviceObjectListType
 
 class WindowsDriverObjectType(win_executable_file_object.WindowsExecutableFileObjectType):
@@ -499,151 +507,153 @@ class WindowsDriverObjectType(win_executable_file_object.WindowsExecutableFileOb
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsDriverObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Device_Object_List':
-            obj_ = DeviceObjectListType.factory()
-            obj_.build(child_)
-            self.set_Device_Object_List(obj_)
-        elif nodeName_ == 'Driver_Init':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Driver_Init(obj_)
-        elif nodeName_ == 'Driver_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Driver_Name(obj_)
-        elif nodeName_ == 'Driver_Object_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Driver_Object_Address(obj_)
-        elif nodeName_ == 'Driver_Start_IO':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Driver_Start_IO(obj_)
-        elif nodeName_ == 'Driver_Unload':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Driver_Unload(obj_)
-        elif nodeName_ == 'Image_Base':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Base(obj_)
-        elif nodeName_ == 'Image_Size':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Size(obj_)
-        elif nodeName_ == 'IRP_MJ_CLEANUP':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_CLEANUP(obj_)
-        elif nodeName_ == 'IRP_MJ_CLOSE':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_CLOSE(obj_)
-        elif nodeName_ == 'IRP_MJ_CREATE':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_CREATE(obj_)
-        elif nodeName_ == 'IRP_MJ_CREATE_MAILSLOT':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_CREATE_MAILSLOT(obj_)
-        elif nodeName_ == 'IRP_MJ_CREATE_NAMED_PIPE':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_CREATE_NAMED_PIPE(obj_)
-        elif nodeName_ == 'IRP_MJ_DEVICE_CHANGE':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_DEVICE_CHANGE(obj_)
-        elif nodeName_ == 'IRP_MJ_DEVICE_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_DEVICE_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_DIRECTORY_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_DIRECTORY_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_FILE_SYSTEM_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_FILE_SYSTEM_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_FLUSH_BUFFERS':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_FLUSH_BUFFERS(obj_)
-        elif nodeName_ == 'IRP_MJ_INTERNAL_DEVICE_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_INTERNAL_DEVICE_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_LOCK_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_LOCK_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_PNP':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_PNP(obj_)
-        elif nodeName_ == 'IRP_MJ_POWER':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_POWER(obj_)
-        elif nodeName_ == 'IRP_MJ_READ':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_READ(obj_)
-        elif nodeName_ == 'IRP_MJ_QUERY_EA':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_QUERY_EA(obj_)
-        elif nodeName_ == 'IRP_MJ_QUERY_INFORMATION':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_QUERY_INFORMATION(obj_)
-        elif nodeName_ == 'IRP_MJ_QUERY_SECURITY':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_QUERY_SECURITY(obj_)
-        elif nodeName_ == 'IRP_MJ_QUERY_QUOTA':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_QUERY_QUOTA(obj_)
-        elif nodeName_ == 'IRP_MJ_QUERY_VOLUME_INFORMATION':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_QUERY_VOLUME_INFORMATION(obj_)
-        elif nodeName_ == 'IRP_MJ_SET_EA':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SET_EA(obj_)
-        elif nodeName_ == 'IRP_MJ_SET_INFORMATION':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SET_INFORMATION(obj_)
-        elif nodeName_ == 'IRP_MJ_SET_SECURITY':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SET_SECURITY(obj_)
-        elif nodeName_ == 'IRP_MJ_SET_QUOTA':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SET_QUOTA(obj_)
-        elif nodeName_ == 'IRP_MJ_SET_VOLUME_INFORMATION':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SET_VOLUME_INFORMATION(obj_)
-        elif nodeName_ == 'IRP_MJ_SHUTDOWN':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SHUTDOWN(obj_)
-        elif nodeName_ == 'IRP_MJ_SYSTEM_CONTROL':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_SYSTEM_CONTROL(obj_)
-        elif nodeName_ == 'IRP_MJ_WRITE':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_IRP_MJ_WRITE(obj_)
-        super(WindowsDriverObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Device_Object_List(self, child_, node, nodeName_):
+        obj_ = DeviceObjectListType.factory()
+        obj_.build(child_)
+        self.set_Device_Object_List(obj_)
+    def buildChild_Driver_Init(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Driver_Init(obj_)
+    def buildChild_Driver_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Driver_Name(obj_)
+    def buildChild_Driver_Object_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Driver_Object_Address(obj_)
+    def buildChild_Driver_Start_IO(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Driver_Start_IO(obj_)
+    def buildChild_Driver_Unload(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Driver_Unload(obj_)
+    def buildChild_Image_Base(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Base(obj_)
+    def buildChild_Image_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Size(obj_)
+    def buildChild_IRP_MJ_CLEANUP(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_CLEANUP(obj_)
+    def buildChild_IRP_MJ_CLOSE(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_CLOSE(obj_)
+    def buildChild_IRP_MJ_CREATE(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_CREATE(obj_)
+    def buildChild_IRP_MJ_CREATE_MAILSLOT(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_CREATE_MAILSLOT(obj_)
+    def buildChild_IRP_MJ_CREATE_NAMED_PIPE(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_CREATE_NAMED_PIPE(obj_)
+    def buildChild_IRP_MJ_DEVICE_CHANGE(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_DEVICE_CHANGE(obj_)
+    def buildChild_IRP_MJ_DEVICE_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_DEVICE_CONTROL(obj_)
+    def buildChild_IRP_MJ_DIRECTORY_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_DIRECTORY_CONTROL(obj_)
+    def buildChild_IRP_MJ_FILE_SYSTEM_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_FILE_SYSTEM_CONTROL(obj_)
+    def buildChild_IRP_MJ_FLUSH_BUFFERS(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_FLUSH_BUFFERS(obj_)
+    def buildChild_IRP_MJ_INTERNAL_DEVICE_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_INTERNAL_DEVICE_CONTROL(obj_)
+    def buildChild_IRP_MJ_LOCK_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_LOCK_CONTROL(obj_)
+    def buildChild_IRP_MJ_PNP(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_PNP(obj_)
+    def buildChild_IRP_MJ_POWER(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_POWER(obj_)
+    def buildChild_IRP_MJ_READ(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_READ(obj_)
+    def buildChild_IRP_MJ_QUERY_EA(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_QUERY_EA(obj_)
+    def buildChild_IRP_MJ_QUERY_INFORMATION(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_QUERY_INFORMATION(obj_)
+    def buildChild_IRP_MJ_QUERY_SECURITY(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_QUERY_SECURITY(obj_)
+    def buildChild_IRP_MJ_QUERY_QUOTA(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_QUERY_QUOTA(obj_)
+    def buildChild_IRP_MJ_QUERY_VOLUME_INFORMATION(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_QUERY_VOLUME_INFORMATION(obj_)
+    def buildChild_IRP_MJ_SET_EA(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SET_EA(obj_)
+    def buildChild_IRP_MJ_SET_INFORMATION(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SET_INFORMATION(obj_)
+    def buildChild_IRP_MJ_SET_SECURITY(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SET_SECURITY(obj_)
+    def buildChild_IRP_MJ_SET_QUOTA(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SET_QUOTA(obj_)
+    def buildChild_IRP_MJ_SET_VOLUME_INFORMATION(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SET_VOLUME_INFORMATION(obj_)
+    def buildChild_IRP_MJ_SHUTDOWN(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SHUTDOWN(obj_)
+    def buildChild_IRP_MJ_SYSTEM_CONTROL(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_SYSTEM_CONTROL(obj_)
+    def buildChild_IRP_MJ_WRITE(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_IRP_MJ_WRITE(obj_)
 # end class WindowsDriverObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -73,10 +75,13 @@ class UnformattedMessageListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Unformatted_Message':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Unformatted_Message.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Unformatted_Message(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Unformatted_Message.append(obj_)
 # end class UnformattedMessageListType
 
 class WindowsEventLogObjectType(cybox_common.ObjectPropertiesType):
@@ -260,83 +265,85 @@ class WindowsEventLogObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsEventLogObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'EID':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_EID(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Log':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Log(obj_)
-        elif nodeName_ == 'Message':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Message(obj_)
-        elif nodeName_ == 'Category_Num':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Category_Num(obj_)
-        elif nodeName_ == 'Category':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Category(obj_)
-        elif nodeName_ == 'Generation_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Generation_Time(obj_)
-        elif nodeName_ == 'Source':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Source(obj_)
-        elif nodeName_ == 'Machine':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Machine(obj_)
-        elif nodeName_ == 'User':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User(obj_)
-        elif nodeName_ == 'Blob':
-            obj_ = cybox_common.Base64BinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Blob(obj_)
-        elif nodeName_ == 'Correlation_Activity_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Correlation_Activity_ID(obj_)
-        elif nodeName_ == 'Correlation_Related_Activity_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Correlation_Related_Activity_ID(obj_)
-        elif nodeName_ == 'Execution_Process_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Execution_Process_ID(obj_)
-        elif nodeName_ == 'Execution_Thread_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Execution_Thread_ID(obj_)
-        elif nodeName_ == 'Index':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Index(obj_)
-        elif nodeName_ == 'Reserved':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Reserved(obj_)
-        elif nodeName_ == 'Unformatted_Message_List':
-            obj_ = UnformattedMessageListType.factory()
-            obj_.build(child_)
-            self.set_Unformatted_Message_List(obj_)
-        elif nodeName_ == 'Write_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Write_Time(obj_)
-        super(WindowsEventLogObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_EID(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_EID(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Log(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Log(obj_)
+    def buildChild_Message(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Message(obj_)
+    def buildChild_Category_Num(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Category_Num(obj_)
+    def buildChild_Category(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Category(obj_)
+    def buildChild_Generation_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Generation_Time(obj_)
+    def buildChild_Source(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Source(obj_)
+    def buildChild_Machine(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Machine(obj_)
+    def buildChild_User(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User(obj_)
+    def buildChild_Blob(self, child_, node, nodeName_):
+        obj_ = cybox_common.Base64BinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Blob(obj_)
+    def buildChild_Correlation_Activity_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Correlation_Activity_ID(obj_)
+    def buildChild_Correlation_Related_Activity_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Correlation_Related_Activity_ID(obj_)
+    def buildChild_Execution_Process_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Execution_Process_ID(obj_)
+    def buildChild_Execution_Thread_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Execution_Thread_ID(obj_)
+    def buildChild_Index(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Index(obj_)
+    def buildChild_Reserved(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Reserved(obj_)
+    def buildChild_Unformatted_Message_List(self, child_, node, nodeName_):
+        obj_ = UnformattedMessageListType.factory()
+        obj_.build(child_)
+        self.set_Unformatted_Message_List(obj_)
+    def buildChild_Write_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Write_Time(obj_)
 # end class WindowsEventLogObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_handle_object
 
@@ -161,19 +163,21 @@ class WindowsEventObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsEventObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Handle':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_Handle(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = WinEventType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(WindowsEventObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Handle(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_Handle(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = WinEventType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class WindowsEventObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_file_object
 
@@ -81,18 +83,21 @@ class PEChecksumType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'PE_Computed_API':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_PE_Computed_API(obj_)
-        elif nodeName_ == 'PE_File_API':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_PE_File_API(obj_)
-        elif nodeName_ == 'PE_File_Raw':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_PE_File_Raw(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_PE_Computed_API(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_PE_Computed_API(obj_)
+    def buildChild_PE_File_API(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_PE_File_API(obj_)
+    def buildChild_PE_File_Raw(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_PE_File_Raw(obj_)
 # end class PEChecksumType
 
 class PEExportsType(GeneratedsSuper):
@@ -192,30 +197,33 @@ class PEExportsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Exported_Functions':
-            obj_ = PEExportedFunctionsType.factory()
-            obj_.build(child_)
-            self.set_Exported_Functions(obj_)
-        elif nodeName_ == 'Number_Of_Functions':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Functions(obj_)
-        elif nodeName_ == 'Exports_Time_Stamp':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exports_Time_Stamp(obj_)
-        elif nodeName_ == 'Number_Of_Addresses':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Addresses(obj_)
-        elif nodeName_ == 'Number_Of_Names':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Names(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Exported_Functions(self, child_, node, nodeName_):
+        obj_ = PEExportedFunctionsType.factory()
+        obj_.build(child_)
+        self.set_Exported_Functions(obj_)
+    def buildChild_Number_Of_Functions(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Functions(obj_)
+    def buildChild_Exports_Time_Stamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exports_Time_Stamp(obj_)
+    def buildChild_Number_Of_Addresses(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Addresses(obj_)
+    def buildChild_Number_Of_Names(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Names(obj_)
 # end class PEExportsType
 
 class PEExportedFunctionsType(GeneratedsSuper):
@@ -280,10 +288,13 @@ class PEExportedFunctionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Exported_Function':
-            obj_ = PEExportedFunctionType.factory()
-            obj_.build(child_)
-            self.Exported_Function.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Exported_Function(self, child_, node, nodeName_):
+        obj_ = PEExportedFunctionType.factory()
+        obj_.build(child_)
+        self.Exported_Function.append(obj_)
 # end class PEExportedFunctionsType
 
 class PESectionListType(GeneratedsSuper):
@@ -348,10 +359,13 @@ class PESectionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Section':
-            obj_ = PESectionType.factory()
-            obj_.build(child_)
-            self.Section.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Section(self, child_, node, nodeName_):
+        obj_ = PESectionType.factory()
+        obj_.build(child_)
+        self.Section.append(obj_)
 # end class PESectionListType
 
 class EntropyType(GeneratedsSuper):
@@ -426,18 +440,21 @@ class EntropyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Value':
-            obj_ = cybox_common.FloatObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Value(obj_)
-        elif nodeName_ == 'Min':
-            obj_ = cybox_common.FloatObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Min(obj_)
-        elif nodeName_ == 'Max':
-            obj_ = cybox_common.FloatObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Max(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.FloatObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Value(obj_)
+    def buildChild_Min(self, child_, node, nodeName_):
+        obj_ = cybox_common.FloatObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Min(obj_)
+    def buildChild_Max(self, child_, node, nodeName_):
+        obj_ = cybox_common.FloatObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Max(obj_)
 # end class EntropyType
 
 class PEImportType(GeneratedsSuper):
@@ -551,18 +568,21 @@ class PEImportType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Name(obj_)
-        elif nodeName_ == 'Imported_Functions':
-            obj_ = PEImportedFunctionsType.factory()
-            obj_.build(child_)
-            self.set_Imported_Functions(obj_)
-        elif nodeName_ == 'Virtual_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Address(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Name(obj_)
+    def buildChild_Imported_Functions(self, child_, node, nodeName_):
+        obj_ = PEImportedFunctionsType.factory()
+        obj_.build(child_)
+        self.set_Imported_Functions(obj_)
+    def buildChild_Virtual_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Address(obj_)
 # end class PEImportType
 
 class PEImportedFunctionsType(GeneratedsSuper):
@@ -627,10 +647,13 @@ class PEImportedFunctionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Imported_Function':
-            obj_ = PEImportedFunctionType.factory()
-            obj_.build(child_)
-            self.Imported_Function.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Imported_Function(self, child_, node, nodeName_):
+        obj_ = PEImportedFunctionType.factory()
+        obj_.build(child_)
+        self.Imported_Function.append(obj_)
 # end class PEImportedFunctionsType
 
 class PEResourceContentType(cybox_common.BaseObjectPropertyType):
@@ -822,38 +845,41 @@ class PEResourceType(GeneratedsSuper):
 
             self.extensiontype_ = value
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = PEResourceContentType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Size':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size(obj_)
-        elif nodeName_ == 'Virtual_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Address(obj_)
-        elif nodeName_ == 'Language':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Language(obj_)
-        elif nodeName_ == 'Sub_Language':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Sub_Language(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = PEResourceContentType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size(obj_)
+    def buildChild_Virtual_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Address(obj_)
+    def buildChild_Language(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Language(obj_)
+    def buildChild_Sub_Language(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Sub_Language(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
 # end class PEResourceType
 
 class PEVersionInfoResourceType(PEResourceType):
@@ -994,59 +1020,61 @@ class PEVersionInfoResourceType(PEResourceType):
     def buildAttributes(self, node, attrs, already_processed):
         super(PEVersionInfoResourceType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Comments':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Comments(obj_)
-        elif nodeName_ == 'CompanyName':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_CompanyName(obj_)
-        elif nodeName_ == 'FileDescription':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_FileDescription(obj_)
-        elif nodeName_ == 'FileVersion':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_FileVersion(obj_)
-        elif nodeName_ == 'InternalName':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_InternalName(obj_)
-        elif nodeName_ == 'LangID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_LangID(obj_)
-        elif nodeName_ == 'LegalCopyright':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_LegalCopyright(obj_)
-        elif nodeName_ == 'LegalTrademarks':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_LegalTrademarks(obj_)
-        elif nodeName_ == 'OriginalFilename':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_OriginalFilename(obj_)
-        elif nodeName_ == 'PrivateBuild':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_PrivateBuild(obj_)
-        elif nodeName_ == 'ProductName':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ProductName(obj_)
-        elif nodeName_ == 'ProductVersion':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ProductVersion(obj_)
-        elif nodeName_ == 'SpecialBuild':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_SpecialBuild(obj_)
-        super(PEVersionInfoResourceType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Comments(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Comments(obj_)
+    def buildChild_CompanyName(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_CompanyName(obj_)
+    def buildChild_FileDescription(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_FileDescription(obj_)
+    def buildChild_FileVersion(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_FileVersion(obj_)
+    def buildChild_InternalName(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_InternalName(obj_)
+    def buildChild_LangID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_LangID(obj_)
+    def buildChild_LegalCopyright(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_LegalCopyright(obj_)
+    def buildChild_LegalTrademarks(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_LegalTrademarks(obj_)
+    def buildChild_OriginalFilename(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_OriginalFilename(obj_)
+    def buildChild_PrivateBuild(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_PrivateBuild(obj_)
+    def buildChild_ProductName(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ProductName(obj_)
+    def buildChild_ProductVersion(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ProductVersion(obj_)
+    def buildChild_SpecialBuild(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_SpecialBuild(obj_)
 # end class PEVersionInfoResourceType
 
 class PEExportedFunctionType(GeneratedsSuper):
@@ -1127,18 +1155,21 @@ class PEExportedFunctionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Function_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Function_Name(obj_)
-        elif nodeName_ == 'Entry_Point':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Entry_Point(obj_)
-        elif nodeName_ == 'Ordinal':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Ordinal(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Function_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Function_Name(obj_)
+    def buildChild_Entry_Point(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Entry_Point(obj_)
+    def buildChild_Ordinal(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Ordinal(obj_)
 # end class PEExportedFunctionType
 
 class PEResourceListType(GeneratedsSuper):
@@ -1207,14 +1238,17 @@ class PEResourceListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Resource':
-            obj_ = PEResourceType.factory()
-            obj_.build(child_)
-            self.add_Resource(obj_)
-        elif nodeName_ == 'VersionInfoResource':
-            obj_ = PEVersionInfoResourceType.factory()
-            obj_.build(child_)
-            self.add_Resource(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Resource(self, child_, node, nodeName_):
+        obj_ = PEResourceType.factory()
+        obj_.build(child_)
+        self.add_Resource(obj_)
+    def buildChild_VersionInfoResource(self, child_, node, nodeName_):
+        obj_ = PEVersionInfoResourceType.factory()
+        obj_.build(child_)
+        self.add_Resource(obj_)
 # end class PEResourceListType
 
 class PEImportedFunctionType(GeneratedsSuper):
@@ -1308,26 +1342,29 @@ class PEImportedFunctionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Function_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Function_Name(obj_)
-        elif nodeName_ == 'Hint':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hint(obj_)
-        elif nodeName_ == 'Ordinal':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Ordinal(obj_)
-        elif nodeName_ == 'Bound':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Bound(obj_)
-        elif nodeName_ == 'Virtual_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Address(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Function_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Function_Name(obj_)
+    def buildChild_Hint(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hint(obj_)
+    def buildChild_Ordinal(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Ordinal(obj_)
+    def buildChild_Bound(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Bound(obj_)
+    def buildChild_Virtual_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Address(obj_)
 # end class PEImportedFunctionType
 
 class PEImportListType(GeneratedsSuper):
@@ -1393,10 +1430,13 @@ class PEImportListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Import':
-            obj_ = PEImportType.factory()
-            obj_.build(child_)
-            self.Import.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Import(self, child_, node, nodeName_):
+        obj_ = PEImportType.factory()
+        obj_.build(child_)
+        self.Import.append(obj_)
 # end class PEImportListType
 
 class PESectionType(GeneratedsSuper):
@@ -1481,22 +1521,25 @@ class PESectionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Section_Header':
-            obj_ = PESectionHeaderStructType.factory()
-            obj_.build(child_)
-            self.set_Section_Header(obj_)
-        elif nodeName_ == 'Data_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Data_Hashes(obj_)
-        elif nodeName_ == 'Entropy':
-            obj_ = EntropyType.factory()
-            obj_.build(child_)
-            self.set_Entropy(obj_)
-        elif nodeName_ == 'Header_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Header_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Section_Header(self, child_, node, nodeName_):
+        obj_ = PESectionHeaderStructType.factory()
+        obj_.build(child_)
+        self.set_Section_Header(obj_)
+    def buildChild_Data_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Data_Hashes(obj_)
+    def buildChild_Entropy(self, child_, node, nodeName_):
+        obj_ = EntropyType.factory()
+        obj_.build(child_)
+        self.set_Entropy(obj_)
+    def buildChild_Header_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Header_Hashes(obj_)
 # end class PESectionType
 
 class PEDataDirectoryStructType(GeneratedsSuper):
@@ -1569,14 +1612,17 @@ class PEDataDirectoryStructType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Virtual_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Address(obj_)
-        elif nodeName_ == 'Size':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Virtual_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Address(obj_)
+    def buildChild_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size(obj_)
 # end class PEDataDirectoryStructType
 
 class PESectionHeaderStructType(GeneratedsSuper):
@@ -1700,46 +1746,49 @@ class PESectionHeaderStructType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Virtual_Size':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Size(obj_)
-        elif nodeName_ == 'Virtual_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Virtual_Address(obj_)
-        elif nodeName_ == 'Size_Of_Raw_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Raw_Data(obj_)
-        elif nodeName_ == 'Pointer_To_Raw_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pointer_To_Raw_Data(obj_)
-        elif nodeName_ == 'Pointer_To_Relocations':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pointer_To_Relocations(obj_)
-        elif nodeName_ == 'Pointer_To_Linenumbers':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pointer_To_Linenumbers(obj_)
-        elif nodeName_ == 'Number_Of_Relocations':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Relocations(obj_)
-        elif nodeName_ == 'Number_Of_Linenumbers':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Linenumbers(obj_)
-        elif nodeName_ == 'Characteristics':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Characteristics(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Virtual_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Size(obj_)
+    def buildChild_Virtual_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Virtual_Address(obj_)
+    def buildChild_Size_Of_Raw_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Raw_Data(obj_)
+    def buildChild_Pointer_To_Raw_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pointer_To_Raw_Data(obj_)
+    def buildChild_Pointer_To_Relocations(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pointer_To_Relocations(obj_)
+    def buildChild_Pointer_To_Linenumbers(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pointer_To_Linenumbers(obj_)
+    def buildChild_Number_Of_Relocations(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Relocations(obj_)
+    def buildChild_Number_Of_Linenumbers(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Linenumbers(obj_)
+    def buildChild_Characteristics(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Characteristics(obj_)
 # end class PESectionHeaderStructType
 
 class DOSHeaderType(GeneratedsSuper):
@@ -1926,86 +1975,89 @@ class DOSHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'e_magic':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_magic(obj_)
-        elif nodeName_ == 'e_cblp':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_cblp(obj_)
-        elif nodeName_ == 'e_cp':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_cp(obj_)
-        elif nodeName_ == 'e_crlc':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_crlc(obj_)
-        elif nodeName_ == 'e_cparhdr':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_cparhdr(obj_)
-        elif nodeName_ == 'e_minalloc':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_minalloc(obj_)
-        elif nodeName_ == 'e_maxalloc':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_maxalloc(obj_)
-        elif nodeName_ == 'e_ss':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_ss(obj_)
-        elif nodeName_ == 'e_sp':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_sp(obj_)
-        elif nodeName_ == 'e_csum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_csum(obj_)
-        elif nodeName_ == 'e_ip':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_ip(obj_)
-        elif nodeName_ == 'e_cs':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_cs(obj_)
-        elif nodeName_ == 'e_lfarlc':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_lfarlc(obj_)
-        elif nodeName_ == 'e_ovro':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_ovro(obj_)
-        elif nodeName_ == 'reserved1':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.reserved1.append(obj_)
-        elif nodeName_ == 'e_oemid':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_oemid(obj_)
-        elif nodeName_ == 'e_oeminfo':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_oeminfo(obj_)
-        elif nodeName_ == 'reserved2':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_reserved2(obj_)
-        elif nodeName_ == 'e_lfanew':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_e_lfanew(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_e_magic(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_magic(obj_)
+    def buildChild_e_cblp(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_cblp(obj_)
+    def buildChild_e_cp(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_cp(obj_)
+    def buildChild_e_crlc(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_crlc(obj_)
+    def buildChild_e_cparhdr(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_cparhdr(obj_)
+    def buildChild_e_minalloc(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_minalloc(obj_)
+    def buildChild_e_maxalloc(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_maxalloc(obj_)
+    def buildChild_e_ss(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_ss(obj_)
+    def buildChild_e_sp(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_sp(obj_)
+    def buildChild_e_csum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_csum(obj_)
+    def buildChild_e_ip(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_ip(obj_)
+    def buildChild_e_cs(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_cs(obj_)
+    def buildChild_e_lfarlc(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_lfarlc(obj_)
+    def buildChild_e_ovro(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_ovro(obj_)
+    def buildChild_reserved1(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.reserved1.append(obj_)
+    def buildChild_e_oemid(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_oemid(obj_)
+    def buildChild_e_oeminfo(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_oeminfo(obj_)
+    def buildChild_reserved2(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_reserved2(obj_)
+    def buildChild_e_lfanew(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_e_lfanew(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class DOSHeaderType
 
 class PEHeadersType(GeneratedsSuper):
@@ -2098,30 +2150,33 @@ class PEHeadersType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'DOS_Header':
-            obj_ = DOSHeaderType.factory()
-            obj_.build(child_)
-            self.set_DOS_Header(obj_)
-        elif nodeName_ == 'Signature':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature(obj_)
-        elif nodeName_ == 'File_Header':
-            obj_ = PEFileHeaderType.factory()
-            obj_.build(child_)
-            self.set_File_Header(obj_)
-        elif nodeName_ == 'Optional_Header':
-            obj_ = PEOptionalHeaderType.factory()
-            obj_.build(child_)
-            self.set_Optional_Header(obj_)
-        elif nodeName_ == 'Entropy':
-            obj_ = EntropyType.factory()
-            obj_.build(child_)
-            self.set_Entropy(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_DOS_Header(self, child_, node, nodeName_):
+        obj_ = DOSHeaderType.factory()
+        obj_.build(child_)
+        self.set_DOS_Header(obj_)
+    def buildChild_Signature(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature(obj_)
+    def buildChild_File_Header(self, child_, node, nodeName_):
+        obj_ = PEFileHeaderType.factory()
+        obj_.build(child_)
+        self.set_File_Header(obj_)
+    def buildChild_Optional_Header(self, child_, node, nodeName_):
+        obj_ = PEOptionalHeaderType.factory()
+        obj_.build(child_)
+        self.set_Optional_Header(obj_)
+    def buildChild_Entropy(self, child_, node, nodeName_):
+        obj_ = EntropyType.factory()
+        obj_.build(child_)
+        self.set_Entropy(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PEHeadersType
 
 class PEFileHeaderType(GeneratedsSuper):
@@ -2231,38 +2286,41 @@ class PEFileHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Machine':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Machine(obj_)
-        elif nodeName_ == 'Number_Of_Sections':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Sections(obj_)
-        elif nodeName_ == 'Time_Date_Stamp':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Time_Date_Stamp(obj_)
-        elif nodeName_ == 'Pointer_To_Symbol_Table':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Pointer_To_Symbol_Table(obj_)
-        elif nodeName_ == 'Number_Of_Symbols':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Symbols(obj_)
-        elif nodeName_ == 'Size_Of_Optional_Header':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Optional_Header(obj_)
-        elif nodeName_ == 'Characteristics':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Characteristics(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Machine(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Machine(obj_)
+    def buildChild_Number_Of_Sections(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Sections(obj_)
+    def buildChild_Time_Date_Stamp(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Time_Date_Stamp(obj_)
+    def buildChild_Pointer_To_Symbol_Table(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Pointer_To_Symbol_Table(obj_)
+    def buildChild_Number_Of_Symbols(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Symbols(obj_)
+    def buildChild_Size_Of_Optional_Header(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Optional_Header(obj_)
+    def buildChild_Characteristics(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Characteristics(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PEFileHeaderType
 
 class PEOptionalHeaderType(GeneratedsSuper):
@@ -2513,134 +2571,137 @@ class PEOptionalHeaderType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Magic':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Magic(obj_)
-        elif nodeName_ == 'Major_Linker_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Major_Linker_Version(obj_)
-        elif nodeName_ == 'Minor_Linker_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Minor_Linker_Version(obj_)
-        elif nodeName_ == 'Size_Of_Code':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Code(obj_)
-        elif nodeName_ == 'Size_Of_Initialized_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Initialized_Data(obj_)
-        elif nodeName_ == 'Size_Of_Uninitialized_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Uninitialized_Data(obj_)
-        elif nodeName_ == 'Address_Of_Entry_Point':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Address_Of_Entry_Point(obj_)
-        elif nodeName_ == 'Base_Of_Code':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Base_Of_Code(obj_)
-        elif nodeName_ == 'Base_Of_Data':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Base_Of_Data(obj_)
-        elif nodeName_ == 'Image_Base':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Image_Base(obj_)
-        elif nodeName_ == 'Section_Alignment':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Section_Alignment(obj_)
-        elif nodeName_ == 'File_Alignment':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Alignment(obj_)
-        elif nodeName_ == 'Major_OS_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Major_OS_Version(obj_)
-        elif nodeName_ == 'Minor_OS_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Minor_OS_Version(obj_)
-        elif nodeName_ == 'Major_Image_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Major_Image_Version(obj_)
-        elif nodeName_ == 'Minor_Image_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Minor_Image_Version(obj_)
-        elif nodeName_ == 'Major_Subsystem_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Major_Subsystem_Version(obj_)
-        elif nodeName_ == 'Minor_Subsystem_Version':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Minor_Subsystem_Version(obj_)
-        elif nodeName_ == 'Win32_Version_Value':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Win32_Version_Value(obj_)
-        elif nodeName_ == 'Size_Of_Image':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Image(obj_)
-        elif nodeName_ == 'Size_Of_Headers':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Headers(obj_)
-        elif nodeName_ == 'Checksum':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Checksum(obj_)
-        elif nodeName_ == 'Subsystem':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subsystem(obj_)
-        elif nodeName_ == 'DLL_Characteristics':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_DLL_Characteristics(obj_)
-        elif nodeName_ == 'Size_Of_Stack_Reserve':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Stack_Reserve(obj_)
-        elif nodeName_ == 'Size_Of_Stack_Commit':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Stack_Commit(obj_)
-        elif nodeName_ == 'Size_Of_Heap_Reserve':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Heap_Reserve(obj_)
-        elif nodeName_ == 'Size_Of_Heap_Commit':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_Of_Heap_Commit(obj_)
-        elif nodeName_ == 'Loader_Flags':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Loader_Flags(obj_)
-        elif nodeName_ == 'Number_Of_Rva_And_Sizes':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Rva_And_Sizes(obj_)
-        elif nodeName_ == 'Data_Directory':
-            obj_ = DataDirectoryType.factory()
-            obj_.build(child_)
-            self.set_Data_Directory(obj_)
-        elif nodeName_ == 'Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Magic(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Magic(obj_)
+    def buildChild_Major_Linker_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Major_Linker_Version(obj_)
+    def buildChild_Minor_Linker_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Minor_Linker_Version(obj_)
+    def buildChild_Size_Of_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Code(obj_)
+    def buildChild_Size_Of_Initialized_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Initialized_Data(obj_)
+    def buildChild_Size_Of_Uninitialized_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Uninitialized_Data(obj_)
+    def buildChild_Address_Of_Entry_Point(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Address_Of_Entry_Point(obj_)
+    def buildChild_Base_Of_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Base_Of_Code(obj_)
+    def buildChild_Base_Of_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Base_Of_Data(obj_)
+    def buildChild_Image_Base(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Image_Base(obj_)
+    def buildChild_Section_Alignment(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Section_Alignment(obj_)
+    def buildChild_File_Alignment(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Alignment(obj_)
+    def buildChild_Major_OS_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Major_OS_Version(obj_)
+    def buildChild_Minor_OS_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Minor_OS_Version(obj_)
+    def buildChild_Major_Image_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Major_Image_Version(obj_)
+    def buildChild_Minor_Image_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Minor_Image_Version(obj_)
+    def buildChild_Major_Subsystem_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Major_Subsystem_Version(obj_)
+    def buildChild_Minor_Subsystem_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Minor_Subsystem_Version(obj_)
+    def buildChild_Win32_Version_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Win32_Version_Value(obj_)
+    def buildChild_Size_Of_Image(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Image(obj_)
+    def buildChild_Size_Of_Headers(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Headers(obj_)
+    def buildChild_Checksum(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Checksum(obj_)
+    def buildChild_Subsystem(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subsystem(obj_)
+    def buildChild_DLL_Characteristics(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_DLL_Characteristics(obj_)
+    def buildChild_Size_Of_Stack_Reserve(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Stack_Reserve(obj_)
+    def buildChild_Size_Of_Stack_Commit(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Stack_Commit(obj_)
+    def buildChild_Size_Of_Heap_Reserve(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Heap_Reserve(obj_)
+    def buildChild_Size_Of_Heap_Commit(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_Of_Heap_Commit(obj_)
+    def buildChild_Loader_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Loader_Flags(obj_)
+    def buildChild_Number_Of_Rva_And_Sizes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Rva_And_Sizes(obj_)
+    def buildChild_Data_Directory(self, child_, node, nodeName_):
+        obj_ = DataDirectoryType.factory()
+        obj_.build(child_)
+        self.set_Data_Directory(obj_)
+    def buildChild_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Hashes(obj_)
 # end class PEOptionalHeaderType
 
 class DataDirectoryType(GeneratedsSuper):
@@ -2793,70 +2854,73 @@ class DataDirectoryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Export_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Export_Table(obj_)
-        elif nodeName_ == 'Import_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Import_Table(obj_)
-        elif nodeName_ == 'Resource_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Resource_Table(obj_)
-        elif nodeName_ == 'Exception_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Exception_Table(obj_)
-        elif nodeName_ == 'Certificate_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Certificate_Table(obj_)
-        elif nodeName_ == 'Base_Relocation_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Base_Relocation_Table(obj_)
-        elif nodeName_ == 'Debug':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Debug(obj_)
-        elif nodeName_ == 'Architecture':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Architecture(obj_)
-        elif nodeName_ == 'Global_Ptr':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Global_Ptr(obj_)
-        elif nodeName_ == 'TLS_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_TLS_Table(obj_)
-        elif nodeName_ == 'Load_Config_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Load_Config_Table(obj_)
-        elif nodeName_ == 'Bound_Import':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Bound_Import(obj_)
-        elif nodeName_ == 'Import_Address_Table':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Import_Address_Table(obj_)
-        elif nodeName_ == 'Delay_Import_Descriptor':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Delay_Import_Descriptor(obj_)
-        elif nodeName_ == 'CLR_Runtime_Header':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_CLR_Runtime_Header(obj_)
-        elif nodeName_ == 'Reserved':
-            obj_ = PEDataDirectoryStructType.factory()
-            obj_.build(child_)
-            self.set_Reserved(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Export_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Export_Table(obj_)
+    def buildChild_Import_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Import_Table(obj_)
+    def buildChild_Resource_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Resource_Table(obj_)
+    def buildChild_Exception_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Exception_Table(obj_)
+    def buildChild_Certificate_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Certificate_Table(obj_)
+    def buildChild_Base_Relocation_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Base_Relocation_Table(obj_)
+    def buildChild_Debug(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Debug(obj_)
+    def buildChild_Architecture(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Architecture(obj_)
+    def buildChild_Global_Ptr(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Global_Ptr(obj_)
+    def buildChild_TLS_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_TLS_Table(obj_)
+    def buildChild_Load_Config_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Load_Config_Table(obj_)
+    def buildChild_Bound_Import(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Bound_Import(obj_)
+    def buildChild_Import_Address_Table(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Import_Address_Table(obj_)
+    def buildChild_Delay_Import_Descriptor(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Delay_Import_Descriptor(obj_)
+    def buildChild_CLR_Runtime_Header(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_CLR_Runtime_Header(obj_)
+    def buildChild_Reserved(self, child_, node, nodeName_):
+        obj_ = PEDataDirectoryStructType.factory()
+        obj_.build(child_)
+        self.set_Reserved(obj_)
 # end class DataDirectoryType
 
 class PEBuildInformationType(GeneratedsSuper):
@@ -2938,22 +3002,25 @@ class PEBuildInformationType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Linker_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Linker_Name(obj_)
-        elif nodeName_ == 'Linker_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Linker_Version(obj_)
-        elif nodeName_ == 'Compiler_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Compiler_Name(obj_)
-        elif nodeName_ == 'Compiler_Version':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Compiler_Version(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Linker_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Linker_Name(obj_)
+    def buildChild_Linker_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Linker_Version(obj_)
+    def buildChild_Compiler_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compiler_Name(obj_)
+    def buildChild_Compiler_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Compiler_Version(obj_)
 # end class PEBuildInformationType
 
 
@@ -3227,47 +3294,49 @@ class WindowsExecutableFileObjectType(win_file_object.WindowsFileObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsExecutableFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Build_Information':
-            obj_ = PEBuildInformationType.factory()
-            obj_.build(child_)
-            self.set_Build_Information(obj_)
-        elif nodeName_ == 'Digital_Signature':
-            obj_ = cybox_common.DigitalSignatureInfoType.factory()
-            obj_.build(child_)
-            self.set_Digital_Signature(obj_)
-        elif nodeName_ == 'Exports':
-            obj_ = PEExportsType.factory()
-            obj_.build(child_)
-            self.set_Exports(obj_)
-        elif nodeName_ == 'Extraneous_Bytes':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Extraneous_Bytes(obj_)
-        elif nodeName_ == 'Headers':
-            obj_ = PEHeadersType.factory()
-            obj_.build(child_)
-            self.set_Headers(obj_)
-        elif nodeName_ == 'Imports':
-            obj_ = PEImportListType.factory()
-            obj_.build(child_)
-            self.set_Imports(obj_)
-        elif nodeName_ == 'PE_Checksum':
-            obj_ = PEChecksumType.factory()
-            obj_.build(child_)
-            self.set_PE_Checksum(obj_)
-        elif nodeName_ == 'Resources':
-            obj_ = PEResourceListType.factory()
-            obj_.build(child_)
-            self.set_Resources(obj_)
-        elif nodeName_ == 'Sections':
-            obj_ = PESectionListType.factory()
-            obj_.build(child_)
-            self.set_Sections(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = PEType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(WindowsExecutableFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Build_Information(self, child_, node, nodeName_):
+        obj_ = PEBuildInformationType.factory()
+        obj_.build(child_)
+        self.set_Build_Information(obj_)
+    def buildChild_Digital_Signature(self, child_, node, nodeName_):
+        obj_ = cybox_common.DigitalSignatureInfoType.factory()
+        obj_.build(child_)
+        self.set_Digital_Signature(obj_)
+    def buildChild_Exports(self, child_, node, nodeName_):
+        obj_ = PEExportsType.factory()
+        obj_.build(child_)
+        self.set_Exports(obj_)
+    def buildChild_Extraneous_Bytes(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Extraneous_Bytes(obj_)
+    def buildChild_Headers(self, child_, node, nodeName_):
+        obj_ = PEHeadersType.factory()
+        obj_.build(child_)
+        self.set_Headers(obj_)
+    def buildChild_Imports(self, child_, node, nodeName_):
+        obj_ = PEImportListType.factory()
+        obj_.build(child_)
+        self.set_Imports(obj_)
+    def buildChild_PE_Checksum(self, child_, node, nodeName_):
+        obj_ = PEChecksumType.factory()
+        obj_.build(child_)
+        self.set_PE_Checksum(obj_)
+    def buildChild_Resources(self, child_, node, nodeName_):
+        obj_ = PEResourceListType.factory()
+        obj_.build(child_)
+        self.set_Resources(obj_)
+    def buildChild_Sections(self, child_, node, nodeName_):
+        obj_ = PESectionListType.factory()
+        obj_.build(child_)
+        self.set_Sections(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = PEType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class WindowsExecutableFileObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import file_object
 
@@ -71,10 +73,13 @@ class StreamListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Stream':
-            obj_ = StreamObjectType.factory()
-            obj_.build(child_)
-            self.Stream.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Stream(self, child_, node, nodeName_):
+        obj_ = StreamObjectType.factory()
+        obj_.build(child_)
+        self.Stream.append(obj_)
 # end class StreamListType
 
 class WindowsFilePermissionsType(file_object.FilePermissionsType):
@@ -168,57 +173,59 @@ class WindowsFilePermissionsType(file_object.FilePermissionsType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsFilePermissionsType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Full_Control':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Full_Control')
-            self.Full_Control = ival_
-        elif nodeName_ == 'Modify':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Modify')
-            self.Modify = ival_
-        elif nodeName_ == 'Read':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Read')
-            self.Read = ival_
-        elif nodeName_ == 'Read_And_Execute':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Read_And_Execute')
-            self.Read_And_Execute = ival_
-        elif nodeName_ == 'Write':
-            sval_ = child_.text
-            if sval_ in ('true', '1'):
-                ival_ = True
-            elif sval_ in ('false', '0'):
-                ival_ = False
-            else:
-                raise_parse_error(child_, 'requires boolean')
-            ival_ = self.gds_validate_boolean(ival_, node, 'Write')
-            self.Write = ival_
-        super(WindowsFilePermissionsType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Full_Control(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Full_Control')
+        self.Full_Control = ival_
+    def buildChild_Modify(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Modify')
+        self.Modify = ival_
+    def buildChild_Read(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Read')
+        self.Read = ival_
+    def buildChild_Read_And_Execute(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Read_And_Execute')
+        self.Read_And_Execute = ival_
+    def buildChild_Write(self, child_, node, nodeName_):
+        sval_ = child_.text
+        if sval_ in ('true', '1'):
+            ival_ = True
+        elif sval_ in ('false', '0'):
+            ival_ = False
+        else:
+            raise_parse_error(child_, 'requires boolean')
+        ival_ = self.gds_validate_boolean(ival_, node, 'Write')
+        self.Write = ival_
 # end class WindowsFilePermissionsType
 
 class WindowsFileAttributeType(cybox_common.BaseObjectPropertyType):
@@ -365,11 +372,13 @@ class WindowsFileAttributesType(file_object.FileAttributeType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsFileAttributesType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Attribute':
-            obj_ = WindowsFileAttributeType.factory()
-            obj_.build(child_)
-            self.Attribute.append(obj_)
-        super(WindowsFileAttributesType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Attribute(self, child_, node, nodeName_):
+        obj_ = WindowsFileAttributeType.factory()
+        obj_.build(child_)
+        self.Attribute.append(obj_)
 # end class WindowsFileAttributesType
 
 class StreamObjectType(cybox_common.HashListType):
@@ -445,15 +454,17 @@ class StreamObjectType(cybox_common.HashListType):
     def buildAttributes(self, node, attrs, already_processed):
         super(StreamObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Size_In_Bytes':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Size_In_Bytes(obj_)
-        super(StreamObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Size_In_Bytes(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Size_In_Bytes(obj_)
 # end class StreamObjectType
 
 class WindowsFileObjectType(file_object.FileObjectType):
@@ -562,35 +573,37 @@ class WindowsFileObjectType(file_object.FileObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsFileObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Filename_Accessed_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Filename_Accessed_Time(obj_)
-        elif nodeName_ == 'Filename_Created_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Filename_Created_Time(obj_)
-        elif nodeName_ == 'Filename_Modified_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Filename_Modified_Time(obj_)
-        elif nodeName_ == 'Drive':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Drive(obj_)
-        elif nodeName_ == 'Security_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_ID(obj_)
-        elif nodeName_ == 'Security_Type':
-            obj_ = cybox_common.SIDType.factory()
-            obj_.build(child_)
-            self.set_Security_Type(obj_)
-        elif nodeName_ == 'Stream_List':
-            obj_ = StreamListType.factory()
-            obj_.build(child_)
-            self.set_Stream_List(obj_)
-        super(WindowsFileObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Filename_Accessed_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Filename_Accessed_Time(obj_)
+    def buildChild_Filename_Created_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Filename_Created_Time(obj_)
+    def buildChild_Filename_Modified_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Filename_Modified_Time(obj_)
+    def buildChild_Drive(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Drive(obj_)
+    def buildChild_Security_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_ID(obj_)
+    def buildChild_Security_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.SIDType.factory()
+        obj_.build(child_)
+        self.set_Security_Type(obj_)
+    def buildChild_Stream_List(self, child_, node, nodeName_):
+        obj_ = StreamListType.factory()
+        obj_.build(child_)
+        self.set_Stream_List(obj_)
 # end class WindowsFileObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_handle_object
 
@@ -255,39 +257,41 @@ class WindowsFilemappingObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsFilemappingObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'File_Handle':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_File_Handle(obj_)
-        elif nodeName_ == 'Handle':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_Handle(obj_)
-        elif nodeName_ == 'Page_Protection_Value':
-            obj_ = PageProtectionValueType.factory()
-            obj_.build(child_)
-            self.set_Page_Protection_Value(obj_)
-        elif nodeName_ == 'Page_Protection_Attribute':
-            obj_ = PageProtectionAttributeType.factory()
-            obj_.build(child_)
-            self.Page_Protection_Attribute.append(obj_)
-        elif nodeName_ == 'Maximum_Size':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Maximum_Size(obj_)
-        elif nodeName_ == 'Actual_Size':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Actual_Size(obj_)
-        elif nodeName_ == 'Security_Attributes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_Attributes(obj_)
-        super(WindowsFilemappingObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_File_Handle(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_File_Handle(obj_)
+    def buildChild_Handle(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_Handle(obj_)
+    def buildChild_Page_Protection_Value(self, child_, node, nodeName_):
+        obj_ = PageProtectionValueType.factory()
+        obj_.build(child_)
+        self.set_Page_Protection_Value(obj_)
+    def buildChild_Page_Protection_Attribute(self, child_, node, nodeName_):
+        obj_ = PageProtectionAttributeType.factory()
+        obj_.build(child_)
+        self.Page_Protection_Attribute.append(obj_)
+    def buildChild_Maximum_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Maximum_Size(obj_)
+    def buildChild_Actual_Size(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Actual_Size(obj_)
+    def buildChild_Security_Attributes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_Attributes(obj_)
 # end class WindowsFilemappingObjectType
 
 GDSClassesMapping = {
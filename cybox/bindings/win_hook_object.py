@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import library_object
 from . import win_handle_object
@@ -167,27 +169,29 @@ class WindowsHookObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsHookObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = WinHookType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Handle':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_Handle(obj_)
-        elif nodeName_ == 'Hooking_Function_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hooking_Function_Name(obj_)
-        elif nodeName_ == 'Hooking_Module':
-            obj_ = library_object.LibraryObjectType.factory()
-            obj_.build(child_)
-            self.set_Hooking_Module(obj_)
-        elif nodeName_ == 'Thread_ID':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Thread_ID(obj_)
-        super(WindowsHookObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = WinHookType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Handle(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_Handle(obj_)
+    def buildChild_Hooking_Function_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hooking_Function_Name(obj_)
+    def buildChild_Hooking_Module(self, child_, node, nodeName_):
+        obj_ = library_object.LibraryObjectType.factory()
+        obj_.build(child_)
+        self.set_Hooking_Module(obj_)
+    def buildChild_Thread_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Thread_ID(obj_)
 # end class WindowsHookObjectType
 
 GDSClassesMapping = {
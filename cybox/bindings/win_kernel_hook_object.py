@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -193,39 +195,41 @@ class WindowsKernelHookObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsKernelHookObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Digital_Signature_Hooking':
-            obj_ = cybox_common.DigitalSignatureInfoType.factory()
-            obj_.build(child_)
-            self.set_Digital_Signature_Hooking(obj_)
-        elif nodeName_ == 'Digital_Signature_Hooked':
-            obj_ = cybox_common.DigitalSignatureInfoType.factory()
-            obj_.build(child_)
-            self.set_Digital_Signature_Hooked(obj_)
-        elif nodeName_ == 'Hooking_Address':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hooking_Address(obj_)
-        elif nodeName_ == 'Hook_Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hook_Description(obj_)
-        elif nodeName_ == 'Hooked_Function':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hooked_Function(obj_)
-        elif nodeName_ == 'Hooked_Module':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hooked_Module(obj_)
-        elif nodeName_ == 'Hooking_Module':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hooking_Module(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = KernelHookType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(WindowsKernelHookObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Digital_Signature_Hooking(self, child_, node, nodeName_):
+        obj_ = cybox_common.DigitalSignatureInfoType.factory()
+        obj_.build(child_)
+        self.set_Digital_Signature_Hooking(obj_)
+    def buildChild_Digital_Signature_Hooked(self, child_, node, nodeName_):
+        obj_ = cybox_common.DigitalSignatureInfoType.factory()
+        obj_.build(child_)
+        self.set_Digital_Signature_Hooked(obj_)
+    def buildChild_Hooking_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hooking_Address(obj_)
+    def buildChild_Hook_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hook_Description(obj_)
+    def buildChild_Hooked_Function(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hooked_Function(obj_)
+    def buildChild_Hooked_Module(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hooked_Module(obj_)
+    def buildChild_Hooking_Module(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hooking_Module(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = KernelHookType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class WindowsKernelHookObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -70,10 +72,13 @@ class SSDTEntryListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'SSDT_Entry':
-            obj_ = SSDTEntryType.factory()
-            obj_.build(child_)
-            self.SSDT_Entry.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_SSDT_Entry(self, child_, node, nodeName_):
+        obj_ = SSDTEntryType.factory()
+        obj_.build(child_)
+        self.SSDT_Entry.append(obj_)
 # end class SSDTEntryListType
 
 class SSDTEntryType(GeneratedsSuper):
@@ -172,22 +177,25 @@ class SSDTEntryType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Service_Table_Base':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_Table_Base(obj_)
-        elif nodeName_ == 'Service_Counter_Table_Base':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_Counter_Table_Base(obj_)
-        elif nodeName_ == 'Number_Of_Services':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Of_Services(obj_)
-        elif nodeName_ == 'Argument_Table_Base':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Argument_Table_Base(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Service_Table_Base(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_Table_Base(obj_)
+    def buildChild_Service_Counter_Table_Base(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_Counter_Table_Base(obj_)
+    def buildChild_Number_Of_Services(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Of_Services(obj_)
+    def buildChild_Argument_Table_Base(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Argument_Table_Base(obj_)
 # end class SSDTEntryType
 
 class IDTEntryListType(GeneratedsSuper):
@@ -256,10 +264,13 @@ class IDTEntryListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IDT_Entry':
-            obj_ = IDTEntryType.factory()
-            obj_.build(child_)
-            self.IDT_Entry.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IDT_Entry(self, child_, node, nodeName_):
+        obj_ = IDTEntryType.factory()
+        obj_.build(child_)
+        self.IDT_Entry.append(obj_)
 # end class IDTEntryListType
 
 class IDTEntryType(GeneratedsSuper):
@@ -348,26 +359,29 @@ class IDTEntryType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type_Attr':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Type_Attr(obj_)
-        elif nodeName_ == 'Offset_High':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset_High(obj_)
-        elif nodeName_ == 'Offset_Low':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset_Low(obj_)
-        elif nodeName_ == 'Offset_Middle':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Offset_Middle(obj_)
-        elif nodeName_ == 'Selector':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Selector(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type_Attr(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Type_Attr(obj_)
+    def buildChild_Offset_High(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset_High(obj_)
+    def buildChild_Offset_Low(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset_Low(obj_)
+    def buildChild_Offset_Middle(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Offset_Middle(obj_)
+    def buildChild_Selector(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Selector(obj_)
 # end class IDTEntryType
 
 class WindowsKernelObjectType(cybox_common.ObjectPropertiesType):
@@ -437,15 +451,17 @@ class WindowsKernelObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsKernelObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'IDT':
-            obj_ = IDTEntryListType.factory()
-            obj_.build(child_)
-            self.set_IDT(obj_)
-        elif nodeName_ == 'SSDT':
-            obj_ = SSDTEntryListType.factory()
-            obj_.build(child_)
-            self.set_SSDT(obj_)
-        super(WindowsKernelObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_IDT(self, child_, node, nodeName_):
+        obj_ = IDTEntryListType.factory()
+        obj_.build(child_)
+        self.set_IDT(obj_)
+    def buildChild_SSDT(self, child_, node, nodeName_):
+        obj_ = SSDTEntryListType.factory()
+        obj_.build(child_)
+        self.set_SSDT(obj_)
 # end class WindowsKernelObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import memory_object
 
@@ -328,27 +330,29 @@ class WindowsMemoryPageRegionObjectType(memory_object.MemoryObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsMemoryPageRegionObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Type':
-            obj_ = MemoryPageTypeType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        elif nodeName_ == 'Allocation_Base_Address':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Allocation_Base_Address(obj_)
-        elif nodeName_ == 'Allocation_Protect':
-            obj_ = MemoryPageProtectionType.factory()
-            obj_.build(child_)
-            self.set_Allocation_Protect(obj_)
-        elif nodeName_ == 'State':
-            obj_ = MemoryPageStateType.factory()
-            obj_.build(child_)
-            self.set_State(obj_)
-        elif nodeName_ == 'Protect':
-            obj_ = MemoryPageProtectionType.factory()
-            obj_.build(child_)
-            self.set_Protect(obj_)
-        super(WindowsMemoryPageRegionObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = MemoryPageTypeType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
+    def buildChild_Allocation_Base_Address(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Allocation_Base_Address(obj_)
+    def buildChild_Allocation_Protect(self, child_, node, nodeName_):
+        obj_ = MemoryPageProtectionType.factory()
+        obj_.build(child_)
+        self.set_Allocation_Protect(obj_)
+    def buildChild_State(self, child_, node, nodeName_):
+        obj_ = MemoryPageStateType.factory()
+        obj_.build(child_)
+        self.set_State(obj_)
+    def buildChild_Protect(self, child_, node, nodeName_):
+        obj_ = MemoryPageProtectionType.factory()
+        obj_.build(child_)
+        self.set_Protect(obj_)
 # end class WindowsMemoryPageRegionObjectType
 
 GDSClassesMapping = {
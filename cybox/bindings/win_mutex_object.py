@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import mutex_object
 from . import win_handle_object
@@ -79,15 +81,17 @@ class WindowsMutexObjectType(mutex_object.MutexObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsMutexObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Handle':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_Handle(obj_)
-        elif nodeName_ == 'Security_Attributes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_Attributes(obj_)
-        super(WindowsMutexObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Handle(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_Handle(obj_)
+    def buildChild_Security_Attributes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_Attributes(obj_)
 # end class WindowsMutexObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import address_object
 from . import network_route_entry_object
@@ -232,15 +234,17 @@ class WindowsNetworkRouteEntryObjectType(network_route_entry_object.NetworkRoute
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsNetworkRouteEntryObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'NL_ROUTE_PROTOCOL':
-            obj_ = NLRouteProtocolType.factory()
-            obj_.build(child_)
-            self.set_NL_ROUTE_PROTOCOL(obj_)
-        elif nodeName_ == 'NL_ROUTE_ORIGIN':
-            obj_ = NLRouteOriginType.factory()
-            obj_.build(child_)
-            self.set_NL_ROUTE_ORIGIN(obj_)
-        super(WindowsNetworkRouteEntryObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_NL_ROUTE_PROTOCOL(self, child_, node, nodeName_):
+        obj_ = NLRouteProtocolType.factory()
+        obj_.build(child_)
+        self.set_NL_ROUTE_PROTOCOL(obj_)
+    def buildChild_NL_ROUTE_ORIGIN(self, child_, node, nodeName_):
+        obj_ = NLRouteOriginType.factory()
+        obj_.build(child_)
+        self.set_NL_ROUTE_ORIGIN(obj_)
 # end class WindowsNetworkRouteEntryObjectType
 
 GDSClassesMapping = {
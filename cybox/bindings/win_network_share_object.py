@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -296,27 +298,29 @@ class WindowsNetworkShareObjectType(cybox_common.ObjectPropertiesType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(WindowsNetworkShareObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Current_Uses':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Current_Uses(obj_)
-        elif nodeName_ == 'Local_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Local_Path(obj_)
-        elif nodeName_ == 'Max_Uses':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Max_Uses(obj_)
-        elif nodeName_ == 'Netname':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Netname(obj_)
-        elif nodeName_ == 'Type':
-            obj_ = SharedResourceType.factory()
-            obj_.build(child_)
-            self.set_Type(obj_)
-        super(WindowsNetworkShareObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Current_Uses(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Current_Uses(obj_)
+    def buildChild_Local_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Local_Path(obj_)
+    def buildChild_Max_Uses(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Max_Uses(obj_)
+    def buildChild_Netname(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Netname(obj_)
+    def buildChild_Type(self, child_, node, nodeName_):
+        obj_ = SharedResourceType.factory()
+        obj_.build(child_)
+        self.set_Type(obj_)
 # end class WindowsNetworkShareObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import device_object
 from . import win_volume_object
@@ -75,10 +77,13 @@ class AccessedFileListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Accessed_Filename':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Accessed_Filename.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Accessed_Filename(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Accessed_Filename.append(obj_)
 # end class AccessedFileListType
 
 class AccessedDirectoryListType(GeneratedsSuper):
@@ -147,10 +152,13 @@ class AccessedDirectoryListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Accessed_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Accessed_Directory.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Accessed_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Accessed_Directory.append(obj_)
 # end class AccessedDirectoryListType
 
 class VolumeType(GeneratedsSuper):
@@ -227,14 +235,17 @@ class VolumeType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'VolumeItem':
-            obj_ = win_volume_object.WindowsVolumeObjectType.factory()
-            obj_.build(child_)
-            self.VolumeItem.append(obj_)
-        elif nodeName_ == 'DeviceItem':
-            obj_ = device_object.DeviceObjectType.factory()
-            obj_.build(child_)
-            self.DeviceItem.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_VolumeItem(self, child_, node, nodeName_):
+        obj_ = win_volume_object.WindowsVolumeObjectType.factory()
+        obj_.build(child_)
+        self.VolumeItem.append(obj_)
+    def buildChild_DeviceItem(self, child_, node, nodeName_):
+        obj_ = device_object.DeviceObjectType.factory()
+        obj_.build(child_)
+        self.DeviceItem.append(obj_)
 # end class VolumeType
 
 class WindowsPrefetchObjectType(cybox_common.ObjectPropertiesType):
@@ -352,39 +363,41 @@ class WindowsPrefetchObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsPrefetchObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Application_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Application_File_Name(obj_)
-        elif nodeName_ == 'Prefetch_Hash':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Prefetch_Hash(obj_)
-        elif nodeName_ == 'Times_Executed':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Times_Executed(obj_)
-        elif nodeName_ == 'First_Run':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_First_Run(obj_)
-        elif nodeName_ == 'Last_Run':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Last_Run(obj_)
-        elif nodeName_ == 'Volume':
-            obj_ = VolumeType.factory()
-            obj_.build(child_)
-            self.set_Volume(obj_)
-        elif nodeName_ == 'Accessed_File_List':
-            obj_ = AccessedFileListType.factory()
-            obj_.build(child_)
-            self.set_Accessed_File_List(obj_)
-        elif nodeName_ == 'Accessed_Directory_List':
-            obj_ = AccessedDirectoryListType.factory()
-            obj_.build(child_)
-            self.set_Accessed_Directory_List(obj_)
-        super(WindowsPrefetchObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Application_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Application_File_Name(obj_)
+    def buildChild_Prefetch_Hash(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Prefetch_Hash(obj_)
+    def buildChild_Times_Executed(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Times_Executed(obj_)
+    def buildChild_First_Run(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_First_Run(obj_)
+    def buildChild_Last_Run(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Last_Run(obj_)
+    def buildChild_Volume(self, child_, node, nodeName_):
+        obj_ = VolumeType.factory()
+        obj_.build(child_)
+        self.set_Volume(obj_)
+    def buildChild_Accessed_File_List(self, child_, node, nodeName_):
+        obj_ = AccessedFileListType.factory()
+        obj_.build(child_)
+        self.set_Accessed_File_List(obj_)
+    def buildChild_Accessed_Directory_List(self, child_, node, nodeName_):
+        obj_ = AccessedDirectoryListType.factory()
+        obj_.build(child_)
+        self.set_Accessed_Directory_List(obj_)
 # end class WindowsPrefetchObjectType
 
 GDSClassesMapping = {
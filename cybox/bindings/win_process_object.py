@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import memory_object
 from . import process_object
@@ -74,10 +76,13 @@ class MemorySectionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Memory_Section':
-            obj_ = memory_object.MemoryObjectType.factory()
-            obj_.build(child_)
-            self.Memory_Section.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Memory_Section(self, child_, node, nodeName_):
+        obj_ = memory_object.MemoryObjectType.factory()
+        obj_.build(child_)
+        self.Memory_Section.append(obj_)
 # end class MemorySectionListType
 
 class StartupInfoType(GeneratedsSuper):
@@ -225,62 +230,65 @@ class StartupInfoType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'lpDesktop':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_lpDesktop(obj_)
-        elif nodeName_ == 'lpTitle':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_lpTitle(obj_)
-        elif nodeName_ == 'dwX':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwX(obj_)
-        elif nodeName_ == 'dwY':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwY(obj_)
-        elif nodeName_ == 'dwXSize':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwXSize(obj_)
-        elif nodeName_ == 'dwYSize':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwYSize(obj_)
-        elif nodeName_ == 'dwXCountChars':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwXCountChars(obj_)
-        elif nodeName_ == 'dwYCountChars':
-            obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwYCountChars(obj_)
-        elif nodeName_ == 'dwFillAttribute':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwFillAttribute(obj_)
-        elif nodeName_ == 'dwFlags':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_dwFlags(obj_)
-        elif nodeName_ == 'wShowWindow':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_wShowWindow(obj_)
-        elif nodeName_ == 'hStdInput':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_hStdInput(obj_)
-        elif nodeName_ == 'hStdOutput':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_hStdOutput(obj_)
-        elif nodeName_ == 'hStdError':
-            obj_ = win_handle_object.WindowsHandleObjectType.factory()
-            obj_.build(child_)
-            self.set_hStdError(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_lpDesktop(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_lpDesktop(obj_)
+    def buildChild_lpTitle(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_lpTitle(obj_)
+    def buildChild_dwX(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwX(obj_)
+    def buildChild_dwY(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwY(obj_)
+    def buildChild_dwXSize(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwXSize(obj_)
+    def buildChild_dwYSize(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwYSize(obj_)
+    def buildChild_dwXCountChars(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwXCountChars(obj_)
+    def buildChild_dwYCountChars(self, child_, node, nodeName_):
+        obj_ = cybox_common.PositiveIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwYCountChars(obj_)
+    def buildChild_dwFillAttribute(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwFillAttribute(obj_)
+    def buildChild_dwFlags(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_dwFlags(obj_)
+    def buildChild_wShowWindow(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_wShowWindow(obj_)
+    def buildChild_hStdInput(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_hStdInput(obj_)
+    def buildChild_hStdOutput(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_hStdOutput(obj_)
+    def buildChild_hStdError(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleObjectType.factory()
+        obj_.build(child_)
+        self.set_hStdError(obj_)
 # end class StartupInfoType
 
 class WindowsProcessObjectType(process_object.ProcessObjectType):
@@ -429,39 +437,41 @@ class WindowsProcessObjectType(process_object.ProcessObjectType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(WindowsProcessObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Handle_List':
-            obj_ = win_handle_object.WindowsHandleListType.factory()
-            obj_.build(child_)
-            self.set_Handle_List(obj_)
-        elif nodeName_ == 'Priority':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Priority(obj_)
-        elif nodeName_ == 'Section_List':
-            obj_ = MemorySectionListType.factory()
-            obj_.build(child_)
-            self.set_Section_List(obj_)
-        elif nodeName_ == 'Security_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_ID(obj_)
-        elif nodeName_ == 'Startup_Info':
-            obj_ = StartupInfoType.factory()
-            obj_.build(child_)
-            self.set_Startup_Info(obj_)
-        elif nodeName_ == 'Security_Type':
-            obj_ = cybox_common.SIDType.factory()
-            obj_.build(child_)
-            self.set_Security_Type(obj_)
-        elif nodeName_ == 'Window_Title':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Window_Title(obj_)
-        elif nodeName_ == 'Thread':
-            obj_ = win_thread_object.WindowsThreadObjectType.factory()
-            obj_.build(child_)
-            self.Thread.append(obj_)
-        super(WindowsProcessObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Handle_List(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleListType.factory()
+        obj_.build(child_)
+        self.set_Handle_List(obj_)
+    def buildChild_Priority(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Priority(obj_)
+    def buildChild_Section_List(self, child_, node, nodeName_):
+        obj_ = MemorySectionListType.factory()
+        obj_.build(child_)
+        self.set_Section_List(obj_)
+    def buildChild_Security_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_ID(obj_)
+    def buildChild_Startup_Info(self, child_, node, nodeName_):
+        obj_ = StartupInfoType.factory()
+        obj_.build(child_)
+        self.set_Startup_Info(obj_)
+    def buildChild_Security_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.SIDType.factory()
+        obj_.build(child_)
+        self.set_Security_Type(obj_)
+    def buildChild_Window_Title(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Window_Title(obj_)
+    def buildChild_Thread(self, child_, node, nodeName_):
+        obj_ = win_thread_object.WindowsThreadObjectType.factory()
+        obj_.build(child_)
+        self.Thread.append(obj_)
 # end class WindowsProcessObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_handle_object
 
@@ -90,22 +92,25 @@ class RegistryValueType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Data':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Data(obj_)
-        elif nodeName_ == 'Datatype':
-            obj_ = RegistryDatatypeType.factory()
-            obj_.build(child_)
-            self.set_Datatype(obj_)
-        elif nodeName_ == 'Byte_Runs':
-            obj_ = cybox_common.ByteRunsType.factory()
-            obj_.build(child_)
-            self.set_Byte_Runs(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Data(obj_)
+    def buildChild_Datatype(self, child_, node, nodeName_):
+        obj_ = RegistryDatatypeType.factory()
+        obj_.build(child_)
+        self.set_Datatype(obj_)
+    def buildChild_Byte_Runs(self, child_, node, nodeName_):
+        obj_ = cybox_common.ByteRunsType.factory()
+        obj_.build(child_)
+        self.set_Byte_Runs(obj_)
 # end class RegistryValueType
 
 class RegistryValuesType(GeneratedsSuper):
@@ -171,10 +176,13 @@ class RegistryValuesType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Value':
-            obj_ = RegistryValueType.factory()
-            obj_.build(child_)
-            self.Value.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Value(self, child_, node, nodeName_):
+        obj_ = RegistryValueType.factory()
+        obj_.build(child_)
+        self.Value.append(obj_)
 # end class RegistryValuesType
 
 class RegistrySubkeysType(GeneratedsSuper):
@@ -240,10 +248,13 @@ class RegistrySubkeysType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Subkey':
-            obj_ = WindowsRegistryKeyObjectType.factory()
-            obj_.build(child_)
-            self.Subkey.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Subkey(self, child_, node, nodeName_):
+        obj_ = WindowsRegistryKeyObjectType.factory()
+        obj_.build(child_)
+        self.Subkey.append(obj_)
 # end class RegistrySubkeysType
 
 class RegistryHiveType(cybox_common.BaseObjectPropertyType):
@@ -521,47 +532,49 @@ class WindowsRegistryKeyObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsRegistryKeyObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Key':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Key(obj_)
-        elif nodeName_ == 'Hive':
-            obj_ = RegistryHiveType.factory()
-            obj_.build(child_)
-            self.set_Hive(obj_)
-        elif nodeName_ == 'Number_Values':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Values(obj_)
-        elif nodeName_ == 'Values':
-            obj_ = RegistryValuesType.factory()
-            obj_.build(child_)
-            self.set_Values(obj_)
-        elif nodeName_ == 'Modified_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Modified_Time(obj_)
-        elif nodeName_ == 'Creator_Username':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creator_Username(obj_)
-        elif nodeName_ == 'Handle_List':
-            obj_ = win_handle_object.WindowsHandleListType.factory()
-            obj_.build(child_)
-            self.set_Handle_List(obj_)
-        elif nodeName_ == 'Number_Subkeys':
-            obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Number_Subkeys(obj_)
-        elif nodeName_ == 'Subkeys':
-            obj_ = RegistrySubkeysType.factory()
-            obj_.build(child_)
-            self.set_Subkeys(obj_)
-        elif nodeName_ == 'Byte_Runs':
-            obj_ = cybox_common.ByteRunsType.factory()
-            obj_.build(child_)
-            self.set_Byte_Runs(obj_)
-        super(WindowsRegistryKeyObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Key(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Key(obj_)
+    def buildChild_Hive(self, child_, node, nodeName_):
+        obj_ = RegistryHiveType.factory()
+        obj_.build(child_)
+        self.set_Hive(obj_)
+    def buildChild_Number_Values(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Values(obj_)
+    def buildChild_Values(self, child_, node, nodeName_):
+        obj_ = RegistryValuesType.factory()
+        obj_.build(child_)
+        self.set_Values(obj_)
+    def buildChild_Modified_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Modified_Time(obj_)
+    def buildChild_Creator_Username(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creator_Username(obj_)
+    def buildChild_Handle_List(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleListType.factory()
+        obj_.build(child_)
+        self.set_Handle_List(obj_)
+    def buildChild_Number_Subkeys(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Number_Subkeys(obj_)
+    def buildChild_Subkeys(self, child_, node, nodeName_):
+        obj_ = RegistrySubkeysType.factory()
+        obj_.build(child_)
+        self.set_Subkeys(obj_)
+    def buildChild_Byte_Runs(self, child_, node, nodeName_):
+        obj_ = cybox_common.ByteRunsType.factory()
+        obj_.build(child_)
+        self.set_Byte_Runs(obj_)
 # end class WindowsRegistryKeyObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import win_process_object
 
@@ -73,10 +75,13 @@ class ServiceDescriptionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Description.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Description.append(obj_)
 # end class ServiceDescriptionListType
 
 class ServiceType(cybox_common.BaseObjectPropertyType):
@@ -484,63 +489,65 @@ class WindowsServiceObjectType(win_process_object.WindowsProcessObjectType):
                 raise_parse_error(node, 'Bad boolean attribute')
         super(WindowsServiceObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Description_List':
-            obj_ = ServiceDescriptionListType.factory()
-            obj_.build(child_)
-            self.set_Description_List(obj_)
-        elif nodeName_ == 'Display_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Display_Name(obj_)
-        elif nodeName_ == 'Group_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Group_Name(obj_)
-        elif nodeName_ == 'Service_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_Name(obj_)
-        elif nodeName_ == 'Service_DLL':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_DLL(obj_)
-        elif nodeName_ == 'Service_DLL_Certificate_Issuer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_DLL_Certificate_Issuer(obj_)
-        elif nodeName_ == 'Service_DLL_Certificate_Subject':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_DLL_Certificate_Subject(obj_)
-        elif nodeName_ == 'Service_DLL_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Service_DLL_Hashes(obj_)
-        elif nodeName_ == 'Service_DLL_Signature_Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Service_DLL_Signature_Description(obj_)
-        elif nodeName_ == 'Startup_Command_Line':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Startup_Command_Line(obj_)
-        elif nodeName_ == 'Startup_Type':
-            obj_ = ServiceModeType.factory()
-            obj_.build(child_)
-            self.set_Startup_Type(obj_)
-        elif nodeName_ == 'Service_Status':
-            obj_ = ServiceStatusType.factory()
-            obj_.build(child_)
-            self.set_Service_Status(obj_)
-        elif nodeName_ == 'Service_Type':
-            obj_ = ServiceType.factory()
-            obj_.build(child_)
-            self.set_Service_Type(obj_)
-        elif nodeName_ == 'Started_As':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Started_As(obj_)
-        super(WindowsServiceObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Description_List(self, child_, node, nodeName_):
+        obj_ = ServiceDescriptionListType.factory()
+        obj_.build(child_)
+        self.set_Description_List(obj_)
+    def buildChild_Display_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Display_Name(obj_)
+    def buildChild_Group_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Group_Name(obj_)
+    def buildChild_Service_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_Name(obj_)
+    def buildChild_Service_DLL(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_DLL(obj_)
+    def buildChild_Service_DLL_Certificate_Issuer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_DLL_Certificate_Issuer(obj_)
+    def buildChild_Service_DLL_Certificate_Subject(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_DLL_Certificate_Subject(obj_)
+    def buildChild_Service_DLL_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Service_DLL_Hashes(obj_)
+    def buildChild_Service_DLL_Signature_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Service_DLL_Signature_Description(obj_)
+    def buildChild_Startup_Command_Line(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Startup_Command_Line(obj_)
+    def buildChild_Startup_Type(self, child_, node, nodeName_):
+        obj_ = ServiceModeType.factory()
+        obj_.build(child_)
+        self.set_Startup_Type(obj_)
+    def buildChild_Service_Status(self, child_, node, nodeName_):
+        obj_ = ServiceStatusType.factory()
+        obj_.build(child_)
+        self.set_Service_Status(obj_)
+    def buildChild_Service_Type(self, child_, node, nodeName_):
+        obj_ = ServiceType.factory()
+        obj_.build(child_)
+        self.set_Service_Type(obj_)
+    def buildChild_Started_As(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Started_As(obj_)
 # end class WindowsServiceObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import system_object
 from . import win_handle_object
@@ -72,10 +74,13 @@ class GlobalFlagListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Global_Flag':
-            obj_ = GlobalFlagType.factory()
-            obj_.build(child_)
-            self.Global_Flag.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Global_Flag(self, child_, node, nodeName_):
+        obj_ = GlobalFlagType.factory()
+        obj_.build(child_)
+        self.Global_Flag.append(obj_)
 # end class GlobalFlagListType
 
 class GlobalFlagType(GeneratedsSuper):
@@ -160,22 +165,25 @@ class GlobalFlagType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Abbreviation':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Abbreviation(obj_)
-        elif nodeName_ == 'Destination':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Destination(obj_)
-        elif nodeName_ == 'Hexadecimal_Value':
-            obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Hexadecimal_Value(obj_)
-        elif nodeName_ == 'Symbolic_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Symbolic_Name(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Abbreviation(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Abbreviation(obj_)
+    def buildChild_Destination(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Destination(obj_)
+    def buildChild_Hexadecimal_Value(self, child_, node, nodeName_):
+        obj_ = cybox_common.HexBinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Hexadecimal_Value(obj_)
+    def buildChild_Symbolic_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Symbolic_Name(obj_)
 # end class GlobalFlagType
 
 class WindowsSystemObjectType(system_object.SystemObjectType):
@@ -307,51 +315,53 @@ class WindowsSystemObjectType(system_object.SystemObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsSystemObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Domain':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Domain.append(obj_)
-        elif nodeName_ == 'Global_Flag_List':
-            obj_ = GlobalFlagListType.factory()
-            obj_.build(child_)
-            self.set_Global_Flag_List(obj_)
-        elif nodeName_ == 'NetBIOS_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_NetBIOS_Name(obj_)
-        elif nodeName_ == 'Open_Handle_List':
-            obj_ = win_handle_object.WindowsHandleListType.factory()
-            obj_.build(child_)
-            self.set_Open_Handle_List(obj_)
-        elif nodeName_ == 'Product_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Product_ID(obj_)
-        elif nodeName_ == 'Product_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Product_Name(obj_)
-        elif nodeName_ == 'Registered_Organization':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Registered_Organization(obj_)
-        elif nodeName_ == 'Registered_Owner':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Registered_Owner(obj_)
-        elif nodeName_ == 'Windows_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Windows_Directory(obj_)
-        elif nodeName_ == 'Windows_System_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Windows_System_Directory(obj_)
-        elif nodeName_ == 'Windows_Temp_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Windows_Temp_Directory(obj_)
-        super(WindowsSystemObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Domain(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Domain.append(obj_)
+    def buildChild_Global_Flag_List(self, child_, node, nodeName_):
+        obj_ = GlobalFlagListType.factory()
+        obj_.build(child_)
+        self.set_Global_Flag_List(obj_)
+    def buildChild_NetBIOS_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_NetBIOS_Name(obj_)
+    def buildChild_Open_Handle_List(self, child_, node, nodeName_):
+        obj_ = win_handle_object.WindowsHandleListType.factory()
+        obj_.build(child_)
+        self.set_Open_Handle_List(obj_)
+    def buildChild_Product_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Product_ID(obj_)
+    def buildChild_Product_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Product_Name(obj_)
+    def buildChild_Registered_Organization(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Registered_Organization(obj_)
+    def buildChild_Registered_Owner(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Registered_Owner(obj_)
+    def buildChild_Windows_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Windows_Directory(obj_)
+    def buildChild_Windows_System_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Windows_System_Directory(obj_)
+    def buildChild_Windows_Temp_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Windows_Temp_Directory(obj_)
 # end class WindowsSystemObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -71,10 +73,13 @@ class HiveListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Hive':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.Hive.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Hive(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.Hive.append(obj_)
 # end class HiveListType
 
 class ChangeLogEntryTypeType(cybox_common.BaseObjectPropertyType):
@@ -332,83 +337,85 @@ class WindowsSystemRestoreObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsSystemRestoreObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Restore_Point_Description':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Restore_Point_Description(obj_)
-        elif nodeName_ == 'Restore_Point_Full_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Restore_Point_Full_Path(obj_)
-        elif nodeName_ == 'Restore_Point_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Restore_Point_Name(obj_)
-        elif nodeName_ == 'Restore_Point_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Restore_Point_Type(obj_)
-        elif nodeName_ == 'ACL_Change_SID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ACL_Change_SID(obj_)
-        elif nodeName_ == 'ACL_Change_Username':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ACL_Change_Username(obj_)
-        elif nodeName_ == 'Backup_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Backup_File_Name(obj_)
-        elif nodeName_ == 'Change_Event':
-            obj_ = ChangeLogEntryTypeType.factory()
-            obj_.build(child_)
-            self.set_Change_Event(obj_)
-        elif nodeName_ == 'ChangeLog_Entry_Flags':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ChangeLog_Entry_Flags(obj_)
-        elif nodeName_ == 'ChangeLog_Entry_Sequence_Number':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_ChangeLog_Entry_Sequence_Number(obj_)
-        elif nodeName_ == 'ChangeLog_Entry_Type':
-            obj_ = ChangeLogEntryTypeType.factory()
-            obj_.build(child_)
-            self.set_ChangeLog_Entry_Type(obj_)
-        elif nodeName_ == 'Change_Log_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Change_Log_File_Name(obj_)
-        elif nodeName_ == 'Created':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Created(obj_)
-        elif nodeName_ == 'File_Attributes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_File_Attributes(obj_)
-        elif nodeName_ == 'New_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_New_File_Name(obj_)
-        elif nodeName_ == 'Original_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Original_File_Name(obj_)
-        elif nodeName_ == 'Original_Short_File_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Original_Short_File_Name(obj_)
-        elif nodeName_ == 'Process_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Process_Name(obj_)
-        elif nodeName_ == 'Registry_Hive_List':
-            obj_ = HiveListType.factory()
-            obj_.build(child_)
-            self.set_Registry_Hive_List(obj_)
-        super(WindowsSystemRestoreObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Restore_Point_Description(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Restore_Point_Description(obj_)
+    def buildChild_Restore_Point_Full_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Restore_Point_Full_Path(obj_)
+    def buildChild_Restore_Point_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Restore_Point_Name(obj_)
+    def buildChild_Restore_Point_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Restore_Point_Type(obj_)
+    def buildChild_ACL_Change_SID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ACL_Change_SID(obj_)
+    def buildChild_ACL_Change_Username(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ACL_Change_Username(obj_)
+    def buildChild_Backup_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Backup_File_Name(obj_)
+    def buildChild_Change_Event(self, child_, node, nodeName_):
+        obj_ = ChangeLogEntryTypeType.factory()
+        obj_.build(child_)
+        self.set_Change_Event(obj_)
+    def buildChild_ChangeLog_Entry_Flags(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ChangeLog_Entry_Flags(obj_)
+    def buildChild_ChangeLog_Entry_Sequence_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_ChangeLog_Entry_Sequence_Number(obj_)
+    def buildChild_ChangeLog_Entry_Type(self, child_, node, nodeName_):
+        obj_ = ChangeLogEntryTypeType.factory()
+        obj_.build(child_)
+        self.set_ChangeLog_Entry_Type(obj_)
+    def buildChild_Change_Log_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Change_Log_File_Name(obj_)
+    def buildChild_Created(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Created(obj_)
+    def buildChild_File_Attributes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_File_Attributes(obj_)
+    def buildChild_New_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_New_File_Name(obj_)
+    def buildChild_Original_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Original_File_Name(obj_)
+    def buildChild_Original_Short_File_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Original_Short_File_Name(obj_)
+    def buildChild_Process_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Process_Name(obj_)
+    def buildChild_Registry_Hive_List(self, child_, node, nodeName_):
+        obj_ = HiveListType.factory()
+        obj_.build(child_)
+        self.set_Registry_Hive_List(obj_)
 # end class WindowsSystemRestoreObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import email_message_object
 
@@ -71,10 +73,13 @@ class TriggerListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Trigger':
-            obj_ = TriggerType.factory()
-            obj_.build(child_)
-            self.Trigger.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Trigger(self, child_, node, nodeName_):
+        obj_ = TriggerType.factory()
+        obj_.build(child_)
+        self.Trigger.append(obj_)
 # end class TriggerListType
 
 class TriggerType(GeneratedsSuper):
@@ -198,34 +203,37 @@ class TriggerType(GeneratedsSuper):
             else:
                 raise_parse_error(node, 'Bad boolean attribute')
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Trigger_Begin':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Begin(obj_)
-        elif nodeName_ == 'Trigger_Delay':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Delay(obj_)
-        elif nodeName_ == 'Trigger_End':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_End(obj_)
-        elif nodeName_ == 'Trigger_Frequency':
-            obj_ = TaskTriggerFrequencyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Frequency(obj_)
-        elif nodeName_ == 'Trigger_Max_Run_Time':
-            obj_ = cybox_common.DurationObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Max_Run_Time(obj_)
-        elif nodeName_ == 'Trigger_Session_Change_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Session_Change_Type(obj_)
-        elif nodeName_ == 'Trigger_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Trigger_Type(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Trigger_Begin(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Begin(obj_)
+    def buildChild_Trigger_Delay(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Delay(obj_)
+    def buildChild_Trigger_End(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_End(obj_)
+    def buildChild_Trigger_Frequency(self, child_, node, nodeName_):
+        obj_ = TaskTriggerFrequencyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Frequency(obj_)
+    def buildChild_Trigger_Max_Run_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DurationObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Max_Run_Time(obj_)
+    def buildChild_Trigger_Session_Change_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Session_Change_Type(obj_)
+    def buildChild_Trigger_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Trigger_Type(obj_)
 # end class TriggerType
 
 class TaskActionListType(GeneratedsSuper):
@@ -290,10 +298,13 @@ class TaskActionListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action':
-            obj_ = TaskActionType.factory()
-            obj_.build(child_)
-            self.Action.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action(self, child_, node, nodeName_):
+        obj_ = TaskActionType.factory()
+        obj_.build(child_)
+        self.Action.append(obj_)
 # end class TaskActionListType
 
 class TaskActionType(GeneratedsSuper):
@@ -389,30 +400,33 @@ class TaskActionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Action_Type':
-            obj_ = TaskActionTypeType.factory()
-            obj_.build(child_)
-            self.set_Action_Type(obj_)
-        elif nodeName_ == 'Action_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Action_ID(obj_)
-        elif nodeName_ == 'IEmailAction':
-            obj_ = email_message_object.EmailMessageObjectType.factory()
-            obj_.build(child_)
-            self.set_IEmailAction(obj_)
-        elif nodeName_ == 'IComHandlerAction':
-            obj_ = IComHandlerActionType.factory()
-            obj_.build(child_)
-            self.set_IComHandlerAction(obj_)
-        elif nodeName_ == 'IExecAction':
-            obj_ = IExecActionType.factory()
-            obj_.build(child_)
-            self.set_IExecAction(obj_)
-        elif nodeName_ == 'IShowMessageAction':
-            obj_ = IShowMessageActionType.factory()
-            obj_.build(child_)
-            self.set_IShowMessageAction(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Action_Type(self, child_, node, nodeName_):
+        obj_ = TaskActionTypeType.factory()
+        obj_.build(child_)
+        self.set_Action_Type(obj_)
+    def buildChild_Action_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Action_ID(obj_)
+    def buildChild_IEmailAction(self, child_, node, nodeName_):
+        obj_ = email_message_object.EmailMessageObjectType.factory()
+        obj_.build(child_)
+        self.set_IEmailAction(obj_)
+    def buildChild_IComHandlerAction(self, child_, node, nodeName_):
+        obj_ = IComHandlerActionType.factory()
+        obj_.build(child_)
+        self.set_IComHandlerAction(obj_)
+    def buildChild_IExecAction(self, child_, node, nodeName_):
+        obj_ = IExecActionType.factory()
+        obj_.build(child_)
+        self.set_IExecAction(obj_)
+    def buildChild_IShowMessageAction(self, child_, node, nodeName_):
+        obj_ = IShowMessageActionType.factory()
+        obj_.build(child_)
+        self.set_IShowMessageAction(obj_)
 # end class TaskActionType
 
 class IComHandlerActionType(GeneratedsSuper):
@@ -481,14 +495,17 @@ class IComHandlerActionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'COM_Data':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_COM_Data(obj_)
-        elif nodeName_ == 'COM_Class_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_COM_Class_ID(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_COM_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_COM_Data(obj_)
+    def buildChild_COM_Class_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_COM_Class_ID(obj_)
 # end class IComHandlerActionType
 
 class IExecActionType(GeneratedsSuper):
@@ -569,22 +586,25 @@ class IExecActionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Exec_Arguments':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exec_Arguments(obj_)
-        elif nodeName_ == 'Exec_Program_Path':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exec_Program_Path(obj_)
-        elif nodeName_ == 'Exec_Working_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exec_Working_Directory(obj_)
-        elif nodeName_ == 'Exec_Program_Hashes':
-            obj_ = cybox_common.HashListType.factory()
-            obj_.build(child_)
-            self.set_Exec_Program_Hashes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Exec_Arguments(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exec_Arguments(obj_)
+    def buildChild_Exec_Program_Path(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exec_Program_Path(obj_)
+    def buildChild_Exec_Working_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exec_Working_Directory(obj_)
+    def buildChild_Exec_Program_Hashes(self, child_, node, nodeName_):
+        obj_ = cybox_common.HashListType.factory()
+        obj_.build(child_)
+        self.set_Exec_Program_Hashes(obj_)
 # end class IExecActionType
 
 class IShowMessageActionType(GeneratedsSuper):
@@ -653,14 +673,17 @@ class IShowMessageActionType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Show_Message_Body':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Show_Message_Body(obj_)
-        elif nodeName_ == 'Show_Message_Title':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Show_Message_Title(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Show_Message_Body(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Show_Message_Body(obj_)
+    def buildChild_Show_Message_Title(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Show_Message_Title(obj_)
 # end class IShowMessageActionType
 
 class TaskStatusType(cybox_common.BaseObjectPropertyType):
@@ -1306,87 +1329,89 @@ class WindowsTaskObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsTaskObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Status':
-            obj_ = TaskStatusType.factory()
-            obj_.build(child_)
-            self.set_Status(obj_)
-        elif nodeName_ == 'Priority':
-            obj_ = TaskPriorityType.factory()
-            obj_.build(child_)
-            self.set_Priority(obj_)
-        elif nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        elif nodeName_ == 'Application_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Application_Name(obj_)
-        elif nodeName_ == 'Parameters':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Parameters(obj_)
-        elif nodeName_ == 'Flags':
-            obj_ = TaskFlagType.factory()
-            obj_.build(child_)
-            self.set_Flags(obj_)
-        elif nodeName_ == 'Account_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Account_Name(obj_)
-        elif nodeName_ == 'Account_Run_Level':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Account_Run_Level(obj_)
-        elif nodeName_ == 'Account_Logon_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Account_Logon_Type(obj_)
-        elif nodeName_ == 'Creator':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creator(obj_)
-        elif nodeName_ == 'Creation_Date':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Creation_Date(obj_)
-        elif nodeName_ == 'Most_Recent_Run_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Most_Recent_Run_Time(obj_)
-        elif nodeName_ == 'Exit_Code':
-            obj_ = cybox_common.LongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exit_Code(obj_)
-        elif nodeName_ == 'Max_Run_Time':
-            obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Max_Run_Time(obj_)
-        elif nodeName_ == 'Next_Run_Time':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Next_Run_Time(obj_)
-        elif nodeName_ == 'Action_List':
-            obj_ = TaskActionListType.factory()
-            obj_.build(child_)
-            self.set_Action_List(obj_)
-        elif nodeName_ == 'Trigger_List':
-            obj_ = TriggerListType.factory()
-            obj_.build(child_)
-            self.set_Trigger_List(obj_)
-        elif nodeName_ == 'Comment':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Comment(obj_)
-        elif nodeName_ == 'Working_Directory':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Working_Directory(obj_)
-        elif nodeName_ == 'Work_Item_Data':
-            obj_ = cybox_common.Base64BinaryObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Work_Item_Data(obj_)
-        super(WindowsTaskObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Status(self, child_, node, nodeName_):
+        obj_ = TaskStatusType.factory()
+        obj_.build(child_)
+        self.set_Status(obj_)
+    def buildChild_Priority(self, child_, node, nodeName_):
+        obj_ = TaskPriorityType.factory()
+        obj_.build(child_)
+        self.set_Priority(obj_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
+    def buildChild_Application_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Application_Name(obj_)
+    def buildChild_Parameters(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Parameters(obj_)
+    def buildChild_Flags(self, child_, node, nodeName_):
+        obj_ = TaskFlagType.factory()
+        obj_.build(child_)
+        self.set_Flags(obj_)
+    def buildChild_Account_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Account_Name(obj_)
+    def buildChild_Account_Run_Level(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Account_Run_Level(obj_)
+    def buildChild_Account_Logon_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Account_Logon_Type(obj_)
+    def buildChild_Creator(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creator(obj_)
+    def buildChild_Creation_Date(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Creation_Date(obj_)
+    def buildChild_Most_Recent_Run_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Most_Recent_Run_Time(obj_)
+    def buildChild_Exit_Code(self, child_, node, nodeName_):
+        obj_ = cybox_common.LongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exit_Code(obj_)
+    def buildChild_Max_Run_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.UnsignedLongObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Max_Run_Time(obj_)
+    def buildChild_Next_Run_Time(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Next_Run_Time(obj_)
+    def buildChild_Action_List(self, child_, node, nodeName_):
+        obj_ = TaskActionListType.factory()
+        obj_.build(child_)
+        self.set_Action_List(obj_)
+    def buildChild_Trigger_List(self, child_, node, nodeName_):
+        obj_ = TriggerListType.factory()
+        obj_.build(child_)
+        self.set_Trigger_List(obj_)
+    def buildChild_Comment(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Comment(obj_)
+    def buildChild_Working_Directory(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Working_Directory(obj_)
+    def buildChild_Work_Item_Data(self, child_, node, nodeName_):
+        obj_ = cybox_common.Base64BinaryObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Work_Item_Data(obj_)
 # end class WindowsTaskObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import user_account_object
 
@@ -83,11 +85,13 @@ class WindowsPrivilegeType(user_account_object.PrivilegeType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsPrivilegeType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'User_Right':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_User_Right(obj_)
-        super(WindowsPrivilegeType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_User_Right(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_User_Right(obj_)
 # end class WindowsPrivilegeType
 
 class WindowsGroupType(user_account_object.GroupType):
@@ -161,11 +165,13 @@ class WindowsGroupType(user_account_object.GroupType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsGroupType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name(obj_)
-        super(WindowsGroupType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name(obj_)
 # end class WindowsGroupType
 
 class WindowsUserAccountObjectType(user_account_object.UserAccountObjectType):
@@ -241,15 +247,17 @@ class WindowsUserAccountObjectType(user_account_object.UserAccountObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsUserAccountObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Security_ID':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Security_ID(obj_)
-        elif nodeName_ == 'Security_Type':
-            obj_ = cybox_common.SIDType.factory()
-            obj_.build(child_)
-            self.set_Security_Type(obj_)
-        super(WindowsUserAccountObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Security_ID(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Security_ID(obj_)
+    def buildChild_Security_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.SIDType.factory()
+        obj_.build(child_)
+        self.set_Security_Type(obj_)
 # end class WindowsUserAccountObjectType
 
 GDSClassesMapping = {
@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 from . import volume_object
 
@@ -73,10 +75,13 @@ class WindowsVolumeAttributesListType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Attribute':
-            obj_ = WindowsVolumeAttributeType.factory()
-            obj_.build(child_)
-            self.Attribute.append(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Attribute(self, child_, node, nodeName_):
+        obj_ = WindowsVolumeAttributeType.factory()
+        obj_.build(child_)
+        self.Attribute.append(obj_)
 # end class WindowsVolumeAttributesListType
 
 class WindowsVolumeAttributeType(cybox_common.BaseObjectPropertyType):
@@ -307,19 +312,21 @@ class WindowsVolumeObjectType(volume_object.VolumeObjectType):
     def buildAttributes(self, node, attrs, already_processed):
         super(WindowsVolumeObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Attributes_List':
-            obj_ = WindowsVolumeAttributesListType.factory()
-            obj_.build(child_)
-            self.set_Attributes_List(obj_)
-        elif nodeName_ == 'Drive_Letter':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Drive_Letter(obj_)
-        elif nodeName_ == 'Drive_Type':
-            obj_ = WindowsDriveType.factory()
-            obj_.build(child_)
-            self.set_Drive_Type(obj_)
-        super(WindowsVolumeObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Attributes_List(self, child_, node, nodeName_):
+        obj_ = WindowsVolumeAttributesListType.factory()
+        obj_.build(child_)
+        self.set_Attributes_List(obj_)
+    def buildChild_Drive_Letter(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Drive_Letter(obj_)
+    def buildChild_Drive_Type(self, child_, node, nodeName_):
+        obj_ = WindowsDriveType.factory()
+        obj_.build(child_)
+        self.set_Drive_Type(obj_)
 # end class WindowsVolumeObjectType
 
 GDSClassesMapping = {
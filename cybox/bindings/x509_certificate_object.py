@@ -4,6 +4,8 @@
 import sys
 
 from mixbox.binding_utils import *
+from . import child_builders
+from . import quote_attrib, quote_xml, showIndent
 from . import cybox_common
 
 
@@ -120,42 +122,45 @@ class X509CertificateContentsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Version':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Version(obj_)
-        elif nodeName_ == 'Serial_Number':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Serial_Number(obj_)
-        elif nodeName_ == 'Signature_Algorithm':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature_Algorithm(obj_)
-        elif nodeName_ == 'Issuer':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Issuer(obj_)
-        elif nodeName_ == 'Validity':
-            obj_ = ValidityType.factory()
-            obj_.build(child_)
-            self.set_Validity(obj_)
-        elif nodeName_ == 'Subject':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject(obj_)
-        elif nodeName_ == 'Subject_Public_Key':
-            obj_ = SubjectPublicKeyType.factory()
-            obj_.build(child_)
-            self.set_Subject_Public_Key(obj_)
-        elif nodeName_ == 'Standard_Extensions':
-            obj_ = X509V3ExtensionsType.factory()
-            obj_.build(child_)
-            self.set_Standard_Extensions(obj_)
-        elif nodeName_ == 'Non_Standard_Extensions':
-            obj_ = X509NonStandardExtensionsType.factory()
-            obj_.build(child_)
-            self.set_Non_Standard_Extensions(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Version(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Version(obj_)
+    def buildChild_Serial_Number(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Serial_Number(obj_)
+    def buildChild_Signature_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature_Algorithm(obj_)
+    def buildChild_Issuer(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Issuer(obj_)
+    def buildChild_Validity(self, child_, node, nodeName_):
+        obj_ = ValidityType.factory()
+        obj_.build(child_)
+        self.set_Validity(obj_)
+    def buildChild_Subject(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject(obj_)
+    def buildChild_Subject_Public_Key(self, child_, node, nodeName_):
+        obj_ = SubjectPublicKeyType.factory()
+        obj_.build(child_)
+        self.set_Subject_Public_Key(obj_)
+    def buildChild_Standard_Extensions(self, child_, node, nodeName_):
+        obj_ = X509V3ExtensionsType.factory()
+        obj_.build(child_)
+        self.set_Standard_Extensions(obj_)
+    def buildChild_Non_Standard_Extensions(self, child_, node, nodeName_):
+        obj_ = X509NonStandardExtensionsType.factory()
+        obj_.build(child_)
+        self.set_Non_Standard_Extensions(obj_)
 # end class X509CertificateContentsType
 
 class X509CertificateSignatureType(GeneratedsSuper):
@@ -225,14 +230,17 @@ class X509CertificateSignatureType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Signature_Algorithm':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature_Algorithm(obj_)
-        elif nodeName_ == 'Signature':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Signature(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Signature_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature_Algorithm(obj_)
+    def buildChild_Signature(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Signature(obj_)
 # end class X509CertificateSignatureType
 
 class SubjectPublicKeyType(GeneratedsSuper):
@@ -302,14 +310,17 @@ class SubjectPublicKeyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Public_Key_Algorithm':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Public_Key_Algorithm(obj_)
-        elif nodeName_ == 'RSA_Public_Key':
-            obj_ = RSAPublicKeyType.factory()
-            obj_.build(child_)
-            self.set_RSA_Public_Key(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Public_Key_Algorithm(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Public_Key_Algorithm(obj_)
+    def buildChild_RSA_Public_Key(self, child_, node, nodeName_):
+        obj_ = RSAPublicKeyType.factory()
+        obj_.build(child_)
+        self.set_RSA_Public_Key(obj_)
 # end class SubjectPublicKeyType
 
 class ValidityType(GeneratedsSuper):
@@ -380,14 +391,17 @@ class ValidityType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Not_Before':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Not_Before(obj_)
-        elif nodeName_ == 'Not_After':
-            obj_ = cybox_common.DateTimeObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Not_After(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Not_Before(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Not_Before(obj_)
+    def buildChild_Not_After(self, child_, node, nodeName_):
+        obj_ = cybox_common.DateTimeObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Not_After(obj_)
 # end class ValidityType
 
 class RSAPublicKeyType(GeneratedsSuper):
@@ -459,14 +473,17 @@ class RSAPublicKeyType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Modulus':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Modulus(obj_)
-        elif nodeName_ == 'Exponent':
-            obj_ = cybox_common.IntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Exponent(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Modulus(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Modulus(obj_)
+    def buildChild_Exponent(self, child_, node, nodeName_):
+        obj_ = cybox_common.IntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Exponent(obj_)
 # end class RSAPublicKeyType
 
 class X509V3ExtensionsType(GeneratedsSuper):
@@ -618,66 +635,69 @@ class X509V3ExtensionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Basic_Constraints':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Basic_Constraints(obj_)
-        elif nodeName_ == 'Name_Constraints':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Name_Constraints(obj_)
-        elif nodeName_ == 'Policy_Constraints':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Policy_Constraints(obj_)
-        elif nodeName_ == 'Key_Usage':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Key_Usage(obj_)
-        elif nodeName_ == 'Extended_Key_Usage':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Extended_Key_Usage(obj_)
-        elif nodeName_ == 'Subject_Key_Identifier':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject_Key_Identifier(obj_)
-        elif nodeName_ == 'Authority_Key_Identifier':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Authority_Key_Identifier(obj_)
-        elif nodeName_ == 'Subject_Alternative_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject_Alternative_Name(obj_)
-        elif nodeName_ == 'Issuer_Alternative_Name':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Issuer_Alternative_Name(obj_)
-        elif nodeName_ == 'Subject_Directory_Attributes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Subject_Directory_Attributes(obj_)
-        elif nodeName_ == 'CRL_Distribution_Points':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_CRL_Distribution_Points(obj_)
-        elif nodeName_ == 'Inhibit_Any_Policy':
-            obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Inhibit_Any_Policy(obj_)
-        elif nodeName_ == 'Private_Key_Usage_Period':
-            obj_ = ValidityType.factory()
-            obj_.build(child_)
-            self.set_Private_Key_Usage_Period(obj_)
-        elif nodeName_ == 'Certificate_Policies':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Certificate_Policies(obj_)
-        elif nodeName_ == 'Policy_Mappings':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Policy_Mappings(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Basic_Constraints(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Basic_Constraints(obj_)
+    def buildChild_Name_Constraints(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Name_Constraints(obj_)
+    def buildChild_Policy_Constraints(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Policy_Constraints(obj_)
+    def buildChild_Key_Usage(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Key_Usage(obj_)
+    def buildChild_Extended_Key_Usage(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Extended_Key_Usage(obj_)
+    def buildChild_Subject_Key_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject_Key_Identifier(obj_)
+    def buildChild_Authority_Key_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Authority_Key_Identifier(obj_)
+    def buildChild_Subject_Alternative_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject_Alternative_Name(obj_)
+    def buildChild_Issuer_Alternative_Name(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Issuer_Alternative_Name(obj_)
+    def buildChild_Subject_Directory_Attributes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Subject_Directory_Attributes(obj_)
+    def buildChild_CRL_Distribution_Points(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_CRL_Distribution_Points(obj_)
+    def buildChild_Inhibit_Any_Policy(self, child_, node, nodeName_):
+        obj_ = cybox_common.NonNegativeIntegerObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Inhibit_Any_Policy(obj_)
+    def buildChild_Private_Key_Usage_Period(self, child_, node, nodeName_):
+        obj_ = ValidityType.factory()
+        obj_.build(child_)
+        self.set_Private_Key_Usage_Period(obj_)
+    def buildChild_Certificate_Policies(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Certificate_Policies(obj_)
+    def buildChild_Policy_Mappings(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Policy_Mappings(obj_)
 # end class X509V3ExtensionsType
 
 class X509NonStandardExtensionsType(GeneratedsSuper):
@@ -763,22 +783,25 @@ class X509NonStandardExtensionsType(GeneratedsSuper):
     def buildAttributes(self, node, attrs, already_processed):
         pass
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Netscape_Comment':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Netscape_Comment(obj_)
-        elif nodeName_ == 'Netscape_Certificate_Type':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Netscape_Certificate_Type(obj_)
-        elif nodeName_ == 'Old_Authority_Key_Identifier':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Old_Authority_Key_Identifier(obj_)
-        elif nodeName_ == 'Old_Primary_Key_Attributes':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Old_Primary_Key_Attributes(obj_)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Netscape_Comment(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Netscape_Comment(obj_)
+    def buildChild_Netscape_Certificate_Type(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Netscape_Certificate_Type(obj_)
+    def buildChild_Old_Authority_Key_Identifier(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Old_Authority_Key_Identifier(obj_)
+    def buildChild_Old_Primary_Key_Attributes(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Old_Primary_Key_Attributes(obj_)
 # end class X509NonStandardExtensionsType
 
 class X509CertificateObjectType(cybox_common.ObjectPropertiesType):
@@ -852,19 +875,21 @@ class X509CertificateObjectType(cybox_common.ObjectPropertiesType):
     def buildAttributes(self, node, attrs, already_processed):
         super(X509CertificateObjectType, self).buildAttributes(node, attrs, already_processed)
     def buildChildren(self, child_, node, nodeName_, fromsubclass_=False):
-        if nodeName_ == 'Certificate':
-            obj_ = X509CertificateContentsType.factory()
-            obj_.build(child_)
-            self.set_Certificate(obj_)
-        elif nodeName_ == 'Raw_Certificate':
-            obj_ = cybox_common.StringObjectPropertyType.factory()
-            obj_.build(child_)
-            self.set_Raw_Certificate(obj_)
-        elif nodeName_ == 'Certificate_Signature':
-            obj_ = X509CertificateSignatureType.factory()
-            obj_.build(child_)
-            self.set_Certificate_Signature(obj_)
-        super(X509CertificateObjectType, self).buildChildren(child_, node, nodeName_, True)
+        build_child_ = child_builders[self.__class__].get(nodeName_)
+        if build_child_ is not None:
+            build_child_(self, child_, node, nodeName_)
+    def buildChild_Certificate(self, child_, node, nodeName_):
+        obj_ = X509CertificateContentsType.factory()
+        obj_.build(child_)
+        self.set_Certificate(obj_)
+    def buildChild_Raw_Certificate(self, child_, node, nodeName_):
+        obj_ = cybox_common.StringObjectPropertyType.factory()
+        obj_.build(child_)
+        self.set_Raw_Certificate(obj_)
+    def buildChild_Certificate_Signature(self, child_, node, nodeName_):
+        obj_ = X509CertificateSignatureType.factory()
+        obj_.build(child_)
+        self.set_Certificate_Signature(obj_)
 # end class X509CertificateObjectType
 
 GDSClassesMapping = {
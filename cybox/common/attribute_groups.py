@@ -2,6 +2,7 @@
 # See LICENSE.txt for complete terms.
 
 from mixbox import fields
+from mixbox.vendor import six
 
 DEFAULT_DELIM = "##comma##"
 DEFAULT_APPLY_CONDITION = "ANY"
@@ -26,18 +27,30 @@ class PatternFieldGroup(object):
         self.delimiter = DEFAULT_DELIM
         self.apply_condition = DEFAULT_APPLY_CONDITION
 
+    # The values besides None each field can have in a "plain" entity.
+    # Subclasses extend this with their own fields.
+    _PLAIN_VALUES = {
+        "condition": (),
+        "apply_condition": (DEFAULT_APPLY_CONDITION,),
+        "bit_mask": (),
+        "pattern_type": (),
+        "regex_syntax": (),
+        "has_changed": (),
+        "trend": (),
+        "is_case_sensitive": (True,),
+        "delimiter": (DEFAULT_DELIM,),
+    }
+
     def is_plain(self):
-        return (
-            self.condition is None and
-            self.apply_condition in (None, DEFAULT_APPLY_CONDITION) and
-            self.bit_mask is None and
-            self.pattern_type is None and
-            self.regex_syntax is None and
-            self.has_changed is None and
-            self.trend is None and
-            self.is_case_sensitive in (None, True) and
-            self.delimiter in (None, DEFAULT_DELIM)
-        )
+        """Whether the entity can be represented as a single value."""
+        plain_values = _plain_values(self.__class__)
+
+        # Fields which were never set are None, which is always allowed.
+        for field, value in six.iteritems(self._fields):
+            if (value is not None and field in plain_values and
+                    value not in plain_values[field]):
+                return False
+        return True
 
     @staticmethod
     def _conditions_equal(first, second):
@@ -83,8 +96,8 @@ class PatternFieldGroup(object):
 
         return obj
 
-    def to_dict(self):
-        d = super(PatternFieldGroup, self).to_dict()
+    def _finalize_dict(self, d):
+        super(PatternFieldGroup, self)._finalize_dict(d)
 
         # Custom processing of these dictionary items. Unset them and re-add
         # if necessary.
@@ -99,8 +112,6 @@ class PatternFieldGroup(object):
         if self._apply_condition_dict_value():
             d["apply_condition"] = self._apply_condition_dict_value()
 
-        return d
-
     @classmethod
     def from_obj(cls, cls_obj):
         if not cls_obj:
@@ -123,4 +134,22 @@ class PatternFieldGroup(object):
         obj.delimiter = cls_dict.get('delimiter', DEFAULT_DELIM)
         obj.apply_condition = cls_dict.get('apply_condition', DEFAULT_APPLY_CONDITION)
 
-        return obj
\ No newline at end of file
+        return obj
+
+# Maps PatternFieldGroup subclasses to their _PLAIN_VALUES, keyed by the
+# TypedFields of the subclass rather than their attribute names.
+_plain_values_cache = {}
+
+
+def _plain_values(klass):
+    try:
+        return _plain_values_cache[klass]
+    except KeyError:
+        pass
+
+    plain_values = dict(
+        (getattr(klass, name), values)
+        for name, values in six.iteritems(klass._PLAIN_VALUES)
+    )
+    _plain_values_cache[klass] = plain_values
+    return plain_values
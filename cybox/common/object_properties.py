@@ -6,6 +6,13 @@ from mixbox import fields
 
 import cybox.bindings.cybox_common as common_binding
 import cybox.objects
+from cybox.utils.binary import BinaryMixin
+from cybox.utils.dictconv import FastDictMixin
+from cybox.utils.jsonio import JSONMixin
+from cybox.utils.typecache import type_cache
+from cybox.utils.lazy import LazyEntityMixin
+from cybox.utils.treebuilder import ElementTreeMixin
+from cybox.utils.xmlexport import XMLExportMixin
 
 from .properties import String
 
@@ -47,10 +54,12 @@ class ObjectPropertiesFactory(entities.EntityFactory):
     def entity_class(cls, key):
         if not key:
             raise ValueError("Must provide an xsi:type key for ObjectProperties.")
-        return cybox.objects.get_class_for_object_type(key)
+        return type_cache.api_class(key)
 
 
-class ObjectProperties(entities.Entity):
+class ObjectProperties(ElementTreeMixin, LazyEntityMixin, XMLExportMixin,
+                       FastDictMixin, JSONMixin, BinaryMixin,
+                       entities.Entity):
     """The Cybox ObjectProperties base class."""
     _XSI_TYPE = None
     _XSI_NS   = None
@@ -91,10 +100,8 @@ class ObjectProperties(entities.Entity):
 
         return obj
 
-    def to_dict(self):
-        d = super(ObjectProperties, self).to_dict()
+    def _finalize_dict(self, d):
+        super(ObjectProperties, self)._finalize_dict(d)
 
         if self._XSI_TYPE:
             d['xsi:type'] = self._XSI_TYPE
-
-        return d
@@ -9,6 +9,7 @@ from cybox.common.attribute_groups import PatternFieldGroup
 from cybox.common.datetimewithprecision import (validate_date_precision,
     validate_time_precision, validate_datetime_precision)
 from cybox.utils import normalize_to_xml, denormalize_from_xml
+from cybox.utils.dictconv import FastDictMixin
 
 DATE_PRECISION_VALUES = ("year", "month", "day")
 TIME_PRECISION_VALUES = ("hour", "minute", "second")
@@ -55,7 +56,7 @@ class ListLongField(ListFieldMixin, fields.LongField): pass
 
 
 @six.python_2_unicode_compatible
-class BaseProperty(PatternFieldGroup, entities.Entity):
+class BaseProperty(PatternFieldGroup, FastDictMixin, entities.Entity):
     __hash__ = entities.Entity.__hash__
 
     # Most Properties are defined in the "common" binding, so we'll just set
@@ -162,30 +163,24 @@ class BaseProperty(PatternFieldGroup, entities.Entity):
     def __ne__(self, other):
         return not self == other
 
-    def is_plain(self):
-        """Whether the Property can be represented as a single value.
-
-        The `datatype` can be inferred by the particular BaseProperty subclass,
-        so if `datatype` and `value` are the only non-None properties, the
-        BaseProperty can be represented by a single value rather than a
-        dictionary. This makes the JSON representation simpler without losing
-        any data fidelity.
-        """
-        return (
-            # ignore value
-            self.id_ is None and
-            self.idref is None and
-            # ignore datatype
-            self.appears_random is None and
-            self.is_obfuscated is None and
-            self.obfuscation_algorithm_ref is None and
-            self.is_defanged is None and
-            self.defanging_algorithm_ref is None and
-            self.refanging_transform_type is None and
-            self.refanging_transform is None and
-            self.observed_encoding is None and
-            super(BaseProperty, self).is_plain()
-        )
+    # The `datatype` can be inferred by the particular BaseProperty subclass,
+    # so if `datatype` and `value` are the only non-None properties, the
+    # BaseProperty can be represented by a single value rather than a
+    # dictionary. This makes the JSON representation simpler without losing
+    # any data fidelity.
+    _PLAIN_VALUES = dict(
+        PatternFieldGroup._PLAIN_VALUES,
+        id_=(),
+        idref=(),
+        appears_random=(),
+        is_obfuscated=(),
+        obfuscation_algorithm_ref=(),
+        is_defanged=(),
+        defanging_algorithm_ref=(),
+        refanging_transform_type=(),
+        refanging_transform=(),
+        observed_encoding=(),
+    )
 
     def __nonzero__(self):
         return (not self.is_plain()) or (self.value is not None)
@@ -210,8 +205,10 @@ class BaseProperty(PatternFieldGroup, entities.Entity):
     def to_dict(self):
         if self.is_plain():
             return self.serialized_value
+        return super(BaseProperty, self).to_dict()
 
-        attr_dict = super(BaseProperty, self).to_dict()
+    def _finalize_dict(self, attr_dict):
+        super(BaseProperty, self)._finalize_dict(attr_dict)
         attr_dict.pop("datatype", None)
 
         if self._datatype_serialized_value():
@@ -219,8 +216,6 @@ class BaseProperty(PatternFieldGroup, entities.Entity):
         if self.value is not None:
             attr_dict['value'] = self.serialized_value
 
-        return attr_dict
-
     @classmethod
     def from_obj(cls, cls_obj):
         # Use the subclass this was called on to initialize the object
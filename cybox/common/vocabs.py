@@ -12,6 +12,7 @@ from mixbox.vendor import six
 import cybox.bindings.cybox_common as common_binding
 from cybox.common import PatternFieldGroup
 from cybox.utils import normalize_to_xml, denormalize_from_xml
+from cybox.utils.dictconv import FastDictMixin
 
 
 def validate_value(instance, value):
@@ -84,7 +85,7 @@ class VocabField(fields.TypedField):
         return isinstance(value, VocabString)
 
 
-class VocabString(PatternFieldGroup, entities.Entity):
+class VocabString(PatternFieldGroup, FastDictMixin, entities.Entity):
     __hash__ = entities.Entity.__hash__
 
     _namespace = 'http://cybox.mitre.org/default_vocabularies-2'
@@ -18,3 +18,8 @@ from .event import Event, EventType
 from .pattern_fidelity import (PatternFidelity, ObfuscationTechniques,
                                ObfuscationTechnique)
 from .observable import Observable, Observables, ObservableComposition
+from .stream import (ObservablesHeader, ObservableStream, SkippedObservable,
+                     iter_observables)
+from .jsonstream import JSONObservableStream, iter_json_observables
+from .writer import ObservablesWriter
+from .offset_index import ObservablesIndex, build_index, load_object, load_observable
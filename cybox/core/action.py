@@ -11,19 +11,20 @@ import cybox.bindings.cybox_core as core_binding
 from cybox.common import StructuredText, MeasureSource
 from cybox.common.vocabs import VocabField
 from cybox.core import ActionReference, AssociatedObject, Frequency
+from cybox.utils.xmlexport import XMLExportMixin
 
 from cybox.common.vocabs import ActionName, ActionType
 from cybox.common.vocabs import ActionArgumentName as ArgumentName
 
 
-class ActionAliases(entities.EntityList):
+class ActionAliases(XMLExportMixin, entities.EntityList):
     _binding = core_binding
     _binding_class = core_binding.ActionAliasesType
     _namespace = 'http://cybox.mitre.org/cybox-2'
     action_alias = fields.TypedField("Action_Alias", cybox.Unicode, multiple=True)
 
 
-class ActionArgument(entities.Entity):
+class ActionArgument(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = core_binding.ActionArgumentType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -32,18 +33,18 @@ class ActionArgument(entities.Entity):
     argument_value = fields.TypedField("Argument_Value")
 
 
-class ActionArguments(entities.EntityList):
+class ActionArguments(XMLExportMixin, entities.EntityList):
     _binding_class = core_binding.ActionArgumentsType
     _namespace = 'http://cybox.mitre.org/cybox-2'
     action_argument = fields.TypedField("Action_Argument", ActionArgument, multiple=True)
 
 
-class AssociatedObjects(entities.EntityList):
+class AssociatedObjects(XMLExportMixin, entities.EntityList):
     _binding_class = core_binding.AssociatedObjectsType
     _namespace = 'http://cybox.mitre.org/cybox-2'
     associated_object = fields.TypedField("Associated_Object", AssociatedObject, multiple=True)
 
-class ActionRelationship(entities.Entity):
+class ActionRelationship(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = _binding.ActionRelationshipType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -52,14 +53,14 @@ class ActionRelationship(entities.Entity):
     action_references = fields.TypedField("Action_Reference", ActionReference, multiple=True)
 
 
-class ActionRelationships(entities.EntityList):
+class ActionRelationships(XMLExportMixin, entities.EntityList):
     _binding_class = core_binding.ActionRelationshipsType
     _binding_var = "Relationship"
     _contained_type = ActionRelationship
     _namespace = 'http://cybox.mitre.org/cybox-2'
     relationship = fields.TypedField("Relationship", ActionRelationship, multiple=True)
 
-class Action(entities.Entity):
+class Action(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = core_binding.ActionType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -81,7 +82,7 @@ class Action(entities.Entity):
     frequency = fields.TypedField("Frequency", Frequency)
 
 
-class Actions(entities.EntityList):
+class Actions(XMLExportMixin, entities.EntityList):
     _binding_class = core_binding.ActionsType
     _namespace = 'http://cybox.mitre.org/cybox-2'
     action = fields.TypedField("Action", Action, multiple=True)
\ No newline at end of file
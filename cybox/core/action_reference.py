@@ -7,9 +7,10 @@ from mixbox import entities
 from mixbox import fields
 
 import cybox.bindings.cybox_core as core_binding
+from cybox.utils.xmlexport import XMLExportMixin
 
 
-class ActionReference(entities.Entity):
+class ActionReference(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = core_binding.ActionReferenceType
     _namespace = 'http://cybox.mitre.org/cybox-2'
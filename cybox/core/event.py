@@ -8,9 +8,10 @@ import cybox.bindings.cybox_core as core_binding
 from cybox.common import StructuredText, MeasureSource
 from cybox.common.vocabs import EventType, VocabField
 from cybox.core import Actions, Frequency
+from cybox.utils.xmlexport import XMLExportMixin
 
 
-class Event(entities.Entity):
+class Event(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = core_binding.EventType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -5,9 +5,10 @@ from mixbox import entities
 from mixbox import fields
 
 import cybox.bindings.cybox_core as core_binding
+from cybox.utils.xmlexport import XMLExportMixin
 
 
-class Frequency(entities.Entity):
+class Frequency(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _binding_class = core_binding.FrequencyType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -0,0 +1,147 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Reading and writing Observables as JSON Lines.
+
+A JSON Lines document holds one ``Observable.to_dict()`` per line. It may
+start with a header line holding the rest of ``Observables.to_dict()``: the
+``major_version``, ``minor_version`` and ``update_version`` fields and the
+``observable_package_source``, if any.
+
+:func:`write_observables` and :func:`read_observables` handle one Observable
+at a time, so given a generator (or a file) they run in constant memory no
+matter how many Observables pass through them. JSON is encoded and decoded
+with a :mod:`cybox.utils.jsonio` backend.
+
+Example:
+    >>> with open("feed.jsonl", "wb") as f:  # doctest: +SKIP
+    ...     write_observables(iter_observables("feed.xml"), f, header=True)
+    >>> with open("feed.jsonl", "rb") as f:  # doctest: +SKIP
+    ...     for observable in read_observables(f):
+    ...         print(observable.id_)
+"""
+
+from cybox.common import MeasureSource
+from cybox.core import Observable, Observables
+from cybox.core.stream import ObservablesHeader
+from cybox.utils import jsonio
+from cybox.utils.caches import scoped
+
+# Keys found in the header line, and never in an Observable.
+_HEADER_KEYS = ("major_version", "minor_version", "update_version")
+
+
+def write_observables(observables, fileobj, header=False,
+                      observable_package_source=None, encoding="utf-8",
+                      backend=None):
+    """Write Observables to `fileobj`, one per line.
+
+    Args:
+        observables: An iterable of :class:`cybox.core.Observable`
+            instances, which is consumed one Observable at a time.
+        fileobj: A file-like object, opened in binary mode unless `encoding`
+            is ``None``. It is not closed.
+        header: Whether to start with a header line. A header is always
+            written if `observable_package_source` is given.
+        observable_package_source: A :class:`cybox.common.MeasureSource` to
+            write in the header line.
+        encoding: The output character encoding. If ``None``, unicode strings
+            are written to `fileobj`.
+        backend: The :mod:`cybox.utils.jsonio` backend (or its name) to
+            encode JSON with, or ``None`` for the default.
+
+    Returns:
+        The number of Observables written.
+    """
+    backend = jsonio.get_backend(backend)
+
+    def write(value):
+        line = backend.dumps(value) + "\n"
+        if encoding:
+            line = line.encode(encoding)
+        fileobj.write(line)
+
+    if header or observable_package_source is not None:
+        root = Observables()
+        root.observable_package_source = observable_package_source
+        write(root.to_dict())
+
+    count = 0
+    for observable in observables:
+        write(observable.to_dict())
+        count += 1
+    return count
+
+
+class ObservableLinesReader(object):
+    """An iterator over the Observables in a JSON Lines document.
+
+    Use :func:`read_observables` rather than creating this class directly.
+
+    Attributes:
+        header: An :class:`cybox.core.stream.ObservablesHeader`, read from
+            the header line of the document, if it has one, before the first
+            Observable is returned. Its ``namespaces`` are always empty.
+    """
+
+    def __init__(self, fileobj, backend=None, scope=None):
+        self.header = ObservablesHeader()
+        self._scope = scope
+        self._lines = iter(fileobj)
+        self._backend = jsonio.get_backend(backend)
+        self._first = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for line in self._lines:
+            if not line.strip():
+                continue
+
+            observable_dict = self._backend.loads(line)
+
+            if self._first:
+                self._first = False
+                if any(key in observable_dict for key in _HEADER_KEYS):
+                    self._read_header(observable_dict)
+                    continue
+
+            with scoped(self._scope):
+                return Observable.from_dict(observable_dict)
+
+        raise StopIteration
+
+    next = __next__
+
+    def _read_header(self, header_dict):
+        header = self.header
+        header.major_version = header_dict.get("major_version")
+        header.minor_version = header_dict.get("minor_version")
+        header.update_version = header_dict.get("update_version")
+        header.observable_package_source = MeasureSource.from_dict(
+            header_dict.get("observable_package_source")
+        )
+
+
+def read_observables(fileobj, backend=None, scope=None):
+    """Iterate over the Observables in a JSON Lines document.
+
+    Each line is decoded and converted to a :class:`cybox.core.Observable`
+    only when it is reached, so `fileobj` is never read as a whole. Blank
+    lines are skipped.
+
+    Args:
+        fileobj: A file-like object (or any iterable of lines) opened in
+            binary or text mode.
+        backend: The :mod:`cybox.utils.jsonio` backend (or its name) to
+            decode JSON with, or ``None`` for the default.
+        scope: A :class:`cybox.utils.caches.CacheScope` or
+            :class:`cybox.utils.caches.Cache` to put the Objects built in,
+            rather than the current cache.
+
+    Returns:
+        An :class:`ObservableLinesReader`, which yields
+        :class:`cybox.core.Observable` instances and exposes the header line
+        of the document as its ``header`` attribute.
+    """
+    return ObservableLinesReader(fileobj, backend, scope)
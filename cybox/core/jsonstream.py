@@ -0,0 +1,330 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Incremental parsing of large CybOX Observables JSON documents.
+
+:func:`iter_json_observables` is the JSON counterpart of
+:func:`cybox.core.iter_observables`. It walks the ``observables`` array of
+an ``Observables.to_dict()`` document and builds one
+:class:`cybox.core.Observable` at a time, so peak memory is bounded by the
+largest single Observable rather than by the size of the document.
+
+The document is parsed with `ijson`_ when it is installed, and otherwise
+with a reader built on the standard library ``json`` module, which decodes
+one array item at a time from a buffer of the input.
+
+.. _ijson: https://pypi.org/project/ijson/
+"""
+
+import codecs
+import json
+import re
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+from mixbox.vendor import six
+
+from cybox.common import MeasureSource
+from cybox.core import Observable
+from cybox.core.stream import ObservablesHeader
+from cybox.utils.caches import scoped
+from cybox.utils.fileio import open_xml
+
+PARSER_IJSON = "ijson"
+PARSER_JSON = "json"
+
+_OBSERVABLES_KEY = "observables"
+_ITEM_PREFIX = _OBSERVABLES_KEY + ".item"
+
+# The number of bytes (or characters) read from the source at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+_IJSON_SCALARS = ("null", "boolean", "integer", "double", "number", "string")
+_IJSON_STARTS = ("start_map", "start_array")
+_IJSON_ENDS = ("end_map", "end_array")
+_IJSON_ROOT = ("start_map", "map_key", "end_map")
+
+
+def _set_header(header, key, value):
+    if key == "major_version":
+        header.major_version = value
+    elif key == "minor_version":
+        header.minor_version = value
+    elif key == "update_version":
+        header.update_version = value
+    elif key == "observable_package_source":
+        header.observable_package_source = MeasureSource.from_dict(value)
+
+
+class _Scanner(object):
+    """Reads JSON values one at a time from a buffer of a file-like object.
+
+    Consumed input is dropped from the buffer whenever more is read, so the
+    buffer only ever holds the value being decoded and one chunk.
+    """
+
+    def __init__(self, fileobj, chunk_size):
+        self._read = fileobj.read
+        self._chunk_size = chunk_size
+        self._unicode = None
+        self._buffer = six.text_type()
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size):
+        """Read up to `size` more bytes or characters into the buffer.
+
+        Returns:
+            ``False`` if the end of the input was reached.
+        """
+        data = self._read(size)
+
+        if isinstance(data, six.binary_type):
+            if self._unicode is None:
+                self._unicode = codecs.getincrementaldecoder("utf-8")()
+            text = self._unicode.decode(data, final=not data)
+        else:
+            text = data
+
+        if not data:
+            self._eof = True
+
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(data)
+
+    def peek(self):
+        """Skip whitespace and return the next character, or an empty
+        string at the end of the input."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof or not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, chars):
+        """Consume and return the next character, which must be in
+        `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError("Expecting one of %r, found %r" %
+                             (tuple(chars), char or "end of input"))
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode and return the next JSON value."""
+        self.peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # The value may continue past the end of the buffer. Read
+                # at least as much again as is buffered, so that a large
+                # value is not decoded over and over.
+                if self._eof:
+                    raise
+                self._fill(max(self._chunk_size, len(self._buffer)))
+                continue
+
+            # A number at the end of the buffer may continue in the input.
+            if end == len(self._buffer) and not self._eof:
+                self._fill(self._chunk_size)
+                continue
+
+            self._pos = end
+            return value
+
+
+def _iter_json(fileobj, header, chunk_size):
+    """Yield the items of the ``observables`` array of the document in
+    `fileobj`, using the standard library ``json`` module."""
+    scanner = _Scanner(fileobj, chunk_size)
+    scanner.expect("{")
+
+    if scanner.peek() == "}":
+        return
+
+    while True:
+        key = scanner.value()
+        if not isinstance(key, six.string_types):
+            raise ValueError("Expecting an object key, found %r" % (key,))
+        scanner.expect(":")
+
+        if key == _OBSERVABLES_KEY and scanner.peek() == "[":
+            scanner.expect("[")
+            if scanner.peek() == "]":
+                scanner.expect("]")
+            else:
+                while True:
+                    yield scanner.value()
+                    if scanner.expect(",]") == "]":
+                        break
+        else:
+            _set_header(header, key, scanner.value())
+
+        if scanner.expect(",}") == "}":
+            return
+
+
+class _BinaryReader(object):
+    """Encodes text read from a file-like object as UTF-8, for ijson."""
+
+    def __init__(self, fileobj):
+        self._read = fileobj.read
+
+    def read(self, size=-1):
+        data = self._read(size)
+        if isinstance(data, six.text_type):
+            data = data.encode("utf-8")
+        return data
+
+
+def _iter_ijson(fileobj, header, chunk_size):
+    """Yield the items of the ``observables`` array of the document in
+    `fileobj`, using ijson."""
+    events = ijson.parse(_BinaryReader(fileobj), buf_size=chunk_size,
+                         use_float=True)
+    builder = None
+    target = None
+
+    try:
+        for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == target and event in _IJSON_ENDS:
+                    if target == _ITEM_PREFIX:
+                        yield builder.value
+                    else:
+                        _set_header(header, target, builder.value)
+                    builder = None
+                continue
+
+            if not prefix:
+                if event not in _IJSON_ROOT:
+                    raise ValueError("Expecting an object, found %s" % event)
+            elif prefix == _ITEM_PREFIX:
+                if event in _IJSON_STARTS:
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                    target = prefix
+                elif event in _IJSON_SCALARS:
+                    yield value
+            elif prefix != _OBSERVABLES_KEY and "." not in prefix:
+                # A value of the root object other than the Observables.
+                if event in _IJSON_STARTS:
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                    target = prefix
+                elif event in _IJSON_SCALARS:
+                    _set_header(header, prefix, value)
+    except ijson.JSONError as ex:
+        raise ValueError("Invalid JSON: %s" % ex)
+
+
+class JSONObservableStream(object):
+    """An iterator over the Observables of a CybOX JSON document.
+
+    Use :func:`iter_json_observables` rather than creating this class
+    directly.
+
+    Attributes:
+        header: An :class:`cybox.core.stream.ObservablesHeader`. Fields of
+            the root object which precede the ``observables`` array are
+            available once the first Observable has been returned, and the
+            rest once every Observable has. Its ``namespaces`` are always
+            empty.
+    """
+
+    def __init__(self, source, parser=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 scope=None):
+        if parser is None:
+            parser = PARSER_JSON if ijson is None else PARSER_IJSON
+
+        if parser == PARSER_IJSON:
+            if ijson is None:
+                raise ValueError("The ijson parser is not installed.")
+            iter_items = _iter_ijson
+        elif parser == PARSER_JSON:
+            iter_items = _iter_json
+        else:
+            raise ValueError("Unknown JSON parser: %r" % (parser,))
+
+        self.header = ObservablesHeader()
+        self._scope = scope
+
+        fileobj, self._opened = open_xml(source)
+        if isinstance(fileobj, six.string_types):
+            fileobj = open(fileobj, "rb")
+            self._opened.append(fileobj)
+
+        self._items = iter_items(fileobj, self.header, chunk_size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for item in self._items:
+            with scoped(self._scope):
+                return Observable.from_dict(item)
+
+        self.close()
+        raise StopIteration
+
+    next = __next__
+
+    def close(self):
+        """Close any files opened for the source.
+
+        This happens automatically once every Observable has been read.
+        """
+        for fileobj in reversed(self._opened):
+            fileobj.close()
+        self._opened = []
+
+
+def iter_json_observables(source, parser=None,
+                          chunk_size=DEFAULT_CHUNK_SIZE, scope=None):
+    """Iterate over the Observables in a CybOX JSON document.
+
+    The document is an ``Observables.to_dict()``, as written by
+    ``Observables.to_json()``. Each item of its ``observables`` array is
+    converted to a :class:`cybox.core.Observable` with
+    ``Observable.from_dict()`` as soon as it has been read.
+
+    Note:
+        Objects with an ``id`` are still added to the current object cache
+        (see :mod:`cybox.utils.caches`) as they are built, unless a `scope`
+        is given.
+
+    Example:
+        >>> stream = iter_json_observables("feed.json")  # doctest: +SKIP
+        >>> for observable in stream:  # doctest: +SKIP
+        ...     print(observable.id_)
+
+    Args:
+        source: A filename or a file-like object, opened in binary or text
+            mode. gzip, bzip2 and xz-compressed input is decompressed as it
+            is read (see :mod:`cybox.utils.fileio`).
+        parser: :data:`PARSER_IJSON` or :data:`PARSER_JSON`, or ``None`` to
+            use ijson if it is installed. ijson 3.1 or later is required.
+        chunk_size: The number of bytes (or characters) to read from
+            `source` at a time.
+        scope: A :class:`cybox.utils.caches.CacheScope` or
+            :class:`cybox.utils.caches.Cache` to put the Objects built in,
+            rather than the current cache.
+
+    Returns:
+        A :class:`JSONObservableStream`, which yields
+        :class:`cybox.core.Observable` instances and exposes the other
+        fields of the document as its ``header`` attribute.
+    """
+    return JSONObservableStream(source, parser, chunk_size, scope)
@@ -11,6 +11,9 @@ from cybox.common import StructuredText
 from cybox.common.object_properties import ObjectPropertiesFactory, ObjectProperties
 from cybox.common.vocabs import VocabField
 from cybox.common.vocabs import ObjectRelationship as Relationship
+from cybox.utils.lazy import LazyEntityMixin
+from cybox.utils.typecache import type_cache
+from cybox.utils.xmlexport import XMLExportMixin
 
 
 _EXTERNAL_CLASSES = {}  # Maps xsi:type values to binding
@@ -27,6 +30,7 @@ def add_external_class(klass, xsi_type):
         xsi_type (str): An xsi:type value corresponding to the `klass`.
     """
     _EXTERNAL_CLASSES[xsi_type] = klass
+    type_cache.clear()
 
 
 class ExternalTypeFactory(entities.EntityFactory):
@@ -46,7 +50,7 @@ def _cache_object(instance, value=None):
         cybox.utils.cache_put(instance)
 
 
-class Object(entities.Entity):
+class Object(LazyEntityMixin, XMLExportMixin, entities.Entity):
     """
     The CybOX Object construct identifies and specifies the characteristics of
     a specific cyber-relevant object (e.g. a file, a registry key or a
@@ -67,7 +71,10 @@ class Object(entities.Entity):
         environment, we encourage the use of ``cybox.utils.caches.cache_clear()``
         in your script to prevent an Out of Memory error. Depending on your
         use case, it can be after serialization or if a certain threshold is
-        met (e.g. %30 of memory consumed by cache mechanism).
+        met (e.g. %30 of memory consumed by cache mechanism). Alternatively,
+        ``cybox.utils.caches.set_cache()`` selects a cache that bounds its
+        own size, such as an ``LRUCache`` or a ``WeakValueCache``, and
+        ``cybox.utils.caches.caching_disabled()`` turns caching off.
 
     """
     _binding = core_binding
@@ -132,11 +139,31 @@ class RelatedObject(Object):
         return "Related: " + super(RelatedObject, self).__str__()
 
     #TODO: make this a property somehow
-    def get_properties(self):
+    def get_properties(self, document=None):
+        """Return the properties of this Object, or of the Object its
+        ``idref`` refers to.
+
+        The Object referred to is looked up in the current cache (see
+        :mod:`cybox.utils.caches`) and, if it is not found there, in
+        `document`. Look Objects up in a document when they were built with
+        caching turned off.
+
+        Args:
+            document: An entity, such as the Observables this RelatedObject
+                belongs to, to look for the Object referred to in.
+
+        Raises:
+            CacheMiss: The Object referred to was not found.
+        """
         if self.properties:
             return self.properties
         elif self.idref:
-            return cybox.utils.cache_get(self.idref).properties
+            try:
+                return cybox.utils.cache_get(self.idref).properties
+            except cybox.utils.CacheMiss:
+                if document is None:
+                    raise
+                return cybox.utils.find_object(document, self.idref).properties
         else:
             return None
 
@@ -187,7 +214,7 @@ class RelatedObject(Object):
         return relobj
 
 
-class RelatedObjects(entities.EntityList):
+class RelatedObjects(XMLExportMixin, entities.EntityList):
     _namespace = "http://cybox.mitre.org/cybox-2"
     _binding = core_binding
     _binding_class = _binding.RelatedObjectsType
@@ -195,7 +222,7 @@ class RelatedObjects(entities.EntityList):
     related_object = fields.TypedField("Related_Object", RelatedObject, multiple=True)
 
 
-class DomainSpecificObjectProperties(entities.Entity):
+class DomainSpecificObjectProperties(XMLExportMixin, entities.Entity):
     """The Cybox DomainSpecificObjectProperties base class."""
     _binding = core_binding
     _binding_class = _binding.DomainSpecificObjectPropertiesType
@@ -208,7 +235,6 @@ class DomainSpecificObjectProperties(entities.Entity):
         obj = super(DomainSpecificObjectProperties, self).to_obj(ns_info=ns_info)
         obj.xsi_type = "%s:%s" % (self._XSI_NS, self._XSI_TYPE)
 
-    def to_dict(self):
-        d = super(DomainSpecificObjectProperties, self).to_dict()
+    def _finalize_dict(self, d):
+        super(DomainSpecificObjectProperties, self)._finalize_dict(d)
         d['xsi:type'] = self._XSI_TYPE
-        return d
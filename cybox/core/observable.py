@@ -10,6 +10,17 @@ from cybox import Unicode
 import cybox.bindings.cybox_core as core_binding
 from cybox.common import MeasureSource, ObjectProperties, StructuredText
 from cybox.core import Object, Event
+from cybox.core import parallel
+from cybox.utils.binary import BinaryMixin
+from cybox.utils.caches import scoped
+from cybox.utils.dictconv import FastDictMixin
+from cybox.utils.elements import (ElementProxy, entity_from_element,
+                                  object_type, type_names)
+from cybox.utils.fileio import get_etree_root
+from cybox.utils.jsonio import JSONMixin
+from cybox.utils.lazy import LazyEntityMixin, lazy_entity
+from cybox.utils.treebuilder import ElementTreeMixin
+from cybox.utils.xmlexport import XMLExportMixin
 
 
 def validate_operator(instance, value):
@@ -55,7 +66,7 @@ def validate_observable_composition(instance, value):
         raise ValueError("Observable already has an Event.")
 
 
-class Keywords(entities.EntityList):
+class Keywords(XMLExportMixin, entities.EntityList):
     _binding = core_binding
     _binding_class = core_binding.KeywordsType
     _namespace = 'http://cybox.mitre.org/cybox-2'
@@ -63,7 +74,8 @@ class Keywords(entities.EntityList):
     keyword = fields.TypedField("Keyword", Unicode, multiple=True)
 
 
-class Observable(entities.Entity):
+class Observable(ElementTreeMixin, LazyEntityMixin, XMLExportMixin,
+                 FastDictMixin, JSONMixin, BinaryMixin, entities.Entity):
     """A single Observable.
     """
     _binding = core_binding
@@ -125,7 +137,19 @@ class Observable(entities.Entity):
         self.keywords.append(value)
 
 
-class Observables(entities.EntityList):
+def _remove_observables(root, object_types):
+    """Remove the top-level Observable elements under `root` whose Object
+    type is not in `object_types`."""
+    object_types = type_names(object_types)
+    tag = "{%s}Observable" % Observable._namespace
+
+    for node in root.findall(tag):
+        if object_type(node) not in object_types:
+            root.remove(node)
+
+
+class Observables(ElementTreeMixin, LazyEntityMixin, XMLExportMixin,
+                  FastDictMixin, JSONMixin, BinaryMixin, entities.EntityList):
     """The root CybOX Observables object.
 
     Pools are not currently supported.
@@ -158,15 +182,111 @@ class Observables(entities.EntityList):
         observables_obj.cybox_update_version = self._update_version
         return observables_obj
 
-    def to_dict(self):
-        observables_dict = super(Observables, self).to_dict()
+    def _finalize_dict(self, observables_dict):
+        super(Observables, self)._finalize_dict(observables_dict)
         observables_dict['major_version'] = self._major_version
         observables_dict['minor_version'] = self._minor_version
         observables_dict['update_version'] = self._update_version
-        return observables_dict
+
+    def to_xml(self, include_namespaces=True, namespace_dict=None,
+               pretty=True, encoding="utf-8", workers=None):
+        """Serialize the Observables as XML.
+
+        Args:
+            workers: If two or more, serialize the Observables in a pool of
+                that many processes (see :mod:`cybox.core.parallel`). The
+                output is the same either way.
+
+        The other arguments are those of ``Entity.to_xml()``.
+        """
+        if workers is not None:
+            return parallel.to_xml(self, workers, include_namespaces,
+                                   namespace_dict, pretty, encoding)
+        return super(Observables, self).to_xml(include_namespaces,
+                                               namespace_dict, pretty,
+                                               encoding)
+
+    def to_json(self, backend=None, workers=None):
+        """Export the Observables as a JSON string.
+
+        Args:
+            backend: The :class:`cybox.utils.jsonio.JSONBackend` or name of
+                the backend to use, or ``None`` for the default.
+            workers: If two or more, serialize the Observables in a pool of
+                that many processes (see :mod:`cybox.core.parallel`). The
+                output is the same either way.
+        """
+        if workers is not None:
+            return parallel.to_json(self, workers, backend)
+        return super(Observables, self).to_json(backend)
+
+    @classmethod
+    def from_obj(cls, cls_obj, lazy=False):
+        """Create an :class:`Observables` from a binding object.
+
+        Args:
+            cls_obj: A ``cybox.bindings.cybox_core.ObservablesType`` instance.
+            lazy: If ``True``, return a lazily loaded instance whose
+                Observable, Object and ObjectProperties values are only
+                converted when they are first read (see
+                :mod:`cybox.utils.lazy`).
+        """
+        if lazy:
+            return lazy_entity(cls, cls_obj)
+        return super(Observables, cls).from_obj(cls_obj)
+
+    @classmethod
+    def from_xml(cls, xml_file, fast=False, lazy=False, object_types=None,
+                 scope=None):
+        """Parse a CybOX Observables XML document.
+
+        Args:
+            xml_file: A filename or file-like object. gzip, bzip2 and
+                xz-compressed input is decompressed as it is read (see
+                :mod:`cybox.utils.fileio`).
+            fast: If ``True``, build the API objects directly from the parsed
+                XML elements rather than going through the generated binding
+                classes first (see :mod:`cybox.utils.elements`). The result
+                is the same either way.
+            lazy: If ``True``, return a lazily loaded instance backed by the
+                parsed XML elements (see :mod:`cybox.utils.lazy`). No binding
+                objects are built, and values are only converted when they
+                are first read.
+            object_types: If given, an iterable of Object type names (such as
+                ``"FileObjectType"``). Top-level Observables whose Object
+                Properties are of another type, and those without Object
+                Properties, are left out without being built.
+            scope: A :class:`cybox.utils.caches.CacheScope` or
+                :class:`cybox.utils.caches.Cache` to put the Objects built
+                in, rather than the current cache. With `lazy`, Objects are
+                put in whichever cache is current when they are first read.
+
+        Returns:
+            An :class:`Observables` instance.
+        """
+        with scoped(scope):
+            return cls._from_xml(xml_file, fast, lazy, object_types)
+
+    @classmethod
+    def _from_xml(cls, xml_file, fast, lazy, object_types):
+        if object_types is None and not (fast or lazy):
+            return cls.from_obj(core_binding.parse(xml_file))
+
+        root = get_etree_root(xml_file)
+        if object_types is not None:
+            _remove_observables(root, object_types)
+
+        if lazy:
+            return lazy_entity(cls, ElementProxy(root, cls))
+        if fast:
+            return entity_from_element(cls, root)
+
+        obj = core_binding.ObservablesType.factory()
+        obj.build(root)
+        return cls.from_obj(obj)
 
 
-class ObservableComposition(entities.EntityList):
+class ObservableComposition(XMLExportMixin, entities.EntityList):
     """The ObservableCompositionType entity defines a logical compositions of
     CybOX Observables. The combinatorial behavior is derived from the operator
     property."""
@@ -0,0 +1,399 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Random access by id into large CybOX Observables documents.
+
+:func:`build_index` reads a document once and records the byte range of
+every top-level ``cybox:Observable``, and of every ``cybox:Object``,
+``cybox:Related_Object`` and ``cybox:Associated_Object`` with an ``id``. The
+ranges are saved in a sidecar file next to the document (``<path>.idx``).
+
+:func:`load_observable` and :func:`load_object` then read and parse just the
+bytes of the element they are asked for. The namespace declarations that
+were in scope for the element in the original document are put around the
+fragment, so prefixes (including those used in ``xsi:type`` values) resolve
+as they did there.
+
+Only uncompressed documents in an ASCII-compatible encoding (such as UTF-8)
+can be indexed.
+"""
+
+import io
+import json
+import mmap
+import os
+import re
+from xml.parsers import expat
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+from mixbox.vendor import six
+from mixbox.xml import get_xml_parser
+
+from cybox.core import AssociatedObject, Object, Observable, RelatedObject
+from cybox.utils.fileio import compression
+
+NS_CYBOX = "http://cybox.mitre.org/cybox-2"
+
+KIND_OBSERVABLE = "Observable"
+
+# Maps the local names of indexed Object elements to their API classes.
+_OBJECT_CLASSES = {
+    "Object": Object,
+    "Related_Object": RelatedObject,
+    "Associated_Object": AssociatedObject,
+}
+
+_CLASSES = dict(_OBJECT_CLASSES, **{KIND_OBSERVABLE: Observable})
+
+_INDEX_VERSION = 1
+
+# Matches the rest of a start tag, skipping over quoted attribute values
+# (which may contain ">").
+_START_TAG_END = re.compile(br"""[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*>""")
+
+_CHUNK_SIZE = 1 << 20
+
+
+def index_filename(path):
+    """Return the name of the sidecar index file for the document `path`."""
+    return path + ".idx"
+
+
+class IndexEntry(object):
+    """The location of an indexed element.
+
+    Attributes:
+        kind: The local name of the element (``"Observable"``, ``"Object"``,
+            ``"Related_Object"`` or ``"Associated_Object"``).
+        start: The byte offset of the element's start tag.
+        end: The byte offset just past the element's end tag.
+        namespaces: Namespace declarations in scope for the element, other
+            than those on the document root, as a dictionary mapping
+            prefixes (``""`` for the default namespace) to URIs.
+    """
+
+    __slots__ = ("kind", "start", "end", "namespaces")
+
+    def __init__(self, kind, start, end, namespaces=None):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.namespaces = namespaces or {}
+
+
+class _Scanner(object):
+    """Finds indexed elements with the expat parser, which reports the byte
+    offset of every tag."""
+
+    def __init__(self, data):
+        self.data = data
+        self.encoding = None
+        self.namespaces = {}
+        self.entries = {}
+
+        self._parser = expat.ParserCreate(namespace_separator=" ")
+        self._parser.XmlDeclHandler = self._xml_decl
+        self._parser.StartNamespaceDeclHandler = self._start_namespace
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+
+        self._declared = {}
+        # One (namespace declarations, pending entry) pair per open element.
+        self._stack = []
+
+    def scan(self):
+        data = self.data
+        size = len(data)
+        for offset in range(0, size, _CHUNK_SIZE):
+            self._parser.Parse(data[offset:offset + _CHUNK_SIZE], False)
+        self._parser.Parse(b"", True)
+
+    def _xml_decl(self, version, encoding, standalone):
+        self.encoding = encoding
+
+    def _start_namespace(self, prefix, uri):
+        self._declared[prefix or ""] = uri
+
+    def _start(self, name, attrs):
+        declared, self._declared = self._declared, {}
+        depth = len(self._stack)
+
+        if depth == 0:
+            self.namespaces = declared
+            self._stack.append((declared, None))
+            return
+
+        uri, _, kind = name.rpartition(" ")
+        pending = None
+        if uri == NS_CYBOX:
+            if kind == KIND_OBSERVABLE and depth == 1:
+                id_ = attrs.get("id")
+            elif kind in _OBJECT_CLASSES:
+                id_ = attrs.get("id")
+            else:
+                id_ = None
+
+            if id_ and id_ not in self.entries:
+                pending = self._open_entry(id_, kind)
+
+        self._stack.append((declared, pending))
+
+    def _open_entry(self, id_, kind):
+        start = self._parser.CurrentByteIndex
+        tag_end = _START_TAG_END.match(self.data, start + 1).end()
+
+        namespaces = {}
+        for declared, _ in self._stack[1:]:
+            namespaces.update(declared)
+
+        entry = IndexEntry(kind, start, None, namespaces)
+        if self.data[tag_end - 2:tag_end] == b"/>":
+            entry.end = tag_end
+
+        self.entries[id_] = entry
+        return entry
+
+    def _end(self, name):
+        _, entry = self._stack.pop()
+        if entry is not None and entry.end is None:
+            # The parser is at the start of the end tag.
+            start = self._parser.CurrentByteIndex
+            entry.end = self.data.find(b">", start) + 1
+
+
+class ObservablesIndex(object):
+    """The byte ranges of the Observables and Objects in a document.
+
+    Use :func:`build_index` or :meth:`open` to get an index.
+
+    Attributes:
+        path: The indexed document.
+        entries: A dictionary mapping ids to :class:`IndexEntry` instances.
+        namespaces: The namespace declarations on the document root.
+        encoding: The encoding named in the document's XML declaration, or
+            ``None``.
+    """
+
+    def __init__(self, path, entries, namespaces=None, encoding=None,
+                 size=None, mtime=None):
+        self.path = path
+        self.entries = entries
+        self.namespaces = namespaces or {}
+        self.encoding = encoding
+        self._size = size
+        self._mtime = mtime
+
+    @classmethod
+    def build(cls, path):
+        """Read the document at `path` and index it.
+
+        Raises:
+            ValueError: If the document is compressed.
+            xml.parsers.expat.ExpatError: If the document is not well-formed.
+        """
+        stat = os.stat(path)
+
+        with open(path, "rb") as f:
+            if compression(f.read(8)) is not None:
+                raise ValueError("Compressed documents cannot be indexed: %s"
+                                 % path)
+            if stat.st_size == 0:
+                data = b""
+            else:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            scanner = _Scanner(data)
+            scanner.scan()
+        finally:
+            if data:
+                data.close()
+
+        return cls(path, scanner.entries, scanner.namespaces,
+                   scanner.encoding, stat.st_size, stat.st_mtime)
+
+    @classmethod
+    def load(cls, path, filename=None):
+        """Read the sidecar index of the document at `path`.
+
+        Args:
+            path: The indexed document.
+            filename: The index file. Defaults to
+                :func:`index_filename(path) <index_filename>`.
+        """
+        filename = filename or index_filename(path)
+
+        with io.open(filename, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != _INDEX_VERSION:
+                raise ValueError("Unsupported index version: %r"
+                                 % header.get("version"))
+
+            entries = {}
+            for line in f:
+                fields = line.rstrip(u"\n").split(u"\t")
+                namespaces = json.loads(fields[4]) if len(fields) > 4 else None
+                entries[fields[1]] = IndexEntry(
+                    fields[0], int(fields[2]), int(fields[3]), namespaces
+                )
+
+        return cls(path, entries, header["namespaces"], header["encoding"],
+                   header["size"], header["mtime"])
+
+    @classmethod
+    def open(cls, path):
+        """Return the index of `path`, building (and saving) it first if the
+        sidecar file is missing or out of date."""
+        try:
+            index = cls.load(path)
+        except (IOError, OSError, ValueError):
+            index = None
+
+        if index is None or not index.is_current():
+            index = cls.build(path)
+            index.save()
+        return index
+
+    def save(self, filename=None):
+        """Write the index to its sidecar file (or to `filename`)."""
+        filename = filename or index_filename(self.path)
+
+        header = {
+            "version": _INDEX_VERSION,
+            "size": self._size,
+            "mtime": self._mtime,
+            "encoding": self.encoding,
+            "namespaces": self.namespaces,
+        }
+
+        with io.open(filename, "w", encoding="utf-8") as f:
+            f.write(six.text_type(json.dumps(header)))
+            f.write(u"\n")
+            for id_, entry in six.iteritems(self.entries):
+                fields = [entry.kind, id_, str(entry.start), str(entry.end)]
+                if entry.namespaces:
+                    fields.append(json.dumps(entry.namespaces))
+                f.write(u"\t".join(six.text_type(x) for x in fields))
+                f.write(u"\n")
+
+    def is_current(self):
+        """Return True if the document has not changed since it was indexed.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_size == self._size and
+                stat.st_mtime == self._mtime)
+
+    def __contains__(self, id_):
+        return id_ in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def ids(self, kind=None):
+        """Return the indexed ids, optionally only those of one `kind`."""
+        return [id_ for id_, entry in six.iteritems(self.entries)
+                if kind is None or entry.kind == kind]
+
+    def read_fragment(self, id_):
+        """Return the bytes of the element with the id `id_`.
+
+        Raises:
+            KeyError: If `id_` is not in the index.
+        """
+        entry = self.entries[id_]
+        with open(self.path, "rb") as f:
+            f.seek(entry.start)
+            return f.read(entry.end - entry.start)
+
+    def parse_element(self, id_):
+        """Parse the element with the id `id_` into an lxml element.
+
+        Raises:
+            KeyError: If `id_` is not in the index.
+        """
+        entry = self.entries[id_]
+        encoding = self.encoding or "utf-8"
+
+        namespaces = dict(self.namespaces, **entry.namespaces)
+        declarations = "".join(
+            " %s=%s" % ("xmlns:" + prefix if prefix else "xmlns",
+                        quoteattr(uri))
+            for prefix, uri in sorted(namespaces.items())
+        )
+
+        # A wrapper element carries the namespace declarations that were in
+        # scope for the fragment.
+        head = '<?xml version="1.0" encoding="%s"?><_%s>' % (encoding,
+                                                            declarations)
+        document = (head.encode(encoding) + self.read_fragment(id_) +
+                    "</_>".encode(encoding))
+
+        return etree.fromstring(document, get_xml_parser())[0]
+
+    def _load(self, id_, kinds):
+        entry = self.entries[id_]
+        if entry.kind not in kinds:
+            raise KeyError(id_)
+
+        klass = _CLASSES[entry.kind]
+        obj = klass._binding_class.factory()
+        obj.build(self.parse_element(id_))
+        return klass.from_obj(obj)
+
+    def load_observable(self, id_):
+        """Parse the top-level Observable with the id `id_`.
+
+        Raises:
+            KeyError: If there is no such Observable.
+        """
+        return self._load(id_, (KIND_OBSERVABLE,))
+
+    def load_object(self, id_):
+        """Parse the Object (or Related_Object, or Associated_Object) with
+        the id `id_`.
+
+        Raises:
+            KeyError: If there is no such Object.
+        """
+        return self._load(id_, _OBJECT_CLASSES)
+
+
+def build_index(path):
+    """Index the document at `path` and save the index in its sidecar file.
+
+    Returns:
+        An :class:`ObservablesIndex`.
+    """
+    index = ObservablesIndex.build(path)
+    index.save()
+    return index
+
+
+def load_observable(path, id_):
+    """Parse the top-level Observable with the id `id_` from a document.
+
+    The document's sidecar index is used, and built first if it is missing
+    or out of date. Use :meth:`ObservablesIndex.open` to look up several
+    ids without reading the index each time.
+
+    Returns:
+        A :class:`cybox.core.Observable`.
+
+    Raises:
+        KeyError: If there is no such Observable.
+    """
+    return ObservablesIndex.open(path).load_observable(id_)
+
+
+def load_object(path, id_):
+    """Parse the Object with the id `id_` from a document.
+
+    See :func:`load_observable`.
+
+    Returns:
+        A :class:`cybox.core.Object` (or subclass).
+    """
+    return ObservablesIndex.open(path).load_object(id_)
@@ -0,0 +1,236 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Exporting large Observables collections with a pool of processes.
+
+``Observables.to_xml()`` and ``Observables.to_json()`` take a `workers`
+argument. With two or more workers, the Observables are split into chunks
+which are serialized in a pool of worker processes, and the fragments are
+joined under a single root element (or object) in this process.
+
+The output is the same as that of a serial export, including the namespace
+declarations of the root element: each worker sends back the
+:class:`cybox.utils.nscollector.ClassNamespaceCollector` of its chunk, and
+they are merged in the order of the chunks.
+
+Worker processes are started with ``fork()`` and are handed the
+Observables by the pool's initializer, which they inherit rather than
+receive pickled, so nothing but the output is sent between processes. Where
+``fork()`` is not available (on Windows), or the pool cannot be given an
+initializer (before Python 3.7), the export is done in the calling process.
+
+``fork()`` only copies the calling thread, and a lock held by another
+thread at that moment stays locked in the child for good. To avoid
+deadlocking the workers, the export is also done in the calling process
+while other threads are running.
+"""
+
+import copy
+import sys
+import threading
+import uuid
+
+try:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    _FORK = multiprocessing.get_context("fork")
+except (AttributeError, ImportError, ValueError):
+    # Python 2, or a platform without fork(): export in this process.
+    _FORK = None
+
+if sys.version_info < (3, 7):
+    # ProcessPoolExecutor takes no mp_context or initializer before 3.7.
+    _FORK = None
+
+from mixbox.binding_utils import save_encoding
+from mixbox.vendor import six
+
+from cybox.utils import jsonio
+from cybox.utils import xmlexport
+from cybox.utils.lazy import source_element
+from cybox.utils.nscollector import ClassNamespaceCollector
+
+# The number of chunks each worker is given, unless a chunk size is given.
+CHUNKS_PER_WORKER = 4
+
+# The Observables and options of the export, in a worker process (see
+# _init_worker()).
+_work = None
+
+
+class _Chunk(object):
+    """Stands in for the Observables of a chunk in the root entity, and for
+    their binding objects when it is exported."""
+
+    def __init__(self, text, collected=None):
+        self.text = text
+        self.collected = collected
+
+    def to_obj(self, ns_info=None):
+        # Add what the worker collected after what has been collected so
+        # far, as a serial export would.
+        if ns_info and self.collected is not None:
+            ns_info.merge(self.collected)
+        return self
+
+    def to_dict(self):
+        return self.text
+
+    def export(self, lwrite, level, namespace_="cybox:", name_="Observable",
+               pretty_print=True):
+        lwrite(self.text)
+
+
+def _bounds(count, workers, chunk_size):
+    if not chunk_size:
+        chunk_size = max(1, -(-count // (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)]
+
+
+def _init_worker(work):
+    global _work
+    _work = work
+
+
+def _run(function, work, bounds, workers):
+    """Return the results of `function` for each of `bounds`, computed in
+    a pool of up to `workers` processes which can read `work`."""
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(bounds)),
+                               mp_context=_FORK, initializer=_init_worker,
+                               initargs=(work,))
+    with pool:
+        return list(pool.map(function, bounds))
+
+
+def _with_chunks(observables, field, chunks):
+    """Return a copy of the Observables entity `observables` whose
+    Observables are replaced by `chunks`."""
+    head = copy.copy(observables)
+    head._fields = dict(six.iteritems(observables._fields))
+    head._fields[field] = chunks
+    return head
+
+
+def _xml_chunk(bounds):
+    start, stop = bounds
+    observables, include_namespaces, pretty, encoding = _work
+    collector = ClassNamespaceCollector() if include_namespaces else None
+
+    parts = []
+    with save_encoding(encoding):
+        for observable in observables[start:stop]:
+            obj = observable.to_obj(ns_info=collector)
+            obj.export(parts.append, 1, "cybox:", name_="Observable",
+                       pretty_print=pretty)
+
+    return u"".join(parts), collector
+
+
+def _json_chunk(bounds):
+    start, stop = bounds
+    observables, backend, separator = _work
+
+    try:
+        return separator.join(
+            backend.dumps(observable.to_dict(), fallback=False)
+            for observable in observables[start:stop]
+        )
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _split(observables, workers):
+    """Return the field holding the Observables of `observables` and their
+    list, or ``None`` if they are not worth (or safe) exporting in
+    parallel."""
+    if _FORK is None or not workers or workers < 2:
+        return None
+    if threading.active_count() > 1:
+        return None
+
+    field = observables.__class__.observables
+    items = list(field.__get__(observables))
+    if len(items) < 2:
+        return None
+    return field, items
+
+
+def to_xml(observables, workers, include_namespaces=True,
+           namespace_dict=None, pretty=True, encoding="utf-8",
+           chunk_size=None):
+    """Serialize an :class:`cybox.core.Observables` as
+    ``Observables.to_xml()`` does, using `workers` processes.
+
+    An unmodified lazily loaded instance (see :mod:`cybox.utils.lazy`) is
+    serialized from its source element in this process.
+
+    Args:
+        observables: An :class:`cybox.core.Observables`.
+        workers: The number of worker processes. With fewer than two, or
+            while other threads are running, the export is done in this
+            process.
+        chunk_size: The number of Observables serialized by a worker at a
+            time, or ``None`` to give each worker
+            :data:`CHUNKS_PER_WORKER` chunks.
+
+    The other arguments are those of ``Observables.to_xml()``.
+    """
+    split = _split(observables, workers)
+    if split is None or source_element(observables) is not None:
+        return observables.to_xml(include_namespaces, namespace_dict, pretty,
+                                  encoding)
+
+    field, items = split
+    work = (items, include_namespaces, pretty, encoding)
+    results = _run(_xml_chunk, work, _bounds(len(items), workers, chunk_size),
+                   workers)
+
+    chunks = [_Chunk(text, collected) for text, collected in results]
+    head = _with_chunks(observables, field, chunks)
+    return xmlexport.to_xml(head, include_namespaces, namespace_dict, pretty,
+                            encoding)
+
+
+def to_json(observables, workers, backend=None, chunk_size=None):
+    """Serialize an :class:`cybox.core.Observables` as
+    ``Observables.to_json()`` does, using `workers` processes.
+
+    Args:
+        observables: An :class:`cybox.core.Observables`.
+        workers: The number of worker processes. With fewer than two, or
+            while other threads are running, the export is done in this
+            process.
+        backend: The :mod:`cybox.utils.jsonio` backend (or its name) to
+            encode JSON with, or ``None`` for the default.
+        chunk_size: The number of Observables serialized by a worker at a
+            time, or ``None`` to give each worker
+            :data:`CHUNKS_PER_WORKER` chunks.
+    """
+    backend = jsonio.get_backend(backend)
+
+    split = _split(observables, workers)
+    if split is None:
+        return backend.dumps(observables.to_dict())
+
+    # The Observables are written in place of a marker string in the JSON
+    # of the rest of the document.
+    field, items = split
+    marker = "cybox.core.parallel:%s" % uuid.uuid4().hex
+    head = _with_chunks(observables, field, [_Chunk(marker)])
+    try:
+        doc = backend.dumps(head.to_dict(), fallback=False)
+    except (TypeError, ValueError, OverflowError):
+        return backend.dumps(observables.to_dict())
+
+    separator = backend.dumps([0, 0])[2:-2]
+    work = (items, backend, separator)
+    results = _run(_json_chunk, work,
+                   _bounds(len(items), workers, chunk_size), workers)
+
+    # A backend which cannot encode an Observable encodes the whole
+    # document with the standard library instead.
+    if None in results:
+        return backend.dumps(observables.to_dict())
+
+    before, _, after = doc.partition('"%s"' % marker)
+    return before + separator.join(results) + after
@@ -7,9 +7,10 @@ from mixbox import fields
 import cybox.bindings.cybox_core as core_binding
 from cybox.common import StructuredText
 from cybox.core.observable import Observables
+from cybox.utils.xmlexport import XMLExportMixin
 
 
-class ObfuscationTechnique(entities.Entity):
+class ObfuscationTechnique(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _binding_class = core_binding.ObfuscationTechniqueType
@@ -18,14 +19,14 @@ class ObfuscationTechnique(entities.Entity):
     observables = fields.TypedField("Observables", Observables)
 
 
-class ObfuscationTechniques(entities.EntityList):
+class ObfuscationTechniques(XMLExportMixin, entities.EntityList):
     _binding = core_binding
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _binding_class = core_binding.ObfuscationTechniquesType
     obfuscation_technique = fields.TypedField("Obfuscation_Technique", ObfuscationTechnique, multiple=True)
 
 
-class PatternFidelity(entities.Entity):
+class PatternFidelity(XMLExportMixin, entities.Entity):
     _binding = core_binding
     _namespace = 'http://cybox.mitre.org/cybox-2'
     _binding_class = core_binding.PatternFidelityType
@@ -0,0 +1,247 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Incremental parsing of large CybOX Observables documents.
+
+:func:`iter_observables` walks a document with ``lxml.etree.iterparse`` and
+builds one :class:`cybox.core.Observable` at a time, discarding the XML for
+each Observable once it has been converted. Peak memory is bounded by the
+largest single Observable rather than by the size of the document.
+
+Passing ``object_types`` builds only the Observables whose Object is of one
+of the given types. The others are recognized from the ``xsi:type`` of their
+``cybox:Properties`` element and dropped (or reported as a
+:class:`SkippedObservable`) without being built.
+"""
+
+from lxml import etree
+
+import cybox.bindings.cybox_common as common_binding
+import cybox.bindings.cybox_core as core_binding
+from cybox.common import MeasureSource
+from cybox.core import Observable
+from cybox.utils.caches import scoped
+from cybox.utils.elements import object_type, type_names
+from cybox.utils.fileio import open_xml
+
+NS_CYBOX = "http://cybox.mitre.org/cybox-2"
+
+TAG_OBSERVABLES = "{%s}Observables" % NS_CYBOX
+TAG_OBSERVABLE = "{%s}Observable" % NS_CYBOX
+TAG_PACKAGE_SOURCE = "{%s}Observable_Package_Source" % NS_CYBOX
+
+# Keep these in sync with mixbox.xml.get_xml_parser() so that streamed
+# elements look exactly like the ones produced by cybox_core.parse().
+_PARSER_OPTIONS = dict(
+    huge_tree=True,
+    remove_comments=True,
+    remove_pis=True,
+    strip_cdata=False,
+    remove_blank_text=True,
+    resolve_entities=False,
+)
+
+# lxml only filters iterparse() events by several tags since 3.0. Older
+# versions report every element, and the others are skipped while reading.
+if etree.LXML_VERSION >= (3, 0):
+    _PARSER_OPTIONS["tag"] = (TAG_OBSERVABLES, TAG_OBSERVABLE,
+                              TAG_PACKAGE_SOURCE)
+
+
+class ObservablesHeader(object):
+    """Document-level information found on a streamed Observables root.
+
+    Attributes:
+        major_version: The ``cybox_major_version`` attribute value.
+        minor_version: The ``cybox_minor_version`` attribute value.
+        update_version: The ``cybox_update_version`` attribute value.
+        observable_package_source: A :class:`cybox.common.MeasureSource`
+            parsed from ``Observable_Package_Source``, or ``None``.
+        namespaces: A dictionary mapping namespace prefixes to namespace URIs
+            declared on the root element.
+    """
+
+    def __init__(self):
+        self.major_version = None
+        self.minor_version = None
+        self.update_version = None
+        self.observable_package_source = None
+        self.namespaces = {}
+
+    def _read_root(self, root):
+        self.major_version = root.get("cybox_major_version")
+        self.minor_version = root.get("cybox_minor_version")
+        self.update_version = root.get("cybox_update_version")
+        self.namespaces = dict(root.nsmap)
+
+
+class SkippedObservable(object):
+    """An Observable left out of a type-filtered stream.
+
+    Attributes:
+        id_: The ``id`` of the Observable, or ``None``.
+        object_type: The Object type of the Observable without its namespace
+            prefix (for example, ``"FileObjectType"``), or ``None`` if it has
+            no Object Properties.
+    """
+
+    __slots__ = ("id_", "object_type")
+
+    def __init__(self, id_=None, object_type=None):
+        self.id_ = id_
+        self.object_type = object_type
+
+    def __eq__(self, other):
+        return (isinstance(other, SkippedObservable) and
+                self.id_ == other.id_ and
+                self.object_type == other.object_type)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.id_, self.object_type))
+
+    def __repr__(self):
+        return "SkippedObservable(id_=%r, object_type=%r)" % (
+            self.id_, self.object_type
+        )
+
+
+def _build(klass, binding_class, node):
+    obj = binding_class.factory()
+    obj.build(node)
+    return klass.from_obj(obj)
+
+
+def _release(node):
+    """Free `node` and every sibling that was parsed before it."""
+    node.clear()
+
+    parent = node.getparent()
+    while node.getprevious() is not None:
+        del parent[0]
+
+
+class ObservableStream(object):
+    """An iterator over the top-level Observables of a CybOX document.
+
+    Use :func:`iter_observables` rather than creating this class directly.
+
+    Attributes:
+        header: An :class:`ObservablesHeader`. The version fields and
+            namespaces are available once the first Observable has been
+            returned, as is the ``Observable_Package_Source`` (which the
+            schema requires to precede every Observable).
+    """
+
+    def __init__(self, source, object_types=None, skipped=False, scope=None):
+        self.header = ObservablesHeader()
+        self._scope = scope
+        self._root = None
+        self._object_types = None
+        self._skipped = skipped
+        if object_types is not None:
+            self._object_types = type_names(object_types)
+
+        source, self._opened = open_xml(source)
+        self._events = etree.iterparse(
+            source,
+            events=("start", "end"),
+            **_PARSER_OPTIONS
+        )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with scoped(self._scope):
+            return self._next()
+
+    next = __next__
+
+    def _next(self):
+        for event, node in self._events:
+            if event == "start":
+                if self._root is None and node.tag == TAG_OBSERVABLES:
+                    self._root = node
+                    self.header._read_root(node)
+                continue
+
+            # Observables nested in an Observable_Composition are built as
+            # part of their enclosing Observable.
+            if self._root is None or node.getparent() is not self._root:
+                continue
+
+            if node.tag == TAG_OBSERVABLE:
+                if self._object_types is not None:
+                    type_ = object_type(node)
+                    if type_ not in self._object_types:
+                        skipped = SkippedObservable(node.get("id"), type_)
+                        _release(node)
+                        if self._skipped:
+                            return skipped
+                        continue
+
+                observable = _build(Observable, core_binding.ObservableType, node)
+                _release(node)
+                return observable
+            elif node.tag == TAG_PACKAGE_SOURCE:
+                self.header.observable_package_source = _build(
+                    MeasureSource, common_binding.MeasureSourceType, node
+                )
+                _release(node)
+
+        self.close()
+        raise StopIteration
+
+    def close(self):
+        """Close any decompressing file objects opened for the source.
+
+        This happens automatically once every Observable has been read.
+        """
+        for fileobj in reversed(self._opened):
+            fileobj.close()
+        self._opened = []
+
+
+def iter_observables(source, object_types=None, skipped=False, scope=None):
+    """Iterate over the top-level Observables in a CybOX XML document.
+
+    Each ``cybox:Observable`` child of the root ``cybox:Observables`` element
+    is converted to a :class:`cybox.core.Observable` as soon as it has been
+    read, after which its XML is discarded. This keeps memory flat no matter
+    how large the input document is.
+
+    Note:
+        Objects with an ``id`` are still added to the current object cache
+        (see :mod:`cybox.utils.caches`) as they are built, unless a `scope`
+        is given. Objects in skipped Observables are not.
+
+    Example:
+        >>> stream = iter_observables("feed.xml")  # doctest: +SKIP
+        >>> for observable in stream:  # doctest: +SKIP
+        ...     print(observable.id_)
+        >>> stream.header.observable_package_source  # doctest: +SKIP
+
+    Args:
+        source: A filename or a file-like object opened in binary mode.
+            gzip, bzip2 and xz-compressed input is decompressed as it is
+            read (see :mod:`cybox.utils.fileio`).
+        object_types: If given, an iterable of Object type names (such as
+            ``"FileObjectType"`` or ``"FileObj:FileObjectType"``). Only
+            Observables whose Object Properties have one of these types are
+            built; Events, compositions and idref-only Observables never
+            match.
+        skipped: If ``True``, yield a :class:`SkippedObservable` in place of
+            each Observable filtered out by `object_types`. By default they
+            are dropped.
+        scope: A :class:`cybox.utils.caches.CacheScope` or
+            :class:`cybox.utils.caches.Cache` to put the Objects built in,
+            rather than the current cache.
+
+    Returns:
+        An :class:`ObservableStream`, which yields
+        :class:`cybox.core.Observable` instances and exposes the document's
+        :class:`ObservablesHeader` as its ``header`` attribute.
+    """
+    return ObservableStream(source, object_types, skipped, scope)
@@ -0,0 +1,223 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Incremental writing of large CybOX Observables documents.
+
+:class:`ObservablesWriter` is the counterpart of
+:func:`cybox.core.iter_observables`: it writes the root
+``cybox:Observables`` element up front and then serializes one
+:class:`cybox.core.Observable` at a time, so that memory use is bounded by
+the largest single Observable rather than by the size of the document.
+"""
+
+from mixbox.binding_utils import save_encoding
+from mixbox.vendor import six
+
+from cybox.bindings import export_xml, quote_attrib
+from cybox.common import String
+from cybox.core import Observable, Observables
+from cybox.utils.nscollector import ClassNamespaceCollector
+from cybox.utils.typecache import type_cache
+
+_ROOT_TAG = "cybox:Observables"
+
+
+class ObservablesWriter(object):
+    """Write a CybOX Observables document one Observable at a time.
+
+    The root element, its namespace declarations and the
+    ``Observable_Package_Source`` are written when the writer is entered
+    (or on the first :meth:`write`). Each :meth:`write` then serializes an
+    Observable and flushes it to `fileobj`, and :meth:`close` writes the
+    closing tag. `fileobj` itself is not closed.
+
+    The root element declares the namespaces every Observables document
+    uses, those of the `object_types` (and of the cyboxCommon property
+    types their values are made of), and those in `namespace_dict`. An
+    Observable that uses namespaces beyond these declares them on its own
+    ``cybox:Observable`` element. When the root declares exactly the
+    namespaces the Observables use, the output is the same document as
+    ``Observables.to_xml()`` would produce (though the namespace
+    declarations on the root may be listed in a different order); each
+    ``cybox:Observable`` element is always serialized exactly as
+    ``to_xml()`` would.
+
+    Example:
+        >>> with open("feed.xml", "wb") as f:  # doctest: +SKIP
+        ...     with ObservablesWriter(f, [File, Address]) as writer:
+        ...         for observable in observables:
+        ...             writer.write(observable)
+
+    Args:
+        fileobj: A file-like object, opened in binary mode unless `encoding`
+            is ``None``.
+        object_types: An iterable of ObjectProperties subclasses or Object
+            type names (such as ``"FileObjectType"``) whose namespaces are
+            declared on the root element.
+        namespace_dict: A dictionary mapping additional namespace URIs to
+            prefixes, as for ``to_xml()``.
+        observable_package_source: A :class:`cybox.common.MeasureSource` to
+            write before the Observables.
+        pretty: Whether to produce readable (``True``) or compact (``False``)
+            output, as for ``to_xml()``.
+        encoding: The output character encoding. If ``None``, unicode strings
+            are written to `fileobj`.
+
+    Attributes:
+        count: The number of Observables written so far.
+    """
+
+    def __init__(self, fileobj, object_types=None, namespace_dict=None,
+                 observable_package_source=None, pretty=True,
+                 encoding="utf-8"):
+        self._fileobj = fileobj
+        self._object_types = object_types or ()
+        self._namespace_dict = namespace_dict
+        self._pretty = pretty
+        self._encoding = encoding
+        self._eol = "\n" if pretty else ""
+
+        self._root = Observables()
+        self._root.observable_package_source = observable_package_source
+
+        # The namespace URIs declared on the root element.
+        self._declared = None
+        # Whether the root start tag has been closed with ">".
+        self._has_content = False
+        self._closed = False
+        self.count = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, text):
+        text = six.text_type(text)
+        if self._encoding:
+            text = text.encode(self._encoding)
+        self._fileobj.write(text)
+
+    def _flush(self):
+        flush = getattr(self._fileobj, "flush", None)
+        if flush is not None:
+            flush()
+
+    def _export(self, obj, **kwargs):
+        with save_encoding(self._encoding):
+            return export_xml(obj, pretty_print=self._pretty, **kwargs)
+
+    def _open_root(self):
+        if not self._has_content:
+            self._write(">" + self._eol)
+            self._has_content = True
+
+    def start(self):
+        """Write the root start tag and the Observable_Package_Source.
+
+        This is done automatically by the first call to :meth:`write`.
+        """
+        if self._declared is not None:
+            return
+
+        collector = ClassNamespaceCollector()
+        root = self._root.to_obj(ns_info=collector)
+        for object_type in self._object_types:
+            if isinstance(object_type, six.string_types):
+                object_type = type_cache.api_class(object_type)
+            collector.collect(object_type())
+        if self._object_types:
+            # Object properties are made of cyboxCommon property types.
+            collector.collect(String())
+        collector.finalize(self._namespace_dict)
+
+        self._declared = set(collector.binding_namespaces)
+
+        delim = "\n\t" if self._pretty else " "
+        namespace_def = (collector.get_xmlns_string(delim) + delim +
+                         collector.get_schema_location_string(delim))
+
+        parts = ["<%s %s" % (_ROOT_TAG, namespace_def)]
+        with save_encoding(self._encoding):
+            root.exportAttributes(parts.append, 0, set(), "cybox:",
+                                  name_="Observables")
+        self._write(u"".join(parts))
+
+        source = root.Observable_Package_Source
+        if source is not None:
+            self._open_root()
+            self._write(self._export(
+                source, level=1, namespace_="cybox:",
+                name_="Observable_Package_Source"
+            ))
+        self._flush()
+
+    def _namespace_def(self, collector):
+        """Return the declarations of namespaces used by an Observable which
+        are not declared on the root."""
+        prefixes, schemalocs = collector.namespace_maps(self._namespace_dict)
+
+        undeclared = [uri for uri in prefixes if uri not in self._declared]
+        if not undeclared:
+            return ""
+
+        decls = ["xmlns:%s=%s" % (prefixes[uri], quote_attrib(uri))
+                 for uri in undeclared]
+
+        locations = ["%s %s" % (uri, schemalocs[uri]) for uri in undeclared
+                     if schemalocs.get(uri)]
+        if locations:
+            decls.append("xsi:schemaLocation=%s" %
+                         quote_attrib(" ".join(locations)))
+
+        return " ".join(decls)
+
+    def write(self, observable):
+        """Serialize `observable` and flush it to the output.
+
+        Args:
+            observable: An :class:`cybox.core.Observable`, or anything
+                ``Observables.add()`` accepts (such as ObjectProperties).
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if self._closed:
+            raise ValueError("Cannot write to a closed ObservablesWriter.")
+        if not observable:
+            return
+        if not isinstance(observable, Observable):
+            observable = Observable(observable)
+
+        self.start()
+
+        collector = ClassNamespaceCollector()
+        obj = observable.to_obj(ns_info=collector)
+
+        xml = self._export(
+            obj, level=1, namespace_="cybox:", name_="Observable",
+            namespacedef_=self._namespace_def(collector)
+        )
+
+        self._open_root()
+        self._write(xml)
+        self._flush()
+        self.count += 1
+
+    def close(self):
+        """Write the closing tag of the root element.
+
+        Further calls have no effect.
+        """
+        if self._closed:
+            return
+        self.start()
+
+        if self._has_content:
+            self._write("</%s>%s" % (_ROOT_TAG, self._eol))
+        else:
+            self._write("/>%s" % self._eol)
+
+        self._flush()
+        self._closed = True
@@ -183,8 +183,8 @@ class Artifact(ObjectProperties):
 
         return artifact_obj
 
-    def to_dict(self):
-        artifact_dict = super(Artifact, self).to_dict()
+    def _finalize_dict(self, artifact_dict):
+        super(Artifact, self)._finalize_dict(artifact_dict)
 
         if self.packaging:
             artifact_dict['packaging'] = [p.to_dict() for p in self.packaging]
@@ -192,8 +192,6 @@ class Artifact(ObjectProperties):
             self.raw_artifact.value = self.packed_data
             artifact_dict['raw_artifact'] = self.raw_artifact.to_dict()
 
-        return artifact_dict
-
     @classmethod
     def from_obj(cls, cls_obj):
         if not cls_obj:
@@ -258,10 +256,9 @@ class Compression(Packaging):
         self.compression_mechanism = compression_mechanism
         self.compression_mechanism_ref = compression_mechanism_ref
 
-    def to_dict(self):
-        dict_ = super(Compression, self).to_dict()
+    def _finalize_dict(self, dict_):
+        super(Compression, self)._finalize_dict(dict_)
         dict_['packaging_type'] = 'compression'
-        return dict_
 
 
 class ZlibCompression(Compression):
@@ -308,10 +305,9 @@ class Encryption(Packaging):
         self.encryption_mechanism_ref = encryption_mechanism_ref
         self.encryption_key_ref = encryption_key_ref
 
-    def to_dict(self):
-        dict_ = super(Encryption, self).to_dict()
+    def _finalize_dict(self, dict_):
+        super(Encryption, self)._finalize_dict(dict_)
         dict_['packaging_type'] = 'encryption'
-        return dict_
 
 
 class XOREncryption(Encryption):
@@ -370,10 +366,9 @@ class Encoding(Packaging):
         self.character_set = character_set
         self.custom_character_set_ref = custom_character_set_ref
 
-    def to_dict(self):
-        dict_ = super(Encoding, self).to_dict()
+    def _finalize_dict(self, dict_):
+        super(Encoding, self)._finalize_dict(dict_)
         dict_['packaging_type'] = 'encoding'
-        return dict_
 
 
 class Base64Encoding(Encoding):
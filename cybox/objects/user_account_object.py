@@ -16,14 +16,12 @@ class Group(entities.Entity):
     _namespace = 'http://cybox.mitre.org/objects#UserAccountObject-2'
     _XSI_TYPE = None  # overridden by subclasses
 
-    def to_dict(self):
-        d = super(Group, self).to_dict()
+    def _finalize_dict(self, d):
+        super(Group, self)._finalize_dict(d)
 
         if self._XSI_TYPE:
             d['xsi:type'] = self._XSI_TYPE
 
-        return d
-
 
 class GroupList(entities.EntityList):
     _binding = user_account_binding
@@ -40,14 +38,12 @@ class Privilege(entities.Entity):
     _namespace = 'http://cybox.mitre.org/objects#UserAccountObject-2'
     _XSI_TYPE = None  # overridden by subclasses
 
-    def to_dict(self):
-        d = super(Privilege, self).to_dict()
+    def _finalize_dict(self, d):
+        super(Privilege, self)._finalize_dict(d)
 
         if self._XSI_TYPE:
             d['xsi:type'] = self._XSI_TYPE
 
-        return d
-
 
 class PrivilegeList(entities.EntityList):
     _binding = user_account_binding
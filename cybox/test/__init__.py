@@ -11,6 +11,9 @@ from mixbox.entities import Entity
 from mixbox.vendor import six
 
 import cybox.utils
+from cybox.core import Observable, Observables
+from cybox.objects.address_object import Address
+from cybox.objects.file_object import File
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +159,23 @@ def round_trip_list(cls, list_):
     return list2
 
 
+def make_observables(file_name="example.txt", size_in_bytes=None,
+                     addresses=("10.0.0.1",)):
+    """Return Observables of an IPv4 Address for each of `addresses`,
+    followed by a File.
+    """
+    f = File()
+    f.file_name = file_name
+    if size_in_bytes is not None:
+        f.size_in_bytes = size_in_bytes
+
+    observables = Observables()
+    for address in addresses:
+        observables.add(Observable(Address(address, Address.CAT_IPV4)))
+    observables.add(Observable(f))
+    return observables
+
+
 class EntityTestCase(object):
     """A mixin class for testing CybOX Entities"""
 
@@ -0,0 +1,112 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import subprocess
+import sys
+import unittest
+
+from lxml import etree
+from mixbox import binding_utils
+from mixbox.vendor.six import u
+
+from cybox.bindings import (child_builders, export_xml, quote_attrib,
+                            quote_xml, showIndent)
+import cybox.bindings.cybox_core as core_binding
+from cybox.bindings.address_object import AddressObjectType
+from cybox.bindings.archive_file_object import ArchiveFileObjectType
+from cybox.bindings.file_object import FileObjectType
+from cybox.bindings.network_packet_object import LinkLayerType
+
+NS_FILE = "http://cybox.mitre.org/objects#FileObject-2"
+NS_ARCHIVE = "http://cybox.mitre.org/objects#ArchiveFileObject-1"
+
+
+class ChildDispatchTest(unittest.TestCase):
+
+    def test_table(self):
+        builders = child_builders[LinkLayerType]
+        self.assertEqual(set(["Physical_Interface", "Logical_Protocols"]),
+                         set(builders))
+        self.assertTrue(child_builders[LinkLayerType] is builders)
+
+    def test_inherited_entries(self):
+        builders = child_builders[ArchiveFileObjectType]
+        # Own children, children of FileObjectType and ObjectPropertiesType.
+        self.assertTrue("Archived_File" in builders)
+        self.assertTrue("File_Name" in builders)
+        self.assertTrue("Custom_Properties" in builders)
+        self.assertFalse("Archived_File" in child_builders[FileObjectType])
+
+    def test_build(self):
+        root = etree.Element("{%s}Properties" % NS_ARCHIVE)
+        name = etree.SubElement(root, "{%s}File_Name" % NS_FILE)
+        name.text = "example.zip"
+        etree.SubElement(root, "{%s}Comment" % NS_ARCHIVE).text = "Comment"
+        etree.SubElement(root, "{%s}Unknown" % NS_ARCHIVE).text = "Ignored"
+
+        obj = ArchiveFileObjectType.factory()
+        obj.build(root)
+        self.assertEqual("example.zip", obj.File_Name.valueOf_)
+        self.assertEqual("Comment", obj.Comment.valueOf_)
+
+
+class ObjectBindingsTest(unittest.TestCase):
+
+    def test_object_bindings(self):
+        self.assertTrue(core_binding.AddressObjectType is AddressObjectType)
+        self.assertTrue("AddressObjectType" in dir(core_binding))
+
+    def test_all_object_bindings_load(self):
+        # Every binding named in OBJ_LIST must be importable.
+        for name in core_binding._OBJECT_BINDINGS:
+            self.assertEqual(name, getattr(core_binding, name).__name__)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, core_binding, "NotAType")
+
+    def test_no_api_import(self):
+        # The bindings do not depend on the API classes.
+        script = ("import sys, cybox.bindings.cybox_core; "
+                  "print('cybox.objects' in sys.modules)")
+        output = subprocess.check_output([sys.executable, "-c", script])
+        self.assertEqual(b"False", output.strip())
+
+
+class ExportTest(unittest.TestCase):
+
+    VALUES = [
+        None, 42, True, u(""), u("example.txt"), u("a < b && c > d"),
+        u("say \"hi\""), u("it's"), u("it's \"quoted\""),
+        u("tab\tnew\nline\rreturn"), u("<![CDATA[<raw> & text]]>"),
+        u("\u00e9t\u00e9"),
+    ]
+
+    def test_quote_xml(self):
+        for value in self.VALUES:
+            self.assertEqual(binding_utils.quote_xml(value), quote_xml(value))
+
+    def test_quote_attrib(self):
+        for value in self.VALUES:
+            self.assertEqual(binding_utils.quote_attrib(value),
+                             quote_attrib(value))
+
+    def test_show_indent(self):
+        parts = []
+        showIndent(parts.append, 2, pretty_print=False)
+        showIndent(parts.append, 0)
+        self.assertEqual([], parts)
+        showIndent(parts.append, 2)
+        self.assertEqual(["        "], parts)
+
+    def test_export_xml(self):
+        obj = AddressObjectType(category="ipv4-addr")
+        for pretty in (True, False):
+            out = []
+            obj.export(out.append, 1, name_="Properties", pretty_print=pretty)
+            self.assertEqual(u("").join(out),
+                             export_xml(obj, 1, name_="Properties",
+                                        pretty_print=pretty))
+
+
+if __name__ == "__main__":
+    unittest.main()
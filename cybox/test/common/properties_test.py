@@ -28,6 +28,16 @@ class TestBaseProperty(unittest.TestCase):
         a = BaseProperty("test_value")
         self.assertTrue(a.is_plain())
 
+    def test_not_plain(self):
+        for name, value in (("id_", "example:a-1"), ("is_obfuscated", True),
+                            ("condition", "Equals"), ("apply_condition", "ALL"),
+                            ("is_case_sensitive", False), ("delimiter", ",")):
+            a = String("test_value")
+            setattr(a, name, value)
+            self.assertFalse(a.is_plain(), name)
+            setattr(a, name, None)
+            self.assertTrue(a.is_plain(), name)
+
     def test_string(self):
         s = String("test_string")
         self.assertEqual(s.datatype, "string")
@@ -0,0 +1,69 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import json
+import unittest
+
+from mixbox.vendor.six import BytesIO, StringIO
+
+from cybox.common import MeasureSource
+from cybox.core.jsonl import read_observables, write_observables
+from cybox.test import make_observables
+
+
+class TestJSONLines(unittest.TestCase):
+
+    def test_write(self):
+        observables = make_observables("example\ntxt").observables
+        out = BytesIO()
+        self.assertEqual(2, write_observables(iter(observables), out))
+
+        lines = out.getvalue().decode("utf-8").splitlines()
+        self.assertEqual([o.to_dict() for o in observables],
+                         [json.loads(line) for line in lines])
+
+    def test_round_trip(self):
+        observables = make_observables("example\ntxt").observables
+        out = BytesIO()
+        write_observables(observables, out, backend="json")
+        out.seek(0)
+
+        reader = read_observables(out)
+        self.assertEqual([o.to_dict() for o in observables],
+                         [o.to_dict() for o in reader])
+        self.assertEqual(None, reader.header.major_version)
+
+    def test_header(self):
+        source = MeasureSource()
+        source.name = "Example"
+        out = StringIO()
+        write_observables(make_observables("example\ntxt").observables, out,
+                          encoding=None, observable_package_source=source)
+        out.seek(0)
+
+        reader = read_observables(out)
+        self.assertEqual(2, len(list(reader)))
+        self.assertEqual(2, reader.header.major_version)
+        self.assertEqual(1, reader.header.minor_version)
+        self.assertEqual(0, reader.header.update_version)
+        self.assertEqual("Example",
+                         reader.header.observable_package_source.name)
+
+    def test_header_only(self):
+        out = BytesIO()
+        self.assertEqual(0, write_observables([], out, header=True))
+        out.seek(0)
+        reader = read_observables(out)
+        self.assertEqual([], list(reader))
+        self.assertEqual(2, reader.header.major_version)
+        self.assertEqual(None, reader.header.observable_package_source)
+
+    def test_blank_lines(self):
+        observable = make_observables("example\ntxt")[0]
+        lines = ["", json.dumps(observable.to_dict()), "  ", ""]
+        self.assertEqual([observable.to_dict()],
+                         [o.to_dict() for o in read_observables(lines)])
+
+
+if __name__ == "__main__":
+    unittest.main()
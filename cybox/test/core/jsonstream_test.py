@@ -0,0 +1,111 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import gzip
+import json
+import unittest
+
+from mixbox.vendor.six import BytesIO, StringIO, u
+
+from cybox.common import MeasureSource
+from cybox.core import Observable, ObservableComposition
+from cybox.core import jsonstream
+from cybox.core.jsonstream import (PARSER_IJSON, PARSER_JSON,
+                                   iter_json_observables)
+from cybox.objects.address_object import Address
+from cybox.test import make_observables
+
+
+def _observables():
+    observables = make_observables(u("\u00e9t\u00e9.txt"), 1234567,
+                                   ("192.168.1.1",))
+
+    composition = ObservableComposition(operator="OR")
+    composition.add(Observable(Address("10.0.0.1", Address.CAT_IPV4)))
+    composition.add(Observable(Address("10.0.0.2", Address.CAT_IPV4)))
+    observables.add(Observable(composition))
+
+    observables.observable_package_source = MeasureSource()
+    observables.observable_package_source.name = "Feed"
+    return observables
+
+
+class TestIterJSONObservables(unittest.TestCase):
+
+    parser = PARSER_JSON
+
+    def setUp(self):
+        self.observables = _observables()
+        self.json = json.dumps(self.observables.to_dict(), indent=2)
+        self.expected = [o.to_dict() for o in self.observables]
+
+    def _parse(self, source, **kwargs):
+        return iter_json_observables(source, parser=self.parser, **kwargs)
+
+    def test_observables(self):
+        stream = self._parse(BytesIO(self.json.encode("utf-8")))
+        self.assertEqual(self.expected, [o.to_dict() for o in stream])
+        self.assertTrue(isinstance(stream.header.observable_package_source,
+                                   MeasureSource))
+        self.assertEqual("Feed", stream.header.observable_package_source.name)
+        self.assertEqual(2, stream.header.major_version)
+
+    def test_small_chunks(self):
+        # Values, including multibyte characters, are split across reads.
+        for source in (BytesIO(self.json.encode("utf-8")),
+                       StringIO(self.json)):
+            stream = self._parse(source, chunk_size=3)
+            self.assertEqual(self.expected, [o.to_dict() for o in stream])
+
+    def test_header_after_observables(self):
+        doc = '{"observables": [{"id": "example:Observable-1"}], ' \
+              '"major_version": 2, "minor_version": 1}'
+        stream = self._parse(StringIO(doc), chunk_size=4)
+
+        observable = next(stream)
+        self.assertTrue(isinstance(observable, Observable))
+        self.assertEqual("example:Observable-1", observable.id_)
+        self.assertEqual(None, stream.header.major_version)
+        self.assertEqual([], list(stream))
+        self.assertEqual(1, stream.header.minor_version)
+
+    def test_empty(self):
+        for doc in ('{}', '{"observables": []}', ' { "major_version" : 2 } '):
+            self.assertEqual([], list(self._parse(StringIO(doc))))
+
+    def test_gzip(self):
+        compressed = BytesIO()
+        with gzip.GzipFile(fileobj=compressed, mode="wb") as f:
+            f.write(self.json.encode("utf-8"))
+        compressed.seek(0)
+
+        stream = self._parse(compressed)
+        self.assertEqual(self.expected, [o.to_dict() for o in stream])
+
+    def test_invalid(self):
+        for doc in ('[]', '{"observables": [{"id": 1}', '{"observables": [} '):
+            stream = self._parse(StringIO(doc))
+            self.assertRaises(ValueError, list, stream)
+
+
+@unittest.skipIf(jsonstream.ijson is None, "ijson is not installed")
+class TestIterJSONObservablesIjson(TestIterJSONObservables):
+
+    parser = PARSER_IJSON
+
+
+class TestParserChoice(unittest.TestCase):
+
+    def test_unknown_parser(self):
+        self.assertRaises(ValueError, iter_json_observables, StringIO("{}"),
+                          "nosuchparser")
+
+    def test_default_parser(self):
+        observables = _observables()
+        stream = iter_json_observables(StringIO(observables.to_json()))
+        self.assertEqual(observables.to_dict()["observables"],
+                         [o.to_dict() for o in stream])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from cybox.core import (Observable, ObservableComposition, ObservablesIndex,
+                        build_index, load_object, load_observable)
+from cybox.core.offset_index import index_filename
+from cybox.objects.address_object import Address
+from cybox.test import make_observables
+
+# An idref-only (empty) Observable, a namespace declared below the root, and
+# an attribute value containing ">".
+_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<cybox:Observables xmlns:cybox="http://cybox.mitre.org/cybox-2" cybox_major_version="2" cybox_minor_version="1" cybox_update_version="0">
+  <cybox:Observable id="example:observable-1" idref="example:observable-2"/>
+  <cybox:Observable id="example:observable-2" xmlns:AddressObj="http://cybox.mitre.org/objects#AddressObject-2" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+    <cybox:Title>a &gt; b</cybox:Title>
+    <cybox:Object id="example:object-1">
+      <cybox:Properties xsi:type="AddressObj:AddressObjectType" category="ipv4-addr" is_source="true">
+        <AddressObj:Address_Value condition="Equals" pattern_type="r>1">10.0.0.1</AddressObj:Address_Value>
+      </cybox:Properties>
+    </cybox:Object>
+  </cybox:Observable>
+</cybox:Observables>
+"""
+
+
+def _observables():
+    observables = make_observables(addresses=())
+    observables[0].object_.add_related(Address("10.0.0.1", Address.CAT_IPV4),
+                                       "Contains")
+
+    composition = ObservableComposition(operator="OR")
+    composition.add(Observable(Address("10.0.0.2", Address.CAT_IPV4)))
+    observables.add(Observable(composition))
+    return observables
+
+
+class TestObservablesIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, data):
+        path = os.path.join(self.tmpdir, "observables.xml")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_generated(self):
+        observables = _observables()
+        path = self._write(observables.to_xml())
+        index = build_index(path)
+        self.assertTrue(os.path.exists(index_filename(path)))
+
+        obs, composition = observables
+        related = obs.object_.related_objects[0]
+        nested = composition.observable_composition.observables[0]
+
+        self.assertEqual(sorted([obs.id_, composition.id_]),
+                         sorted(index.ids("Observable")))
+        # Objects in nested Observables are indexed; the nested Observables
+        # themselves are not.
+        self.assertTrue(nested.object_.id_ in index)
+        self.assertFalse(nested.id_ in index)
+
+        for expected in observables:
+            actual = load_observable(path, expected.id_)
+            self.assertEqual(expected.to_dict(), actual.to_dict())
+
+        for expected in (obs.object_, related, nested.object_):
+            actual = load_object(path, expected.id_)
+            self.assertEqual(type(expected), type(actual))
+            self.assertEqual(expected.to_dict(), actual.to_dict())
+
+        self.assertRaises(KeyError, load_observable, path, obs.object_.id_)
+        self.assertRaises(KeyError, load_object, path, obs.id_)
+        self.assertRaises(KeyError, load_observable, path, "example:missing")
+
+    def test_fragments(self):
+        path = self._write(_XML)
+        index = ObservablesIndex.build(path)
+
+        self.assertEqual(
+            b'<cybox:Observable id="example:observable-1" '
+            b'idref="example:observable-2"/>',
+            index.read_fragment("example:observable-1")
+        )
+        fragment = index.read_fragment("example:observable-2")
+        self.assertTrue(fragment.startswith(b"<cybox:Observable "))
+        self.assertTrue(fragment.endswith(b"</cybox:Observable>"))
+
+        obj = index.load_object("example:object-1")
+        self.assertEqual("10.0.0.1", obj.properties.address_value.value)
+        self.assertEqual("r>1",
+                         obj.properties.address_value.pattern_type)
+
+    def test_sidecar(self):
+        path = self._write(_XML)
+        build_index(path)
+
+        index = ObservablesIndex.load(path)
+        self.assertTrue(index.is_current())
+        self.assertEqual(3, len(index))
+        self.assertEqual("UTF-8", index.encoding)
+        self.assertEqual({"cybox": "http://cybox.mitre.org/cybox-2"},
+                         index.namespaces)
+        entry = index.entries["example:object-1"]
+        self.assertEqual("Object", entry.kind)
+        self.assertEqual("http://cybox.mitre.org/objects#AddressObject-2",
+                         entry.namespaces["AddressObj"])
+
+        # Changing the document makes the sidecar index out of date, and
+        # open() rebuilds it.
+        time.sleep(0.01)
+        self._write(_observables().to_xml())
+        self.assertFalse(ObservablesIndex.load(path).is_current())
+        self.assertFalse("example:object-1" in ObservablesIndex.open(path))
+        self.assertTrue(ObservablesIndex.load(path).is_current())
+
+    def test_compressed(self):
+        path = self._write(b"\x1f\x8b\x08\x00")
+        self.assertRaises(ValueError, ObservablesIndex.build, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
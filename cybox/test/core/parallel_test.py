@@ -0,0 +1,178 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import threading
+import unittest
+
+from mixbox.vendor.six import BytesIO, u
+
+from cybox.common import MeasureSource
+from cybox.core import Observable, Observables, parallel
+from cybox.objects.uri_object import URI
+from cybox.test import make_observables
+from cybox.utils import jsonio
+
+
+def _observables():
+    observables = Observables()
+    for i in range(10):
+        observables.extend(make_observables(u("\u00e9t\u00e9-%d.txt") % i, i,
+                                            ("10.0.0.%d" % i,)))
+        observables.add(URI("http://example.com/%d" % i, URI.TYPE_URL))
+
+    source = MeasureSource()
+    source.name = "Example"
+    observables.observable_package_source = source
+    return observables
+
+
+@unittest.skipIf(parallel._FORK is None, "fork() is not available")
+class TestParallelXML(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = _observables()
+
+    def assertSameXML(self, **kwargs):
+        self.assertEqual(self.observables.to_xml(**kwargs),
+                         self.observables.to_xml(workers=3, **kwargs))
+
+    def test_pretty(self):
+        self.assertSameXML()
+
+    def test_compact(self):
+        self.assertSameXML(pretty=False)
+
+    def test_no_namespaces(self):
+        self.assertSameXML(include_namespaces=False)
+
+    def test_unicode(self):
+        self.assertSameXML(encoding=None)
+
+    def test_namespace_dict(self):
+        self.assertSameXML(namespace_dict={"http://example.com/test": "test"})
+
+    def test_chunk_size(self):
+        self.assertEqual(
+            self.observables.to_xml(),
+            parallel.to_xml(self.observables, 2, chunk_size=7)
+        )
+
+    def test_input_namespaces(self):
+        # Namespaces of entities parsed from other documents are merged
+        # from every chunk.
+        self.observables.observables[12].__input_namespaces__ = {
+            "test": "http://example.com/test"
+        }
+        self.observables.observables[25].__input_schemalocations__ = {
+            "http://example.com/test": "test.xsd"
+        }
+        self.assertSameXML()
+        self.assertTrue(b'xmlns:test="http://example.com/test"' in
+                        self.observables.to_xml(workers=3))
+
+    def test_parsed(self):
+        xml = self.observables.to_xml()
+        for kwargs in ({}, {"lazy": True}):
+            parsed = Observables.from_xml(BytesIO(xml), **kwargs)
+            parsed.observables[0].title = "Modified"
+            self.assertEqual(parsed.to_xml(), parsed.to_xml(workers=2))
+
+    def test_lazy_unmodified(self):
+        xml = self.observables.to_xml()
+        parsed = Observables.from_xml(BytesIO(xml), lazy=True)
+        self.assertEqual(parsed.to_xml(), parsed.to_xml(workers=2))
+
+    def test_serial(self):
+        single = Observables([Observable(URI("http://example.com/"))])
+        self.assertEqual(single.to_xml(), single.to_xml(workers=2))
+        self.assertEqual(self.observables.to_xml(),
+                         self.observables.to_xml(workers=1))
+
+    def test_no_global_work(self):
+        self.observables.to_xml(workers=2)
+        self.assertEqual(None, parallel._work)
+
+    def test_threads(self):
+        # No process is forked while another thread is running.
+        def run(*args):
+            raise AssertionError("Exported in worker processes")
+
+        done = threading.Event()
+        thread = threading.Thread(target=done.wait)
+        thread.start()
+        old_run = parallel._run
+        parallel._run = run
+        try:
+            self.assertEqual(self.observables.to_xml(),
+                             self.observables.to_xml(workers=2))
+            self.assertEqual(self.observables.to_json(),
+                             self.observables.to_json(workers=2))
+        finally:
+            parallel._run = old_run
+            done.set()
+            thread.join()
+
+
+@unittest.skipIf(parallel._FORK is None, "fork() is not available")
+class TestParallelJSON(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = _observables()
+
+    def test_backends(self):
+        for backend in jsonio.available_backends():
+            self.assertEqual(
+                self.observables.to_json(backend=backend),
+                self.observables.to_json(backend=backend, workers=3)
+            )
+
+    def test_chunk_size(self):
+        self.assertEqual(
+            self.observables.to_json(backend="json"),
+            parallel.to_json(self.observables, 2, "json", chunk_size=4)
+        )
+
+    def test_fallback(self):
+        # A value the backend cannot encode makes the whole document be
+        # encoded with the standard library, as in a serial export.
+        def dumps(value):
+            raise TypeError("Not supported")
+
+        backend = jsonio.JSONBackend("failing", dumps, None)
+        self.observables.observables[3].title = "Fallback"
+        self.assertEqual(self.observables.to_json(backend=backend),
+                         self.observables.to_json(backend=backend, workers=2))
+
+    def test_serial(self):
+        single = Observables([Observable(URI("http://example.com/"))])
+        self.assertEqual(single.to_json(), single.to_json(workers=2))
+
+
+class TestParallelUnavailable(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = _observables()
+        self.old_fork = parallel._FORK
+        self.old_run = parallel._run
+        parallel._FORK = None
+
+        def run(*args):
+            raise AssertionError("Exported in worker processes")
+
+        parallel._run = run
+
+    def tearDown(self):
+        parallel._FORK = self.old_fork
+        parallel._run = self.old_run
+
+    def test_serial(self):
+        # Without a usable fork() context (on Windows, or before Python
+        # 3.7), the export is done in this process.
+        self.assertEqual(self.observables.to_xml(),
+                         self.observables.to_xml(workers=2))
+        self.assertEqual(self.observables.to_json(),
+                         self.observables.to_json(workers=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
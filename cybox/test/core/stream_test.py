@@ -0,0 +1,128 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from mixbox.vendor.six import BytesIO
+
+from cybox.common import MeasureSource
+from cybox.core import (Observable, ObservableComposition, Observables,
+                        SkippedObservable, iter_observables, stream)
+from cybox.objects.address_object import Address
+from cybox.test import make_observables
+
+
+def _observables():
+    observables = make_observables(addresses=("192.168.1.1",))
+
+    composition = ObservableComposition(operator="OR")
+    composition.add(Observable(Address("10.0.0.1", Address.CAT_IPV4)))
+    composition.add(Observable(Address("10.0.0.2", Address.CAT_IPV4)))
+    observables.add(Observable(composition))
+
+    observables.observable_package_source = MeasureSource()
+    observables.observable_package_source.name = "Feed"
+    return observables
+
+
+class TestIterObservables(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = _observables()
+        self.xml = self.observables.to_xml()
+
+    def test_yields_top_level_observables(self):
+        parsed = list(iter_observables(BytesIO(self.xml)))
+
+        self.assertEqual(3, len(parsed))
+        for expected, actual in zip(self.observables, parsed):
+            self.assertTrue(isinstance(actual, Observable))
+            self.assertEqual(expected.to_dict(), actual.to_dict())
+
+    def test_header(self):
+        stream = iter_observables(BytesIO(self.xml))
+        next(stream)
+
+        header = stream.header
+        self.assertEqual("2", header.major_version)
+        self.assertEqual("1", header.minor_version)
+        self.assertEqual("0", header.update_version)
+        self.assertEqual("Feed", header.observable_package_source.name)
+        self.assertEqual("http://cybox.mitre.org/cybox-2",
+                         header.namespaces["cybox"])
+
+    def test_parsed_elements_are_released(self):
+        stream = iter_observables(BytesIO(self.xml))
+        list(stream)
+        # Only the (cleared) last Observable is left under the root.
+        self.assertEqual(1, len(stream._root))
+        self.assertEqual(0, len(stream._root[0]))
+
+    def test_unfiltered_events(self):
+        # lxml before 3.0 reports every element to iterparse().
+        options = stream._PARSER_OPTIONS
+        stream._PARSER_OPTIONS = dict(options)
+        stream._PARSER_OPTIONS.pop("tag", None)
+        try:
+            parsed = iter_observables(BytesIO(self.xml))
+            self.assertEqual([x.to_dict() for x in self.observables],
+                             [x.to_dict() for x in parsed])
+            self.assertEqual("Feed",
+                             parsed.header.observable_package_source.name)
+        finally:
+            stream._PARSER_OPTIONS = options
+
+    def test_empty_document(self):
+        xml = Observables().to_xml()
+        stream = iter_observables(BytesIO(xml))
+        self.assertEqual([], list(stream))
+        self.assertEqual("2", stream.header.major_version)
+        self.assertEqual(None, stream.header.observable_package_source)
+
+
+class TestTypeFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = _observables()
+        self.xml = self.observables.to_xml()
+
+    def test_iter_matching_types(self):
+        parsed = list(iter_observables(BytesIO(self.xml),
+                                       object_types=["FileObjectType"]))
+
+        self.assertEqual(1, len(parsed))
+        self.assertEqual(self.observables[1].to_dict(), parsed[0].to_dict())
+
+    def test_iter_prefixed_types(self):
+        types = ["FileObj:FileObjectType", "AddressObj:AddressObjectType"]
+        parsed = list(iter_observables(BytesIO(self.xml), object_types=types))
+        self.assertEqual(2, len(parsed))
+
+    def test_iter_skipped(self):
+        parsed = list(iter_observables(BytesIO(self.xml),
+                                       object_types=["FileObjectType"],
+                                       skipped=True))
+
+        self.assertEqual(3, len(parsed))
+        self.assertEqual(
+            SkippedObservable(self.observables[0].id_, "AddressObjectType"),
+            parsed[0]
+        )
+        self.assertTrue(isinstance(parsed[1], Observable))
+        # A composition has no Object type of its own.
+        self.assertEqual(SkippedObservable(self.observables[2].id_, None),
+                         parsed[2])
+
+    def test_from_xml(self):
+        for kwargs in ({}, {"fast": True}, {"lazy": True}):
+            parsed = Observables.from_xml(BytesIO(self.xml),
+                                          object_types=["AddressObjectType"],
+                                          **kwargs)
+            self.assertEqual(1, len(parsed))
+            self.assertEqual(self.observables[0].to_dict(),
+                             parsed[0].to_dict())
+            self.assertEqual("Feed", parsed.observable_package_source.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from lxml import etree
+from mixbox.vendor.six import BytesIO, StringIO
+from mixbox.xml import TAG_SCHEMALOCATION
+
+from cybox.common import MeasureSource
+from cybox.core import Observables, ObservablesWriter
+from cybox.objects.address_object import Address
+from cybox.objects.file_object import File
+from cybox.test import make_observables
+
+
+def _split(xml):
+    """Split a document into its root start tag and the rest."""
+    end = xml.index(b'cybox_update_version="0"') + len(b'cybox_update_version="0"')
+    return xml[:end], xml[end:]
+
+
+def _schemalocs(root):
+    locs = root.get(TAG_SCHEMALOCATION).split()
+    return set(zip(locs[::2], locs[1::2]))
+
+
+class TestObservablesWriter(unittest.TestCase):
+
+    def _write(self, observables, **kwargs):
+        out = BytesIO()
+        with ObservablesWriter(out, **kwargs) as writer:
+            for observable in observables:
+                writer.write(observable)
+        self.assertEqual(len(observables), writer.count)
+        return out.getvalue()
+
+    def assertSameDocument(self, expected, actual):
+        # Namespace declarations on the root may come in a different order.
+        expected_head, expected_tail = _split(expected)
+        actual_head, actual_tail = _split(actual)
+        self.assertEqual(expected_tail, actual_tail)
+
+        expected_root = etree.fromstring(expected_head + b"/>")
+        actual_root = etree.fromstring(actual_head + b"/>")
+        self.assertEqual(expected_root.nsmap, actual_root.nsmap)
+        self.assertEqual(_schemalocs(expected_root), _schemalocs(actual_root))
+
+    def test_same_as_to_xml(self):
+        observables = make_observables().observables
+        source = MeasureSource()
+        source.name = "Feed"
+
+        batch = Observables(observables)
+        batch.observable_package_source = source
+
+        for pretty in (True, False):
+            actual = self._write(observables, pretty=pretty,
+                                 object_types=[File, "AddressObjectType"],
+                                 observable_package_source=source)
+            self.assertSameDocument(batch.to_xml(pretty=pretty), actual)
+
+    def test_empty(self):
+        self.assertEqual(Observables().to_xml(), self._write([]))
+
+    def test_undeclared_namespaces(self):
+        # Without object_types, each Observable declares the namespaces of
+        # its Object.
+        observables = make_observables().observables
+        xml = self._write(observables)
+
+        root = etree.fromstring(xml)
+        self.assertFalse("AddressObj" in root.nsmap)
+        self.assertTrue("AddressObj" in root[0].nsmap)
+        self.assertFalse("AddressObj" in root[1].nsmap)
+
+        parsed = Observables.from_xml(BytesIO(xml))
+        self.assertEqual([x.to_dict() for x in observables],
+                         [x.to_dict() for x in parsed])
+
+    def test_escaped_namespaces(self):
+        observable = make_observables()[0]
+        observable.__input_namespaces__ = {"test": "http://example.com/?a&b"}
+        observable.__input_schemalocations__ = {
+            "http://example.com/?a&b": "test.xsd?a&b"
+        }
+
+        root = etree.fromstring(self._write([observable]))
+        self.assertEqual("http://example.com/?a&b", root[0].nsmap["test"])
+
+    def test_text_output(self):
+        out = StringIO()
+        with ObservablesWriter(out, encoding=None) as writer:
+            writer.write(Address("10.0.0.1", Address.CAT_IPV4))
+
+        parsed = Observables.from_xml(BytesIO(out.getvalue().encode("utf-8")))
+        self.assertEqual("10.0.0.1",
+                         parsed[0].object_.properties.address_value.value)
+
+    def test_streams(self):
+        out = BytesIO()
+        writer = ObservablesWriter(out)
+        writer.start()
+        header = out.getvalue()
+        self.assertTrue(header.startswith(b"<cybox:Observables "))
+
+        writer.write(make_observables()[0])
+        self.assertTrue(out.getvalue().endswith(b"</cybox:Observable>\n"))
+
+        writer.close()
+        self.assertTrue(out.getvalue().endswith(b"</cybox:Observables>\n"))
+        self.assertRaises(ValueError, writer.write, make_observables()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import bz2
+import gzip
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
+import cybox.utils
+from cybox.core import Observable, Observables
+from cybox.objects.address_object import Address
+from cybox.objects.file_object import File
+from cybox.tools import convert
+from cybox.utils.fileio import lzma
+
+
+def _write_xml(filename, observables):
+    with open(filename, "wb") as f:
+        f.write(observables.to_xml())
+
+
+class _Executor(object):
+    """Stands in for a ProcessPoolExecutor, running tasks when they are
+    submitted."""
+
+    instances = []
+
+    def __init__(self, max_workers=None):
+        self.submitted = 0
+        _Executor.instances.append(self)
+
+    def shutdown(self, wait=True):
+        pass
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = futures.Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class TestConvert(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.input_dir = os.path.join(self.tmpdir, "input")
+        os.makedirs(os.path.join(self.input_dir, "sub"))
+
+        f = File()
+        f.file_name = "example.txt"
+        self.observables = [
+            Observables(Observable(Address("10.0.0.1", Address.CAT_IPV4))),
+            Observables(Observable(f)),
+        ]
+        _write_xml(os.path.join(self.input_dir, "a.xml"), self.observables[0])
+        _write_xml(os.path.join(self.input_dir, "sub", "b.xml"),
+                   self.observables[1])
+        with open(os.path.join(self.input_dir, "bad.xml"), "wb") as f:
+            f.write(b"<not-cybox")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_find_files(self):
+        names = [name for _, name in convert.find_files([self.input_dir])]
+        self.assertEqual(["a.xml", "bad.xml", os.path.join("sub", "b.xml")],
+                         names)
+
+    def test_find_compressed_files(self):
+        xml = self.observables[0].to_xml()
+        writers = [(".xml.gz", gzip.open), (".XML.BZ2", bz2.BZ2File)]
+        if lzma is not None:
+            writers.append((".xml.xz", lzma.LZMAFile))
+        for extension, opener in writers:
+            f = opener(os.path.join(self.input_dir, "c" + extension), "wb")
+            with f:
+                f.write(xml)
+        with open(os.path.join(self.input_dir, "notes.txt"), "wb") as f:
+            f.write(b"Not XML")
+
+        files = list(convert.find_files([self.input_dir]))
+        names = [name for _, name in files]
+        expected = ["a.xml", "bad.xml", os.path.join("sub", "b.xml")]
+        expected.extend("c" + extension for extension, _ in writers)
+        self.assertEqual(sorted(expected), sorted(names))
+
+        output_dir = os.path.join(self.tmpdir, "output")
+        results = list(convert.convert_files([self.input_dir], output_dir,
+                                             workers=1))
+        self.assertEqual(len(files) - 1, len([r for r in results if r.ok]))
+        self.assertTrue(os.path.join(output_dir, "c.json") in
+                        [r.output for r in results])
+
+    def test_json_filename(self):
+        for name in ("a.xml", "a.xml.gz", "a.XML.BZ2", "a.xml.xz", "a.txt"):
+            self.assertEqual(os.path.join("out", "a.json"),
+                             convert.json_filename("out", name))
+
+    @unittest.skipIf(futures is None, "concurrent.futures is not available")
+    def test_bounded_submission(self):
+        for i in range(10):
+            _write_xml(os.path.join(self.input_dir, "many-%d.xml" % i),
+                       self.observables[0])
+
+        output_dir = os.path.join(self.tmpdir, "output")
+        old_executor = convert.ProcessPoolExecutor
+        convert.ProcessPoolExecutor = _Executor
+        try:
+            results = convert.convert_files([self.input_dir], output_dir,
+                                            workers=2)
+            next(results)
+            executor = _Executor.instances[-1]
+            self.assertEqual(2 * convert.PENDING_PER_WORKER,
+                             executor.submitted)
+            self.assertEqual(13, 1 + len(list(results)))
+            self.assertEqual(13, executor.submitted)
+        finally:
+            convert.ProcessPoolExecutor = old_executor
+
+    @unittest.skipIf(futures is None, "concurrent.futures is not available")
+    @unittest.skipIf(
+        getattr(multiprocessing, "get_start_method", lambda: None)() != "fork",
+        "worker processes are not forked")
+    def test_worker_dies(self):
+        # The worker converting "die.xml" is killed, which fails every
+        # pending chunk. Only that file is reported as failed.
+        _write_xml(os.path.join(self.input_dir, "die.xml"),
+                   self.observables[0])
+        for i in range(4):
+            _write_xml(os.path.join(self.input_dir, "z-%d.xml" % i),
+                       self.observables[1])
+
+        old_convert = convert._convert
+
+        def _convert(task):
+            if task[0].endswith("die.xml"):
+                os._exit(1)
+            return old_convert(task)
+
+        output_dir = os.path.join(self.tmpdir, "output")
+        convert._convert = _convert
+        try:
+            results = list(convert.convert_files([self.input_dir], output_dir,
+                                                 workers=2))
+        finally:
+            convert._convert = old_convert
+
+        names = [os.path.basename(r.path) for r in results]
+        self.assertEqual(["a.xml", "bad.xml", "die.xml", "z-0.xml", "z-1.xml",
+                          "z-2.xml", "z-3.xml", "b.xml"], names)
+        self.assertEqual([True, False, False, True, True, True, True, True],
+                         [r.ok for r in results])
+        self.assertTrue(results[2].error.startswith("BrokenProcessPool"))
+
+    def test_json(self):
+        output_dir = os.path.join(self.tmpdir, "output")
+        results = list(convert.convert_files([self.input_dir], output_dir,
+                                             workers=1))
+
+        self.assertEqual([True, False, True], [r.ok for r in results])
+        self.assertTrue(results[1].error.startswith("XMLSyntaxError"))
+        self.assertEqual(None, results[1].output)
+
+        expected = [os.path.join(output_dir, "a.json"),
+                    os.path.join(output_dir, "sub", "b.json")]
+        self.assertEqual(expected, [results[0].output, results[2].output])
+        for filename, observables in zip(expected, self.observables):
+            with io.open(filename, encoding="utf-8") as f:
+                self.assertEqual(observables.to_dict(), json.load(f))
+
+    def test_jsonl_workers(self):
+        output = os.path.join(self.tmpdir, "out.jsonl")
+        results = list(convert.convert_files([self.input_dir], output,
+                                             format=convert.FORMAT_JSONL,
+                                             workers=2, chunksize=2))
+
+        self.assertEqual([True, False, True], [r.ok for r in results])
+        with io.open(output, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual([x.to_dict() for x in self.observables],
+                         [json.loads(x) for x in lines])
+
+    def test_cache_untouched(self):
+        # Each file is parsed in a cache scope of its own.
+        count = cybox.utils.cache_count()
+        output_dir = os.path.join(self.tmpdir, "output")
+        list(convert.convert_files([self.input_dir], output_dir, workers=1))
+        self.assertEqual(count, cybox.utils.cache_count())
+
+    def test_bad_format(self):
+        results = convert.convert_files([self.input_dir], self.tmpdir,
+                                        format="yaml")
+        self.assertRaises(ValueError, list, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from mixbox.vendor.six import BytesIO, u
+
+from cybox.core import Observable, Observables
+from cybox.test import make_observables
+from cybox.utils import binary
+from cybox.utils.binary import (MAGIC, BinaryReader, BinaryWriter, dumps,
+                                loads)
+
+
+VALUES = [
+    None, True, False, 0, 1, 127, 128, -1, -32, -33, -200, 2 ** 16, -2 ** 40,
+    2 ** 64 - 1, 2 ** 70, -2 ** 70, 1.5, u(""), u("abc"), u("x") * 40,
+    u("y") * 300, u("z") * 70000, [], list(range(20)), {},
+    dict((u("key%d") % i, i) for i in range(20)),
+    {u("nested"): [{u("xsi:type"): u("AddressObjectType")}] * 3},
+]
+
+
+def _codecs():
+    codecs = [(binary._PythonEncoder, binary._PythonDecoder)]
+    if binary.msgpack is not None:
+        codecs += [
+            (binary._MsgpackEncoder, binary._MsgpackDecoder),
+            (binary._PythonEncoder, binary._MsgpackDecoder),
+            (binary._MsgpackEncoder, binary._PythonDecoder),
+        ]
+    return codecs
+
+
+class TestCodecs(unittest.TestCase):
+
+    def test_values(self):
+        for encoder_class, decoder_class in _codecs():
+            for compact in (False, True):
+                encoder, decoder = encoder_class(compact), decoder_class()
+                for value in VALUES + VALUES:
+                    self.assertEqual(value,
+                                     decoder.decode(encoder.encode(value)))
+
+    def test_interning(self):
+        encoder = binary._PythonEncoder(compact=True)
+        value = {u("condition"): u("Equals")}
+
+        first = encoder.encode(value)
+        second = encoder.encode(value)
+        third = encoder.encode(value)
+        # The key is interned at once, and the value once it repeats.
+        self.assertTrue(len(second) < len(first))
+        self.assertTrue(len(third) < len(second))
+
+        decoder = binary._PythonDecoder()
+        for data in (first, second, third):
+            self.assertEqual(value, decoder.decode(data))
+
+    def test_unencodable(self):
+        encoder = binary._PythonEncoder()
+        self.assertRaises(TypeError, encoder.encode, object())
+        self.assertRaises(TypeError, encoder.encode, {1: u("a")})
+
+
+class TestStreams(unittest.TestCase):
+
+    def test_entity_round_trip(self):
+        observables = make_observables(u("\u00e9t\u00e9.txt"), 42,
+                                       ("10.0.0.1", "10.0.0.2"))
+        data = observables.to_bytes()
+        self.assertTrue(data.startswith(MAGIC))
+        self.assertEqual(observables.to_dict(),
+                         Observables.from_bytes(data).to_dict())
+
+        observable = observables[2]
+        self.assertEqual(observable.to_dict(),
+                         Observable.from_bytes(observable.to_bytes()).to_dict())
+
+    def test_smaller_than_json(self):
+        observables = make_observables(u("\u00e9t\u00e9.txt"), 42,
+                                       ("10.0.0.1", "10.0.0.2"))
+        self.assertTrue(len(observables.to_bytes()) <
+                        len(observables.to_json().encode("utf-8")))
+        self.assertTrue(len(observables.to_bytes(compact=True)) <
+                        len(observables.to_bytes()))
+
+    def test_frames(self):
+        observables = make_observables(u("\u00e9t\u00e9.txt"), 42,
+                                       ("10.0.0.1", "10.0.0.2"))
+        for compact in (False, True):
+            out = BytesIO()
+            writer = BinaryWriter(out, compact)
+            for observable in observables:
+                writer.write(observable)
+            self.assertEqual(3, writer.count)
+
+            reader = BinaryReader(BytesIO(out.getvalue()), Observable)
+            self.assertEqual([o.to_dict() for o in observables],
+                             [o.to_dict() for o in reader])
+        self.assertEqual([], list(BinaryReader(BytesIO())))
+
+    def test_invalid(self):
+        data = dumps([1, 2, 3])
+        self.assertEqual([1, 2, 3], loads(data))
+        self.assertRaises(ValueError, loads, b"")
+        self.assertRaises(ValueError, loads, b"XXXX\x01" + data[len(MAGIC):])
+        self.assertRaises(ValueError, loads, data[:-1])
+        self.assertRaises(ValueError, loads, data + data[len(MAGIC):])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,514 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import gc
+import sys
+import threading
+import unittest
+
+from mixbox.vendor.six import BytesIO
+
+import cybox.utils
+from cybox.core import (Object, Observable, Observables, RelatedObject,
+                        iter_json_observables, iter_observables)
+from cybox.core.jsonl import read_observables, write_observables
+from cybox.objects.file_object import File
+from cybox.utils.caches import (Cache, CacheMiss, CacheScope, DictCache,
+                                DocumentCache, LRUCache, NullCache,
+                                WeakValueCache, scoped, sizeof)
+
+
+class Value(object):
+    """A value that can be weakly referenced."""
+
+    def __init__(self, id_, data=""):
+        self.id_ = id_
+        self.data = data
+
+
+class Unnamed(object):
+    """A value without an ``id_``, which a cache generates one for."""
+    pass
+
+
+class TestDictCache(unittest.TestCase):
+
+    def test_stats(self):
+        cache = DictCache()
+        cache.put(Value("a"))
+        cache.get("a")
+        self.assertRaises(CacheMiss, cache.get, "b")
+
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "evictions": 0, "count": 1},
+            cache.stats()
+        )
+        cache.reset_stats()
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_max_entries(self):
+        cache = LRUCache(max_entries=2)
+        a, b, c = Value("a"), Value("b"), Value("c")
+        cache.put(a)
+        cache.put(b)
+        self.assertEqual(a, cache.get("a"))
+        cache.put(c)
+
+        # "b" was the least recently used.
+        self.assertRaises(CacheMiss, cache.get, "b")
+        self.assertEqual(a, cache.get("a"))
+        self.assertEqual(c, cache.get("c"))
+        self.assertEqual(2, cache.count())
+        self.assertEqual(1, cache.evictions)
+
+    def test_put_again(self):
+        cache = LRUCache(max_entries=2)
+        cache.put(Value("a"))
+        cache.put(Value("b"))
+        cache.put(Value("a"))
+        cache.put(Value("c"))
+
+        self.assertRaises(CacheMiss, cache.get, "b")
+        self.assertEqual(2, cache.count())
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_bytes=250, sizeof=lambda value: 100)
+        for id_ in "abcd":
+            cache.put(Value(id_))
+
+        # Each value is measured when the next one is put.
+        self.assertEqual(200, cache.size())
+        self.assertEqual(2, cache.count())
+        self.assertEqual(2, cache.evictions)
+        self.assertRaises(CacheMiss, cache.get, "b")
+        cache.get("c")
+        cache.get("d")
+
+    def test_measured_late(self):
+        # Objects are cached when their id is set, before their properties.
+        sizes = []
+        cache = LRUCache(max_bytes=10 ** 9,
+                         sizeof=lambda value: sizes.append(value.data) or 1)
+        value = Value("a")
+        cache.put(value)
+        value.data = "filled in"
+        cache.put(Value("b"))
+
+        self.assertEqual(["filled in"], sizes)
+        self.assertEqual(2, cache.size())
+
+    def test_oversized(self):
+        cache = LRUCache(max_bytes=10, sizeof=lambda value: 100)
+        cache.put(Value("a"))
+        cache.put(Value("b"))
+        self.assertEqual(1, cache.count())
+        cache.get("b")
+
+    def test_generated_ids(self):
+        cache = LRUCache(max_entries=10)
+        self.assertEqual(0, cache.put(42))
+        self.assertEqual(1, cache.put(43))
+        self.assertEqual(43, cache.get(1))
+
+    def test_clear(self):
+        cache = LRUCache(max_bytes=1000)
+        cache.put(Value("a"))
+        cache.clear()
+        self.assertEqual(0, cache.count())
+        self.assertEqual(0, cache.size())
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, LRUCache, max_entries=0)
+
+    def test_unbounded_size(self):
+        self.assertEqual(None, LRUCache().size())
+
+
+class TestWeakValueCache(unittest.TestCase):
+
+    def test_dropped(self):
+        cache = WeakValueCache()
+        value = Value("a")
+        cache.put(value)
+        self.assertEqual(value, cache.get("a"))
+
+        del value
+        gc.collect()
+        self.assertRaises(CacheMiss, cache.get, "a")
+        self.assertEqual(0, cache.count())
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "evictions": 0, "count": 0},
+            cache.stats()
+        )
+
+
+class TestSizeof(unittest.TestCase):
+
+    def test_entity(self):
+        f = File()
+        f.file_name = "example.txt"
+        small = sizeof(Object(f))
+
+        f = File()
+        f.file_name = "example.txt" * 100
+        self.assertTrue(sizeof(Object(f)) > small + 1000)
+
+    def test_cycle(self):
+        value = Value("a")
+        value.data = [value]
+        self.assertTrue(sizeof(value) > 0)
+
+
+class TestGlobalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = cybox.utils.set_cache(LRUCache(max_entries=2))
+
+    def tearDown(self):
+        cybox.utils.set_cache(self.previous)
+
+    def test_set_cache(self):
+        objects = [Object(id_="example:Object-%d" % i) for i in range(3)]
+        self.assertEqual(2, cybox.utils.cache_count())
+        self.assertEqual(objects[2], cybox.utils.cache_get(objects[2].id_))
+        self.assertRaises(CacheMiss, cybox.utils.cache_get, objects[0].id_)
+
+        stats = cybox.utils.cache_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["evictions"])
+
+    def test_reset(self):
+        cybox.utils.set_cache(None)
+        self.assertTrue(isinstance(cybox.utils.caches._get_cache(),
+                                   DictCache))
+
+
+def _related_observables():
+    f = File()
+    f.file_name = "example.txt"
+    target = Object(f, id_="example:Object-target")
+    source = Object(File(), id_="example:Object-source")
+    related = RelatedObject(idref=target.id_, relationship="Contains")
+    source.related_objects.append(related)
+    return Observables([Observable(target), Observable(source)])
+
+
+def _related(observables):
+    return observables.observables[1].object_.related_objects[0]
+
+
+def _has_target(cache):
+    try:
+        cache.get("example:Object-target")
+    except CacheMiss:
+        return False
+    return True
+
+
+class TestCacheScope(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = cybox.utils.set_cache(DictCache())
+
+    def tearDown(self):
+        cybox.utils.set_cache(self.previous)
+
+    def test_scope(self):
+        with cybox.utils.cache_scope() as scope:
+            obj = Object(id_="example:Object-1")
+            self.assertEqual(obj, cybox.utils.cache_get(obj.id_))
+            self.assertEqual(1, scope.cache.count())
+
+        self.assertRaises(CacheMiss, cybox.utils.cache_get, obj.id_)
+        self.assertEqual(0, cybox.utils.cache_count())
+
+    def test_nested(self):
+        outer = cybox.utils.cache_scope()
+        with outer:
+            Object(id_="example:Object-1")
+            with cybox.utils.cache_scope(LRUCache(max_entries=1)) as inner:
+                Object(id_="example:Object-2")
+                self.assertRaises(CacheMiss, cybox.utils.cache_get,
+                                  "example:Object-1")
+            cybox.utils.cache_get("example:Object-1")
+
+            # A scope can be entered again.
+            with outer:
+                cybox.utils.cache_get("example:Object-1")
+
+        self.assertEqual(1, outer.cache.count())
+        self.assertEqual(1, inner.cache.count())
+
+    def test_exception(self):
+        try:
+            with cybox.utils.cache_scope():
+                raise ValueError()
+        except ValueError:
+            pass
+        Object(id_="example:Object-1")
+        self.assertEqual(1, cybox.utils.cache_count())
+
+    def test_scoped(self):
+        cache = DictCache()
+        scope = cybox.utils.cache_scope()
+        self.assertTrue(scoped(scope) is scope)
+        self.assertTrue(isinstance(scoped(cache), CacheScope))
+        self.assertTrue(scoped(cache).cache is cache)
+        with scoped(None) as none:
+            self.assertEqual(None, none)
+
+    def test_threads(self):
+        # Each thread starts outside of any scope, and only sees its own.
+        entered = threading.Event()
+        resume = threading.Event()
+        scopes = []
+
+        def run():
+            with cybox.utils.cache_scope() as scope:
+                Object(id_="example:Object-scoped")
+                entered.set()
+                resume.wait(10)
+                cybox.utils.cache_get("example:Object-scoped")
+            scopes.append(scope)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        try:
+            entered.wait(10)
+            with cybox.utils.cache_scope() as scope:
+                self.assertRaises(CacheMiss, cybox.utils.cache_get,
+                                  "example:Object-scoped")
+            Object(id_="example:Object-global")
+        finally:
+            resume.set()
+            thread.join()
+
+        self.assertEqual(1, cybox.utils.cache_count())
+        self.assertEqual(1, scopes[0].cache.count())
+
+    def test_from_xml(self):
+        xml = _related_observables().to_xml()
+        cybox.utils.cache_clear()
+
+        for kwargs in ({}, {"fast": True}):
+            scope = cybox.utils.cache_scope()
+            parsed = Observables.from_xml(BytesIO(xml), scope=scope,
+                                          **kwargs)
+            self.assertEqual(0, cybox.utils.cache_count())
+            self.assertTrue(_has_target(scope.cache))
+
+            related = _related(parsed)
+            self.assertRaises(CacheMiss, related.get_properties)
+            with scope:
+                self.assertEqual("example.txt",
+                                 related.get_properties().file_name)
+
+    def test_documents_apart(self):
+        xml = _related_observables().to_xml()
+        cybox.utils.cache_clear()
+        first = Observables.from_xml(BytesIO(xml), scope=DictCache())
+        second = Observables.from_xml(BytesIO(xml), scope=DictCache())
+        self.assertEqual(0, cybox.utils.cache_count())
+        self.assertFalse(first.observables[0].object_ is
+                         second.observables[0].object_)
+
+    def test_from_json(self):
+        doc = _related_observables().to_json()
+        cybox.utils.cache_clear()
+        data = _related_observables().to_bytes()
+        cybox.utils.cache_clear()
+
+        json_cache, bytes_cache = DictCache(), DictCache()
+        Observables.from_json(doc, scope=json_cache)
+        Observables.from_bytes(data, scope=bytes_cache)
+
+        self.assertTrue(_has_target(json_cache))
+        self.assertTrue(_has_target(bytes_cache))
+        self.assertEqual(0, cybox.utils.cache_count())
+
+    def test_streams(self):
+        observables = _related_observables()
+        xml = observables.to_xml()
+        json_doc = observables.to_json().encode("utf-8")
+        lines = BytesIO()
+        write_observables(observables, lines)
+        cybox.utils.cache_clear()
+
+        for parse, doc in ((iter_observables, xml),
+                           (iter_json_observables, json_doc),
+                           (read_observables, lines.getvalue())):
+            scope = cybox.utils.cache_scope()
+            self.assertEqual(2, len(list(parse(BytesIO(doc), scope=scope))))
+            self.assertTrue(_has_target(scope.cache))
+            self.assertEqual(0, cybox.utils.cache_count())
+
+
+class TestCachingDisabled(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = cybox.utils.set_cache(DictCache())
+
+    def tearDown(self):
+        cybox.utils.set_caching(True)
+        cybox.utils.set_cache(self.previous)
+
+    def test_context(self):
+        with cybox.utils.caching_disabled():
+            self.assertFalse(cybox.utils.caching_enabled())
+            obj = Object(id_="example:Object-1")
+            self.assertRaises(CacheMiss, cybox.utils.cache_get, obj.id_)
+
+            with cybox.utils.cache_scope() as scope:
+                self.assertTrue(cybox.utils.caching_enabled())
+                Object(id_="example:Object-2")
+            self.assertEqual(1, scope.cache.count())
+
+        self.assertTrue(cybox.utils.caching_enabled())
+        self.assertEqual(0, cybox.utils.cache_count())
+
+    def test_set_caching(self):
+        Object(id_="example:Object-1")
+        self.assertTrue(cybox.utils.set_caching(False))
+        Object(id_="example:Object-2")
+        self.assertRaises(CacheMiss, cybox.utils.cache_get,
+                          "example:Object-1")
+        self.assertFalse(cybox.utils.set_caching(True))
+
+        # The global cache is kept while caching is off.
+        cybox.utils.cache_get("example:Object-1")
+        self.assertRaises(CacheMiss, cybox.utils.cache_get,
+                          "example:Object-2")
+
+    def test_null_cache(self):
+        cache = NullCache()
+        self.assertEqual("a", cache.put(Value("a")))
+        self.assertRaises(CacheMiss, cache.get, "a")
+        self.assertEqual(0, cache.count())
+        self.assertEqual(1, cache.misses)
+
+    def test_get_properties(self):
+        xml = _related_observables().to_xml()
+        cybox.utils.cache_clear()
+
+        for kwargs in ({}, {"lazy": True}):
+            with cybox.utils.caching_disabled():
+                parsed = Observables.from_xml(BytesIO(xml), **kwargs)
+                related = _related(parsed)
+                self.assertRaises(CacheMiss, related.get_properties)
+                self.assertEqual(
+                    "example.txt",
+                    related.get_properties(document=parsed).file_name
+                )
+
+        self.assertEqual(0, cybox.utils.cache_count())
+
+        related.idref = "example:Object-missing"
+        self.assertRaises(CacheMiss, related.get_properties, parsed)
+
+    def test_document_cache(self):
+        with cybox.utils.caching_disabled():
+            observables = _related_observables()
+
+        # The RelatedObject only has an idref.
+        cache = DocumentCache(observables)
+        self.assertEqual(2, cache.count())
+        self.assertEqual(observables.observables[0].object_,
+                         cache.get("example:Object-target"))
+        self.assertRaises(CacheMiss, cache.get, "example:Object-missing")
+
+        with cybox.utils.cache_scope(cache):
+            self.assertEqual("example.txt",
+                             _related(observables).get_properties().file_name)
+            obj = Object(id_="example:Object-new")
+        self.assertEqual(obj, cache.get(obj.id_))
+        self.assertEqual(0, cybox.utils.cache_count())
+
+
+def _in_threads(function, count=8):
+    """Call `function` with each of ``range(count)`` in a thread of its
+    own, and return the results in that order."""
+    results = [None] * count
+    errors = []
+
+    def run(index):
+        try:
+            results[index] = function(index)
+        except Exception as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+class TestThreads(unittest.TestCase):
+
+    def setUp(self):
+        # Switch threads as often as possible, to make races likely.
+        if hasattr(sys, "setswitchinterval"):
+            self.interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if hasattr(sys, "setswitchinterval"):
+            sys.setswitchinterval(self.interval)
+
+    def test_generated_ids(self):
+        for cache in (DictCache(), LRUCache(), WeakValueCache()):
+            values = [[Unnamed() for _ in range(5000)] for _ in range(8)]
+            ids = _in_threads(
+                lambda index: [cache.put(value) for value in values[index]]
+            )
+
+            generated = set(id_ for thread_ids in ids for id_ in thread_ids)
+            self.assertEqual(8 * 5000, len(generated))
+            self.assertEqual(8 * 5000, cache.count())
+
+    def test_lru(self):
+        cache = LRUCache(max_entries=100)
+
+        def run(index):
+            for i in range(1000):
+                cache.put(Value("%d-%d" % (index, i)))
+                try:
+                    cache.get("%d-%d" % (index, i // 2))
+                except CacheMiss:
+                    pass
+
+        _in_threads(run)
+        self.assertEqual(100, cache.count())
+        self.assertEqual(8 * 1000 - 100, cache.evictions)
+
+    def test_locks(self):
+        # Caches do not wait on each other's locks.
+        caches = [DictCache(), DictCache(), LRUCache(), NullCache()]
+        self.assertEqual(len(caches), len(set(id(x._lock) for x in caches)))
+
+        class Legacy(Cache):
+            # A subclass which does not call Cache.__init__().
+            def __init__(self):
+                self.values = {}
+
+            def _save(self, value, id_):
+                self.values[id_] = value
+                return id_
+
+        legacy = Legacy()
+        self.assertEqual("a", legacy.put(Value("a")))
+        self.assertTrue(legacy._lock is legacy._lock)
+        self.assertRaises(AttributeError, getattr, legacy, "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
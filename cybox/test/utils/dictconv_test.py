@@ -0,0 +1,81 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from mixbox.entities import Entity, EntityList
+
+from cybox.common import Hash, HashList, String
+from cybox.core import Observable, Observables
+from cybox.objects.file_object import File
+from cybox.test import make_observables
+from cybox.utils import dictconv
+from cybox.utils.dictconv import FastDictMixin
+
+
+def _observables():
+    observables = make_observables(size_in_bytes=42)
+    observable = observables[1]
+    observable.title = "A file"
+    f = observable.object_.properties
+    f.hashes = HashList([Hash("d41d8cd98f00b204e9800998ecf8427e")])
+    f.file_name.condition = "Equals"
+    return observables
+
+
+def _generic_to_dict(entity):
+    if isinstance(entity, EntityList):
+        return EntityList.to_dict(entity)
+    return Entity.to_dict(entity)
+
+
+class TestDictConv(unittest.TestCase):
+
+    def test_to_dict(self):
+        observables = _observables()
+        self.assertEqual(_generic_to_dict(observables), observables.to_dict())
+        self.assertEqual(observables.to_dict(), dictconv.to_dict(observables))
+        self.assertEqual(None, dictconv.to_dict(None))
+
+    def test_key_order(self):
+        observable = _observables()[1]
+        self.assertEqual(list(_generic_to_dict(observable)),
+                         list(observable.to_dict()))
+
+    def test_round_trip(self):
+        observables_dict = _observables().to_dict()
+        observables = Observables.from_dict(observables_dict)
+        self.assertEqual(observables_dict, observables.to_dict())
+        self.assertEqual(observables_dict,
+                         dictconv.from_dict(Observables,
+                                            observables_dict).to_dict())
+
+        observable = observables[1]
+        self.assertEqual("A file", observable.title)
+        self.assertTrue(isinstance(observable.object_.properties, File))
+        self.assertEqual(None, observable.idref)
+
+    def test_plain_values(self):
+        s = String.from_dict("example")
+        self.assertEqual("example", s.value)
+        self.assertTrue(s.is_plain())
+        self.assertEqual("example", s.to_dict())
+        self.assertEqual(None, String.from_dict(None))
+
+    def test_converters_cached(self):
+        observables = _observables()
+        observables.to_dict()
+        converter = dictconv._to_dict_converters[Observable]
+        observables.to_dict()
+        self.assertTrue(converter is dictconv._to_dict_converters[Observable])
+
+    def test_no_fields(self):
+        class Example(FastDictMixin, Entity):
+            pass
+
+        entity = Example.from_dict({"ignored": 1})
+        self.assertEqual({}, entity.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
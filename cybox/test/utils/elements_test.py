@@ -0,0 +1,75 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from mixbox.vendor.six import BytesIO, u
+from lxml import etree
+from mixbox.xml import get_etree_root
+
+import cybox.utils
+from cybox.core import Observable, Observables
+from cybox.core.observable import Keywords
+from cybox.objects.network_packet_object import NetworkPacket
+from cybox.objects.win_file_object import WinFile
+from cybox.test.core import object_test, observable_test
+from cybox.test.objects import network_packet_test, win_file_test
+from cybox.utils.elements import ElementProxy
+
+
+class TestFastParse(unittest.TestCase):
+
+    def assertFastParseEqual(self, observables):
+        xml = observables.to_xml()
+
+        cybox.utils.cache_clear()
+        expected = Observables.from_xml(BytesIO(xml))
+        cybox.utils.cache_clear()
+        actual = Observables.from_xml(BytesIO(xml), fast=True)
+
+        self.maxDiff = None
+        self.assertEqual(expected.to_dict(), actual.to_dict())
+        return actual
+
+    def test_observable(self):
+        o = Observable.from_dict(observable_test.TestObservable._full_dict)
+        self.assertFastParseEqual(Observables(o))
+
+    def test_related_objects(self):
+        o = Observable.from_dict({'object': object_test.ObjectTest._full_dict})
+        self.assertFastParseEqual(Observables(o))
+
+    def test_typed_leaf_values(self):
+        # Packet headers hold xs:boolean and xs:integer leaf elements.
+        np = NetworkPacket.from_dict(network_packet_test.TestNetworkPacket._full_dict)
+        self.assertFastParseEqual(Observables(Observable(np)))
+
+    def test_nested_properties(self):
+        f = WinFile.from_dict(win_file_test.TestWinFile._full_dict)
+        self.assertFastParseEqual(Observables(Observable(f)))
+
+    def test_proxy_attributes(self):
+        o = Observable(title=u("Title"))
+        o.sighting_count = 3
+        xml = Observables(o).to_xml()
+
+        root = Observables.from_xml(BytesIO(xml), fast=True)
+        self.assertEqual(3, root.observables[0].sighting_count)
+
+        proxy = ElementProxy(get_etree_root(BytesIO(xml))[0], Observable)
+        self.assertEqual(u("Title"), proxy.Title)
+        self.assertEqual(3, proxy.sighting_count)
+        self.assertEqual(None, proxy.Event)
+        self.assertRaises(AttributeError, getattr, proxy, "Not_A_Field")
+
+    def test_proxy_defaults_not_shared(self):
+        element = etree.fromstring(
+            '<cybox:Keywords xmlns:cybox="http://cybox.mitre.org/cybox-2"/>'
+        )
+        proxy = ElementProxy(element, Keywords)
+        proxy.Keyword.append(u("Changed"))
+        self.assertEqual([], ElementProxy(element, Keywords).Keyword)
+
+
+if __name__ == "__main__":
+    unittest.main()
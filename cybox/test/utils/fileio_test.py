@@ -0,0 +1,111 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import bz2
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from mixbox.vendor.six import BytesIO
+
+import cybox.bindings.cybox_core as core_binding
+from cybox.core import Observable, Observables, iter_observables
+from cybox.objects.address_object import Address
+from cybox.utils import fileio
+
+
+def _gzip(data):
+    buf = BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+class _Unseekable(object):
+    """A file-like object without tell(), seek() or peek()."""
+
+    def __init__(self, data):
+        self._buf = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._buf.read(size)
+
+
+class TestCompressedInput(unittest.TestCase):
+
+    def setUp(self):
+        self.observables = Observables([
+            Observable(Address("10.0.0.1", Address.CAT_IPV4)),
+            Observable(Address("10.0.0.2", Address.CAT_IPV4)),
+        ])
+        self.xml = self.observables.to_xml()
+        self.compressed = {
+            fileio.GZIP: _gzip(self.xml),
+            fileio.BZIP2: bz2.compress(self.xml),
+        }
+        if fileio.lzma is not None:
+            self.compressed[fileio.XZ] = fileio.lzma.compress(self.xml)
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, name, data):
+        filename = os.path.join(self.tmpdir, name)
+        with open(filename, "wb") as f:
+            f.write(data)
+        return filename
+
+    def assertParsed(self, obj):
+        parsed = Observables.from_obj(obj)
+        self.assertEqual(self.observables.to_dict(), parsed.to_dict())
+
+    def test_compression(self):
+        for format_, data in self.compressed.items():
+            self.assertEqual(format_, fileio.compression(data[:6]))
+        self.assertEqual(None, fileio.compression(self.xml[:6]))
+        self.assertEqual(None, fileio.compression(u"<xml/>"))
+
+    def test_parse_filename(self):
+        # Detection does not depend on the file extension.
+        for format_, data in self.compressed.items():
+            self.assertParsed(core_binding.parse(self._write(format_, data)))
+
+    def test_parse_fileobj(self):
+        for data in self.compressed.values():
+            self.assertParsed(core_binding.parse(BytesIO(data)))
+            self.assertParsed(core_binding.parse(_Unseekable(data)))
+        self.assertParsed(core_binding.parse(_Unseekable(self.xml)))
+
+    def test_parse_mapped(self):
+        filename = self._write("plain.xml", self.xml)
+        self.assertParsed(core_binding.parse(filename))
+
+        self.assertRaises(Exception, core_binding.parse,
+                          self._write("empty.xml", b""))
+
+    def test_parse_string(self):
+        for data in self.compressed.values():
+            self.assertParsed(core_binding.parseString(data))
+        self.assertParsed(core_binding.parseString(self.xml))
+        self.assertParsed(core_binding.parseString(self.xml.decode("utf-8")))
+
+    def test_from_xml(self):
+        for data in self.compressed.values():
+            for kwargs in ({}, {"fast": True}, {"lazy": True}):
+                parsed = Observables.from_xml(BytesIO(data), **kwargs)
+                self.assertEqual(self.observables.to_dict(), parsed.to_dict())
+
+    def test_iter_observables(self):
+        for format_, data in self.compressed.items():
+            stream = iter_observables(self._write(format_, data))
+            parsed = [x.to_dict() for x in stream]
+            self.assertEqual([x.to_dict() for x in self.observables], parsed)
+            self.assertEqual([], stream._opened)
+
+
+if __name__ == "__main__":
+    unittest.main()
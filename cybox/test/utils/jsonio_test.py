@@ -0,0 +1,86 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import json
+import unittest
+
+from mixbox.vendor.six import BytesIO, StringIO, u
+
+from cybox.core import Observables
+from cybox.test import make_observables
+from cybox.utils import jsonio
+
+
+class TestJSONBackends(unittest.TestCase):
+
+    def tearDown(self):
+        jsonio.set_backend(None)
+
+    def test_available(self):
+        names = jsonio.available_backends()
+        self.assertEqual("json", names[-1])
+
+    def test_default(self):
+        # The standard library is used unless another backend is selected,
+        # whichever libraries are installed.
+        observable = make_observables(u("\u00e9t\u00e9.txt"), 42)[1]
+        self.assertEqual("json", jsonio.get_backend().name)
+        self.assertEqual(json.dumps(observable.to_dict()),
+                         observable.to_json())
+
+    def test_round_trip(self):
+        observables = make_observables(u("\u00e9t\u00e9.txt"), 42)
+        expected = observables.to_dict()
+
+        for name in jsonio.available_backends():
+            doc = observables.to_json(backend=name)
+            self.assertEqual(expected, json.loads(doc))
+            self.assertEqual(expected,
+                             Observables.from_json(doc, name).to_dict())
+            self.assertEqual(
+                expected,
+                Observables.from_json(BytesIO(doc.encode("utf-8")),
+                                      name).to_dict())
+
+    def test_stdlib_output(self):
+        observable = make_observables(u("\u00e9t\u00e9.txt"), 42)[1]
+        self.assertEqual(json.dumps(observable.to_dict()),
+                         observable.to_json(backend="json"))
+
+    def test_set_backend(self):
+        fastest = jsonio.available_backends()[0]
+        jsonio.set_backend(fastest)
+        self.assertEqual(fastest, jsonio.get_backend().name)
+        jsonio.set_backend(None)
+        self.assertEqual("json", jsonio.get_backend().name)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, jsonio.get_backend, "nosuchjson")
+        self.assertRaises(ValueError, jsonio.set_backend, "nosuchjson")
+
+    def test_unencodable_fallback(self):
+        value = {"big": 2 ** 70}
+        for name in jsonio.available_backends():
+            self.assertEqual(value, json.loads(jsonio.dumps(value, name)))
+
+    def test_register_backend(self):
+        calls = []
+
+        def dumps(value):
+            calls.append(value)
+            return json.dumps(value)
+
+        backend = jsonio.JSONBackend("example", dumps, json.loads)
+        jsonio.register_backend(backend)
+        try:
+            self.assertTrue("example" in jsonio.available_backends())
+            self.assertEqual("[1]", jsonio.dumps([1], "example"))
+            self.assertEqual([[1]], calls)
+            self.assertEqual([1], jsonio.load(StringIO(u("[1]")), backend))
+        finally:
+            jsonio._backends.pop("example")
+            jsonio._preferred.remove("example")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from mixbox.vendor.six import BytesIO, u
+
+import cybox.utils
+import cybox.bindings.cybox_core as core_binding
+from cybox.core import Object, Observable, Observables
+from cybox.objects.address_object import Address
+from cybox.test import make_observables
+from cybox.test.core import observable_test
+from cybox.utils.lazy import is_lazy
+
+
+class TestLazyParse(unittest.TestCase):
+
+    def setUp(self):
+        cybox.utils.cache_clear()
+        observables = make_observables(size_in_bytes=42,
+                                       addresses=("192.168.1.1",))
+        self.xml = observables.to_xml()
+
+    def parse(self):
+        return Observables.from_xml(BytesIO(self.xml), lazy=True)
+
+    def test_values(self):
+        lazy = self.parse()
+        cybox.utils.cache_clear()
+        eager = Observables.from_xml(BytesIO(self.xml))
+        self.assertEqual(eager.to_dict(), lazy.to_dict())
+
+    def test_full_observable(self):
+        o = Observable.from_dict(observable_test.TestObservable._full_dict)
+        xml = Observables(o).to_xml()
+        lazy = Observables.from_xml(BytesIO(xml), lazy=True)
+        self.assertEqual(Observables.from_xml(BytesIO(xml)).to_dict(),
+                         lazy.to_dict())
+
+    def test_from_obj(self):
+        obj = core_binding.parse(BytesIO(self.xml))
+        lazy = Observables.from_obj(obj, lazy=True)
+        self.assertTrue(is_lazy(lazy))
+        self.assertEqual(Observables.from_obj(obj).to_dict(), lazy.to_dict())
+
+    def test_fields_load_on_first_read(self):
+        observable = self.parse().observables[0]
+        self.assertTrue(is_lazy(observable))
+        self.assertTrue(Observable.object_ in observable._fields._pending)
+
+        obj = observable.object_
+        self.assertFalse(Observable.object_ in observable._fields._pending)
+        self.assertTrue(is_lazy(obj))
+        self.assertTrue(Object.properties in obj._fields._pending)
+
+        address = obj.properties
+        self.assertTrue(isinstance(address, Address))
+        self.assertTrue(is_lazy(address))
+        self.assertEqual(u("192.168.1.1"), address.address_value.value)
+        self.assertTrue(address.parent is obj)
+
+    def test_ids_are_cached(self):
+        obj = self.parse().observables[0].object_
+        self.assertTrue(obj.id_.startswith("example:Address-"))
+        self.assertTrue(cybox.utils.cache_get(obj.id_) is obj)
+
+    def test_unmodified_to_xml(self):
+        lazy = self.parse()
+        lazy.observables[1].object_.properties.file_name
+        self.assertEqual(
+            Observables.from_xml(BytesIO(self.xml)).to_dict(),
+            Observables.from_xml(BytesIO(lazy.to_xml())).to_dict()
+        )
+
+        element = lazy._fields.source.__sourcenode__
+        element[0].set("title_check", "1")
+        self.assertTrue(b"title_check" in lazy.to_xml())
+
+    def test_unmodified_to_xml_format(self):
+        lazy = self.parse()
+        xml = lazy.to_xml(encoding=None)
+        self.assertTrue(u("\n  <cybox:Observable ") in xml)
+        self.assertFalse(u("\n\txmlns:") in xml)
+
+        # Elements below the root have no xsi:schemaLocation of their own.
+        cybox.utils.cache_clear()
+        eager = Observables.from_xml(BytesIO(self.xml))
+        self.assertFalse(b"schemaLocation" in lazy.observables[0].to_xml())
+        self.assertTrue(b"schemaLocation" in eager.observables[0].to_xml())
+
+    def test_unmodified_to_xml_options(self):
+        lazy = self.parse()
+        cybox.utils.cache_clear()
+        eager = Observables.from_xml(BytesIO(self.xml))
+
+        self.assertEqual(eager.to_xml(include_namespaces=False),
+                         lazy.to_xml(include_namespaces=False))
+
+        namespace_dict = {"http://example.com/test": "test"}
+        xml = lazy.to_xml(namespace_dict=namespace_dict)
+        self.assertTrue(b'xmlns:test="http://example.com/test"' in xml)
+        self.assertEqual(eager.to_dict(),
+                         Observables.from_xml(BytesIO(xml)).to_dict())
+
+    def test_modified_to_xml(self):
+        lazy = self.parse()
+        lazy.observables[0].title = u("Changed")
+        self.assertTrue(b"Changed" in lazy.to_xml())
+
+    def test_modified_leaf_value(self):
+        lazy = self.parse()
+        lazy.observables[1].object_.properties.file_name.value = "other.txt"
+        xml = lazy.to_xml()
+        self.assertTrue(b"other.txt" in xml)
+        self.assertFalse(b"example.txt" in xml)
+
+    def test_modified_list(self):
+        lazy = self.parse()
+        lazy.add(Observable(Address("10.0.0.1", Address.CAT_IPV4)))
+        parsed = Observables.from_xml(BytesIO(lazy.to_xml()))
+        self.assertEqual(3, len(parsed.observables))
+
+    def test_observable_to_xml(self):
+        observable = self.parse().observables[1]
+        xml = observable.to_xml(encoding=None)
+        self.assertTrue(xml.startswith(u("<cybox:Observable ")))
+        self.assertTrue(u("example.txt") in xml)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+import warnings
+
+from mixbox import entities
+from mixbox import idgen
+from mixbox.entities import NamespaceCollector
+from mixbox.namespaces import Namespace, register_namespace
+
+from cybox.common import ObjectProperties
+from cybox.core import Observables
+from cybox.objects.file_object import File
+from cybox.test import make_observables
+from cybox.utils import nscollector
+from cybox.utils.nscollector import ClassNamespaceCollector
+
+
+class _Registered(entities.Entity):
+    _namespace = "http://example.com/nscollector-test"
+
+
+def _finalized(collector, entity):
+    entity.to_obj(ns_info=collector)
+    collector.finalize()
+    return collector
+
+
+class TestClassNamespaceCollector(unittest.TestCase):
+
+    def setUp(self):
+        nscollector._namespace_defs.clear()
+
+    def test_same_namespaces(self):
+        observables = make_observables()
+        expected = _finalized(NamespaceCollector(), observables)
+        actual = _finalized(ClassNamespaceCollector(), observables)
+
+        self.assertEqual(expected.binding_namespaces,
+                         actual.binding_namespaces)
+        self.assertEqual(expected.finalized_schemalocs,
+                         actual.finalized_schemalocs)
+
+    def test_classes(self):
+        collector = ClassNamespaceCollector()
+        make_observables().to_obj(ns_info=collector)
+
+        self.assertEqual(Observables, collector.classes[0])
+        self.assertEqual(len(set(collector.classes)), len(collector.classes))
+        self.assertTrue(File in collector.classes)
+        self.assertFalse(collector.has_input_namespaces)
+
+    def test_namespace_classes(self):
+        self.assertEqual((File,), nscollector.namespace_classes(File))
+        self.assertEqual((), nscollector.namespace_classes(ObjectProperties))
+
+    def test_input_namespaces(self):
+        observables = make_observables()
+        observables.__input_namespaces__ = {"test": "http://example.com/test"}
+        observables.__input_schemalocations__ = {
+            "http://example.com/test": "test.xsd"
+        }
+        collector = ClassNamespaceCollector()
+        observables.to_obj(ns_info=collector)
+
+        self.assertTrue(collector.has_input_namespaces)
+        self.assertEqual(observables.__input_namespaces__,
+                         collector._input_namespaces)
+        self.assertEqual(observables.__input_schemalocations__,
+                         collector._input_schemalocs)
+
+    def test_merge(self):
+        observables = make_observables()
+        first = ClassNamespaceCollector()
+        observables.observables[0].to_obj(ns_info=first)
+        second = ClassNamespaceCollector()
+        observables.observables[1].to_obj(ns_info=second)
+
+        first.merge(second)
+        self.assertTrue(File in first.classes)
+        self.assertEqual(len(set(first.classes)), len(first.classes))
+
+    def test_namespace_def_cached(self):
+        observable = make_observables().observables[1]
+        collector = ClassNamespaceCollector()
+        observable.to_obj(ns_info=collector)
+        namespace_def = collector.namespace_def()
+        self.assertTrue('xmlns:FileObj=' in namespace_def)
+
+        # Another collector with the same classes is not finalized.
+        other = ClassNamespaceCollector()
+        observable.to_obj(ns_info=other)
+        self.assertEqual(namespace_def, other.namespace_def())
+        self.assertEqual(None, other.binding_namespaces)
+
+        self.assertNotEqual(namespace_def, other.namespace_def(delim="\n"))
+
+    def test_namespace_def_id_namespace(self):
+        observable = make_observables().observables[0]
+        old_namespace = idgen.get_id_namespace()
+        old_alias = idgen.get_id_namespace_alias()
+
+        try:
+            collector = ClassNamespaceCollector()
+            observable.to_obj(ns_info=collector)
+            collector.namespace_def()
+
+            idgen.set_id_namespace(Namespace("http://example.com/test",
+                                             "test"))
+            collector = ClassNamespaceCollector()
+            observable.to_obj(ns_info=collector)
+            self.assertTrue('xmlns:test="http://example.com/test"' in
+                            collector.namespace_def())
+        finally:
+            idgen.set_id_namespace(Namespace(old_namespace, old_alias))
+
+    def test_namespace_def_input_namespaces(self):
+        observables = make_observables()
+        observables.__input_namespaces__ = {"test": "http://example.com/test"}
+        observables.__input_schemalocations__ = {
+            "http://example.com/test": "test.xsd"
+        }
+
+        collector = ClassNamespaceCollector()
+        observables.to_obj(ns_info=collector)
+        self.assertTrue('xmlns:test="http://example.com/test"' in
+                        collector.namespace_def())
+        self.assertEqual({}, nscollector._namespace_defs)
+
+    def test_namespace_def_registered(self):
+        def namespace_def():
+            collector = ClassNamespaceCollector()
+            collector.collect(_Registered())
+            return collector.namespace_def()
+
+        register_namespace(Namespace(_Registered._namespace, "nstest"))
+        with warnings.catch_warnings():
+            # Without a schema location, mixbox warns when finalizing.
+            warnings.simplefilter("ignore")
+            self.assertTrue('xmlns:nstest=' in namespace_def())
+            self.assertFalse('nstest.xsd' in namespace_def())
+
+        # Registering the namespace again adds its schema location.
+        register_namespace(Namespace(_Registered._namespace, "nstest",
+                                     "nstest.xsd"))
+        self.assertTrue('nstest.xsd' in namespace_def())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from mixbox.vendor.six import BytesIO, u
+
+import cybox.utils
+from cybox.core import Object, Observable, Observables, RelatedObject
+from cybox.objects.address_object import Address
+from cybox.objects.file_object import File
+from cybox.utils.caches import CacheMiss
+from cybox.utils import sqlitecache
+from cybox.utils.sqlitecache import SQLiteCache
+
+
+def _file_object(id_, name):
+    f = File()
+    f.file_name = name
+    f.size_in_bytes = 42
+    return Object(f, id_=id_)
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "objects.db")
+        self.cache = SQLiteCache(self.path, memory_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self):
+        self.cache.close()
+        self.cache = SQLiteCache(self.path, memory_entries=2)
+
+    def stored(self):
+        """Return the IDs another connection sees in the database."""
+        db = sqlite3.connect(self.path)
+        try:
+            return sorted(row[0] for row in
+                          db.execute("SELECT id FROM cybox_objects"))
+        finally:
+            db.close()
+
+    def test_persistent(self):
+        with cybox.utils.cache_scope(self.cache):
+            obj = _file_object("example:Object-1", u("\u00e9t\u00e9.txt"))
+        self.assertTrue(obj is self.cache.get(obj.id_))
+
+        self.reopen()
+        loaded = self.cache.get(obj.id_)
+        self.assertEqual(obj.to_dict(), loaded.to_dict())
+        self.assertTrue(isinstance(loaded.properties, File))
+
+        # Values read back are kept in memory.
+        self.assertTrue(loaded is self.cache.get(obj.id_))
+        self.assertEqual(2, self.cache.hits)
+        self.assertRaises(CacheMiss, self.cache.get, "example:Object-2")
+        self.assertEqual(1, self.cache.misses)
+
+    def test_written_when_evicted(self):
+        with cybox.utils.cache_scope(self.cache):
+            objects = [_file_object("example:Object-%d" % i, "%d.txt" % i)
+                       for i in range(5)]
+
+        # The Objects were complete when they were dropped from memory.
+        self.assertEqual(3, self.cache.evictions)
+        loaded = self.cache.get(objects[0].id_)
+        self.assertFalse(loaded is objects[0])
+        self.assertEqual("0.txt", loaded.properties.file_name)
+        self.assertEqual(5, self.cache.count())
+
+    def test_committed_after_scope(self):
+        with cybox.utils.cache_scope(self.cache):
+            _file_object("example:Object-1", "1.txt")
+            _file_object("example:Object-2", "2.txt")
+        self.assertEqual(["example:Object-1", "example:Object-2"],
+                         self.stored())
+
+    def test_count_in_scope(self):
+        # Counting does not write values which may not be complete.
+        with cybox.utils.cache_scope(self.cache):
+            for i in range(5):
+                _file_object("example:Object-%d" % i, "%d.txt" % i)
+            self.assertEqual(5, self.cache.count())
+            self.assertEqual([], self.stored())
+        self.assertEqual(5, len(self.stored()))
+        self.assertEqual(5, self.cache.count())
+
+    def test_pending_written(self):
+        # Without a scope, the values kept aside are written once there are
+        # MAX_PENDING of them.
+        old_max_pending = sqlitecache.MAX_PENDING
+        sqlitecache.MAX_PENDING = 3
+        try:
+            for i in range(5):
+                self.cache.put(_file_object("example:Object-%d" % i,
+                                            "%d.txt" % i))
+        finally:
+            sqlitecache.MAX_PENDING = old_max_pending
+
+        self.assertEqual(0, len(self.cache._pending))
+        self.cache._commit()
+        self.assertEqual(["example:Object-0", "example:Object-1",
+                          "example:Object-2"], self.stored())
+        self.assertEqual(5, self.cache.count())
+
+    def test_flush(self):
+        obj = _file_object("example:Object-1", "before.txt")
+        self.cache.put(obj)
+        self.cache.flush()
+        obj.properties.file_name = "after.txt"
+
+        self.reopen()
+        self.assertEqual("before.txt",
+                         self.cache.get(obj.id_).properties.file_name)
+
+    def test_related_object(self):
+        target = _file_object("example:Object-target", "example.txt")
+        source = Object(Address("10.0.0.1", Address.CAT_IPV4))
+        source.related_objects.append(
+            RelatedObject(idref=target.id_, relationship="Contains")
+        )
+        xml = Observables([Observable(target), Observable(source)]).to_xml()
+
+        Observables.from_xml(BytesIO(xml), scope=self.cache)
+        self.reopen()
+
+        with cybox.utils.caching_disabled():
+            observables = Observables.from_xml(BytesIO(xml))
+        related = observables.observables[1].object_.related_objects[0]
+
+        with cybox.utils.cache_scope(self.cache):
+            self.assertEqual("example.txt",
+                             related.get_properties().file_name)
+
+        # Only the IDs the Objects were parsed with are stored.
+        self.assertEqual(2, self.cache.count())
+
+    def test_evicted_while_parsing(self):
+        # Objects dropped from memory before they are complete are written
+        # once the document has been parsed.
+        obj = _file_object("example:Object-parent", "parent.txt")
+        for i in range(5):
+            f = File()
+            f.file_name = "child-%d.txt" % i
+            obj.add_related(f, "Contains")
+        xml = Observables([Observable(obj)]).to_xml()
+
+        with cybox.utils.cache_scope(self.cache):
+            Observables.from_xml(BytesIO(xml))
+            self.assertTrue(self.cache.evictions > 0)
+        self.reopen()
+
+        loaded = self.cache.get(obj.id_)
+        self.assertEqual(5, len(loaded.related_objects))
+        self.assertEqual("child-4.txt",
+                         loaded.related_objects[4].properties.file_name)
+
+        for fast in (False, True):
+            self.cache.clear()
+            Observables.from_xml(BytesIO(xml), fast=fast, scope=self.cache)
+            self.reopen()
+            self.assertEqual(5, len(self.cache.get(obj.id_).related_objects))
+
+    def test_put_again(self):
+        obj = _file_object("example:Object-1", "before.txt")
+        with cybox.utils.cache_scope(self.cache):
+            self.cache.put(obj)
+            self.cache.put(_file_object("example:Object-2", "2.txt"))
+            self.cache.put(_file_object("example:Object-3", "3.txt"))
+            obj = _file_object("example:Object-1", "after.txt")
+
+        self.reopen()
+        self.assertEqual("after.txt",
+                         self.cache.get(obj.id_).properties.file_name)
+
+    def test_not_entities(self):
+        self.cache.put(42, id_="answer")
+        self.assertEqual(42, self.cache.get("answer"))
+        self.cache.flush()
+        self.assertEqual([], self.stored())
+        self.assertEqual(1, self.cache.count())
+
+    def test_stored_class(self):
+        # Only cybox Entity classes are built from the database.
+        db = sqlite3.connect(self.path)
+        db.executemany("INSERT INTO cybox_objects VALUES (?, ?, ?)", [
+            ("example:os", "os.system", "{}"),
+            ("example:cache", "cybox.utils.caches.DictCache", "{}"),
+        ])
+        db.commit()
+        db.close()
+
+        self.assertRaises(ValueError, self.cache.get, "example:os")
+        self.assertRaises(ValueError, self.cache.get, "example:cache")
+
+    def test_clear(self):
+        self.cache.put(_file_object("example:Object-1", "example.txt"))
+        self.cache.flush()
+        self.cache.clear()
+        self.assertEqual(0, self.cache.count())
+        self.assertRaises(CacheMiss, self.cache.get, "example:Object-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from lxml import etree
+from mixbox.vendor.six import BytesIO
+from mixbox.xml import TAG_SCHEMALOCATION, get_xml_parser
+
+import cybox.utils
+from cybox.core import Observables
+from cybox.objects.address_object import Address
+from cybox.objects.email_message_object import EmailMessage
+from cybox.test import make_observables
+from cybox.utils.treebuilder import to_etree
+
+
+def _schemalocs(root):
+    locs = (root.get(TAG_SCHEMALOCATION) or "").split()
+    return set(zip(locs[::2], locs[1::2]))
+
+
+class TestToEtree(unittest.TestCase):
+
+    def assertSameTree(self, entity, **kwargs):
+        expected = etree.fromstring(entity.to_xml(pretty=False, **kwargs))
+        actual = to_etree(entity, **kwargs)
+
+        self.assertEqual(expected.nsmap, actual.nsmap)
+        self.assertEqual(_schemalocs(expected), _schemalocs(actual))
+        for root in (expected, actual):
+            root.attrib.pop(TAG_SCHEMALOCATION, None)
+        self.assertEqual(etree.tostring(expected, method="c14n"),
+                         etree.tostring(actual, method="c14n"))
+
+    def test_observables(self):
+        observables = make_observables(size_in_bytes=42)
+        self.assertSameTree(observables)
+        self.assertSameTree(observables[1])
+        self.assertSameTree(observables,
+                            namespace_dict={"http://example.com": "example"})
+
+    def test_object_properties(self):
+        self.assertSameTree(Address("10.0.0.1", Address.CAT_IPV4))
+
+    def test_mixin(self):
+        observables = make_observables(size_in_bytes=42)
+        self.assertEqual(etree.tostring(to_etree(observables)),
+                         etree.tostring(observables.to_etree()))
+
+    def test_cdata(self):
+        # The raw body is exported as CDATA.
+        email = EmailMessage()
+        email.subject = "Hello"
+        email.raw_body = "<html>Hi & bye</html>"
+        self.assertSameTree(Observables(email))
+
+    def test_include_namespaces(self):
+        root = to_etree(make_observables(size_in_bytes=42),
+                        include_namespaces=False)
+        self.assertEqual(None, root.get(TAG_SCHEMALOCATION))
+        self.assertTrue("FileObj" in root.nsmap)
+
+    def test_lazy(self):
+        cybox.utils.cache_clear()
+        xml = make_observables(size_in_bytes=42).to_xml()
+        lazy = Observables.from_xml(BytesIO(xml), lazy=True)
+
+        before = lazy.to_xml()
+        root = lazy.to_etree()
+        expected = etree.fromstring(xml, get_xml_parser())
+        self.assertEqual(etree.tostring(expected), etree.tostring(root))
+        # The element is a copy of the source.
+        root.clear()
+        self.assertEqual(before, lazy.to_xml())
+
+        root = lazy.to_etree(include_namespaces=False)
+        self.assertEqual(None, root.get(TAG_SCHEMALOCATION))
+        self.assertTrue(expected.get(TAG_SCHEMALOCATION))
+
+        root = lazy.to_etree(namespace_dict={"http://example.com/test": "test"})
+        self.assertEqual("http://example.com/test", root.nsmap["test"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from lxml import etree
+
+import cybox.bindings.cybox_core as core_binding
+from cybox.bindings.address_object import AddressObjectType
+from cybox.common.object_properties import ObjectPropertiesFactory
+from cybox.objects import UnknownObjectType, get_class_for_object_type
+from cybox.objects.address_object import Address
+from cybox.utils.typecache import type_cache
+
+ADDRESS_NS = "http://cybox.mitre.org/objects#AddressObject-2"
+
+
+def _properties(prefix):
+    return etree.Element("Properties", nsmap={prefix: ADDRESS_NS})
+
+
+class TypeCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        type_cache.clear()
+
+    def test_api_class(self):
+        self.assertEqual(Address, type_cache.api_class("AddressObjectType"))
+        self.assertEqual(Address, get_class_for_object_type("AddressObjectType"))
+        self.assertTrue(type_cache.resolve(None, "AddressObjectType") is
+                        type_cache.resolve(None, "AddressObjectType"))
+
+    def test_object_properties_factory(self):
+        binding = AddressObjectType(xsi_type="AddressObj:AddressObjectType")
+        key = ObjectPropertiesFactory.objkey(binding)
+        self.assertEqual("AddressObjectType", key)
+        self.assertEqual(Address, ObjectPropertiesFactory.entity_class(key))
+
+    def test_unknown_type(self):
+        self.assertRaises(UnknownObjectType, get_class_for_object_type,
+                          "NotAnObjectType")
+        self.assertRaises(UnknownObjectType, type_cache.api_class,
+                          "NotAnObjectType")
+        self.assertRaises(KeyError, type_cache.binding_class,
+                          "Foo:NotAnObjectType")
+
+    def test_binding_class_namespace(self):
+        # The same type is found whatever prefix a document gives it.
+        first = _properties("AddressObj")
+        second = _properties("addr")
+        self.assertEqual(AddressObjectType, type_cache.binding_class(
+            "AddressObj:AddressObjectType", first))
+        self.assertEqual(AddressObjectType, type_cache.binding_class(
+            "addr:AddressObjectType", second))
+        self.assertEqual([(ADDRESS_NS, "AddressObjectType")],
+                         list(type_cache._types))
+
+        # Unprefixed names are in the default namespace.
+        default = _properties(None)
+        type_cache.binding_class("AddressObjectType", default)
+        self.assertEqual(1, len(type_cache._types))
+
+    def test_root_class(self):
+        node = etree.Element("{http://cybox.mitre.org/cybox-2}Observables")
+        self.assertEqual(("Observables", core_binding.ObservablesType),
+                         core_binding.get_root_tag(node))
+        self.assertTrue(("http://cybox.mitre.org/cybox-2", "Observables") in
+                        type_cache._types)
+        self.assertEqual(("NotARoot", None),
+                         type_cache.root_class("{http://example.com}NotARoot"))
+
+    def test_add_external_class(self):
+        name = "TypeCacheTestObjectType"
+        self.assertRaises(KeyError, type_cache.binding_class, "Test:" + name)
+
+        class TypeCacheTestObjectType(AddressObjectType):
+            pass
+
+        type_cache.binding_class("AddressObj:AddressObjectType")
+        core_binding.add_external_class(TypeCacheTestObjectType)
+        try:
+            self.assertEqual({}, type_cache._types)
+            self.assertEqual(TypeCacheTestObjectType,
+                             type_cache.binding_class("Test:" + name))
+        finally:
+            delattr(core_binding, name)
+            type_cache.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
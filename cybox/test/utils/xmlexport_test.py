@@ -0,0 +1,79 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+
+import unittest
+
+from lxml import etree
+from mixbox import entities
+from mixbox.vendor.six import u
+
+from cybox.core import (Action, Actions, AssociatedObject, AssociatedObjects,
+                        Event, Object, Observable)
+from cybox.objects.address_object import Address
+from cybox.objects.file_object import File
+from cybox.utils import xmlexport
+from cybox.utils.xmlexport import XMLExportMixin
+
+
+def _event():
+    f = File()
+    f.file_name = u("\u00e9t\u00e9 <&>.txt")
+    action = Action()
+    action.name = "Create File"
+    action.associated_objects = AssociatedObjects([AssociatedObject(f)])
+    event = Event()
+    event.type_ = "File Ops (CRUD)"
+    event.actions = Actions([action])
+    return event
+
+
+_SCHEMALOCATION = "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation"
+
+
+def _canonical(xml):
+    # The namespace declarations and schema locations are not written in
+    # any particular order.
+    root = etree.fromstring(xml)
+    locations = root.attrib.pop(_SCHEMALOCATION, "").split()
+    return etree.tostring(root, method="c14n"), sorted(
+        zip(locations[::2], locations[1::2])
+    )
+
+
+class TestXMLExport(unittest.TestCase):
+
+    def assertSameXML(self, entity, **kwargs):
+        expected = entities.Entity.to_xml(entity, **kwargs)
+        actual = xmlexport.to_xml(entity, **kwargs)
+        self.assertEqual(type(expected), type(actual))
+        self.assertEqual(_canonical(expected), _canonical(actual))
+
+    def test_same_xml(self):
+        obj = Object(Address("10.0.0.1", Address.CAT_IPV4))
+        for entity in (_event(), obj, Observable(obj)):
+            self.assertSameXML(entity)
+            self.assertSameXML(entity, pretty=False)
+            self.assertSameXML(entity, encoding=None)
+            self.assertEqual(
+                entities.Entity.to_xml(entity, include_namespaces=False),
+                xmlexport.to_xml(entity, include_namespaces=False)
+            )
+            self.assertSameXML(
+                entity, namespace_dict={"http://example.com/test": "test"}
+            )
+
+    def test_mixin(self):
+        event = _event()
+        self.assertTrue(isinstance(event, XMLExportMixin))
+        self.assertTrue(isinstance(event.actions[0], XMLExportMixin))
+        self.assertEqual(_canonical(entities.Entity.to_xml(event)),
+                         _canonical(event.to_xml()))
+
+        f = File()
+        self.assertTrue(isinstance(f, XMLExportMixin))
+        self.assertEqual(_canonical(entities.Entity.to_xml(f)),
+                         _canonical(f.to_xml()))
+
+
+if __name__ == "__main__":
+    unittest.main()
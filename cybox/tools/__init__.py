@@ -0,0 +1,3 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Command-line tools for working with CybOX documents."""
@@ -0,0 +1,380 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Convert CybOX XML documents to JSON in bulk.
+
+Files are converted in a pool of worker processes. Each file is converted on
+its own: a file that fails to parse is reported along with the time spent on
+it, and the rest of the batch carries on. If a worker process dies (killed
+for running out of memory, for instance), the files it was converting are
+reported as failed and the pool is started again for the rest. Every file is
+parsed in a :func:`cybox.utils.cache_scope` of its own, so Objects from one
+document are never resolved from (or kept in memory for) another.
+
+Input files may be gzip, bzip2 or xz compressed (see
+:mod:`cybox.utils.fileio`). Output is written either as one ``.json`` file
+per input file (:data:`FORMAT_JSON`) or as a single JSON Lines file holding
+one Observables document per line (:data:`FORMAT_JSONL`).
+
+Installing the package adds a ``cybox-convert`` command running
+:func:`main`.
+
+Example usage:
+    cybox-convert -o json/ feeds/
+    python -m cybox.tools.convert -f jsonl -o feeds.jsonl -j 8 feeds/
+"""
+
+import argparse
+import collections
+import errno
+import multiprocessing
+import io
+import os
+import sys
+from timeit import default_timer
+
+try:
+    from concurrent.futures import Future, ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+except ImportError:
+    # Python 2 without the "futures" backport: convert in this process.
+    ProcessPoolExecutor = None
+
+from mixbox.vendor import six
+
+import cybox.utils
+from cybox.core import Observables
+
+FORMAT_JSON = "json"
+FORMAT_JSONL = "jsonl"
+FORMATS = (FORMAT_JSON, FORMAT_JSONL)
+
+#: The filename extensions of the files searched for in directories.
+XML_EXTENSIONS = (".xml", ".xml.gz", ".xml.bz2", ".xml.xz")
+
+# The number of chunks of files handed to the pool ahead of the results
+# being read, per worker.
+PENDING_PER_WORKER = 2
+
+# Before Python 3.7 (and in the Python 2 backport), the executor terminates
+# the workers of a broken pool itself, and shutdown() can then block forever
+# on a queue lock held by a terminated worker.
+_SHUTDOWN_BROKEN = sys.version_info >= (3, 7)
+
+
+class ConversionResult(object):
+    """The outcome of converting one file.
+
+    Attributes:
+        path: The input filename.
+        output: The filename the JSON was written to, or ``None`` if the
+            conversion failed.
+        seconds: The time spent converting the file.
+        error: A description of the error the conversion failed with, or
+            ``None``.
+    """
+
+    def __init__(self, path, output=None, seconds=0.0, error=None):
+        self.path = path
+        self.output = output
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the file was converted."""
+        return self.error is None
+
+
+def find_files(paths, extensions=XML_EXTENSIONS):
+    """Yield the files to convert for a list of files and directories.
+
+    Directories are searched recursively for files ending in one of
+    `extensions` (in any case).
+
+    Yields:
+        ``(filename, name)`` tuples, where `name` is the path of the file
+        relative to the directory it was found in (or its basename, for files
+        given directly).
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path, os.path.basename(path)
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(extensions):
+                    filename = os.path.join(dirpath, filename)
+                    yield filename, os.path.relpath(filename, path)
+
+
+def json_filename(output_dir, name):
+    """Return the output filename for the input file `name`.
+
+    One of :data:`XML_EXTENSIONS` (or else any extension) is replaced by
+    ``.json``.
+    """
+    lower = name.lower()
+    for extension in sorted(XML_EXTENSIONS, key=len, reverse=True):
+        if lower.endswith(extension):
+            base = name[:-len(extension)]
+            break
+    else:
+        base = os.path.splitext(name)[0]
+    return os.path.join(output_dir, base + ".json")
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as ex:
+        # Another worker may have created it first.
+        if ex.errno != errno.EEXIST:
+            raise
+
+
+def _write(filename, document):
+    dirname = os.path.dirname(filename)
+    if dirname:
+        _makedirs(dirname)
+
+    with io.open(filename, "w", encoding="utf-8") as f:
+        f.write(six.text_type(document))
+
+
+def _convert(task):
+    """Convert one file in a worker process.
+
+    Returns:
+        A ``(ConversionResult, document)`` tuple. `document` is the JSON
+        string if no output filename was given, and ``None`` otherwise.
+    """
+    path, output, fast = task
+    start = default_timer()
+    document = None
+
+    try:
+        with cybox.utils.cache_scope():
+            document = Observables.from_xml(path, fast=fast).to_json()
+        if output is not None:
+            _write(output, document)
+            document = None
+    except Exception as ex:
+        error = "%s: %s" % (type(ex).__name__, ex)
+        result = ConversionResult(path, seconds=default_timer() - start,
+                                  error=error)
+    else:
+        result = ConversionResult(path, output, default_timer() - start)
+
+    return result, document
+
+
+def _convert_chunk(tasks):
+    return [_convert(task) for task in tasks]
+
+
+def _failed(tasks, ex):
+    """Return the results of a chunk of tasks which failed as a whole."""
+    error = "%s: %s" % (type(ex).__name__, ex)
+    return [(ConversionResult(task[0], error=error), None) for task in tasks]
+
+
+class _Pool(object):
+    """Converts chunks of tasks in a ProcessPoolExecutor, which is replaced
+    if one of its worker processes dies."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.pending = collections.deque()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def submit(self, chunk):
+        try:
+            future = self.executor.submit(_convert_chunk, chunk)
+        except BrokenProcessPool as ex:
+            future = Future()
+            future.set_exception(ex)
+        self.pending.append((chunk, future))
+
+    def restart(self):
+        """Replace the executor, whose pool is broken."""
+        if _SHUTDOWN_BROKEN:
+            self.executor.shutdown()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def next_results(self):
+        """Return the results of the oldest pending chunk."""
+        chunk, future = self.pending.popleft()
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            pass
+        except Exception as ex:
+            return _failed(chunk, ex)
+
+        # A dead worker fails every pending chunk, not only the one it was
+        # converting. Convert this chunk again on its own to find out
+        # whether it is to blame, then submit the others again.
+        others = [pending for pending, _ in self.pending]
+        self.pending.clear()
+        self.restart()
+
+        try:
+            results = self.executor.submit(_convert_chunk, chunk).result()
+        except BrokenProcessPool as ex:
+            results = _failed(chunk, ex)
+            self.restart()
+        except Exception as ex:
+            results = _failed(chunk, ex)
+
+        for other in others:
+            self.submit(other)
+        return results
+
+
+def _map(tasks, workers, chunksize):
+    if workers == 1 or len(tasks) < 2 or ProcessPoolExecutor is None:
+        for task in tasks:
+            yield _convert(task)
+        return
+
+    # Only submit a few chunks per worker ahead of the results read, so
+    # that a large batch does not queue up every task (and hold every
+    # result) at once.
+    workers = workers or multiprocessing.cpu_count()
+    chunksize = max(1, chunksize)
+    limit = workers * PENDING_PER_WORKER
+    pool = _Pool(workers)
+
+    try:
+        for start in range(0, len(tasks), chunksize):
+            if len(pool) >= limit:
+                for converted in pool.next_results():
+                    yield converted
+            pool.submit(tasks[start:start + chunksize])
+
+        while pool:
+            for converted in pool.next_results():
+                yield converted
+    finally:
+        pool.shutdown()
+
+
+def convert_files(paths, output, format=FORMAT_JSON, workers=None,
+                  chunksize=1, fast=False):
+    """Convert CybOX XML files to JSON.
+
+    Args:
+        paths: A list of XML files and directories to search for them (see
+            :func:`find_files`).
+        output: For :data:`FORMAT_JSON`, the directory to write ``.json``
+            files to. Directory structure below the input directories is
+            kept. For :data:`FORMAT_JSONL`, the file to write to.
+        format: :data:`FORMAT_JSON` or :data:`FORMAT_JSONL`.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs. With ``1``, files are converted in this process.
+        chunksize: The number of files handed to a worker at a time. Larger
+            chunks cut inter-process overhead for batches of small files.
+        fast: Passed to :meth:`cybox.core.Observables.from_xml`.
+
+    Yields:
+        A :class:`ConversionResult` for each file, in input order. Failures
+        do not stop the conversion.
+
+    Raises:
+        ValueError: If `format` is not supported.
+    """
+    if format not in FORMATS:
+        raise ValueError("Unsupported output format: %r" % (format,))
+
+    files = list(find_files(paths))
+
+    if format == FORMAT_JSON:
+        tasks = [(path, json_filename(output, name), fast)
+                 for path, name in files]
+        for result, _ in _map(tasks, workers, chunksize):
+            yield result
+        return
+
+    dirname = os.path.dirname(output)
+    if dirname:
+        _makedirs(dirname)
+
+    tasks = [(path, None, fast) for path, _ in files]
+    with io.open(output, "w", encoding="utf-8") as f:
+        for result, document in _map(tasks, workers, chunksize):
+            if result.ok:
+                f.write(six.text_type(document))
+                f.write(u"\n")
+                result.output = output
+            yield result
+
+
+def _get_arg_parser():
+    parser = argparse.ArgumentParser(
+        description="Convert CybOX XML documents to JSON."
+    )
+    parser.add_argument(
+        "paths", nargs="+", metavar="PATH",
+        help="XML files, or directories to search for .xml files (which "
+             "may be compressed: .xml.gz, .xml.bz2 or .xml.xz)"
+    )
+    parser.add_argument(
+        "-o", "--output", required=True,
+        help="output directory (json) or file (jsonl)"
+    )
+    parser.add_argument(
+        "-f", "--format", choices=FORMATS, default=FORMAT_JSON,
+        help="one .json file per input file, or a single JSON Lines file"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "-c", "--chunksize", type=int, default=1,
+        help="number of files sent to a worker at a time (default: 1)"
+    )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="build objects directly from the XML elements"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="only report failures"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = _get_arg_parser().parse_args(argv)
+
+    start = default_timer()
+    total = failed = 0
+
+    results = convert_files(args.paths, args.output, args.format,
+                            workers=args.workers, chunksize=args.chunksize,
+                            fast=args.fast)
+    for result in results:
+        total += 1
+        if not result.ok:
+            failed += 1
+            sys.stderr.write("FAILED %s (%.3fs): %s\n" %
+                             (result.path, result.seconds, result.error))
+        elif not args.quiet:
+            sys.stderr.write("%.3fs %s\n" % (result.seconds, result.path))
+
+    sys.stderr.write("Converted %d of %d files in %.3fs (%d failed)\n" %
+                     (total - failed, total, default_timer() - start, failed))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,70 @@
 # Copyright (c) 2017, The MITRE Corporation. All rights reserved.
 # See LICENSE.txt for complete terms.
+"""Caches of Objects and Observables.
+
+Every :class:`cybox.core.Object` with an ``id_`` is put in the global cache,
+so that ``RelatedObject.get_properties()`` can find the Object an ``idref``
+refers to. The global cache is a :class:`DictCache` unless another cache is
+selected with :func:`set_cache`:
+
+* :class:`DictCache` keeps every value until it is cleared.
+* :class:`LRUCache` drops the least recently used values once it holds a
+  maximum number of them, or values of a maximum total size.
+* :class:`WeakValueCache` only keeps values which are still referenced
+  elsewhere, such as the Objects of a document that is still in use.
+* :class:`NullCache` keeps nothing.
+
+Caches count the lookups that found a value (*hits*) and that did not
+(*misses*), and the values they dropped to stay within their limits
+(*evictions*). See :meth:`Cache.stats` and :func:`cache_stats`.
+
+Within a :func:`cache_scope`, :func:`cache_put`, :func:`cache_get` and the
+other module functions use a cache of their own instead of the global one,
+so that the Objects of one document are kept apart from those of any other
+and are dropped along with the scope:
+
+    >>> with cache_scope():  # doctest: +SKIP
+    ...     observables = Observables.from_xml("feed.xml")
+    ...     related.get_properties()
+
+The parse functions of :mod:`cybox.core` also take a `scope` argument, which
+builds the Objects they return within a given scope.
+
+Scopes are entered in the current ``contextvars`` context (or, on Python
+versions without ``contextvars``, the current thread), so the scopes of
+concurrent requests, threads or asyncio tasks do not see each other. A new
+thread starts outside of any scope, using the global cache.
+
+Code which builds many Objects and never resolves an ``idref`` can turn
+caching off, with :func:`set_caching` or within :func:`caching_disabled`.
+The Objects of a document can still be found by ID with a
+:class:`DocumentCache`, which looks them up in the document itself:
+
+    >>> with caching_disabled():  # doctest: +SKIP
+    ...     observables = Observables.from_xml("feed.xml")
+    >>> related.get_properties(document=observables)  # doctest: +SKIP
+
+The caches in this module can be used by several threads at once.
+"""
+
+import collections
+import functools
+import sys
+import threading
+import types
+import weakref
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+from mixbox.vendor import six
+
+
+# Held while the lock of a cache which did not call Cache.__init__() is
+# created.
+_lock_creation = threading.Lock()
 
 
 class CacheMiss(Exception):
@@ -8,7 +73,35 @@ class CacheMiss(Exception):
 
 
 class Cache(object):
-    """Abstract class for storing and retrieving Objects and Observables."""
+    """Abstract class for storing and retrieving Objects and Observables.
+
+    Each cache has a lock of its own, ``_lock``, which is held by
+    :meth:`put` while an ID is generated and the value is saved. Subclasses
+    which can be used by several threads at once should hold it in the
+    methods they override.
+
+    Attributes:
+        hits: The number of values found by :meth:`get`.
+        misses: The number of :meth:`get` calls which raised
+            :class:`CacheMiss`.
+        evictions: The number of values dropped by the cache to stay
+            within its limits.
+    """
+
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    def __init__(self):
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails: subclasses written
+        # before Cache had an __init__() may not call it.
+        if name != "_lock":
+            raise AttributeError(name)
+        with _lock_creation:
+            return self.__dict__.setdefault("_lock", threading.RLock())
 
     def put(self, value, id_=None):
         """Save a value in the cache.
@@ -19,13 +112,14 @@ class Cache(object):
         responsible for generating one.
         """
 
-        if not id_:
-            try:
-                id_ = value.id_
-            except AttributeError:
-                id_ = self._generate_id()
+        with self._lock:
+            if not id_:
+                try:
+                    id_ = value.id_
+                except AttributeError:
+                    id_ = self._generate_id()
 
-        return self._save(value, id_)
+            return self._save(value, id_)
 
     def _generate_id(self):
         raise NotImplementedError
@@ -50,10 +144,33 @@ class Cache(object):
         """Clear all items from the cache"""
         pass
 
+    def _scope_exited(self):
+        """Called when a context leaves the last :class:`CacheScope` of the
+        cache it had entered, once the values built within it are
+        complete."""
+        pass
+
+    def stats(self):
+        """Return a dictionary of the ``hits``, ``misses`` and
+        ``evictions`` of the cache, and the ``count`` of items in it."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "count": self.count(),
+        }
+
+    def reset_stats(self):
+        """Set the hit, miss and eviction counters to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
 
 class DictCache(Cache):
 
     def __init__(self):
+        super(DictCache, self).__init__()
         self.__inner = {}
         self._next_id = 0
 
@@ -69,26 +186,391 @@ class DictCache(Cache):
         return id_
 
     def get(self, id_):
-        try:
-            return self.__inner[id_]
-        except KeyError:
-            raise CacheMiss
+        with self._lock:
+            try:
+                value = self.__inner[id_]
+            except KeyError:
+                self.misses += 1
+                raise CacheMiss
+            self.hits += 1
+            return value
 
     def count(self):
-        return len(self.__inner)
+        with self._lock:
+            return len(self.__inner)
 
     def clear(self):
-        self.__inner = {}
-        # No need to reset _next_id
+        with self._lock:
+            self.__inner = {}
+            # No need to reset _next_id
+
+
+# Values shared by the entities which refer to them rather than owned by
+# them, which sizeof() leaves out.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    functools.partial,
+)
+
+
+def sizeof(value):
+    """Return the approximate size in bytes of `value`.
+
+    This is the ``sys.getsizeof()`` of `value` and of everything reachable
+    from it through the items of containers, the values of dictionaries and
+    the ``__dict__`` of objects (including the ``_fields`` of entities),
+    each counted once. Classes, functions and modules are left out, and so
+    are the keys of dictionaries, which are the field descriptors and
+    attribute names shared by every instance of a class.
+    """
+    size = 0
+    seen = set()
+    pending = [value]
+
+    while pending:
+        value = pending.pop()
+        if id(value) in seen or isinstance(value, _SHARED_TYPES):
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+
+        if isinstance(value, (six.string_types, six.binary_type)):
+            continue
+        if isinstance(value, dict):
+            pending.extend(six.itervalues(value))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+
+        attrs = getattr(value, "__dict__", None)
+        if attrs is not None:
+            pending.append(attrs)
+
+    return size
+
+
+class LRUCache(Cache):
+    """A cache which drops the least recently used values once it is full.
+
+    A value is *used* when it is put in the cache or found by :meth:`get`.
+
+    Objects are put in the global cache as soon as their ``id_`` is set,
+    before their other fields are, so the size of a value is only measured
+    when the next value is put (or when :meth:`size` is called).
+
+    Args:
+        max_entries: If given, the maximum number of values to keep.
+        max_bytes: If given, the maximum total size of the values to keep,
+            as measured by `sizeof`.
+        sizeof: A function returning the size of a value in bytes.
+            Defaults to :func:`sizeof`.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=sizeof):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        super(LRUCache, self).__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._inner = collections.OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._unmeasured = []
+        self._next_id = 0
+
+    def _generate_id(self):
+        while self._next_id in self._inner:
+            self._next_id += 1
+        return self._next_id
+
+    def _save(self, value, id_):
+        inner = self._inner
+        if id_ in inner:
+            del inner[id_]
+            self._bytes -= self._sizes.pop(id_, 0)
+        inner[id_] = value
+
+        if self.max_bytes is not None:
+            self._measure()
+            self._unmeasured.append(id_)
+
+        self._evict()
+        return id_
+
+    def _measure(self):
+        inner = self._inner
+        sizes = self._sizes
+        for id_ in self._unmeasured:
+            if id_ in inner and id_ not in sizes:
+                size = sizes[id_] = self._sizeof(inner[id_])
+                self._bytes += size
+        self._unmeasured = []
+
+    def _evict(self):
+        inner = self._inner
+        max_entries = self.max_entries
+        max_bytes = self.max_bytes
+
+        # The value just put is never dropped.
+        while len(inner) > 1 and (
+                (max_entries is not None and len(inner) > max_entries) or
+                (max_bytes is not None and self._bytes > max_bytes)):
+            id_, value = inner.popitem(last=False)
+            self._bytes -= self._sizes.pop(id_, 0)
+            self.evictions += 1
+            self._evicted(id_, value)
+
+    def _evicted(self, id_, value):
+        """Called with each value dropped from the cache."""
+        pass
+
+    def _load(self, id_):
+        """Return the value for `id_` when it is not in the cache, to be put
+        in it, or raise CacheMiss."""
+        raise CacheMiss
+
+    def get(self, id_):
+        inner = self._inner
+        with self._lock:
+            try:
+                value = inner.pop(id_)
+            except KeyError:
+                try:
+                    value = self._load(id_)
+                except CacheMiss:
+                    self.misses += 1
+                    raise
+                self._save(value, id_)
+            else:
+                inner[id_] = value
+            self.hits += 1
+            return value
+
+    def count(self):
+        with self._lock:
+            return len(self._inner)
+
+    def size(self):
+        """Return the total size in bytes of the values in the cache, if it
+        has a `max_bytes` limit, and otherwise ``None``.
+
+        Values not measured yet are measured first, and values are dropped
+        if the cache has then grown over its limit.
+        """
+        if self.max_bytes is None:
+            return None
+        with self._lock:
+            self._measure()
+            self._evict()
+            return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._inner.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._unmeasured = []
+
+
+class WeakValueCache(Cache):
+    """A cache which only keeps values that are referenced elsewhere.
+
+    Values are held in a ``weakref.WeakValueDictionary``, so an Object is
+    dropped from the cache once nothing else refers to it, such as after
+    the document it belongs to is discarded. Values which cannot be weakly
+    referenced cannot be put in the cache. Values dropped this way are not
+    counted as evictions.
+    """
+
+    def __init__(self):
+        super(WeakValueCache, self).__init__()
+        self._inner = weakref.WeakValueDictionary()
+        self._next_id = 0
+
+    def _generate_id(self):
+        while self._next_id in self._inner:
+            self._next_id += 1
+        return self._next_id
+
+    def _save(self, value, id_):
+        self._inner[id_] = value
+        return id_
+
+    def get(self, id_):
+        with self._lock:
+            value = self._inner.get(id_)
+            if value is None:
+                self.misses += 1
+                raise CacheMiss
+            self.hits += 1
+            return value
+
+    def count(self):
+        with self._lock:
+            return len(self._inner)
+
+    def clear(self):
+        with self._lock:
+            self._inner.clear()
+
+
+class NullCache(Cache):
+    """A cache which keeps nothing: every :meth:`get` is a miss.
+
+    This is the cache in use while caching is turned off (see
+    :func:`set_caching` and :func:`caching_disabled`), so that building
+    Objects costs no cache insertion and does not keep them alive.
+    """
+
+    def put(self, value, id_=None):
+        return id_ or getattr(value, "id_", None)
+
+    def get(self, id_):
+        self.misses += 1
+        raise CacheMiss
+
+    def count(self):
+        return 0
+
+
+def iter_objects(document):
+    """Yield the :class:`cybox.core.Object` instances (including
+    RelatedObjects) within the entity `document`, such as an Observables,
+    and `document` itself if it is one.
+
+    Lazily loaded entities (see :mod:`cybox.utils.lazy`) are loaded.
+    """
+    from mixbox.entities import Entity
+    from mixbox.typedlist import TypedList
+    from cybox.core import Object
+
+    pending = [document]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, Entity):
+            if isinstance(value, Object):
+                yield value
+            values = list(value._fields.values())
+            values.reverse()
+            pending.extend(values)
+        elif isinstance(value, (list, TypedList)):
+            pending.extend(reversed(value))
+
+
+class DocumentCache(Cache):
+    """A cache of the Objects within a document, which finds them by
+    looking through the document rather than by being given them.
+
+    The document is indexed the first time a value is looked up, and values
+    put in the cache afterwards are added to the index. Objects added to the
+    document after it is indexed are not found.
+
+    Args:
+        document: The entity (such as an :class:`cybox.core.Observables`)
+            whose Objects to find.
+    """
+
+    def __init__(self, document):
+        super(DocumentCache, self).__init__()
+        self.document = document
+        self._inner = None
+        self._next_id = 0
+
+    def _index(self):
+        inner = self._inner
+        if inner is None:
+            with self._lock:
+                inner = self._inner
+                if inner is None:
+                    inner = {}
+                    for obj in iter_objects(self.document):
+                        if obj.id_:
+                            inner.setdefault(obj.id_, obj)
+                    self._inner = inner
+        return inner
+
+    def _generate_id(self):
+        inner = self._index()
+        while self._next_id in inner:
+            self._next_id += 1
+        return self._next_id
+
+    def _save(self, value, id_):
+        self._index()[id_] = value
+        return id_
+
+    def get(self, id_):
+        inner = self._index()
+        with self._lock:
+            try:
+                value = inner[id_]
+            except KeyError:
+                self.misses += 1
+                raise CacheMiss
+            self.hits += 1
+            return value
+
+    def count(self):
+        inner = self._index()
+        with self._lock:
+            return len(inner)
+
+    def clear(self):
+        with self._lock:
+            self._inner = None
+
+
+def find_object(document, id_):
+    """Return the :class:`cybox.core.Object` with the ID `id_` within the
+    entity `document`, looking through the document up to the first match.
+
+    Use a :class:`DocumentCache` to look up several IDs in one document.
+
+    Raises:
+        CacheMiss: No Object within `document` has the ID `id_`.
+    """
+    for obj in iter_objects(document):
+        if obj.id_ == id_:
+            return obj
+    raise CacheMiss
 
 
 # Singleton instance within this module. It is lazily instantiated, so simply
 # importing the utils module will not create the object.
 __cache = None
+__cache_lock = threading.Lock()
+
+# Whether the global cache is used outside of any scope (see set_caching()).
+_caching = True
+_NULL_CACHE = NullCache()
+
+# The caches of the scopes entered in the current context, innermost last,
+# as a tuple.
+if contextvars is not None:
+    _scopes = contextvars.ContextVar("cybox.utils.caches.scopes", default=())
+
+    def _get_scopes():
+        return _scopes.get()
+
+    def _set_scopes(scopes):
+        _scopes.set(scopes)
+else:
+    _scopes = threading.local()
+
+    def _get_scopes():
+        return getattr(_scopes, "caches", ())
+
+    def _set_scopes(scopes):
+        _scopes.caches = scopes
 
 
 def _get_cache():
-    """Return the `cybox.utils` module's global cache object.
+    """Return the cache of the innermost scope entered, or else the
+    `cybox.utils` module's global cache object.
 
     Only under rare circumstances should this function be called by external
     code. More likely, external code should initialize its own Cache object.
@@ -97,9 +579,143 @@ def _get_cache():
     representations and dealing with internal references within a document.
     """
     global __cache
-    if not __cache:
-        __cache = DictCache()
-    return __cache
+    scopes = _get_scopes()
+    if scopes:
+        return scopes[-1]
+    if not _caching:
+        return _NULL_CACHE
+
+    cache = __cache
+    if cache is None:
+        with __cache_lock:
+            if __cache is None:
+                __cache = DictCache()
+            cache = __cache
+    return cache
+
+
+class CacheScope(object):
+    """A context manager which makes the module functions use `cache`.
+
+    Use :func:`cache_scope` rather than creating this class directly. A
+    scope can be entered any number of times, including within itself and
+    by several threads at once; its cache is only dropped when the scope
+    is.
+
+    Attributes:
+        cache: The :class:`Cache` of the scope.
+    """
+
+    def __init__(self, cache=None):
+        if cache is None:
+            cache = DictCache()
+        self.cache = cache
+
+    def __enter__(self):
+        _set_scopes(_get_scopes() + (self.cache,))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        scopes = _get_scopes()[:-1]
+        _set_scopes(scopes)
+        if self.cache not in scopes:
+            self.cache._scope_exited()
+        return False
+
+
+class _NoScope(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+def cache_scope(cache=None):
+    """Return a context manager within which :func:`cache_put`,
+    :func:`cache_get` and the other module functions (and so
+    ``RelatedObject.get_properties()``) use a cache of their own.
+
+    Args:
+        cache: The :class:`Cache` to use, or ``None`` for a new
+            :class:`DictCache`.
+
+    Returns:
+        A :class:`CacheScope`.
+    """
+    return CacheScope(cache)
+
+
+def caching_disabled():
+    """Return a context manager within which Objects are not cached, and
+    :func:`cache_get` finds nothing.
+
+    A :func:`cache_scope` entered within it caches as usual.
+
+    Returns:
+        A :class:`CacheScope` of a :class:`NullCache`.
+    """
+    return CacheScope(NullCache())
+
+
+def set_caching(enabled):
+    """Turn the use of the global cache on or off.
+
+    While it is off, Objects created outside of any :func:`cache_scope`
+    are not cached, and :func:`cache_get` finds nothing. The global cache
+    itself is kept, and is used again once caching is turned back on.
+
+    Args:
+        enabled: ``False`` to turn caching off, ``True`` to turn it on.
+
+    Returns:
+        Whether caching was on.
+    """
+    global _caching
+    previous = _caching
+    _caching = bool(enabled)
+    return previous
+
+
+def caching_enabled():
+    """Return ``False`` if Objects created now would not be cached."""
+    return not isinstance(_get_cache(), NullCache)
+
+
+def scoped(scope):
+    """Return a context manager which enters `scope`.
+
+    This is how the `scope` argument of the parse functions is applied.
+
+    Args:
+        scope: A :class:`CacheScope`, a :class:`Cache` to enter a new scope
+            of, or ``None`` to leave the current cache in use.
+    """
+    if scope is None:
+        return _NoScope()
+    if isinstance(scope, Cache):
+        return CacheScope(scope)
+    return scope
+
+
+def set_cache(cache):
+    """Replace the global cache, which is used outside of any
+    :func:`cache_scope`.
+
+    Example:
+        >>> set_cache(LRUCache(max_entries=100000))  # doctest: +SKIP
+
+    Args:
+        cache: A :class:`Cache`, or ``None`` to go back to a new
+            :class:`DictCache`.
+
+    Returns:
+        The previous global cache, or ``None`` if it had not been created.
+    """
+    global __cache
+    previous = __cache
+    __cache = cache
+    return previous
 
 
 def cache_put(value, id_=None):
@@ -121,3 +737,8 @@ def cache_count():
 def cache_clear():
     """Clear the global cache"""
     _get_cache().clear()
+
+
+def cache_stats():
+    """Return the :meth:`Cache.stats` of the global cache."""
+    return _get_cache().stats()
@@ -0,0 +1,339 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Per-class to_dict() and from_dict() converters.
+
+``Entity.to_dict()`` and ``Entity.from_dict()`` look up the key name, type,
+multiplicity and transformer of every TypedField each time an entity is
+converted. The functions here build a converter for each Entity class from
+its TypedFields the first time one of its instances is converted, and reuse
+it from then on.
+
+The dictionaries and entities produced are the same as those of the mixbox
+methods, down to the order of their keys and fields. Values of classes that
+override ``to_dict()`` or ``from_dict()`` are converted with that method;
+:class:`FastDictMixin` makes the converters the ``to_dict()`` and
+``from_dict()`` of a class, and so also what overriding methods in its
+subclasses reach through ``super()``.
+"""
+
+import operator
+
+from mixbox.entities import Entity, EntityList
+from mixbox.fields import IdField, IdrefField, TypedField
+from mixbox.vendor import six
+
+# How to_dict() converts the values of a TypedField.
+_VALUE = 0
+_VALUES = 1
+_ENTITY = 2
+_ENTITIES = 3
+
+
+def _defined(klass, name):
+    """Return the function `klass` resolves the method `name` to."""
+    for base in klass.__mro__:
+        if name in vars(base):
+            method = vars(base)[name]
+            return getattr(method, "__func__", method)
+    return None
+
+
+_DICT_VALUE = _defined(TypedField, "dict_value")
+_CLEAN = _defined(TypedField, "_clean")
+_CHECK_TYPE = _defined(TypedField, "check_type")
+_ISTYPEOF = _defined(Entity, "istypeof")
+_SETTERS = (
+    _defined(TypedField, "__set__"),
+    _defined(IdField, "__set__"),
+    _defined(IdrefField, "__set__"),
+)
+
+
+def _to_dict_kind(field):
+    """Return the ``(key name, kind, converter)`` of `field` for
+    to_dict()."""
+    convert = None
+    if field.type_:
+        kind = _ENTITIES if field.multiple else _ENTITY
+    else:
+        kind = _VALUES if field.multiple else _VALUE
+        if _defined(field.__class__, "dict_value") is not _DICT_VALUE:
+            convert = field.dict_value
+    return field.key_name, kind, convert
+
+
+def _sets_none_directly(field):
+    """Return whether setting `field` to ``None`` only stores ``None`` (or
+    an empty list) in the entity's ``_fields``."""
+    if _defined(field.__class__, "__set__") not in _SETTERS:
+        return False
+    if field.preset_hook or field.postset_hook:
+        return False
+    if field.multiple:
+        return True
+    try:
+        return field._clean(None) is None
+    except Exception:
+        return False
+
+
+def _stores_directly(field):
+    """Return the type a value must be an instance of to be stored in the
+    entity's ``_fields`` as is when setting `field` to it, ``object`` if any
+    value is, or ``None`` if `field` must always be set through
+    ``__set__()``."""
+    # IdField and IdrefField unset each other when set to a true value.
+    if _defined(field.__class__, "__set__") is not _SETTERS[0]:
+        return None
+    if field.multiple or field.preset_hook or field.postset_hook:
+        return None
+    if (_defined(field.__class__, "_clean") is not _CLEAN or
+            _defined(field.__class__, "check_type") is not _CHECK_TYPE):
+        return None
+    type_ = field.type_
+    if type_ is None:
+        return object
+    if (hasattr(type_, "istypeof") and
+            _defined(type_, "istypeof") is not _ISTYPEOF):
+        return None
+    return type_
+
+
+def _make_to_dict(klass):
+    """Build the ``Entity.to_dict()`` (or ``EntityList.to_dict()``) of
+    `klass`."""
+    fields = dict((field, _to_dict_kind(field))
+                  for field in klass.typed_fields())
+    iteritems = six.iteritems
+
+    def entity_to_dict(entity):
+        entity_dict = {}
+
+        for field, value in iteritems(entity._fields):
+            if value is None:
+                continue
+            try:
+                key, kind, convert = fields[field]
+            except KeyError:
+                key, kind, convert = fields[field] = _to_dict_kind(field)
+
+            if kind == _ENTITY:
+                value = to_dict(value)
+            elif kind == _ENTITIES:
+                value = [to_dict(x) for x in value]
+            elif kind == _VALUES:
+                if convert is None:
+                    value = list(value)
+                else:
+                    value = [None if x is None else convert(x) for x in value]
+            elif convert is not None:
+                value = convert(value)
+
+            # Only add non-None objects or non-empty lists
+            if value is not None and value != []:
+                entity_dict[key] = value
+
+        entity._finalize_dict(entity_dict)
+        return entity_dict
+
+    if not (issubclass(klass, EntityList) and klass._dict_as_list()):
+        return entity_to_dict
+
+    if _defined(klass, "to_list") is not _defined(EntityList, "to_list"):
+        return lambda entitylist: entitylist.to_list()
+
+    # Read the items straight from the multiple field, unless the class
+    # changes how it is iterated.
+    inner = klass._multiple_field()
+    if (_defined(klass, "__iter__") is not _defined(EntityList, "__iter__") or
+            _defined(klass, "__getitem__") is not
+            _defined(EntityList, "__getitem__")):
+        return lambda entitylist: [to_dict(x) for x in entitylist]
+    return lambda entitylist: [to_dict(x) for x in inner.__get__(entitylist)]
+
+
+def _make_from_dict(klass):
+    """Build the ``Entity.from_dict()`` (or ``EntityList.from_dict()``) of
+    `klass`."""
+    plan = []
+    for field in klass.typed_fields():
+        plan.append((
+            field,
+            field.key_name,
+            field.transformer,
+            field.multiple,
+            _sets_none_directly(field),
+            _stores_directly(field),
+        ))
+    plan = tuple(plan)
+    functions = _from_dict_functions
+
+    def entity_from_dict(cls_dict):
+        if cls_dict is None:
+            return None
+
+        # Shortcut if an actual dict is not provided:
+        if not isinstance(cls_dict, dict):
+            value = cls_dict
+
+            try:
+                return klass(value)  # Call the class's constructor
+            except TypeError as ex:
+                fmt = "Could not instantiate a %s from a %s: %s"
+                ex.message = fmt % (klass, type(value), value)
+                raise
+
+        entity = klass()
+        entity_fields = entity._fields
+        get = cls_dict.get
+
+        for field, key, transformer, multiple, sets_none, store in plan:
+            value = get(key)
+
+            if value is None and sets_none:
+                entity_fields[field] = field._listfunc() if multiple else None
+                continue
+
+            if transformer is not None:
+                try:
+                    from_dict = functions[transformer]
+                except KeyError:
+                    from_dict = _from_dict_function(transformer)
+
+                if not multiple:
+                    value = from_dict(value)
+                elif value is not None:
+                    value = [from_dict(x) for x in value]
+                else:
+                    value = []
+            elif multiple and not value:
+                value = []
+
+            if store is not None and isinstance(value, store):
+                entity_fields[field] = value
+            else:
+                field.__set__(entity, value)
+
+        return entity
+
+    if not issubclass(klass, EntityList):
+        return entity_from_dict
+
+    as_list = klass._dict_as_list()
+
+    def entitylist_from_dict(cls_dict):
+        if not cls_dict:
+            return None
+        if as_list:
+            return klass.from_list(cls_dict)
+        return entity_from_dict(cls_dict)
+
+    return entitylist_from_dict
+
+
+# Maps Entity classes to their generic to_dict() and from_dict() converters.
+_to_dict_converters = {}
+_from_dict_converters = {}
+
+
+def _to_dict_converter(klass):
+    try:
+        return _to_dict_converters[klass]
+    except KeyError:
+        converter = _to_dict_converters[klass] = _make_to_dict(klass)
+        return converter
+
+
+def _from_dict_converter(klass):
+    try:
+        return _from_dict_converters[klass]
+    except KeyError:
+        converter = _from_dict_converters[klass] = _make_from_dict(klass)
+        return converter
+
+
+class FastDictMixin(object):
+    """Replaces the ``Entity.to_dict()`` and ``Entity.from_dict()`` of an
+    Entity class with converters built for the class."""
+
+    def to_dict(self):
+        return _to_dict_converter(self.__class__)(self)
+
+    @classmethod
+    def from_dict(cls, cls_dict):
+        return _from_dict_converter(cls)(cls_dict)
+
+
+_GENERIC_TO_DICT = (
+    _defined(Entity, "to_dict"),
+    _defined(EntityList, "to_dict"),
+    _defined(FastDictMixin, "to_dict"),
+)
+
+_GENERIC_FROM_DICT = (
+    _defined(Entity, "from_dict"),
+    _defined(EntityList, "from_dict"),
+    _defined(FastDictMixin, "from_dict"),
+)
+
+# Map classes to the function converting their instances to dictionaries,
+# and transformers (Entity classes and factories) to the function converting
+# dictionaries with them.
+_to_dict_functions = {}
+_from_dict_functions = {}
+
+
+def _to_dict_function(klass):
+    try:
+        return _to_dict_functions[klass]
+    except KeyError:
+        pass
+
+    if _defined(klass, "to_dict") in _GENERIC_TO_DICT:
+        function = _to_dict_converter(klass)
+    else:
+        function = operator.methodcaller("to_dict")
+
+    _to_dict_functions[klass] = function
+    return function
+
+
+def _from_dict_function(transformer):
+    try:
+        return _from_dict_functions[transformer]
+    except KeyError:
+        pass
+
+    if (isinstance(transformer, type) and issubclass(transformer, Entity) and
+            _defined(transformer, "from_dict") in _GENERIC_FROM_DICT):
+        function = _from_dict_converter(transformer)
+    else:
+        function = transformer.from_dict
+
+    _from_dict_functions[transformer] = function
+    return function
+
+
+def to_dict(entity):
+    """Return ``entity.to_dict()``.
+
+    Args:
+        entity: An Entity, or ``None``.
+    """
+    if entity is None:
+        return None
+    try:
+        function = _to_dict_functions[entity.__class__]
+    except KeyError:
+        function = _to_dict_function(entity.__class__)
+    return function(entity)
+
+
+def from_dict(klass, cls_dict):
+    """Return ``klass.from_dict(cls_dict)``.
+
+    Args:
+        klass: An Entity class or EntityFactory.
+        cls_dict: A dictionary (or other value) `klass` can convert.
+    """
+    return _from_dict_function(klass)(cls_dict)
@@ -0,0 +1,204 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Build API entities straight from lxml elements.
+
+Parsing normally builds two object graphs: the generated binding classes
+turn every element into a binding object (``GeneratedsSuper.build()``), and
+``Entity.from_obj()`` then copies those objects into API entities.
+
+An :class:`ElementProxy` stands in for a binding object instead. When
+``from_obj()`` asks it for a value, the proxy looks the value up on its
+element, using the ``TypedField`` definitions of the API class being built
+to decide how each child element should be presented. Complex children are
+handed out as further proxies, so no binding object is ever built for them
+and the document is walked only once.
+
+Attribute values and simple (leaf) child elements are still converted by the
+generated ``buildAttributes()`` and ``buildChildren()`` methods, which keeps
+datatype casts and default values identical to the binding layer.
+"""
+
+from mixbox.binding_utils import get_all_text_
+from mixbox.vendor import six
+from mixbox.xml import TAG_XSI_TYPE
+
+NS_CYBOX = "http://cybox.mitre.org/cybox-2"
+
+TAG_OBJECT = "{%s}Object" % NS_CYBOX
+TAG_PROPERTIES = "{%s}Properties" % NS_CYBOX
+
+# Maps Entity classes to {TypedField name: TypedField} dictionaries of the
+# fields whose values are Entities built from complex child elements.
+_COMPLEX_FIELDS = {}
+
+# Maps binding classes to the attribute values they are initialized with.
+_DEFAULTS = {}
+
+
+def _is_complex(field):
+    """Return True if values of `field` are built from binding objects."""
+    if field.factory:
+        return True
+    return getattr(field.type_, "_binding_class", None) is not None
+
+
+def _complex_fields(klass):
+    try:
+        return _COMPLEX_FIELDS[klass]
+    except KeyError:
+        fields = dict(
+            (f.name, f) for f in klass.typed_fields() if _is_complex(f)
+        )
+        _COMPLEX_FIELDS[klass] = fields
+        return fields
+
+
+def _defaults(binding_class):
+    """Return the attribute values of a freshly created `binding_class`."""
+    try:
+        return _DEFAULTS[binding_class]
+    except KeyError:
+        defaults = binding_class.factory().__dict__
+        _DEFAULTS[binding_class] = defaults
+        return defaults
+
+
+def _localname(tag):
+    return tag.rpartition("}")[2]
+
+
+def object_type(element):
+    """Return the Object type of a ``cybox:Observable`` element.
+
+    The type is read from the ``xsi:type`` attribute of the Observable's
+    ``cybox:Object/cybox:Properties`` element, without building anything.
+
+    Returns:
+        The type name without its namespace prefix (for example,
+        ``"FileObjectType"``), or ``None`` if the Observable has no Object
+        Properties (an Event, an Observable_Composition or an idref).
+    """
+    obj = element.find(TAG_OBJECT)
+    if obj is None:
+        return None
+
+    properties = obj.find(TAG_PROPERTIES)
+    if properties is None:
+        return None
+
+    xsi_type = properties.get(TAG_XSI_TYPE)
+    if xsi_type is None:
+        return None
+    return xsi_type.rpartition(":")[2]
+
+
+def type_names(object_types):
+    """Return a set of `object_types` with namespace prefixes removed."""
+    return set(x.rpartition(":")[2] for x in object_types)
+
+
+class ElementProxy(object):
+    """Present an lxml element to ``Entity.from_obj()`` as a binding object.
+
+    The first time a value is requested, the proxy fills itself in with every
+    value its binding object would have had. After that, attribute access is
+    as cheap as on a real binding object, and ``from_obj()`` implementations
+    that modify their binding object (e.g., ``BaseProperty.from_obj()``) work
+    unchanged. Like a built binding object, the proxy keeps its element as
+    ``__sourcenode__``.
+
+    Args:
+        element: An ``lxml.etree._Element``.
+        klass: The Entity class `element` will be parsed into. If ``None``,
+            it is resolved from `field` when first needed.
+        field: The TypedField of the parent Entity that `element` belongs to.
+    """
+
+    def __init__(self, element, klass=None, field=None):
+        self._element = element
+        self.__sourcenode__ = element
+        self._klass = klass
+        self._field = field
+        self._populated = False
+
+        # EntityFactory.objkey() looks for an xsi_type attribute before the
+        # class (and therefore the binding class) of this element is known.
+        if klass is None and field is not None and field.factory:
+            self.xsi_type = element.get(TAG_XSI_TYPE)
+
+    def __nonzero__(self):
+        return True
+
+    __bool__ = __nonzero__
+
+    @property
+    def entity_class(self):
+        """The Entity class this element is parsed into."""
+        if self._klass is None:
+            factory = self._field.factory
+            if factory:
+                self._klass = factory.entity_class(factory.objkey(self))
+            else:
+                self._klass = self._field.type_
+        return self._klass
+
+    def _populate(self):
+        element = self._element
+        klass = self.entity_class
+        fields = _complex_fields(klass)
+
+        children = {}
+        for child in element:
+            children.setdefault(_localname(child.tag), []).append(child)
+
+        # Attribute values, defaults and leaf values come from a binding
+        # object on which only buildAttributes() and buildChildren() for
+        # leaf elements are called. Elements with neither (the common case
+        # for ObjectProperties) just copy the binding class defaults.
+        leaves = [x for x in children if x not in fields]
+        if element.attrib or leaves:
+            binding = klass._binding_class.factory()
+            binding.buildAttributes(element, element.attrib, set())
+            for name in leaves:
+                for node in children[name]:
+                    binding.buildChildren(node, element, name)
+            values = binding.__dict__
+        else:
+            # The defaults are shared, so copy the (empty) lists as well.
+            values = dict(
+                (name, list(value) if isinstance(value, list) else value)
+                for name, value in six.iteritems(
+                    _defaults(klass._binding_class)
+                )
+            )
+
+        if "valueOf_" in values:
+            values["valueOf_"] = get_all_text_(element)
+
+        for name, nodes in six.iteritems(children):
+            if name in leaves:
+                continue
+            field = fields[name]
+            if isinstance(values.get(name), list):
+                values[name] = [ElementProxy(x, field=field) for x in nodes]
+            else:
+                values[name] = ElementProxy(nodes[-1], field=field)
+
+        self.__dict__.update(values)
+        self._populated = True
+
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails.
+        if self._populated or name.startswith("__"):
+            raise AttributeError(name)
+        self._populate()
+        return getattr(self, name)
+
+
+def entity_from_element(klass, element):
+    """Build an instance of the Entity `klass` from an lxml `element`.
+
+    The result is the same as building `element` with the generated binding
+    class for `klass` and passing that to ``klass.from_obj()``.
+    """
+    return klass.from_obj(ElementProxy(element, klass))
@@ -0,0 +1,270 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Reading XML input that may be compressed.
+
+gzip, bzip2 and xz input is recognized by its magic bytes, whatever the
+filename, and decompressed on the fly while it is parsed. Plain files given
+by name are memory-mapped and handed to the XML parser without being read
+into a Python string first.
+
+These functions back ``cybox.bindings.cybox_core.parse()``,
+``parseString()``, :meth:`cybox.core.Observables.from_xml` and
+:func:`cybox.core.iter_observables`.
+"""
+
+import bz2
+import gzip
+import io
+import mmap
+import os
+
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
+
+from lxml import etree
+from mixbox.vendor import six
+from mixbox.xml import get_xml_parser
+
+GZIP = "gzip"
+BZIP2 = "bzip2"
+XZ = "xz"
+
+_MAGIC = (
+    (b"\x1f\x8b", GZIP),
+    (b"BZh", BZIP2),
+    (b"\xfd7zXZ\x00", XZ),
+)
+
+_HEADER_SIZE = max(len(magic) for magic, _ in _MAGIC)
+
+
+def compression(header):
+    """Return the compression format `header` starts with.
+
+    Args:
+        header: The first bytes of a document.
+
+    Returns:
+        :data:`GZIP`, :data:`BZIP2`, :data:`XZ`, or ``None`` for
+        uncompressed (or text) input.
+    """
+    if not isinstance(header, six.binary_type):
+        return None
+
+    for magic, format_ in _MAGIC:
+        if header.startswith(magic):
+            return format_
+    return None
+
+
+def _require_lzma():
+    if lzma is None:
+        raise ValueError("Reading xz-compressed input requires the lzma "
+                         "module (backports.lzma on Python 2).")
+
+
+def decompress(data):
+    """Decompress `data` if it is compressed, and return it unchanged if not.
+    """
+    format_ = compression(data[:_HEADER_SIZE])
+
+    if format_ == GZIP:
+        return gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+    if format_ == BZIP2:
+        return bz2.decompress(data)
+    if format_ == XZ:
+        _require_lzma()
+        return lzma.decompress(data)
+    return data
+
+
+class _PrefixedReader(object):
+    """A file-like object which returns `prefix` before the rest of
+    `fileobj`. Used to put back the header of unseekable input."""
+
+    def __init__(self, prefix, fileobj):
+        self._prefix = prefix
+        self._fileobj = fileobj
+
+    def read(self, size=-1):
+        prefix = self._prefix
+        if not prefix:
+            return self._fileobj.read(size)
+
+        if size is None or size < 0:
+            self._prefix = prefix[:0]
+            return prefix + self._fileobj.read()
+
+        self._prefix = prefix[size:]
+        prefix = prefix[:size]
+        if len(prefix) < size:
+            prefix += self._fileobj.read(size - len(prefix))
+        return prefix
+
+
+def _peek(fileobj):
+    """Return the header of `fileobj` and a file-like object which still
+    starts at the header."""
+    if hasattr(fileobj, "peek"):
+        try:
+            return fileobj.peek(_HEADER_SIZE)[:_HEADER_SIZE], fileobj
+        except (AttributeError, IOError, ValueError):
+            pass
+
+    try:
+        position = fileobj.tell()
+        header = fileobj.read(_HEADER_SIZE)
+        fileobj.seek(position)
+        return header, fileobj
+    except (AttributeError, IOError, ValueError):
+        pass
+
+    header = fileobj.read(_HEADER_SIZE)
+    return header, _PrefixedReader(header, fileobj)
+
+
+def _decompressor(format_, fileobj):
+    if format_ == GZIP:
+        if six.PY2 and isinstance(fileobj, _PrefixedReader):
+            # Python 2's GzipFile calls tell() and seek() on its input.
+            fileobj = io.BytesIO(fileobj.read())
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if format_ == BZIP2:
+        if six.PY2:
+            # Python 2's BZ2File only opens filenames.
+            return io.BytesIO(bz2.decompress(fileobj.read()))
+        return bz2.BZ2File(fileobj)
+    _require_lzma()
+    return lzma.LZMAFile(fileobj)
+
+
+def _is_filename(source):
+    return isinstance(source, six.string_types) and os.path.isfile(source)
+
+
+def open_xml(source):
+    """Prepare `source` for an lxml parser.
+
+    Args:
+        source: A filename, URL or file-like object.
+
+    Returns:
+        A ``(source, opened)`` tuple. `source` is a file-like object that
+        decompresses compressed input, or the original `source` if it is not
+        compressed. `opened` is a list of file objects opened here, which
+        the caller should close once parsing is done.
+    """
+    opened = []
+
+    if _is_filename(source):
+        with open(source, "rb") as f:
+            format_ = compression(f.read(_HEADER_SIZE))
+        if format_ is None:
+            return source, opened
+        fileobj = open(source, "rb")
+        opened.append(fileobj)
+    elif hasattr(source, "read"):
+        header, fileobj = _peek(source)
+        format_ = compression(header)
+        if format_ is None:
+            return fileobj, opened
+    else:
+        return source, opened
+
+    decompressor = _decompressor(format_, fileobj)
+    opened.append(decompressor)
+    return decompressor, opened
+
+
+def _close(opened):
+    for fileobj in reversed(opened):
+        fileobj.close()
+
+
+def _parse_mapped(filename, parser):
+    with open(filename, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            # Empty files (and some special files) cannot be mapped.
+            return etree.parse(filename, parser)
+
+    view = None
+    try:
+        try:
+            view = memoryview(mapped)
+            root = etree.fromstring(view, parser, base_url=filename)
+        except (TypeError, ValueError):
+            # Python 2 cannot take a memoryview of an mmap (TypeError), and
+            # lxml before 3.x cannot parse buffers (ValueError, "can only
+            # parse strings"); read the mapping instead.
+            return etree.parse(mapped, parser, base_url=filename)
+        return root.getroottree()
+    finally:
+        # The mapping cannot be closed while a view of it exists.
+        del view
+        mapped.close()
+
+
+def parse_xml(source, parser=None):
+    """Parse a possibly compressed XML document.
+
+    Args:
+        source: A filename, URL or file-like object.
+        parser: An lxml parser. Defaults to
+            ``mixbox.xml.get_xml_parser()``, as used by the bindings.
+
+    Returns:
+        An ``lxml.etree._ElementTree``.
+    """
+    if parser is None:
+        parser = get_xml_parser()
+
+    source, opened = open_xml(source)
+    try:
+        if not opened and _is_filename(source):
+            return _parse_mapped(source, parser)
+        return etree.parse(source, parser)
+    finally:
+        _close(opened)
+
+
+def parse_xml_string(data, parser=None):
+    """Parse a possibly compressed XML document held in a string.
+
+    Args:
+        data: The document, as bytes or (uncompressed) text.
+        parser: An lxml parser. Defaults to
+            ``mixbox.xml.get_xml_parser()``.
+
+    Returns:
+        An ``lxml.etree._ElementTree``.
+    """
+    if parser is None:
+        parser = get_xml_parser()
+
+    if isinstance(data, six.text_type):
+        return etree.parse(six.StringIO(data), parser)
+    return etree.fromstring(decompress(data), parser).getroottree()
+
+
+def get_etree_root(doc):
+    """Like ``mixbox.xml.get_etree_root()``, but reads compressed input.
+
+    Args:
+        doc: An lxml element or element tree, a filename, or a file-like
+            object.
+
+    Returns:
+        An ``lxml.etree._Element``.
+    """
+    if isinstance(doc, etree._Element):
+        return doc
+    if isinstance(doc, etree._ElementTree):
+        return doc.getroot()
+    return parse_xml(doc).getroot()
@@ -0,0 +1,273 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Encoding and decoding JSON with a choice of libraries.
+
+``to_json()`` and ``from_json()`` of the classes using :class:`JSONMixin`,
+and the other JSON readers and writers in cybox, go through a *backend*.
+The built-in backends are, fastest first:
+
+* ``"orjson"``
+* ``"ujson"``
+* ``"rapidjson"`` (python-rapidjson)
+* ``"json"`` (the standard library)
+
+The default backend is ``"json"``, so that the output does not depend on
+which libraries are installed. A faster one is used once it is selected
+with :func:`set_backend`, for instance the fastest one installed::
+
+    jsonio.set_backend(jsonio.available_backends()[0])
+
+Any function taking a `backend` argument also accepts the name of a
+backend, or a :class:`JSONBackend`, to use for that call only.
+
+Backends other than ``"json"`` write compact JSON and leave non-ASCII
+characters unescaped, so their output differs in whitespace and escaping
+from that of the standard library, but decodes to the same values. Values a
+backend cannot encode, such as integers wider than 64 bits, are encoded
+with the standard library instead.
+"""
+
+import json
+
+from mixbox.vendor import six
+
+from cybox.utils.caches import scoped
+
+
+class JSONBackend(object):
+    """Encodes and decodes JSON with a particular library.
+
+    Args:
+        name: The name the backend is registered under.
+        dumps: A function returning the JSON document (``str`` or UTF-8
+            encoded ``bytes``) for a value.
+        loads: A function returning the value of a JSON document, given as
+            ``str`` or ``bytes``.
+    """
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def __repr__(self):
+        return "<JSONBackend %r>" % self.name
+
+    def dumps(self, value, fallback=True):
+        """Return the JSON document for `value`, as text.
+
+        Args:
+            value: The value to encode.
+            fallback: If ``False``, raise the error of the library rather
+                than encoding a value it cannot encode with the standard
+                library.
+        """
+        try:
+            doc = self._dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            if self._dumps is json.dumps or not fallback:
+                raise
+            return json.dumps(value)
+
+        if isinstance(doc, six.binary_type):
+            doc = doc.decode("utf-8")
+        return doc
+
+    def loads(self, doc):
+        """Return the value of the JSON document `doc` (text or bytes)."""
+        return self._loads(doc)
+
+    def load(self, fileobj):
+        """Return the value of the JSON document read from `fileobj`."""
+        return self._loads(fileobj.read())
+
+
+def _stdlib_backend():
+    def loads(doc):
+        if isinstance(doc, six.binary_type):
+            doc = doc.decode("utf-8")
+        return json.loads(doc)
+
+    return JSONBackend("json", json.dumps, loads)
+
+
+def _orjson_backend():
+    import orjson
+    return JSONBackend("orjson", orjson.dumps, orjson.loads)
+
+
+def _ujson_backend():
+    import ujson
+
+    def dumps(value):
+        return ujson.dumps(value, ensure_ascii=False)
+
+    return JSONBackend("ujson", dumps, ujson.loads)
+
+
+def _rapidjson_backend():
+    import rapidjson
+
+    def loads(doc):
+        if isinstance(doc, six.binary_type):
+            doc = doc.decode("utf-8")
+        return rapidjson.loads(doc)
+
+    return JSONBackend("rapidjson", rapidjson.dumps, loads)
+
+
+# Maps backend names to JSONBackend instances, or to functions building one
+# which may raise ImportError. Built-in backends are only imported when they
+# are first needed.
+_backends = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "rapidjson": _rapidjson_backend,
+    "json": _stdlib_backend,
+}
+
+# Names of the backends, fastest first.
+_preferred = ["orjson", "ujson", "rapidjson", "json"]
+
+# The name of the default backend, unless another is selected with
+# set_backend().
+DEFAULT_BACKEND = "json"
+
+# The backend selected with set_backend(), or None for DEFAULT_BACKEND.
+_default = None
+
+
+def register_backend(backend):
+    """Make `backend` available by its name.
+
+    It is listed by :func:`available_backends` before the standard library
+    backend.
+
+    Args:
+        backend: A :class:`JSONBackend`.
+    """
+    _backends[backend.name] = backend
+
+    if backend.name in _preferred:
+        _preferred.remove(backend.name)
+    if "json" in _preferred:
+        _preferred.insert(_preferred.index("json"), backend.name)
+    else:
+        _preferred.append(backend.name)
+
+
+def _load_backend(name):
+    """Return the backend called `name`, importing it if needed.
+
+    Raises:
+        KeyError: No backend is registered as `name`.
+        ImportError: The library of the backend is not installed.
+    """
+    backend = _backends[name]
+
+    if not isinstance(backend, JSONBackend):
+        backend = _backends[name] = backend()
+    return backend
+
+
+def available_backends():
+    """Return the names of the backends that can be used, fastest first."""
+    names = []
+
+    for name in _preferred:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(backend=None):
+    """Return a :class:`JSONBackend`.
+
+    Args:
+        backend: A :class:`JSONBackend`, the name of a registered backend,
+            or ``None`` for the default backend.
+
+    Raises:
+        ValueError: The backend is unknown or its library is not installed.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+
+    if backend is None:
+        if _default is not None:
+            return _default
+        backend = DEFAULT_BACKEND
+
+    try:
+        return _load_backend(backend)
+    except KeyError:
+        raise ValueError("Unknown JSON backend: %r" % (backend,))
+    except ImportError as ex:
+        raise ValueError("JSON backend %r is not available: %s" %
+                         (backend, ex))
+
+
+def set_backend(backend=None):
+    """Select the default backend.
+
+    Args:
+        backend: A :class:`JSONBackend`, the name of a registered backend,
+            or ``None`` to use the standard library again.
+    """
+    global _default
+
+    if backend is None:
+        _default = None
+    else:
+        _default = get_backend(backend)
+
+
+def dumps(value, backend=None):
+    """Return the JSON document for `value`, as text."""
+    return get_backend(backend).dumps(value)
+
+
+def loads(doc, backend=None):
+    """Return the value of the JSON document `doc` (text or bytes)."""
+    return get_backend(backend).loads(doc)
+
+
+def load(fileobj, backend=None):
+    """Return the value of the JSON document read from `fileobj`."""
+    return get_backend(backend).load(fileobj)
+
+
+class JSONMixin(object):
+    """Makes ``to_json()`` and ``from_json()`` of an Entity class use a
+    JSON backend."""
+
+    def to_json(self, backend=None):
+        """Export the entity as a JSON string.
+
+        Args:
+            backend: The :class:`JSONBackend` or name of the backend to
+                use, or ``None`` for the default.
+        """
+        return dumps(self.to_dict(), backend)
+
+    @classmethod
+    def from_json(cls, json_doc, backend=None, scope=None):
+        """Build an entity from a JSON string or a file-like object.
+
+        Args:
+            json_doc: A JSON document (text or bytes), or a file-like object
+                to read one from.
+            backend: The :class:`JSONBackend` or name of the backend to
+                use, or ``None`` for the default.
+            scope: A :class:`cybox.utils.caches.CacheScope` or
+                :class:`cybox.utils.caches.Cache` to put the Objects built
+                in, rather than the current cache.
+        """
+        if hasattr(json_doc, "read"):
+            json_doc = json_doc.read()
+        value = loads(json_doc, backend)
+        with scoped(scope):
+            return cls.from_dict(value)
@@ -0,0 +1,304 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Lazily loaded API entities.
+
+A lazy entity is an ordinary instance of its API class (an
+:class:`cybox.core.Observable`, for example) whose ``_fields`` dictionary is
+a :class:`LazyFields`. The dictionary keeps the binding object (or
+:class:`cybox.utils.elements.ElementProxy`) the entity was parsed from, and
+only converts a ``TypedField`` value the first time it is read. Untouched
+fields, and the subtrees below them, are never converted at all.
+
+Only classes that use the :class:`LazyEntityMixin` and do not override
+``from_obj()`` are loaded lazily. Values of any other class are built with
+their own ``from_obj()`` when their field is first read.
+
+Id fields are loaded as soon as an entity is created, so an Object is added
+to the object cache (see :mod:`cybox.utils.caches`) once it has been reached
+through its parent. Objects that have not been reached yet are not cached,
+and so cannot be found by ``RelatedObject.get_properties()``.
+"""
+
+from lxml import etree
+from mixbox import entities
+from mixbox import fields
+from mixbox import signals
+from mixbox.typedlist import TypedList
+from mixbox.vendor import six
+
+_ENTITY_FROM_OBJ = entities.Entity.__dict__["from_obj"].__func__
+
+# Maps Entity classes to whether they can be loaded lazily.
+_LAZY_CLASSES = {}
+
+
+def is_lazy_class(klass):
+    """Return True if instances of `klass` can be loaded lazily."""
+    try:
+        return _LAZY_CLASSES[klass]
+    except KeyError:
+        lazy = (issubclass(klass, LazyEntityMixin) and
+                klass.from_obj.__func__ is _ENTITY_FROM_OBJ)
+        _LAZY_CLASSES[klass] = lazy
+        return lazy
+
+
+def is_lazy(entity):
+    """Return True if `entity` was created by :func:`lazy_entity`."""
+    return isinstance(getattr(entity, "_fields", None), LazyFields)
+
+
+def _from_obj(transformer, obj):
+    if not obj:
+        return None
+
+    klass = transformer
+    if issubclass(transformer, entities.EntityFactory):
+        klass = transformer.entity_class(transformer.objkey(obj))
+
+    if is_lazy_class(klass):
+        return lazy_entity(klass, obj)
+    return klass.from_obj(obj)
+
+
+def _transform(field, value):
+    """Convert a binding value the same way ``Entity.from_obj()`` does."""
+    transformer = field.transformer
+    if not transformer:
+        return value
+    if field.multiple and value is not None:
+        return [_from_obj(transformer, x) for x in value]
+    return _from_obj(transformer, value)
+
+
+def _snapshot(value):
+    """Record enough about a loaded `value` to tell later if it changed."""
+    if isinstance(value, (list, TypedList)):
+        return [(x, _snapshot(x)) for x in value]
+    if isinstance(value, entities.Entity) and not is_lazy(value):
+        return value.to_dict()
+    return None
+
+
+def _changed(value, snapshot):
+    if isinstance(value, (list, TypedList)):
+        if len(value) != len(snapshot):
+            return True
+        return any(x is not orig or _changed(x, snap)
+                   for x, (orig, snap) in zip(value, snapshot))
+    if isinstance(value, entities.Entity):
+        if is_lazy(value):
+            return value._fields.is_modified()
+        return value.to_dict() != snapshot
+    return False
+
+
+class LazyFields(dict):
+    """An ``Entity._fields`` dictionary which loads its values on demand.
+
+    Args:
+        entity: The Entity that owns this dictionary.
+        source: The binding object (or ElementProxy) `entity` is parsed from.
+    """
+
+    def __init__(self, entity, source):
+        # Start out with the values set by the entity's constructor. As in
+        # Entity.from_obj(), they are kept for fields `source` lacks.
+        super(LazyFields, self).__init__(entity._fields)
+        self._entity = entity
+        self._source = source
+        self._pending = set(entity.typed_fields())
+        self._snapshots = {}
+        self._loading = 0
+        self._modified = False
+
+    @property
+    def source(self):
+        """The binding object (or ElementProxy) values are loaded from."""
+        return self._source
+
+    def _load(self, field):
+        self._pending.discard(field)
+
+        try:
+            value = getattr(self._source, field.name)
+        except AttributeError:
+            return
+
+        value = _transform(field, value)
+
+        self._loading += 1
+        try:
+            field.__set__(self._entity, value)
+        finally:
+            self._loading -= 1
+
+        if dict.__contains__(self, field):
+            self._snapshots[field] = _snapshot(dict.__getitem__(self, field))
+
+    def _load_all(self):
+        while self._pending:
+            self._load(next(iter(self._pending)))
+
+    def is_modified(self):
+        """Return True if the entity may differ from its source.
+
+        An entity counts as modified once any of its fields has been set or
+        unset, or once a value read from it (including values of lazily
+        loaded children) has changed.
+        """
+        if self._modified:
+            return True
+        for field, snapshot in six.iteritems(self._snapshots):
+            if dict.__contains__(self, field):
+                if _changed(dict.__getitem__(self, field), snapshot):
+                    return True
+        return False
+
+    def __contains__(self, key):
+        if key in self._pending:
+            self._load(key)
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            self._load(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key in self._pending:
+            self._load(key)
+        return dict.get(self, key, default)
+
+    def setdefault(self, key, default=None):
+        if key in self._pending:
+            self._load(key)
+        if not dict.__contains__(self, key):
+            dict.__setitem__(self, key, default)
+            self._snapshots[key] = _snapshot(default)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        if not self._loading:
+            self._pending.discard(key)
+            self._modified = True
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        # Loading an id field unsets idref fields (and vice versa). Fields
+        # that have not been loaded yet stay pending so that the result does
+        # not depend on the order fields are read in.
+        if not self._loading:
+            self._pending.discard(key)
+            self._modified = True
+        if dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+
+    def keys(self):
+        # Used by mixbox.fields.unset(), which should not load anything.
+        return list(set(dict.keys(self)) | self._pending)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        self._load_all()
+        return dict.__len__(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    if six.PY2:
+        def iteritems(self):
+            self._load_all()
+            return dict.iteritems(self)
+
+        def itervalues(self):
+            self._load_all()
+            return dict.itervalues(self)
+
+    def __reduce__(self):
+        # Pickle (and copy) as a plain dictionary of fully loaded values.
+        self._load_all()
+        return (dict, (list(dict.items(self)),))
+
+
+def lazy_entity(klass, source):
+    """Create a lazily loaded instance of `klass`.
+
+    Args:
+        klass: An Entity class.
+        source: A binding object or
+            :class:`cybox.utils.elements.ElementProxy` for `klass`.
+
+    Returns:
+        An instance of `klass` whose field values are converted from `source`
+        the first time they are read.
+    """
+    if not source:
+        return None
+
+    entity = klass()
+    entity._fields = LazyFields(entity, source)
+
+    for field in klass.typed_fields():
+        if isinstance(field, fields.IdField):
+            entity._fields._load(field)
+
+    signals.emit("Entity.created.from_obj", entity, source)
+    return entity
+
+
+def source_element(entity):
+    """Return the lxml element an unmodified lazy `entity` was parsed from.
+
+    Returns:
+        The element, or ``None`` if `entity` is not lazy, has been modified,
+        or was not loaded from an element.
+    """
+    if not is_lazy(entity) or entity._fields.is_modified():
+        return None
+    return getattr(entity._fields.source, "__sourcenode__", None)
+
+
+class LazyEntityMixin(object):
+    """Lets an Entity class be loaded lazily.
+
+    ``to_xml()`` on an unmodified lazy instance serializes the original XML
+    element with lxml rather than rebuilding it from the entity's fields,
+    unless `include_namespaces` is False or a `namespace_dict` is given.
+    The output describes the same content, but is formatted by lxml:
+
+    * The namespaces in scope of the element are declared with their
+      original prefixes, on the same line as its tag.
+    * ``xsi:schemaLocation`` is only written if the element has it in the
+      source document, which an element below the root does not.
+    * Elements parsed without whitespace between them are indented by two
+      spaces rather than four.
+
+    Other instances are serialized by the next class in the MRO.
+    """
+
+    def to_xml(self, include_namespaces=True, namespace_dict=None,
+               pretty=True, encoding="utf-8"):
+        element = None
+        if include_namespaces and not namespace_dict:
+            element = source_element(self)
+
+        if element is None:
+            return super(LazyEntityMixin, self).to_xml(
+                include_namespaces, namespace_dict, pretty, encoding
+            )
+
+        return etree.tostring(
+            element,
+            encoding=encoding or six.text_type,
+            pretty_print=pretty,
+            xml_declaration=False,
+            with_tail=False
+        )
@@ -0,0 +1,181 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Collecting the namespaces of an export by entity class.
+
+``Entity.to_obj()`` calls the ``collect()`` method of its NamespaceCollector
+for every entity it converts. The mixbox collector adds the whole MRO of the
+entity's class to a set each time and looks for input namespaces with
+``hasattr()``, although what it collects only depends on the class unless
+the entity was parsed from a document.
+
+:class:`ClassNamespaceCollector` only records the class of an entity the
+first time it is met. The classes of its MRO which declare a namespace are
+looked up once per class (see :func:`namespace_classes`) and are added when
+the collector is finalized, so the namespaces declared are the same.
+
+Finalizing a collector costs about as much as serializing a small
+Observable. :meth:`ClassNamespaceCollector.namespace_def` caches the
+declarations of the root element for each set of classes collected, and
+:meth:`ClassNamespaceCollector.namespace_maps` the namespaces and schema
+locations they are made from, so that exporting many small entities one at
+a time (see :mod:`cybox.utils.xmlexport` and :mod:`cybox.core.writer`) only
+finalizes a collector for each new combination of classes. A cached entry
+is not used once the namespaces registered with mixbox, their preferred
+prefixes or their schema locations have changed. Further prefixes registered
+for a namespace which is already registered are not noticed, since the
+mixbox registry does not expose them.
+"""
+
+from mixbox import idgen
+from mixbox import namespaces
+from mixbox.entities import NamespaceCollector
+
+# Maps Entity classes to the classes of their MRO which declare a namespace.
+_namespace_classes = {}
+
+# Maps (kind, classes, namespace_dict items, ID namespace) keys to what a
+# finalized collector made of (see ClassNamespaceCollector._cached()), and the
+# registry snapshot it was made with (see _registry_snapshot()). It is emptied
+# when it holds MAX_NAMESPACE_DEFS of them.
+_namespace_defs = {}
+MAX_NAMESPACE_DEFS = 1024
+
+_INPUT_NAMESPACES = "__input_namespaces__"
+_INPUT_SCHEMALOCATIONS = "__input_schemalocations__"
+
+
+def namespace_classes(klass):
+    """Return the classes in the MRO of `klass` whose namespaces a
+    NamespaceCollector declares when it collects an instance of `klass`."""
+    try:
+        return _namespace_classes[klass]
+    except KeyError:
+        pass
+
+    classes = tuple(base for base in klass.__mro__
+                    if getattr(base, "_namespace", None))
+    _namespace_classes[klass] = classes
+    return classes
+
+
+def _registry_snapshot():
+    """Return the prefixes and schema locations of the namespaces registered
+    with mixbox, or ``None`` if a namespace has no prefix."""
+    try:
+        return (namespaces.get_full_ns_map(),
+                namespaces.get_full_schemaloc_map())
+    except namespaces.NoPrefixesError:
+        return None
+
+
+class ClassNamespaceCollector(NamespaceCollector):
+    """A NamespaceCollector which collects the classes of entities, rather
+    than their MROs.
+
+    Attributes:
+        classes: The classes of the entities collected, in the order they
+            were first met.
+        has_input_namespaces: Whether any entity collected was parsed from a
+            document, and so carried namespaces and schema locations of its
+            own.
+    """
+
+    def __init__(self):
+        super(ClassNamespaceCollector, self).__init__()
+        self.classes = []
+        self.has_input_namespaces = False
+        self._seen = set()
+
+    def collect(self, entity):
+        klass = entity.__class__
+        if klass not in self._seen:
+            self._seen.add(klass)
+            self.classes.append(klass)
+
+        attrs = entity.__dict__
+        if _INPUT_NAMESPACES in attrs or _INPUT_SCHEMALOCATIONS in attrs:
+            self.has_input_namespaces = True
+            self._input_namespaces.update(attrs.get(_INPUT_NAMESPACES, ()))
+            self._input_schemalocs.update(
+                attrs.get(_INPUT_SCHEMALOCATIONS, ())
+            )
+
+    def merge(self, other):
+        """Add what the ClassNamespaceCollector `other` has collected, as if
+        its entities had been collected by this collector after those
+        already collected."""
+        for klass in other.classes:
+            if klass not in self._seen:
+                self._seen.add(klass)
+                self.classes.append(klass)
+
+        if other.has_input_namespaces:
+            self.has_input_namespaces = True
+            self._input_namespaces.update(other._input_namespaces)
+            self._input_schemalocs.update(other._input_schemalocs)
+
+    def namespace_def(self, namespace_dict=None, delim=" "):
+        """Return the ``xmlns`` and ``xsi:schemaLocation`` declarations
+        ``Entity.to_xml()`` makes on the root element, separated by
+        `delim`.
+
+        Unless an entity collected was parsed from a document, the result
+        only depends on the classes collected, `namespace_dict`, the ID
+        namespace (see ``mixbox.idgen``) and the namespaces registered with
+        mixbox, and is cached; the collector is only finalized if it is not.
+
+        Args:
+            namespace_dict: A dictionary mapping additional namespace URIs
+                to prefixes, as for ``to_xml()``.
+            delim: The separator of the declarations.
+        """
+        def make():
+            return (self.get_xmlns_string(delim) + delim +
+                    self.get_schema_location_string(delim))
+
+        return self._cached(("namespace_def", delim), namespace_dict, make)
+
+    def namespace_maps(self, namespace_dict=None):
+        """Return the ``binding_namespaces`` and ``finalized_schemalocs``
+        the collector has once it is finalized with `namespace_dict`.
+
+        The result is cached as for :meth:`namespace_def`, and the
+        dictionaries returned must not be modified.
+        """
+        def make():
+            return self.binding_namespaces, self.finalized_schemalocs
+
+        return self._cached(("namespace_maps",), namespace_dict, make)
+
+    def _cached(self, kind, namespace_dict, make):
+        """Return the result of `make`, called once the collector is
+        finalized with `namespace_dict`, from the cache if possible."""
+        key = registry = None
+        if not self.has_input_namespaces:
+            registry = _registry_snapshot()
+
+        if registry is not None:
+            items = None
+            if namespace_dict:
+                items = frozenset(namespace_dict.items())
+            id_namespace = (idgen.get_id_namespace(),
+                            idgen.get_id_namespace_alias())
+            key = (kind, frozenset(self.classes), items, id_namespace)
+            cached = _namespace_defs.get(key)
+            if cached is not None and cached[1] == registry:
+                return cached[0]
+
+        self.finalize(namespace_dict)
+        value = make()
+
+        if key is not None:
+            if len(_namespace_defs) >= MAX_NAMESPACE_DEFS:
+                _namespace_defs.clear()
+            _namespace_defs[key] = (value, registry)
+        return value
+
+    def _parse_collected_classes(self):
+        collected = self._collected_classes
+        for klass in self.classes:
+            collected.update(namespace_classes(klass))
+        super(ClassNamespaceCollector, self)._parse_collected_classes()
@@ -0,0 +1,251 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""A persistent object cache stored in an SQLite database.
+
+:class:`SQLiteCache` keeps the Objects put in it in a database file, so
+that ``RelatedObject.get_properties()`` can resolve idrefs to Objects of
+documents read long before, or by another process, without holding all of
+them in memory:
+
+    >>> cache = SQLiteCache("objects.db")  # doctest: +SKIP
+    >>> with cache_scope(cache):  # doctest: +SKIP
+    ...     Observables.from_xml("old-feed.xml")
+    >>> cache.close()  # doctest: +SKIP
+
+The most recently used values are kept in memory, in front of the database.
+Objects are put in a cache as soon as their ``id_`` is set, before their
+other fields are, so values are not written while they may still be being
+built: those put in the cache are written and committed when the last
+:func:`cybox.utils.caches.cache_scope` of the cache is exited (including
+the scope a parse function enters for its `scope` argument), or by
+:meth:`SQLiteCache.flush`. Until then, values dropped from memory are kept
+aside rather than written, up to :data:`MAX_PENDING` of them. Once there
+are that many, all of them are written: they are the least recently used
+values, which are complete unless a single document holds more Objects than
+fit in memory and aside. Changes made to a value after it has been written
+are not saved unless it is put in the cache again.
+
+A cache made the current cache with :func:`cybox.utils.caches.set_cache`
+rather than in a scope has no scope to exit, so call
+:meth:`SQLiteCache.flush` once the documents read are complete, and
+:meth:`SQLiteCache.close` when done.
+
+Values are stored as the JSON of their ``to_dict()``, along with the name of
+their class, and values read back are built with ``from_dict()``. Only
+Entity classes of cybox modules are built from a database. Values which are
+not entities, and values put under an ID which is no longer their ``id_``
+(such as the ID an Object was given before the one it was parsed with), are
+only kept in memory.
+"""
+
+import importlib
+import sqlite3
+
+from mixbox.entities import Entity
+
+from cybox.utils import jsonio
+from cybox.utils.caches import CacheMiss, LRUCache, caching_disabled
+
+# The number of values written to the database between two commits, other
+# than those of flush().
+COMMIT_INTERVAL = 1000
+
+# The number of values dropped from memory before being written which are
+# kept aside. Once there are this many, they are written.
+MAX_PENDING = COMMIT_INTERVAL
+
+# The number of IDs looked up in the database with a single query, below the
+# SQLite limit on query parameters.
+_IDS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cybox_objects (
+    id TEXT PRIMARY KEY,
+    class TEXT NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+# Maps the class names stored in databases to classes.
+_classes = {}
+
+
+def _class_name(klass):
+    return "%s.%s" % (klass.__module__, klass.__name__)
+
+
+def _load_class(name):
+    """Return the class stored in a database as `name`.
+
+    Raises:
+        ValueError: `name` is not an Entity class of a cybox module.
+    """
+    try:
+        return _classes[name]
+    except KeyError:
+        pass
+
+    module, _, attr = name.rpartition(".")
+    if not module.startswith("cybox."):
+        raise ValueError("Not a cybox class: %r" % (name,))
+
+    klass = getattr(importlib.import_module(module), attr, None)
+    if not (isinstance(klass, type) and issubclass(klass, Entity)):
+        raise ValueError("Not a cybox entity class: %r" % (name,))
+
+    _classes[name] = klass
+    return klass
+
+
+class SQLiteCache(LRUCache):
+    """A cache which keeps its values in an SQLite database, with the most
+    recently used ones in memory.
+
+    A value is looked up in memory first, and then in the database. Values
+    read from the database are built with caching turned off (see
+    :func:`cybox.utils.caches.caching_disabled`), so the Objects they
+    contain are not put in any cache.
+
+    :attr:`evictions` counts the values dropped from memory, including
+    those kept aside until they are written. :meth:`clear` deletes every
+    value in the database.
+
+    Args:
+        path: The path of the database file, which is created if needed.
+        memory_entries: The maximum number of values kept in memory.
+        backend: The :mod:`cybox.utils.jsonio` backend (or its name) to
+            encode values with, or ``None`` for the default.
+    """
+
+    def __init__(self, path, memory_entries=1000, backend=None):
+        super(SQLiteCache, self).__init__(max_entries=memory_entries)
+        self.path = path
+        self._backend = jsonio.get_backend(backend)
+        # The IDs of the values put since they were last written, and
+        # those of them which were dropped from memory before then.
+        self._dirty = set()
+        self._pending = {}
+        self._uncommitted = 0
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def put(self, value, id_=None):
+        with self._lock:
+            id_ = super(SQLiteCache, self).put(value, id_)
+            self._pending.pop(id_, None)
+            self._dirty.add(id_)
+            return id_
+
+    def _write(self, id_, value):
+        if not isinstance(value, Entity) or getattr(value, "id_", id_) != id_:
+            return
+
+        data = self._backend.dumps(value.to_dict())
+        self._db.execute(
+            "INSERT OR REPLACE INTO cybox_objects VALUES (?, ?, ?)",
+            (id_, _class_name(value.__class__), data)
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= COMMIT_INTERVAL:
+            self._commit()
+
+    def _commit(self):
+        self._db.commit()
+        self._uncommitted = 0
+
+    def _evicted(self, id_, value):
+        if id_ not in self._dirty:
+            return
+
+        pending = self._pending
+        pending[id_] = value
+        if len(pending) >= MAX_PENDING:
+            # No scope has been exited (or flush() called) for a long
+            # while. The values kept aside are the least recently used
+            # ones, so write them rather than let them pile up.
+            self._write_pending()
+
+    def _load(self, id_):
+        try:
+            return self._pending.pop(id_)
+        except KeyError:
+            pass
+
+        row = self._db.execute(
+            "SELECT class, data FROM cybox_objects WHERE id = ?", (id_,)
+        ).fetchone()
+        if row is None:
+            raise CacheMiss
+
+        klass = _load_class(row[0])
+        with caching_disabled():
+            return klass.from_dict(self._backend.loads(row[1]))
+
+    def _write_pending(self):
+        pending = self._pending
+        for id_, value in pending.items():
+            self._write(id_, value)
+        self._dirty.difference_update(pending)
+        pending.clear()
+
+    def _write_dirty(self):
+        self._write_pending()
+        for id_, value in list(self._inner.items()):
+            if id_ in self._dirty:
+                self._write(id_, value)
+        self._dirty.clear()
+
+    def _scope_exited(self):
+        self.flush()
+
+    def flush(self):
+        """Write the values which have been put in the cache since they
+        were last written, and commit them to the database.
+
+        Only call this once the values are complete, such as after a
+        document has been parsed."""
+        with self._lock:
+            self._write_dirty()
+            self._commit()
+
+    def count(self):
+        """Return the number of values in memory or in the database.
+
+        Values not written yet are counted without writing them (see
+        :meth:`flush`)."""
+        with self._lock:
+            count = self._db.execute(
+                "SELECT COUNT(*) FROM cybox_objects"
+            ).fetchone()[0]
+
+            ids = set(self._inner)
+            ids.update(self._pending)
+            ids = list(ids)
+            count += len(ids)
+
+            # Leave out those which are also in the database.
+            for start in range(0, len(ids), _IDS_PER_QUERY):
+                chunk = ids[start:start + _IDS_PER_QUERY]
+                count -= self._db.execute(
+                    "SELECT COUNT(*) FROM cybox_objects WHERE id IN (%s)" %
+                    ", ".join("?" * len(chunk)),
+                    chunk
+                ).fetchone()[0]
+            return count
+
+    def clear(self):
+        with self._lock:
+            super(SQLiteCache, self).clear()
+            self._dirty.clear()
+            self._pending.clear()
+            self._db.execute("DELETE FROM cybox_objects")
+            self._commit()
+
+    def close(self):
+        """Write the values not written yet (see :meth:`flush`) and close
+        the database. The cache cannot be used afterwards."""
+        with self._lock:
+            self.flush()
+            self._db.close()
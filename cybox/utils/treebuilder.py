@@ -0,0 +1,65 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Building lxml element trees from API entities.
+
+:func:`to_etree` returns the element ``etree.fromstring(entity.to_xml())``
+would, with the namespaces needed by the tree always declared on its root.
+
+An unmodified lazily loaded entity (see :mod:`cybox.utils.lazy`) is not
+serialized at all: a copy of the element it was parsed from is returned.
+"""
+
+import copy
+
+from lxml import etree
+from mixbox.xml import TAG_SCHEMALOCATION
+
+from cybox.utils.lazy import source_element
+
+
+def to_etree(entity, include_namespaces=True, namespace_dict=None):
+    """Build an lxml element for `entity`.
+
+    Namespace declarations are always made on the root element, since lxml
+    needs them; `include_namespaces` only controls whether
+    ``xsi:schemaLocation`` is added.
+
+    If `entity` is an unmodified lazily loaded entity and no
+    `namespace_dict` is given, a copy of the element it was parsed from is
+    returned, as for ``to_xml()``.
+
+    Args:
+        entity: An Entity.
+        include_namespaces: Whether to add ``xsi:schemaLocation`` to the
+            root element.
+        namespace_dict: A dictionary mapping additional namespace URIs to
+            prefixes, as for ``to_xml()``.
+
+    Returns:
+        An ``lxml.etree._Element``.
+    """
+    element = None
+    if not namespace_dict:
+        element = source_element(entity)
+
+    if element is not None:
+        root = copy.deepcopy(element)
+    else:
+        xml = entity.to_xml(namespace_dict=namespace_dict, pretty=False)
+        root = etree.fromstring(xml)
+
+    if not include_namespaces:
+        root.attrib.pop(TAG_SCHEMALOCATION, None)
+    return root
+
+
+class ElementTreeMixin(object):
+    """Adds :meth:`to_etree` to an Entity class."""
+
+    def to_etree(self, include_namespaces=True, namespace_dict=None):
+        """Build an lxml element for this entity.
+
+        See :func:`cybox.utils.treebuilder.to_etree`.
+        """
+        return to_etree(self, include_namespaces=include_namespaces,
+                        namespace_dict=namespace_dict)
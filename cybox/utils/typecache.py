@@ -0,0 +1,154 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""A cache of resolved XML type names.
+
+Parsing resolves the same few type names over and over: the tag of every
+document root, and the ``xsi:type`` of every Object's ``Properties``. Each
+lookup used to match or split strings, search module globals or import the
+module implementing the type. :data:`type_cache` does that work the first
+time a name is seen and afterwards answers with a dictionary lookup.
+
+Names are cached by ``(namespace URI, local name)``, so that the namespace
+prefixes a document happens to use do not matter. The namespace of an
+``xsi:type`` value is looked up on the element it appears on; names given
+without an element or a namespace (such as the plain Object type names
+``ObjectPropertiesFactory.entity_class()`` is given) are cached with a
+namespace of ``None``.
+
+The cache is cleared whenever a type is registered with
+``cybox.bindings.cybox_core.add_external_class()`` or
+``cybox.core.object.add_external_class()``, or added to the Object type
+metadata in :mod:`cybox.objects`.
+"""
+
+_UNRESOLVED = object()
+
+
+def _resolve_root(name):
+    import cybox.bindings.cybox_core as core_binding
+
+    root_class = core_binding.GDSClassesMapping.get(name)
+    if root_class is None:
+        root_class = getattr(core_binding, name, None)
+    return root_class
+
+
+def _resolve_binding(name):
+    import cybox.bindings.cybox_core as core_binding
+
+    # Object bindings are loaded on first access (see cybox_core), so look
+    # the class up with getattr() rather than in the module dictionary.
+    try:
+        return getattr(core_binding, name)
+    except AttributeError:
+        raise KeyError(name)
+
+
+def _resolve_api(name):
+    import cybox.objects
+
+    # Raises UnknownObjectType for unknown types.
+    return cybox.objects._OBJ_META.get_class_for_object_type(name)
+
+
+class ResolvedType(object):
+    """The classes a type name resolves to.
+
+    Each class is looked up the first time it is asked for. Failed lookups
+    raise and are not cached.
+
+    Attributes:
+        namespace: The namespace URI of the name, or ``None``.
+        name: The local name.
+    """
+
+    __slots__ = ("namespace", "name", "_root_class", "_binding_class",
+                 "_api_class")
+
+    def __init__(self, namespace, name):
+        self.namespace = namespace
+        self.name = name
+        self._root_class = _UNRESOLVED
+        self._binding_class = _UNRESOLVED
+        self._api_class = _UNRESOLVED
+
+    @property
+    def root_class(self):
+        """The binding class of a root element with this name, or ``None``
+        if there is none."""
+        if self._root_class is _UNRESOLVED:
+            self._root_class = _resolve_root(self.name)
+        return self._root_class
+
+    @property
+    def binding_class(self):
+        """The ``cybox.bindings.cybox_core`` class of this type. Raises
+        KeyError for unknown types."""
+        if self._binding_class is _UNRESOLVED:
+            self._binding_class = _resolve_binding(self.name)
+        return self._binding_class
+
+    @property
+    def api_class(self):
+        """The ObjectProperties subclass of this Object type. Raises
+        :class:`cybox.objects.UnknownObjectType` for unknown types."""
+        if self._api_class is _UNRESOLVED:
+            self._api_class = _resolve_api(self.name)
+        return self._api_class
+
+
+class TypeCache(object):
+    """Maps ``(namespace URI, local name)`` pairs to :class:`ResolvedType`
+    instances."""
+
+    def __init__(self):
+        self._types = {}
+
+    def resolve(self, namespace, name):
+        """Return the :class:`ResolvedType` of `name` in `namespace`."""
+        key = (namespace, name)
+        try:
+            return self._types[key]
+        except KeyError:
+            resolved = self._types[key] = ResolvedType(namespace, name)
+            return resolved
+
+    def root_class(self, tag):
+        """Return ``(name, binding class)`` for a root element tag in
+        ``{namespace}name`` form, as ``cybox_core.get_root_tag()`` does.
+        The binding class is ``None`` for unknown tags."""
+        namespace = None
+        name = tag
+        if tag[:1] == "{":
+            namespace, _, name = tag[1:].partition("}")
+        return name, self.resolve(namespace, name).root_class
+
+    def binding_class(self, xsi_type, element=None):
+        """Return the ``cybox.bindings.cybox_core`` class of an ``xsi:type``
+        value, whose prefix is looked up on `element`.
+
+        Raises:
+            KeyError: For unknown types.
+        """
+        prefix, _, name = xsi_type.rpartition(":")
+        namespace = None
+        if element is not None:
+            namespace = element.nsmap.get(prefix or None)
+        return self.resolve(namespace, name).binding_class
+
+    def api_class(self, object_type):
+        """Return the ObjectProperties subclass of a plain Object type name
+        (for example, ``"AddressObjectType"``).
+
+        Raises:
+            cybox.objects.UnknownObjectType: For unknown types.
+        """
+        return self.resolve(None, object_type).api_class
+
+    def clear(self):
+        """Forget every resolved type name."""
+        self._types.clear()
+
+
+#: The process-wide :class:`TypeCache`.
+type_cache = TypeCache()
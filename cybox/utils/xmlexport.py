@@ -0,0 +1,53 @@
+# Copyright (c) 2017, The MITRE Corporation. All rights reserved.
+# See LICENSE.txt for complete terms.
+"""Serializing entities as XML.
+
+``Entity.to_xml()`` writes the output of the binding objects to a StringIO
+and collects the namespaces of the export with a mixbox NamespaceCollector.
+:func:`to_xml` gives the same output, but gathers the output in a list
+which is joined once at the end (see :func:`cybox.bindings.export_xml`) and
+collects the namespaces with a
+:class:`cybox.utils.nscollector.ClassNamespaceCollector`.
+
+The entities of :mod:`cybox.core`, and every
+:class:`cybox.common.ObjectProperties` subclass, are serialized this way
+through the :class:`XMLExportMixin`.
+"""
+
+from mixbox.binding_utils import save_encoding
+
+from cybox.bindings import export_xml
+from cybox.utils.nscollector import ClassNamespaceCollector
+
+
+def to_xml(entity, include_namespaces=True, namespace_dict=None,
+           pretty=True, encoding="utf-8"):
+    """Serialize `entity` as XML.
+
+    The arguments and output are those of ``Entity.to_xml()``.
+    """
+    namespace_def = ""
+
+    ns_collector = ClassNamespaceCollector()
+    obj = entity.to_obj(ns_info=ns_collector if include_namespaces else None)
+
+    if include_namespaces:
+        delim = "\n\t" if pretty else " "
+        namespace_def = ns_collector.namespace_def(namespace_dict, delim)
+
+    with save_encoding(encoding):
+        xml = export_xml(obj, namespacedef_=namespace_def,
+                         pretty_print=pretty)
+
+    if encoding:
+        return xml.encode(encoding)
+    return xml
+
+
+class XMLExportMixin(object):
+    """Serializes an Entity class with :func:`to_xml`."""
+
+    def to_xml(self, include_namespaces=True, namespace_dict=None,
+               pretty=True, encoding="utf-8"):
+        return to_xml(self, include_namespaces, namespace_dict, pretty,
+                      encoding)
@@ -41,6 +41,14 @@ setup(
     url="http://cybox.mitre.org",
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require={
+        'msgpack': ['msgpack>=0.6.1'],
+    },
+    entry_points={
+        'console_scripts': [
+            'cybox-convert = cybox.tools.convert:main',
+        ],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',